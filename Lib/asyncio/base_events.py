@@ -962,6 +962,11 @@ async def _sock_sendfile_native(self, sock, file, offset, count):
             f"syscall sendfile is not available for socket {sock!r} "
             f"and file {file!r} combination")
 
+    async def _file_readinto(self, file, buf):
+        # Read from the file used by the sendfile fallbacks without blocking
+        # the event loop.
+        return await self.run_in_executor(None, file.readinto, buf)
+
     async def _sock_sendfile_fallback(self, sock, file, offset, count):
         if offset:
             file.seek(offset)
@@ -978,7 +983,7 @@ async def _sock_sendfile_fallback(self, sock, file, offset, count):
                     if blocksize <= 0:
                         break
                 view = memoryview(buf)[:blocksize]
-                read = await self.run_in_executor(None, file.readinto, view)
+                read = await self._file_readinto(file, view)
                 if not read:
                     break  # EOF
                 await self.sock_sendall(sock, view[:read])
@@ -1300,7 +1305,7 @@ async def _sendfile_fallback(self, transp, file, offset, count):
                     if blocksize <= 0:
                         return total_sent
                 view = memoryview(buf)[:blocksize]
-                read = await self.run_in_executor(None, file.readinto, view)
+                read = await self._file_readinto(file, view)
                 if not read:
                     return total_sent  # EOF
                 transp.write(view[:read])
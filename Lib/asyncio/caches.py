@@ -0,0 +1,104 @@
+"""Memoization of coroutine functions."""
+
+__all__ = "cached",
+
+import functools
+import operator
+import threading
+
+from . import events
+from . import tasks
+
+
+def cached(maxsize=128, *, typed=False, ttl=None, weigher=None,
+           policy='lru', timer=None):
+    """Memoizing cache decorator for coroutine functions.
+
+    Results of awaiting the decorated coroutine function are cached, so that
+    later calls with the same arguments return them without awaiting the
+    function again.  Concurrent calls with the same arguments are coalesced:
+    while a call is in progress, other calls wait for its result instead of
+    starting another one.  Exceptions are not cached.
+
+    The arguments have the same meaning as for functools.policy_cache().
+    The decorated function has the cache_info(), cache_clear() and
+    cache_parameters() functions of functools.policy_cache(); calls which
+    waited for an in-progress call are counted as hits.
+    """
+    if callable(maxsize) and isinstance(typed, bool):
+        # The user_function was passed in directly via the maxsize argument
+        return cached(typed=typed, ttl=ttl, weigher=weigher, policy=policy,
+                      timer=timer)(maxsize)
+    elif maxsize is not None and not isinstance(maxsize, int):
+        raise TypeError(
+            'Expected first argument to be an integer, a callable, or None')
+
+    maxsize, timer = functools._check_policy_cache_args(maxsize, ttl, weigher,
+                                                        policy, timer)
+
+    def decorating_function(user_function):
+        wrapper = _cached_wrapper(user_function, maxsize, typed, ttl,
+                                  weigher, policy, timer)
+        wrapper.cache_parameters = lambda : {
+            'maxsize': maxsize, 'typed': typed, 'ttl': ttl,
+            'weigher': weigher, 'policy': policy, 'timer': timer}
+        return functools.update_wrapper(wrapper, user_function)
+
+    return decorating_function
+
+
+def _cached_wrapper(user_function, maxsize, typed, ttl, weigher, policy,
+                    timer):
+    sentinel = object()
+    make_key = functools._make_key
+    cache = functools._PolicyCache(maxsize, ttl, weigher, policy, timer)
+    # The cache may be shared by event loops running in different threads.
+    lock = threading.Lock()
+    # Maps keys to the tasks computing their results.
+    pending = {}
+
+    def done(key, task):
+        with lock:
+            if pending.get(key) is task:
+                del pending[key]
+        if maxsize == 0 or task.cancelled() or task.exception() is not None:
+            return
+        result = task.result()
+        weight = 1 if weigher is None else operator.index(weigher(result))
+        now = cache.now()
+        with lock:
+            cache.put(key, result, weight, now)
+
+    async def wrapper(*args, **kwds):
+        key = make_key(args, kwds, typed)
+        loop = events.get_running_loop()
+        now = cache.now()
+        with lock:
+            task = pending.get(key)
+            if task is not None and task.get_loop() is loop:
+                cache.hits += 1
+            else:
+                result = cache.get(key, now, sentinel)
+                if result is not sentinel:
+                    return result
+                # Run the call in its own task, so that cancelling one of
+                # the callers does not cancel it for the others.
+                task = tasks.ensure_future(user_function(*args, **kwds),
+                                           loop=loop)
+                pending[key] = task
+                task.add_done_callback(functools.partial(done, key))
+        return await tasks.shield(task)
+
+    def cache_info():
+        """Report cache statistics"""
+        with lock:
+            return functools._PolicyCacheInfo(*cache.info())
+
+    def cache_clear():
+        """Clear the cache and cache statistics"""
+        with lock:
+            cache.clear()
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    return wrapper
@@ -21,6 +21,8 @@
 
 
 _DEFAULT_LIMIT = 2 ** 16  # 64 KiB
+_BUFFER_SIZE = 2 ** 16  # 64 KiB
+_MIN_READ_SIZE = 2 ** 14  # 16 KiB
 
 
 async def open_connection(host=None, port=None, *,
@@ -177,16 +179,31 @@ def _get_close_waiter(self, stream):
         raise NotImplementedError
 
 
-class StreamReaderProtocol(FlowControlMixin, protocols.Protocol):
+class StreamReaderProtocol(FlowControlMixin, protocols.BufferedProtocol):
     """Helper class to adapt between Protocol and StreamReader.
 
     (This is a helper class instead of making StreamReader itself a
     Protocol subclass, because the StreamReader has other potential
     uses, and to prevent the user of the StreamReader to accidentally
     call inappropriate methods of the protocol.)
+
+    The transport receives data directly into the buffer of the
+    StreamReader through get_buffer() and buffer_updated().  Subclasses
+    which override data_received() receive the data through it instead.
     """
 
     _source_traceback = None
+    _data_buffer = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if (cls.data_received is not StreamReaderProtocol.data_received
+                and cls.get_buffer is StreamReaderProtocol.get_buffer
+                and cls.buffer_updated is StreamReaderProtocol.buffer_updated):
+            # Keep calling the data_received() method of the subclass, as
+            # when StreamReaderProtocol was not a BufferedProtocol.
+            cls.get_buffer = StreamReaderProtocol._get_data_buffer
+            cls.buffer_updated = StreamReaderProtocol._data_buffer_updated
 
     def __init__(self, stream_reader, client_connected_cb=None, loop=None):
         super().__init__(loop=loop)
@@ -278,6 +295,29 @@ def data_received(self, data):
         if reader is not None:
             reader.feed_data(data)
 
+    def get_buffer(self, sizehint):
+        reader = self._stream_reader
+        if reader is None:
+            # Nobody will read the data, discard it.
+            return bytearray(max(sizehint, _BUFFER_SIZE))
+        return reader._get_buffer(sizehint)
+
+    def buffer_updated(self, nbytes):
+        reader = self._stream_reader
+        if reader is not None:
+            reader._buffer_updated(nbytes)
+
+    def _get_data_buffer(self, sizehint):
+        # get_buffer() of the subclasses which override data_received().
+        if self._data_buffer is None or len(self._data_buffer) < sizehint:
+            self._data_buffer = bytearray(max(sizehint, _BUFFER_SIZE))
+        return self._data_buffer
+
+    def _data_buffer_updated(self, nbytes):
+        with memoryview(self._data_buffer) as view:
+            data = bytes(view[:nbytes])
+        self.data_received(data)
+
     def eof_received(self):
         reader = self._stream_reader
         if reader is not None:
@@ -423,7 +463,17 @@ def __init__(self, limit=_DEFAULT_LIMIT, loop=None):
             self._loop = events.get_event_loop()
         else:
             self._loop = loop
-        self._buffer = bytearray()
+        # Received data is stored in self._storage[self._start:self._end].
+        # The transport writes into the free space past self._end and
+        # consumed data is skipped over, so that the storage can be reused
+        # instead of allocating new objects for every chunk.
+        self._storage = bytearray()
+        self._start = 0
+        self._end = 0
+        self._view = None    # The memoryview returned by read_view()
+        # Whether the storage is still exported after the view was
+        # released, so that it must not be overwritten.
+        self._exported = False
         self._eof = False    # Whether we're done.
         self._waiter = None  # A future used by _wait_for_data()
         self._exception = None
@@ -435,8 +485,8 @@ def __init__(self, limit=_DEFAULT_LIMIT, loop=None):
 
     def __repr__(self):
         info = ['StreamReader']
-        if self._buffer:
-            info.append(f'{len(self._buffer)} bytes')
+        if self._end > self._start:
+            info.append(f'{self._end - self._start} bytes')
         if self._eof:
             info.append('eof')
         if self._limit != _DEFAULT_LIMIT:
@@ -475,18 +525,92 @@ def set_transport(self, transport):
         assert self._transport is None, 'Transport already set'
         self._transport = transport
 
+    @property
+    def _buffer(self):
+        # A copy of the buffered data, for debugging.
+        return bytes(self._storage[self._start:self._end])
+
     def _maybe_resume_transport(self):
-        if self._paused and len(self._buffer) <= self._limit:
+        if self._paused and self._end - self._start <= self._limit:
             self._paused = False
             self._transport.resume_reading()
 
+    def _release_view(self):
+        # The memoryview returned by read_view() is only valid until the
+        # next read.
+        view = self._view
+        if view is not None:
+            self._view = None
+            try:
+                view.release()
+            except BufferError:
+                # The view is still exported, leave it to the garbage
+                # collector.
+                pass
+            # Buffers exported by the view and memoryviews made by
+            # memoryview(view) survive it and still refer to the storage.
+            # A bytearray cannot be resized while it is exported.
+            storage = self._storage
+            try:
+                storage.append(0)
+            except BufferError:
+                self._exported = True
+            else:
+                del storage[-1]
+
+    def _take(self, n):
+        start = self._start
+        with memoryview(self._storage) as view:
+            data = bytes(view[start:start + n])
+        self._start = start + n
+        return data
+
+    def _reserve(self, size):
+        """Make room for at least size more bytes past the buffered data."""
+        storage = self._storage
+        start = self._start
+        end = self._end
+        nbytes = end - start
+        shared = self._view is not None or self._exported
+        if start == end and not shared:
+            start = end = self._start = self._end = 0
+            if len(storage) > 4 * max(self._limit, size, _BUFFER_SIZE):
+                # Do not keep a large buffer after reading a large chunk.
+                storage = self._storage = bytearray()
+        if len(storage) - end >= size:
+            return
+        if not shared and nbytes <= len(storage) // 2 and \
+                len(storage) - nbytes >= size:
+            # Move the buffered data to the beginning of the storage.
+            storage[:nbytes] = storage[start:end]
+        else:
+            # Never resize the storage in place: it is shared with the
+            # memoryviews returned by read_view() and get_buffer().
+            new = bytearray(max(2 * nbytes, nbytes + size, _BUFFER_SIZE))
+            new[:nbytes] = storage[start:end]
+            self._storage = new
+            self._exported = False
+        self._start = 0
+        self._end = nbytes
+
+    def _get_buffer(self, sizehint):
+        self._reserve(max(sizehint, _MIN_READ_SIZE))
+        return memoryview(self._storage)[self._end:]
+
+    def _buffer_updated(self, nbytes):
+        assert not self._eof, 'buffer_updated after feed_eof'
+        if not nbytes:
+            return
+        self._end += nbytes
+        self._data_added()
+
     def feed_eof(self):
         self._eof = True
         self._wakeup_waiter()
 
     def at_eof(self):
         """Return True if the buffer is empty and 'feed_eof' was called."""
-        return self._eof and not self._buffer
+        return self._eof and self._start == self._end
 
     def feed_data(self, data):
         assert not self._eof, 'feed_data after feed_eof'
@@ -494,12 +618,20 @@ def feed_data(self, data):
         if not data:
             return
 
-        self._buffer.extend(data)
+        with memoryview(data) as view:
+            nbytes = view.nbytes
+            self._reserve(nbytes)
+            end = self._end
+            self._storage[end:end + nbytes] = view
+        self._end = end + nbytes
+        self._data_added()
+
+    def _data_added(self):
         self._wakeup_waiter()
 
         if (self._transport is not None and
                 not self._paused and
-                len(self._buffer) > 2 * self._limit):
+                self._end - self._start > 2 * self._limit):
             try:
                 self._transport.pause_reading()
             except NotImplementedError:
@@ -561,10 +693,11 @@ async def readline(self):
         except exceptions.IncompleteReadError as e:
             return e.partial
         except exceptions.LimitOverrunError as e:
-            if self._buffer.startswith(sep, e.consumed):
-                del self._buffer[:e.consumed + seplen]
+            start = self._start + e.consumed
+            if self._storage.startswith(sep, start, self._end):
+                self._start = start + seplen
             else:
-                self._buffer.clear()
+                self._start = self._end
             self._maybe_resume_transport()
             raise ValueError(e.args[0])
         return line
@@ -607,6 +740,7 @@ async def readuntil(self, separator=b'\n'):
         if min_seplen == 0:
             raise ValueError('Separator should be at least one-byte string')
 
+        self._release_view()
         if self._exception is not None:
             raise self._exception
 
@@ -634,7 +768,7 @@ async def readuntil(self, separator=b'\n'):
         # Loop until we find a `separator` in the buffer, exceed the buffer size,
         # or an EOF has happened.
         while True:
-            buflen = len(self._buffer)
+            buflen = self._end - self._start
 
             # Check if we now have enough data in the buffer for shortest
             # separator to fit.
@@ -642,9 +776,11 @@ async def readuntil(self, separator=b'\n'):
                 match_start = None
                 match_end = None
                 for sep in separator:
-                    isep = self._buffer.find(sep, offset)
+                    isep = self._storage.find(sep, self._start + offset,
+                                              self._end)
 
                     if isep != -1:
+                        isep -= self._start
                         # `separator` is in the buffer. `match_start` and
                         # `match_end` will be used later to retrieve the
                         # data.
@@ -667,7 +803,7 @@ async def readuntil(self, separator=b'\n'):
             # adds data which makes separator be found. That's why we check for
             # EOF *after* inspecting the buffer.
             if self._eof:
-                chunk = self._buffer.take_bytes()
+                chunk = self._take(buflen)
                 raise exceptions.IncompleteReadError(chunk, None)
 
             # _wait_for_data() will resume reading if stream was paused.
@@ -677,7 +813,7 @@ async def readuntil(self, separator=b'\n'):
             raise exceptions.LimitOverrunError(
                 'Separator is found, but chunk is longer than limit', match_start)
 
-        chunk = self._buffer.take_bytes(match_end)
+        chunk = self._take(match_end)
         self._maybe_resume_transport()
         return chunk
 
@@ -703,6 +839,7 @@ async def read(self, n=-1):
         needed.
         """
 
+        self._release_view()
         if self._exception is not None:
             raise self._exception
 
@@ -719,15 +856,53 @@ async def read(self, n=-1):
                 joined += block
             return joined.take_bytes()
 
-        if not self._buffer and not self._eof:
+        if self._start == self._end and not self._eof:
             await self._wait_for_data('read')
 
         # This will work right even if buffer is less than n bytes
-        data = self._buffer.take_bytes(min(len(self._buffer), n))
+        data = self._take(min(self._end - self._start, n))
 
         self._maybe_resume_transport()
         return data
 
+    async def readinto(self, buffer):
+        """Read up to len(buffer) bytes from the stream into buffer.
+
+        Return the number of bytes read, as soon as at least 1 byte is
+        available in the internal buffer.  If EOF was received and the
+        internal buffer is empty, return 0.
+
+        buffer must be a writable bytes-like object.  The data is copied
+        directly from the internal buffer, no intermediate bytes object is
+        created.
+
+        If stream was paused, this function will automatically resume it if
+        needed.
+        """
+        with memoryview(buffer) as m, m.cast('B') as view:
+            if view.readonly:
+                raise TypeError('readinto() argument must be read-write '
+                                'bytes-like object')
+
+            self._release_view()
+            if self._exception is not None:
+                raise self._exception
+
+            if not view:
+                return 0
+
+            if self._start == self._end and not self._eof:
+                await self._wait_for_data('readinto')
+
+            start = self._start
+            n = min(self._end - start, len(view))
+            with memoryview(self._storage) as storage:
+                view[:n] = storage[start:start + n]
+        self._start = start + n
+
+        self._maybe_resume_transport()
+        return n
+
     async def readexactly(self, n):
         """Read exactly `n` bytes.
 
@@ -746,23 +921,64 @@ async def readexactly(self, n):
         if n < 0:
             raise ValueError('readexactly size can not be less than zero')
 
+        self._release_view()
         if self._exception is not None:
             raise self._exception
 
         if n == 0:
             return b''
 
-        while len(self._buffer) < n:
+        while self._end - self._start < n:
             if self._eof:
-                incomplete = self._buffer.take_bytes()
+                incomplete = self._take(self._end - self._start)
                 raise exceptions.IncompleteReadError(incomplete, n)
 
             await self._wait_for_data('readexactly')
 
-        data = self._buffer.take_bytes(n)
+        data = self._take(n)
         self._maybe_resume_transport()
         return data
 
+    async def read_view(self, n):
+        """Read exactly `n` bytes and return them as a memoryview.
+
+        The returned read-only memoryview refers to the internal buffer of
+        the stream, no copy of the data is made.  It is only valid until
+        the next call of a read method of the stream, which releases it.
+        Use readexactly() to get a bytes object which can be kept.
+
+        Raise an IncompleteReadError if EOF is reached before `n` bytes can be
+        read. The IncompleteReadError.partial attribute of the exception will
+        contain the partial read bytes.
+
+        Returned value is not limited with limit, configured at stream
+        creation.
+
+        If stream was paused, this function will automatically resume it if
+        needed.
+        """
+        if n < 0:
+            raise ValueError('read_view size can not be less than zero')
+
+        self._release_view()
+        if self._exception is not None:
+            raise self._exception
+
+        while self._end - self._start < n:
+            if self._eof:
+                incomplete = self._take(self._end - self._start)
+                raise exceptions.IncompleteReadError(incomplete, n)
+
+            await self._wait_for_data('read_view')
+
+        start = self._start
+        with memoryview(self._storage) as storage:
+            view = storage[start:start + n].toreadonly()
+        self._start = start + n
+        self._view = view
+        self._maybe_resume_transport()
+        return view
+
     def __aiter__(self):
         return self
 
@@ -4,6 +4,7 @@
 import io
 import itertools
 import os
+import select
 import selectors
 import signal
 import socket
@@ -20,7 +21,9 @@
 from . import events
 from . import exceptions
 from . import futures
+from . import proactor_events
 from . import selector_events
+from . import sslproto
 from . import tasks
 from . import transports
 from .log import logger
@@ -28,6 +31,7 @@
 
 __all__ = (
     'SelectorEventLoop',
+    'IoUringEventLoop',
     'EventLoop',
 )
 
@@ -481,6 +485,416 @@ def _stop_serving(self, sock):
                              '%r: %r', path, err)
 
 
+# user_data of the request polling the selector of IoUringEventLoop.
+_SELECTOR_USER_DATA = 0
+
+# Returned by the completion callbacks of _IoUringProactor which queued
+# another request for the same future.
+_PENDING = object()
+
+
+def _io_uring_result(res):
+    if res < 0:
+        raise OSError(-res, os.strerror(-res))
+    return res
+
+
+class _IoUringFuture(futures.Future):
+    """Future wrapping a request of an io_uring proactor."""
+
+    def __init__(self, proactor, *, loop=None):
+        super().__init__(loop=loop)
+        if self._source_traceback:
+            del self._source_traceback[-1]
+        self._proactor = proactor
+        self._user_data = None
+
+    def cancel(self, msg=None):
+        if not self.done() and self._user_data is not None:
+            self._proactor._cancel(self._user_data)
+        return super().cancel(msg=msg)
+
+
+class _IoUringProactor:
+    """Proactor implementation using io_uring.
+
+    Requests are queued in the submission queue of the ring, and submitted
+    all at once when the event loop polls for completions.
+    """
+
+    def __init__(self, ring):
+        self._loop = None
+        self._ring = ring
+        self._user_data = itertools.count(_SELECTOR_USER_DATA + 1)
+        self._cache = {}    # user_data => (future, callback)
+        self._polling_selector = False
+
+    def __repr__(self):
+        info = ['request#=%s' % len(self._cache)]
+        if self._ring is None:
+            info.append('closed')
+        return '<%s %s>' % (self.__class__.__name__, " ".join(info))
+
+    def set_loop(self, loop):
+        self._loop = loop
+
+    def _register(self, fut, callback, op, *args):
+        # Queue a request for fut: callback() is called with the result of
+        # the request when it completes, even if fut was cancelled, and
+        # returns the result of fut, or _PENDING if it queued another
+        # request for fut.
+        if self._ring is None:
+            raise RuntimeError('IoUringProactor is closed')
+        user_data = next(self._user_data)
+        op(user_data, *args)
+        fut._user_data = user_data
+        self._cache[user_data] = (fut, callback)
+        return fut
+
+    def _future(self):
+        return _IoUringFuture(self, loop=self._loop)
+
+    def _cancel(self, user_data):
+        if self._ring is not None and user_data in self._cache:
+            self._ring.cancel(next(self._user_data), user_data)
+
+    def recv(self, conn, nbytes, flags=0):
+        buf = bytearray(nbytes)
+
+        def finish_recv(res):
+            with memoryview(buf) as view:
+                return bytes(view[:_io_uring_result(res)])
+
+        return self._register(self._future(), finish_recv,
+                              self._ring.recv, conn.fileno(), buf, flags)
+
+    def recv_into(self, conn, buf, flags=0):
+        return self._register(self._future(), _io_uring_result,
+                              self._ring.recv, conn.fileno(), buf, flags)
+
+    def send(self, conn, buf, flags=0):
+        fut = self._future()
+        fd = conn.fileno()
+        view = memoryview(buf).cast('B')
+        total = len(view)
+
+        def finish_send(res):
+            # Send the rest of the data after a partial write.
+            nonlocal view
+            view = view[_io_uring_result(res):]
+            if not view or fut.done():
+                return total
+            self._register(fut, finish_send, self._ring.send, fd, view, flags)
+            return _PENDING
+
+        return self._register(fut, finish_send,
+                              self._ring.send, fd, view, flags)
+
+    def accept(self, listener):
+        fut = self._future()
+
+        def finish_accept(res):
+            fd = _io_uring_result(res)
+            if fut.done():
+                os.close(fd)
+                return None
+            conn = socket.socket(listener.family, listener.type,
+                                 listener.proto, fileno=fd)
+            try:
+                conn.setblocking(False)
+                address = conn.getpeername()
+            except OSError:
+                conn.close()
+                raise
+            return conn, address
+
+        return self._register(fut, finish_accept, self._ring.accept,
+                              listener.fileno(), socket.SOCK_CLOEXEC)
+
+    def poll(self, fd, eventmask):
+        return self._register(self._future(), _io_uring_result,
+                              self._ring.poll_add, fd, eventmask)
+
+    def read_into(self, fd, buf, offset):
+        return self._register(self._future(), _io_uring_result,
+                              self._ring.read, fd, buf, offset)
+
+    def _poll(self, timeout=None, selector=None):
+        # Submit the queued requests and wait for their completion, or for
+        # the selector to become ready, which is then the return value.
+        ring = self._ring
+        if selector is not None and not self._polling_selector:
+            ring.poll_add(_SELECTOR_USER_DATA, selector, select.POLLIN)
+            self._polling_selector = True
+        selector_ready = False
+        for user_data, res, flags in ring.wait(timeout):
+            if user_data == _SELECTOR_USER_DATA:
+                self._polling_selector = False
+                selector_ready = True
+                continue
+            try:
+                f, callback = self._cache.pop(user_data)
+            except KeyError:
+                # completion of a cancellation request
+                continue
+            try:
+                value = callback(res)
+            except OSError as exc:
+                if not f.done():
+                    f.set_exception(exc)
+            else:
+                if value is not _PENDING and not f.done():
+                    f.set_result(value)
+            finally:
+                f = None
+        return selector_ready
+
+    def close(self):
+        if self._ring is None:
+            # already closed
+            return
+        ring = self._ring
+        self._ring = None
+        for fut, callback in list(self._cache.values()):
+            fut.cancel()
+        self._cache.clear()
+        # Closing the ring cancels the requests in flight, and waits for
+        # their completion.
+        ring.close()
+
+
+if hasattr(select, 'io_uring'):
+    class _IoUringSelector(selectors.EpollSelector):
+        """Epoll selector which waits for the completions of a proactor.
+
+        While requests are in flight, the epoll object is polled through the
+        ring of the proactor, so that a single io_uring_enter() call submits
+        the queued requests and waits for both their completions and file
+        descriptor events.
+        """
+
+        def __init__(self, proactor):
+            super().__init__()
+            self._proactor = proactor
+
+        def select(self, timeout=None):
+            proactor = self._proactor
+            if proactor._ring is None or not proactor._cache:
+                return super().select(timeout)
+            if timeout is not None:
+                timeout = max(timeout, 0)
+            if proactor._poll(timeout, self._selector):
+                return super().select(0)
+            return []
+
+
+class _IoUringSocketTransport(proactor_events._ProactorSocketTransport):
+
+    def _call_connection_lost(self, exc):
+        if self._called_connection_lost:
+            return
+        try:
+            self._protocol.connection_lost(exc)
+        finally:
+            # shutdown() completes the requests still pending on the socket,
+            # which closing it would not.  On Linux, it fails with ENOTCONN
+            # if the peer already reset the connection.
+            if self._sock.fileno() != -1:
+                try:
+                    self._sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+            self._sock.close()
+            self._sock = None
+            server = self._server
+            if server is not None:
+                server._detach(self)
+                self._server = None
+            self._called_connection_lost = True
+
+
+class IoUringEventLoop(_UnixSelectorEventLoop):
+    """Unix event loop performing socket I/O with io_uring.
+
+    Socket transports and the sock_*() methods queue their operations as
+    io_uring requests, which are submitted together once per iteration of
+    the event loop.  If io_uring is not available, the event loop behaves
+    like SelectorEventLoop.
+    """
+
+    def __init__(self):
+        self._proactor = None
+        selector = None
+        if hasattr(select, 'io_uring'):
+            try:
+                ring = select.io_uring()
+            except OSError as exc:
+                # io_uring can be disabled by the kernel configuration or
+                # by a security policy like seccomp
+                logger.debug('io_uring is not available: %r', exc)
+            else:
+                self._proactor = _IoUringProactor(ring)
+                selector = _IoUringSelector(self._proactor)
+        super().__init__(selector)
+        if self._proactor is not None:
+            self._proactor.set_loop(self)
+
+    def close(self):
+        if self.is_running():
+            raise RuntimeError("Cannot close a running event loop")
+        if self._proactor is not None:
+            self._proactor.close()
+            self._proactor = None
+        super().close()
+
+    def _make_socket_transport(self, sock, protocol, waiter=None, *,
+                               extra=None, server=None):
+        if self._proactor is None:
+            return super()._make_socket_transport(
+                sock, protocol, waiter, extra=extra, server=server)
+        self._ensure_fd_no_transport(sock)
+        return _IoUringSocketTransport(
+            self, sock, protocol, waiter, extra, server)
+
+    def _make_ssl_transport(
+            self, rawsock, protocol, sslcontext, waiter=None,
+            *, server_side=False, server_hostname=None,
+            extra=None, server=None,
+            ssl_handshake_timeout=constants.SSL_HANDSHAKE_TIMEOUT,
+            ssl_shutdown_timeout=constants.SSL_SHUTDOWN_TIMEOUT,
+    ):
+        if self._proactor is None:
+            return super()._make_ssl_transport(
+                rawsock, protocol, sslcontext, waiter,
+                server_side=server_side, server_hostname=server_hostname,
+                extra=extra, server=server,
+                ssl_handshake_timeout=ssl_handshake_timeout,
+                ssl_shutdown_timeout=ssl_shutdown_timeout)
+        self._ensure_fd_no_transport(rawsock)
+        ssl_protocol = sslproto.SSLProtocol(
+            self, protocol, sslcontext, waiter,
+            server_side, server_hostname,
+            ssl_handshake_timeout=ssl_handshake_timeout,
+            ssl_shutdown_timeout=ssl_shutdown_timeout
+        )
+        _IoUringSocketTransport(
+            self, rawsock, ssl_protocol, extra=extra, server=server)
+        return ssl_protocol._app_transport
+
+    def _check_sock(self, sock):
+        base_events._check_ssl_socket(sock)
+        if self._debug and sock.gettimeout() != 0:
+            raise ValueError("the socket must be non-blocking")
+
+    async def sock_recv(self, sock, n):
+        if self._proactor is None:
+            return await super().sock_recv(sock, n)
+        self._check_sock(sock)
+        return await self._proactor.recv(sock, n)
+
+    async def sock_recv_into(self, sock, buf):
+        if self._proactor is None:
+            return await super().sock_recv_into(sock, buf)
+        self._check_sock(sock)
+        return await self._proactor.recv_into(sock, buf)
+
+    async def sock_sendall(self, sock, data):
+        if self._proactor is None:
+            return await super().sock_sendall(sock, data)
+        self._check_sock(sock)
+        if data:
+            await self._proactor.send(sock, data)
+
+    async def sock_accept(self, sock):
+        if self._proactor is None:
+            return await super().sock_accept(sock)
+        self._check_sock(sock)
+        return await self._proactor.accept(sock)
+
+    async def _sock_sendfile_native(self, sock, file, offset, count):
+        if self._proactor is None:
+            return await super()._sock_sendfile_native(sock, file,
+                                                       offset, count)
+        try:
+            fileno = file.fileno()
+        except (AttributeError, io.UnsupportedOperation):
+            raise exceptions.SendfileNotAvailableError("not a regular file")
+        try:
+            fsize = os.fstat(fileno).st_size
+        except OSError:
+            raise exceptions.SendfileNotAvailableError("not a regular file")
+        blocksize = count if count else fsize
+        if not blocksize:
+            return 0  # empty file
+
+        # io_uring has no sendfile operation: call sendfile(2) directly,
+        # and only wait through the ring for the socket to be writable.
+        fd = sock.fileno()
+        total_sent = 0
+        try:
+            while True:
+                if count:
+                    blocksize = count - total_sent
+                    if blocksize <= 0:
+                        return total_sent
+                # On 32-bit architectures truncate to 1GiB to avoid
+                # OverflowError
+                blocksize = min(blocksize, sys.maxsize//2 + 1)
+                try:
+                    sent = os.sendfile(fd, fileno, offset + total_sent,
+                                       blocksize)
+                except (BlockingIOError, InterruptedError):
+                    await self._proactor.poll(fd, select.POLLOUT)
+                    continue
+                except OSError as exc:
+                    if total_sent == 0:
+                        # 'file' is probably not a regular mmap(2)-like
+                        # file: fall back on using plain send().
+                        raise exceptions.SendfileNotAvailableError(
+                            "os.sendfile call failed") from exc
+                    if exc.errno == errno.ENOTCONN:
+                        # The connection was closed in the middle of the
+                        # operation.
+                        raise ConnectionError(
+                            "socket is not connected", errno.ENOTCONN
+                        ) from exc
+                    raise
+                if sent == 0:
+                    return total_sent  # EOF
+                total_sent += sent
+        finally:
+            self._sock_sendfile_update_filepos(fileno, offset + total_sent,
+                                               total_sent)
+
+    async def _sendfile_native(self, transp, file, offset, count):
+        if self._proactor is None:
+            return await super()._sendfile_native(transp, file,
+                                                  offset, count)
+        resume_reading = transp.is_reading()
+        transp.pause_reading()
+        await transp._make_empty_waiter()
+        try:
+            return await self.sock_sendfile(transp._sock, file, offset, count,
+                                            fallback=False)
+        finally:
+            transp._reset_empty_waiter()
+            if resume_reading:
+                transp.resume_reading()
+
+    async def _file_readinto(self, file, buf):
+        if self._proactor is not None:
+            try:
+                fileno = file.fileno()
+                pos = file.tell()
+            except (AttributeError, io.UnsupportedOperation):
+                pass
+            else:
+                read = await self._proactor.read_into(fileno, buf, pos)
+                file.seek(pos + read)
+                return read
+        return await super()._file_readinto(file, buf)
+
+
 class _UnixReadPipeTransport(transports.ReadTransport):
 
     max_size = 256 * 1024  # max bytes we read in one event loop iteration
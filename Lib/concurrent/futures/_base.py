@@ -587,6 +587,19 @@ def _get_snapshot(self):
 
     __class_getitem__ = classmethod(types.GenericAlias)
 
+
+_PyFuture = Future
+
+
+try:
+    from _concurrent_futures import Future as _CFuture
+except ImportError:
+    pass
+else:
+    # _CFuture is needed for tests.
+    Future = _CFuture
+
+
 class Executor(object):
     """This is an abstract base class for concrete asynchronous executors."""
 
@@ -601,6 +614,19 @@ def submit(self, fn, /, *args, **kwargs):
         """
         raise NotImplementedError()
 
+    def submit_many(self, fn, /, *iterables):
+        """Submits a batch of calls to be executed with the given arguments.
+
+        Schedules fn(*args) for each tuple of arguments taken from the
+        iterables, like map(), and returns the Futures of the calls.
+        Executors may schedule the whole batch at once, which is cheaper
+        than calling submit() for each call.
+
+        Returns:
+            A list of Futures representing the given calls, in order.
+        """
+        return [self.submit(fn, *args) for args in zip(*iterables)]
+
     def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None):
         """Returns an iterator equivalent to map(fn, iter).
 
@@ -45,6 +45,8 @@
 
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 
+import collections
+import io
 import os
 from concurrent.futures import _base
 import queue
@@ -53,11 +55,14 @@
 # so that it can be accessed later as `mp.connection`
 import multiprocessing.connection
 from multiprocessing.queues import Queue
+from multiprocessing.reduction import ForkingPickler as _ForkingPickler
 import threading
 import weakref
 from functools import partial
 import itertools
+import pickle
 import sys
+import time
 from traceback import format_exception
 
 
@@ -118,6 +123,11 @@ def _python_exit():
 EXTRA_QUEUED_CALLS = 1
 
 
+# The duration that ProcessPoolExecutor.map() aims for when it sizes the
+# chunks from the observed duration of the calls (chunksize=None). Shorter
+# chunks balance the load better, longer chunks have less overhead.
+_ADAPTIVE_CHUNK_TIME = 0.05
+
 # On Windows, WaitForMultipleObjects is used to wait for processes to finish.
 # It can wait on, at most, 63 objects. There is an overhead of two objects:
 # - the result queue reader
@@ -191,6 +201,196 @@ def _on_queue_feeder_error(self, e, obj):
             super()._on_queue_feeder_error(e, obj)
 
 
+class _SharedBuffer:
+    """Wraps a large bytes or bytearray argument or result so that it is
+    pickled as an out-of-band buffer."""
+    def __init__(self, obj, direct):
+        self.obj = obj
+        self.direct = direct
+
+    def __reduce_ex__(self, protocol):
+        buf = pickle.PickleBuffer(self.obj)
+        # The buffer is copied by the constructor when it is loaded. Keep
+        # it alive, so that its id is not reused during the pickling.
+        self.direct[id(buf)] = buf
+        return type(self.obj), (buf,)
+
+
+class _SharedMemoryPayload:
+    """An object pickled with protocol 5, whose large out-of-band buffers
+    are stored in shared memory segments instead of the pickle data."""
+    def __init__(self, data, buffers):
+        self.data = data
+        # A list of (segment name, size, direct) tuples. Direct buffers
+        # are only read by a bytes or bytearray constructor, other buffers
+        # are copied out of shared memory before being loaded.
+        self.buffers = buffers
+
+    def load(self, unlink=False):
+        from multiprocessing.shared_memory import SharedMemory
+        segments = []
+        views = []
+        try:
+            for name, size, direct in self.buffers:
+                shm = SharedMemory(name, track=unlink)
+                segments.append(shm)
+                if direct:
+                    views.append(shm.buf[:size])
+                else:
+                    with shm.buf[:size] as view:
+                        views.append(bytearray(view))
+            return pickle.loads(self.data, buffers=views)
+        finally:
+            for view in views:
+                if isinstance(view, memoryview):
+                    view.release()
+            for shm in segments:
+                shm.close()
+                if unlink:
+                    shm.unlink()
+
+
+def _has_large_buffer(objs, threshold):
+    for obj in objs:
+        if hasattr(type(obj), '__buffer__'):
+            try:
+                with memoryview(obj) as view:
+                    if view.nbytes >= threshold:
+                        return True
+            except TypeError:
+                pass
+    return False
+
+
+def _dump_shared(obj, direct, threshold, allocate, release):
+    # Pickle obj with its large buffers out-of-band, in shared memory
+    # segments returned by allocate(size), which are passed to
+    # release(segments) on error. direct maps the ids of the buffers of
+    # _SharedBuffer objects to the buffers. Return the payload and the
+    # segments, or None if no buffer is large enough.
+    buffers = []
+    segments = []
+    def buffer_callback(buf):
+        with buf.raw() as view:
+            size = view.nbytes
+            if size < threshold:
+                return True
+            shm = allocate(size)
+            segments.append(shm)
+            shm.buf[:size] = view
+        buffers.append((shm.name, size, id(buf) in direct))
+        return False
+    f = io.BytesIO()
+    try:
+        _ForkingPickler(f, 5, buffer_callback=buffer_callback).dump(obj)
+    except BaseException:
+        release(segments)
+        raise
+    if not segments:
+        return None
+    return _SharedMemoryPayload(f.getvalue(), buffers), segments
+
+
+def _wrap_buffer(obj, threshold, direct):
+    if type(obj) in (bytes, bytearray) and len(obj) >= threshold:
+        return _SharedBuffer(obj, direct)
+    return obj
+
+
+class _SharedMemoryPool:
+    """Allocates the shared memory segments which carry large arguments to
+    the worker processes, and reuses them once the calls are complete."""
+    def __init__(self, threshold, max_free):
+        self.threshold = threshold
+        self._max_free = max_free
+        self._free = []
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def _allocate(self, size):
+        from multiprocessing.shared_memory import SharedMemory
+        with self._lock:
+            best = None
+            for i, shm in enumerate(self._free):
+                if shm.size >= size and (best is None or
+                                         shm.size < self._free[best].size):
+                    best = i
+            if best is not None:
+                return self._free.pop(best)
+        # Round the size up to a power of two to reuse the segment for
+        # similar sizes. The pages which are not written are not allocated.
+        return SharedMemory(create=True, size=1 << (size - 1).bit_length())
+
+    def dump(self, args, kwargs, chunk=False):
+        """Return a _SharedMemoryPayload of the arguments and its segments,
+        or None if they do not contain a large buffer.
+
+        If chunk is true, the last argument is a chunk of a map() call, and
+        the arguments of its calls are also looked at."""
+        values = itertools.chain(args, kwargs.values())
+        if chunk:
+            values = itertools.chain(values,
+                                     itertools.chain.from_iterable(args[-1]))
+        if not _has_large_buffer(values, self.threshold):
+            return None
+        threshold = self.threshold
+        direct = {}
+        args = tuple(_wrap_buffer(arg, threshold, direct) for arg in args)
+        if chunk:
+            args = args[:-1] + (tuple(
+                tuple(_wrap_buffer(arg, threshold, direct) for arg in item)
+                for item in args[-1]),)
+        kwargs = {key: _wrap_buffer(value, threshold, direct)
+                  for key, value in kwargs.items()}
+        return _dump_shared((args, kwargs), direct, threshold,
+                            self._allocate, self.release)
+
+    def release(self, segments):
+        with self._lock:
+            if not self._closed:
+                self._free.extend(segments)
+                # Keep the most recently used segments.
+                segments = self._free[:-self._max_free]
+                del self._free[:-self._max_free]
+        for shm in segments:
+            shm.close()
+            shm.unlink()
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            segments = self._free
+            self._free = []
+        for shm in segments:
+            shm.close()
+            shm.unlink()
+
+
+def _dump_result(result, threshold):
+    # Store a large result in shared memory segments which are unlinked by
+    # the executor once it has loaded the result.
+    from multiprocessing.shared_memory import SharedMemory
+    # On Windows, a segment is destroyed when its last handle is closed, so
+    # it cannot outlive the worker's handle.
+    if os.name != 'posix' or not _has_large_buffer((result,), threshold):
+        return result
+    def allocate(size):
+        return SharedMemory(create=True, size=size)
+    def release(segments):
+        for shm in segments:
+            shm.close()
+            shm.unlink()
+    direct = {}
+    dumped = _dump_shared(_wrap_buffer(result, threshold, direct), direct,
+                          threshold, allocate, release)
+    if dumped is None:
+        return result
+    payload, segments = dumped
+    for shm in segments:
+        shm.close()
+    return payload
+
+
 def _process_chunk(fn, chunk):
     """ Processes a chunk of an iterable passed to map.
 
@@ -203,10 +403,30 @@ def _process_chunk(fn, chunk):
     return [fn(*args) for args in chunk]
 
 
+def _process_timed_chunk(fn, chunk):
+    """ Processes a chunk of an iterable passed to map, and times it.
+
+    Like _process_chunk(), but returns a tuple of the list of results and
+    the time taken by the calls, in seconds.
+
+    This function is run in a separate process.
+
+    """
+    start = time.perf_counter()
+    results = [fn(*args) for args in chunk]
+    return results, time.perf_counter() - start
+
+
 def _sendback_result(result_queue, work_id, result=None, exception=None,
-                     exit_pid=None):
+                     exit_pid=None, shared_memory_threshold=None):
     """Safely send back the given result or exception"""
     try:
+        if shared_memory_threshold is not None:
+            try:
+                result = _dump_result(result, shared_memory_threshold)
+            except Exception:
+                # Send the result through the pipe.
+                pass
         result_queue.put(_ResultItem(work_id, result=result,
                                      exception=exception, exit_pid=exit_pid))
     except BaseException as e:
@@ -215,7 +435,8 @@ def _sendback_result(result_queue, work_id, result=None, exception=None,
                                      exit_pid=exit_pid))
 
 
-def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=None):
+def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=None,
+                    shared_memory_threshold=None, slots=None):
     """Evaluates calls from call_queue and places the results in result_queue.
 
     This worker is run in a separate process.
@@ -227,6 +448,13 @@ def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=N
             to by the worker.
         initializer: A callable initializer, or None
         initargs: A tuple of args for the initializer
+        max_tasks: The maximum number of tasks to execute before exiting,
+            or None
+        shared_memory_threshold: The minimum size of the results passed
+            in shared memory, or None
+        slots: A ctx.Semaphore counting the workers which may evaluate
+            calls, or None. The other workers are spare workers, which wait
+            for a worker to exit.
     """
     if initializer is not None:
         try:
@@ -236,11 +464,15 @@ def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=N
             # The parent will notice that the process stopped and
             # mark the pool broken
             return
+    if slots is not None:
+        slots.acquire()
     num_tasks = 0
     exit_pid = None
     while True:
         call_item = call_queue.get(block=True)
         if call_item is None:
+            if slots is not None:
+                slots.release()
             # Wake up queue management thread
             result_queue.put(os.getpid())
             return
@@ -251,21 +483,29 @@ def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=N
                 exit_pid = os.getpid()
 
         try:
-            r = call_item.fn(*call_item.args, **call_item.kwargs)
+            args, kwargs = call_item.args, call_item.kwargs
+            if isinstance(args, _SharedMemoryPayload):
+                args, kwargs = args.load()
+            r = call_item.fn(*args, **kwargs)
         except BaseException as e:
             exc = _ExceptionWithTraceback(e, e.__traceback__)
             _sendback_result(result_queue, call_item.work_id, exception=exc,
                              exit_pid=exit_pid)
         else:
             _sendback_result(result_queue, call_item.work_id, result=r,
-                             exit_pid=exit_pid)
+                             exit_pid=exit_pid,
+                             shared_memory_threshold=shared_memory_threshold)
             del r
+        args = kwargs = None
 
         # Liberate the resource as soon as possible, to avoid holding onto
         # open files or shared memory that is not needed anymore
         del call_item
 
         if exit_pid is not None:
+            if slots is not None:
+                # Let a spare worker take over.
+                slots.release()
             return
 
 
@@ -325,6 +565,10 @@ def weakref_cb(_,
         #     {5: <_WorkItem...>, 6: <_WorkItem...>, ...}
         self.pending_work_items = executor._pending_work_items
 
+        # A _SharedMemoryPool of the segments which carry large arguments,
+        # or None.
+        self.shared_memory_pool = executor._shared_memory_pool
+
         super().__init__()
 
     def run(self):
@@ -360,7 +604,7 @@ def run(self):
                 if executor := self.executor_reference():
                     if process_exited:
                         with self.shutdown_lock:
-                            executor._adjust_process_count()
+                            executor._adjust_process_count(replace=True)
                     else:
                         executor._idle_worker_semaphore.release()
                     del executor
@@ -439,11 +683,21 @@ def process_result_item(self, result_item):
         # Received a _ResultItem so mark the future as completed.
         work_item = self.pending_work_items.pop(result_item.work_id, None)
         # work_item can be None if another process terminated (see above)
+        result = result_item.result
+        if isinstance(result, _SharedMemoryPayload):
+            # Load the result even if the work item is gone, to unlink its
+            # shared memory segments.
+            try:
+                result = result.load(unlink=True)
+            except BaseException as exc:
+                if work_item is not None:
+                    work_item.future.set_exception(exc)
+                return
         if work_item is not None:
             if result_item.exception is not None:
                 work_item.future.set_exception(result_item.exception)
             else:
-                work_item.future.set_result(result_item.result)
+                work_item.future.set_result(result)
 
     def is_shutting_down(self):
         # Check whether we should start shutting down the executor.
@@ -581,6 +835,9 @@ def _join_executor_internals(self, broken=False):
                 p.terminate()
             p.join()
 
+        if self.shared_memory_pool is not None:
+            self.shared_memory_pool.close()
+
     def get_n_children_alive(self):
         # This is an upper bound on the number of children alive.
         return sum(p.is_alive() for p in self.processes.values())
@@ -634,6 +891,103 @@ def _chain_from_iterable_of_lists(iterable):
             yield element.pop()
 
 
+def _adaptive_map(executor, fn, iterables, timeout, buffersize):
+    """
+    Implements ProcessPoolExecutor.map() with chunksize=None.
+
+    The chunks are submitted as the workers become free, rather than all at
+    once, so that the remaining items go to whichever workers are idle. Only
+    enough chunks to keep the workers busy are pending at a time. The size
+    of the next chunk is computed from the observed duration of the calls,
+    so that a chunk takes about _ADAPTIVE_CHUNK_TIME seconds. If the number
+    of items is known, the chunks also shrink as the end approaches, so
+    that the last chunks are spread over the workers.
+    """
+    if timeout is not None:
+        end_time = timeout + time.monotonic()
+    zipped_iterables = zip(*iterables)
+    try:
+        remaining = min(map(len, iterables), default=0)
+    except TypeError:
+        remaining = None
+    max_workers = executor._max_workers
+    max_running = max_workers + EXTRA_QUEUED_CALLS
+    # The futures of the chunks in submission order, and those which were
+    # not seen to be done yet.
+    fs = collections.deque()
+    running = set()
+    chunksize = 1
+    # A moving average of the duration of a call.
+    call_time = None
+    executor_weakref = weakref.ref(executor)
+
+    def update(future):
+        nonlocal chunksize, call_time
+        running.discard(future)
+        if future.cancelled() or future.exception() is not None:
+            return
+        results, elapsed = future.result()
+        t = elapsed / len(results)
+        call_time = t if call_time is None else (call_time + t) / 2
+        # Grow the chunks gradually, in case the first calls were fast.
+        if call_time > 0:
+            chunksize = max(1, min(int(_ADAPTIVE_CHUNK_TIME / call_time),
+                                   2 * chunksize))
+        else:
+            chunksize *= 2
+
+    def submit_chunks():
+        nonlocal remaining
+        while (len(running) < max_running
+               and (buffersize is None or len(fs) < buffersize)
+               and (executor := executor_weakref()) is not None):
+            size = chunksize
+            if remaining is not None:
+                size = min(size, -(-remaining // (2 * max_workers)))
+            chunk = list(itertools.islice(zipped_iterables, max(size, 1)))
+            if not chunk:
+                break
+            if remaining is not None:
+                remaining -= len(chunk)
+            future = executor.submit(_process_timed_chunk, fn, chunk)
+            fs.append(future)
+            running.add(future)
+            del executor, chunk, future
+
+    def result_iterator():
+        try:
+            while fs:
+                # Submit chunks as the others complete while waiting for the
+                # next results in order.
+                while not fs[0].done():
+                    if timeout is None:
+                        done = _base.wait(running,
+                                          return_when=_base.FIRST_COMPLETED)[0]
+                    else:
+                        done = _base.wait(running, end_time - time.monotonic(),
+                                          return_when=_base.FIRST_COMPLETED)[0]
+                        if not done:
+                            raise _base.TimeoutError()
+                    for future in done:
+                        update(future)
+                    del done
+                    submit_chunks()
+                if fs[0] in running:
+                    update(fs[0])
+                # Careful not to keep a reference to the popped future
+                results = _base._result_or_cancel(fs.popleft())[0]
+                submit_chunks()
+                results.reverse()
+                while results:
+                    yield results.pop()
+        finally:
+            for future in fs:
+                future.cancel()
+
+    submit_chunks()
+    return result_iterator()
+
+
 class BrokenProcessPool(_base.BrokenExecutor):
     """
     Raised when a process in a ProcessPoolExecutor terminated abruptly
@@ -651,7 +1005,8 @@ class BrokenProcessPool(_base.BrokenExecutor):
 
 class ProcessPoolExecutor(_base.Executor):
     def __init__(self, max_workers=None, mp_context=None,
-                 initializer=None, initargs=(), *, max_tasks_per_child=None):
+                 initializer=None, initargs=(), *, max_tasks_per_child=None,
+                 shared_memory_threshold=None, preload=None, spare_workers=0):
         """Initializes a new ProcessPoolExecutor instance.
 
         Args:
@@ -669,6 +1024,18 @@ def __init__(self, max_workers=None, mp_context=None,
                 live as long as the executor. Requires a non-'fork' mp_context
                 start method. When given, we default to using 'spawn' if no
                 mp_context is supplied.
+            shared_memory_threshold: The minimum size in bytes of the buffers
+                which are passed to and from the worker processes in shared
+                memory segments, instead of being pickled through a pipe.
+                The default of None means all arguments and results are
+                pickled through a pipe.
+            preload: A list of names of modules to import in the worker
+                processes before the initializer. With the 'forkserver'
+                start method, they are also imported by the fork server if
+                it is not running yet, so that the workers inherit them.
+            spare_workers: The number of extra worker processes to start,
+                which wait until a worker exits (see max_tasks_per_child)
+                and replace it without delay.
         """
         _check_system_limits()
 
@@ -687,6 +1054,16 @@ def __init__(self, max_workers=None, mp_context=None,
 
             self._max_workers = max_workers
 
+        if not isinstance(spare_workers, int):
+            raise TypeError("spare_workers must be an integer")
+        elif spare_workers < 0:
+            raise ValueError("spare_workers must be >= 0")
+        elif (sys.platform == 'win32' and
+            self._max_workers + spare_workers > _MAX_WINDOWS_WORKERS):
+            raise ValueError(f"max_workers + spare_workers must be <= "
+                             f"{_MAX_WINDOWS_WORKERS}")
+        self._spare_workers = spare_workers
+
         if mp_context is None:
             if max_tasks_per_child is not None:
                 mp_context = mp.get_context("spawn")
@@ -700,8 +1077,16 @@ def __init__(self, max_workers=None, mp_context=None,
 
         if initializer is not None and not callable(initializer):
             raise TypeError("initializer must be a callable")
+        if preload is not None:
+            initializer, initargs = mp.util._setup_preload(
+                self._mp_context, preload, initializer, initargs)
         self._initializer = initializer
         self._initargs = initargs
+        # Only max_workers workers evaluate calls, the others are spares.
+        if spare_workers:
+            self._worker_slots = self._mp_context.Semaphore(self._max_workers)
+        else:
+            self._worker_slots = None
 
         if max_tasks_per_child is not None:
             if not isinstance(max_tasks_per_child, int):
@@ -715,6 +1100,26 @@ def __init__(self, max_workers=None, mp_context=None,
                                  " supply a different mp_context.")
         self._max_tasks_per_child = max_tasks_per_child
 
+        if shared_memory_threshold is not None:
+            if not isinstance(shared_memory_threshold, int):
+                raise TypeError("shared_memory_threshold must be an integer")
+            elif shared_memory_threshold <= 0:
+                raise ValueError("shared_memory_threshold must be >= 1")
+            # Fail early if shared memory is not supported.
+            from multiprocessing import resource_tracker, shared_memory  # noqa: F401
+            # Start the resource tracker before the workers, so that they
+            # share it: the segments created by a worker are unlinked by
+            # the executor.
+            if os.name == 'posix':
+                resource_tracker.ensure_running()
+            # Allow as many free segments as there can be calls in flight.
+            self._shared_memory_pool = _SharedMemoryPool(
+                shared_memory_threshold,
+                self._max_workers + EXTRA_QUEUED_CALLS)
+        else:
+            self._shared_memory_pool = None
+        self._shared_memory_threshold = shared_memory_threshold
+
         # Management thread
         self._executor_manager_thread = None
 
@@ -768,14 +1173,24 @@ def _start_executor_manager_thread(self):
             _threads_wakeups[self._executor_manager_thread] = \
                 self._executor_manager_thread_wakeup
 
-    def _adjust_process_count(self):
+    def _adjust_process_count(self, replace=False):
         # gh-132969: avoid error when state is reset and executor is still running,
         # which will happen when shutdown(wait=False) is called.
         if self._processes is None:
             return
 
-        # if there's an idle process, we don't need to spawn a new one.
-        if self._idle_worker_semaphore.acquire(blocking=False):
+        if self._spare_workers:
+            # Keep the workers and the spare workers started, so that a
+            # spare worker takes over as soon as a worker exits.
+            for _ in range(len(self._processes),
+                           self._max_workers + self._spare_workers):
+                self._spawn_process()
+            return
+
+        # if there's an idle process, we don't need to spawn a new one,
+        # unless a worker exited: the calls already in the call queue may
+        # not be submitted again to trigger the spawn.
+        if not replace and self._idle_worker_semaphore.acquire(blocking=False):
             return
 
         process_count = len(self._processes)
@@ -793,7 +1208,8 @@ def _launch_processes(self):
         assert not self._executor_manager_thread, (
                 'Processes cannot be fork()ed after the thread has started, '
                 'deadlock in the child processes could result.')
-        for _ in range(len(self._processes), self._max_workers):
+        for _ in range(len(self._processes),
+                       self._max_workers + self._spare_workers):
             self._spawn_process()
 
     def _spawn_process(self):
@@ -803,7 +1219,9 @@ def _spawn_process(self):
                   self._result_queue,
                   self._initializer,
                   self._initargs,
-                  self._max_tasks_per_child))
+                  self._max_tasks_per_child,
+                  self._shared_memory_threshold,
+                  self._worker_slots))
         p.start()
         self._processes[p.pid] = p
 
@@ -818,6 +1236,24 @@ def submit(self, fn, /, *args, **kwargs):
                                    'interpreter shutdown')
 
             f = _base.Future()
+            if self._shared_memory_pool is not None:
+                # The calls of map() are submitted in chunks.
+                chunk = (fn is _process_timed_chunk or
+                         type(fn) is partial and fn.func is _process_chunk)
+                try:
+                    dumped = self._shared_memory_pool.dump(args, kwargs,
+                                                           chunk)
+                except Exception:
+                    # The arguments are pickled through the pipe, and
+                    # the error is set on the future as usual.
+                    dumped = None
+                if dumped is not None:
+                    # The arguments are replaced by their payload, and the
+                    # segments are reused once the call is complete.
+                    args, segments = dumped
+                    kwargs = None
+                    release = self._shared_memory_pool.release
+                    f.add_done_callback(lambda f: release(segments))
             w = _WorkItem(f, fn, args, kwargs)
 
             self._pending_work_items[self._queue_count] = w
@@ -843,6 +1279,8 @@ def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None):
             chunksize: If greater than one, the iterables will be chopped into
                 chunks of size chunksize and submitted to the process pool.
                 If set to one, the items in the list will be sent one at a time.
+                If None, the chunks are sized from the observed duration of
+                the calls and submitted as the worker processes become free.
             buffersize: The number of submitted tasks whose results have not
                 yet been yielded. If the buffer is full, iteration over the
                 iterables pauses until a result is yielded from the buffer.
@@ -858,6 +1296,12 @@ def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None):
                 before the given timeout.
             Exception: If fn(*args) raises for any values.
         """
+        if chunksize is None:
+            if buffersize is not None and not isinstance(buffersize, int):
+                raise TypeError("buffersize must be an integer or None")
+            if buffersize is not None and buffersize < 1:
+                raise ValueError("buffersize must be None or > 0")
+            return _adaptive_map(self, fn, iterables, timeout, buffersize)
         if chunksize < 1:
             raise ValueError("chunksize must be >= 1.")
 
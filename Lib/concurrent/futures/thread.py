@@ -6,6 +6,7 @@
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 
 from concurrent.futures import _base
+import collections
 import itertools
 import queue
 import threading
@@ -141,6 +142,98 @@ def _worker(executor_reference, ctx, work_queue):
         ctx.finalize()
 
 
+class _WorkStealingQueue:
+    """A work queue made of one deque per worker thread.
+
+    Items are spread over the deques of the started workers in turn.  Each
+    worker takes the items of its own deque and steals the items of the
+    other deques when its own deque is empty, so the workers do not all
+    contend on a single lock.  A worker which finds no item parks on a lock
+    of its own until put() hands it a wakeup.
+
+    put() and get_nowait() can be used like the methods of
+    queue.SimpleQueue; the workers use the views returned by
+    worker_queue().
+    """
+
+    def __init__(self, max_workers):
+        self._deques = [collections.deque() for _ in range(max_workers)]
+        self._num_workers = 0
+        self._counter = itertools.count().__next__
+        # The wakeup locks of the parked workers.
+        self._parked = []
+        self._parked_lock = threading.Lock()
+
+    def worker_queue(self):
+        """Return the queue of a new worker."""
+        index = self._num_workers
+        self._num_workers += 1
+        return _WorkerQueue(self, index)
+
+    def put(self, item):
+        # Before the first worker is started, use its deque.
+        num_workers = self._num_workers or 1
+        self._deques[self._counter() % num_workers].append(item)
+        if self._parked:
+            with self._parked_lock:
+                if self._parked:
+                    self._parked.pop().release()
+
+    def get_nowait(self, start=0):
+        deques = self._deques
+        num_workers = self._num_workers or 1
+        for i in range(start, start + num_workers):
+            try:
+                return deques[i % num_workers].popleft()
+            except IndexError:
+                pass
+        raise queue.Empty
+
+    def _park(self, wakeup):
+        with self._parked_lock:
+            self._parked.append(wakeup)
+        # Look again for an item put before the worker was parked.
+        if any(self._deques):
+            with self._parked_lock:
+                try:
+                    self._parked.remove(wakeup)
+                except ValueError:
+                    # put() has already handed the wakeup to this worker.
+                    wakeup.acquire()
+            return
+        wakeup.acquire()
+
+
+class _WorkerQueue:
+    """The view of a _WorkStealingQueue used by one worker thread."""
+
+    def __init__(self, work_queue, index):
+        self._work_queue = work_queue
+        self._index = index
+        self._deque = work_queue._deques[index]
+        self._wakeup = threading.Lock()
+        self._wakeup.acquire()
+
+    def put(self, item):
+        self._work_queue.put(item)
+
+    def get_nowait(self):
+        try:
+            return self._deque.popleft()
+        except IndexError:
+            # Steal from the other workers, starting with the next one.
+            return self._work_queue.get_nowait(self._index + 1)
+
+    def get(self, block=True):
+        while True:
+            try:
+                return self.get_nowait()
+            except queue.Empty:
+                if not block:
+                    raise
+            self._work_queue._park(self._wakeup)
+
+
 class BrokenThreadPool(_base.BrokenExecutor):
     """
     Raised when a worker thread in a ThreadPoolExecutor failed initializing.
@@ -159,7 +252,8 @@ def prepare_context(cls, initializer, initargs):
         return WorkerContext.prepare(initializer, initargs)
 
     def __init__(self, max_workers=None, thread_name_prefix='',
-                 initializer=None, initargs=(), **ctxkwargs):
+                 initializer=None, initargs=(), *, work_stealing=False,
+                 **ctxkwargs):
         """Initializes a new ThreadPoolExecutor instance.
 
         Args:
@@ -168,6 +262,9 @@ def __init__(self, max_workers=None, thread_name_prefix='',
             thread_name_prefix: An optional name prefix to give our threads.
             initializer: A callable used to initialize worker threads.
             initargs: A tuple of arguments to pass to the initializer.
+            work_stealing: If true, give each worker thread a queue of its
+                own and let idle workers steal the calls queued for the
+                other workers, instead of sharing a single queue.
             ctxkwargs: Additional arguments to cls.prepare_context().
         """
         if max_workers is None:
@@ -187,7 +284,10 @@ def __init__(self, max_workers=None, thread_name_prefix='',
          ) = type(self).prepare_context(initializer, initargs, **ctxkwargs)
 
         self._max_workers = max_workers
-        self._work_queue = queue.SimpleQueue()
+        if work_stealing:
+            self._work_queue = _WorkStealingQueue(max_workers)
+        else:
+            self._work_queue = queue.SimpleQueue()
         self._idle_semaphore = threading.Semaphore(0)
         self._threads = set()
         self._broken = False
@@ -216,9 +316,33 @@ def submit(self, fn, /, *args, **kwargs):
             return f
     submit.__doc__ = _base.Executor.submit.__doc__
 
-    def _adjust_thread_count(self):
+    def submit_many(self, fn, /, *iterables):
+        resolve_task = self._resolve_work_item_task
+        work_items = [_WorkItem(_base.Future(), resolve_task(fn, args, {}))
+                      for args in zip(*iterables)]
+        with self._shutdown_lock, _global_shutdown_lock:
+            if self._broken:
+                raise self.BROKEN(self._broken)
+
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new futures after shutdown')
+            if _shutdown:
+                raise RuntimeError('cannot schedule new futures after '
+                                   'interpreter shutdown')
+
+            put = self._work_queue.put
+            for w in work_items:
+                put(w)
+            # Wake up or start the workers once for the whole batch.
+            self._adjust_thread_count(len(work_items))
+        return [w.future for w in work_items]
+    submit_many.__doc__ = _base.Executor.submit_many.__doc__
+
+    def _adjust_thread_count(self, num_items=1):
         # if idle threads are available, don't spin new threads
-        if self._idle_semaphore.acquire(timeout=0):
+        while num_items > 0 and self._idle_semaphore.acquire(timeout=0):
+            num_items -= 1
+        if num_items <= 0:
             return
 
         # When the executor gets lost, the weakref callback will wake up
@@ -227,13 +351,18 @@ def weakref_cb(_, q=self._work_queue):
             q.put(None)
 
         num_threads = len(self._threads)
-        if num_threads < self._max_workers:
+        for num_threads in range(num_threads,
+                                 min(num_threads + num_items,
+                                     self._max_workers)):
             thread_name = '%s_%d' % (self._thread_name_prefix or self,
                                      num_threads)
+            work_queue = self._work_queue
+            if isinstance(work_queue, _WorkStealingQueue):
+                work_queue = work_queue.worker_queue()
             t = threading.Thread(name=thread_name, target=_worker,
                                  args=(weakref.ref(self, weakref_cb),
                                        self._create_worker_context(),
-                                       self._work_queue))
+                                       work_queue))
             t.start()
             self._threads.add(t)
             _threads_queues[t] = self._work_queue
@@ -63,6 +63,8 @@ class excel:
         written as two quotes
 """
 
+import os
+import sys
 import types
 from _csv import Error, writer, reader, register_dialect, \
                  unregister_dialect, get_dialect, list_dialects, \
@@ -78,8 +80,8 @@ class excel:
            "Error", "Dialect", "excel", "excel_tab",
            "field_size_limit", "reader", "writer",
            "register_dialect", "get_dialect", "list_dialects", "Sniffer",
-           "unregister_dialect", "DictReader", "DictWriter",
-           "unix_dialect"]
+           "unregister_dialect", "DictReader", "DictWriter", "TupleReader",
+           "unix_dialect", "parallel_reader"]
 
 
 class Dialect:
@@ -147,6 +149,8 @@ def __init__(self, f, fieldnames=None, restkey=None, restval=None,
         self._fieldnames = fieldnames   # list of keys for the dict
         self.restkey = restkey          # key to catch long rows
         self.restval = restval          # default value for short rows
+        # The converters are not applied to the header row.
+        self._converters = kwds.pop("converters", None)
         self.reader = reader(f, dialect, *args, **kwds)
         self.dialect = dialect
         self.line_num = 0
@@ -161,6 +165,9 @@ def fieldnames(self):
                 self._fieldnames = next(self.reader)
             except StopIteration:
                 pass
+        if self._converters is not None:
+            self.reader.converters = self._converters
+            self._converters = None
         self.line_num = self.reader.line_num
         return self._fieldnames
 
@@ -193,6 +200,51 @@ def __next__(self):
     __class_getitem__ = classmethod(types.GenericAlias)
 
 
+class TupleReader(DictReader):
+    """Read rows as named tuples, or as plain tuples if named is false.
+
+    Short rows are padded with restval, and rows with more fields than
+    fieldnames raise Error.
+    """
+
+    def __init__(self, f, fieldnames=None, restval=None, dialect="excel",
+                 *args, named=True, **kwds):
+        super().__init__(f, fieldnames, None, restval, dialect, *args, **kwds)
+        self.named = named
+        self._rowtype_fieldnames = None
+        self._rowtype = None
+
+    @property
+    def rowtype(self):
+        """The type of the rows, created from fieldnames."""
+        fieldnames = self.fieldnames
+        if fieldnames is not self._rowtype_fieldnames:
+            if self.named and fieldnames is not None:
+                from collections import namedtuple
+                self._rowtype = namedtuple("Row", fieldnames, rename=True)
+            else:
+                self._rowtype = tuple
+            self._rowtype_fieldnames = fieldnames
+        return self._rowtype
+
+    def __next__(self):
+        rowtype = self.rowtype
+        row = next(self.reader)
+        self.line_num = self.reader.line_num
+
+        while row == []:
+            row = next(self.reader)
+        lf = len(self._fieldnames)
+        lr = len(row)
+        if lf > lr:
+            row += [self.restval] * (lf - lr)
+        elif lf < lr:
+            raise Error("expected %d fields, got %d" % (lf, lr))
+        if rowtype is tuple:
+            return tuple(row)
+        return rowtype._make(row)
+
+
 class DictWriter:
     def __init__(self, f, fieldnames, restval="", extrasaction="raise",
                  dialect="excel", *args, **kwds):
@@ -228,6 +280,121 @@ def writerows(self, rowdicts):
     __class_getitem__ = classmethod(types.GenericAlias)
 
 
+def _record_chunks(f, size, quotechar):
+    # Yield chunks of about size characters which end at the end of a
+    # record, i.e. at a newline which is not inside a quoted field.  The
+    # last chunk is held back until more data is read, so that a trailing
+    # partial line is not parsed on its own.
+    buf = ''
+    chunk = ''
+    # Whether buf holds an odd number of quote characters.
+    odd = False
+    while True:
+        data = f.read(size)
+        if not data:
+            if chunk or buf:
+                yield chunk + buf
+            return
+        if chunk:
+            yield chunk
+            chunk = ''
+        # The newlines before scanned were already found to be inside a
+        # quoted field, so only the newly read text is scanned.
+        scanned = len(buf)
+        buf += data
+        end = buf.rfind('\n', scanned)
+        if quotechar:
+            # Every chunk starts outside of a quoted field, so a newline
+            # is outside of a quoted field if it is preceded by an even
+            # number of quote characters.
+            if end >= 0:
+                quotes = odd + buf.count(quotechar, scanned, end)
+                while end >= 0 and quotes % 2:
+                    start = buf.rfind('\n', scanned, end)
+                    if start >= 0:
+                        quotes -= buf.count(quotechar, start + 1, end)
+                    end = start
+            # The text before a record end holds an even number of quote
+            # characters, so cutting it off keeps the parity.
+            odd = (odd + data.count(quotechar)) % 2
+        if end >= 0:
+            chunk = buf[:end + 1]
+            buf = buf[end + 1:]
+
+
+def parallel_reader(f, /, dialect="excel", *, chunk_size=1 << 20,
+                    max_workers=None, columns=False, types=None,
+                    converters=None, **fmtparams):
+    """Read the CSV text file f in chunks parsed by a pool of threads.
+
+    The input is split into chunks of about chunk_size characters at
+    the ends of the records, and the chunks are parsed concurrently.
+    Return an iterator over the records, or if columns is true, over the
+    result of reader.read_columns(types=types) for every chunk.
+    """
+    if types is not None and not columns:
+        raise TypeError("types requires columns=True")
+    rdialect = reader((), dialect, **fmtparams).dialect
+    if max_workers is None:
+        # Parsing holds the GIL, so threads only help on the
+        # free-threaded build.
+        if sys._is_gil_enabled():
+            max_workers = 1
+        else:
+            max_workers = os.process_cpu_count() or 1
+    if max_workers <= 0:
+        raise ValueError("max_workers must be greater than 0")
+    return _parallel_reader(f, rdialect, chunk_size, max_workers, columns,
+                            types, converters)
+
+
+def _parallel_reader(f, rdialect, chunk_size, max_workers, columns, types,
+                     converters):
+    if rdialect.escapechar is not None:
+        # An escaped newline or quote character cannot be recognized
+        # without parsing the input from its start.
+        chunks = (f.read(),)
+    else:
+        quotechar = (rdialect.quotechar
+                     if rdialect.quoting != QUOTE_NONE else None)
+        chunks = _record_chunks(f, chunk_size, quotechar)
+
+    def parse(chunk):
+        r = reader(StringIO(chunk, newline=''), rdialect,
+                   converters=converters)
+        if columns:
+            return r.read_columns(types=types)
+        return list(r)
+
+    if max_workers == 1:
+        for chunk in chunks:
+            yield from _chunk_result(parse(chunk), columns)
+        return
+
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+    executor = ThreadPoolExecutor(max_workers)
+    try:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(parse, chunk))
+            if len(pending) > 2 * max_workers:
+                yield from _chunk_result(pending.popleft().result(),
+                                         columns)
+        while pending:
+            yield from _chunk_result(pending.popleft().result(), columns)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _chunk_result(result, columns):
+    if columns:
+        if result:
+            yield result
+    else:
+        yield from result
+
+
 class Sniffer:
     '''
     "Sniffs" the format of a CSV file (i.e. delimiter, quotechar)
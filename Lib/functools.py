@@ -12,7 +12,7 @@
 __all__ = ['update_wrapper', 'wraps', 'WRAPPER_ASSIGNMENTS', 'WRAPPER_UPDATES',
            'total_ordering', 'cache', 'cmp_to_key', 'lru_cache', 'reduce',
            'partial', 'partialmethod', 'singledispatch', 'singledispatchmethod',
-           'cached_property', 'Placeholder']
+           'cached_property', 'Placeholder', 'policy_cache']
 
 from abc import get_cache_token
 from collections import namedtuple
@@ -552,7 +552,7 @@ def _make_key(args, kwds, typed,
         return key[0]
     return key
 
-def lru_cache(maxsize=128, typed=False):
+def lru_cache(maxsize=128, typed=False, *, shards=1):
     """Least-recently-used cache decorator.
 
     If *maxsize* is set to None, the LRU features are disabled and the cache
@@ -563,6 +563,11 @@ def lru_cache(maxsize=128, typed=False):
     distinct calls with distinct results. Some types such as str and int may
     be cached separately even when typed is false.
 
+    If *shards* is greater than 1, the cache is split into that many
+    independently locked caches selected by the hash of the arguments, which
+    reduces contention between threads.  Each shard evicts its own least
+    recently used entries.
+
     Arguments to the cached function must be hashable.
 
     View the cache statistics named tuple (hits, misses, maxsize, currsize)
@@ -578,6 +583,11 @@ def lru_cache(maxsize=128, typed=False):
     # The internals of the lru_cache are encapsulated for thread safety and
     # to allow the implementation to change (including a possible C version).
 
+    if not isinstance(shards, int):
+        raise TypeError('shards must be an integer')
+    if shards < 1:
+        raise ValueError('shards must be greater than 0')
+
     if isinstance(maxsize, int):
         # Negative maxsize is treated as 0
         if maxsize < 0:
@@ -586,8 +596,12 @@ def lru_cache(maxsize=128, typed=False):
     elif callable(maxsize) and isinstance(typed, bool):
         # The user_function was passed in directly via the maxsize argument
         user_function, maxsize = maxsize, 128
-        wrapper = _lru_cache_wrapper(user_function, maxsize, typed, _CacheInfo)
-        wrapper.cache_parameters = lambda : {'maxsize': maxsize, 'typed': typed}
+        wrapper = _lru_cache_wrapper(user_function, maxsize, typed, _CacheInfo,
+                                     shards=shards)
+        # Report the number of shards actually used.
+        nshards = wrapper._shards
+        wrapper.cache_parameters = lambda : _cache_parameters(maxsize, typed,
+                                                              nshards)
         return update_wrapper(wrapper, user_function)
 
     elif maxsize is not None:
@@ -595,15 +609,37 @@ def lru_cache(maxsize=128, typed=False):
             'Expected first argument to be an integer, a callable, or None')
 
     def decorating_function(user_function):
-        wrapper = _lru_cache_wrapper(user_function, maxsize, typed, _CacheInfo)
-        wrapper.cache_parameters = lambda : {'maxsize': maxsize, 'typed': typed}
+        wrapper = _lru_cache_wrapper(user_function, maxsize, typed, _CacheInfo,
+                                     shards=shards)
+        # Report the number of shards actually used.
+        nshards = wrapper._shards
+        wrapper.cache_parameters = lambda : _cache_parameters(maxsize, typed,
+                                                              nshards)
         return update_wrapper(wrapper, user_function)
 
     return decorating_function
 
-def _lru_cache_wrapper(user_function, maxsize, typed, _CacheInfo):
+def _cache_parameters(maxsize, typed, shards):
+    parameters = {'maxsize': maxsize, 'typed': typed}
+    if shards != 1:
+        parameters['shards'] = shards
+    return parameters
+
+def _lru_cache_wrapper(user_function, maxsize, typed, _CacheInfo, shards=1,
+                       *, _make_key=_make_key):
     if not callable(user_function):
         raise TypeError("the first argument must be callable")
+    if not isinstance(shards, int):
+        raise TypeError("shards must be an integer")
+    if shards < 1:
+        raise ValueError("shards must be greater than 0")
+
+    # Every shard of a bounded cache holds at least one entry.
+    if maxsize is not None and shards > maxsize:
+        shards = maxsize
+    if shards > 1:
+        return _sharded_lru_cache_wrapper(user_function, maxsize, typed,
+                                          _CacheInfo, shards)
 
     # Constants shared by all lru cache instances:
     sentinel = object()          # unique object used to signal cache misses
@@ -732,6 +768,52 @@ def cache_clear():
 
     wrapper.cache_info = cache_info
     wrapper.cache_clear = cache_clear
+    wrapper._shards = 1
+    return wrapper
+
+def _sharded_lru_cache_wrapper(user_function, maxsize, typed, _CacheInfo,
+                               shards):
+    # Independent caches, each with its own lock, selected by the hash of
+    # the key.  The maxsize is split as evenly as possible between them.
+    if maxsize is None:
+        sizes = [None] * shards
+    else:
+        q, r = divmod(maxsize, shards)
+        sizes = [q + 1] * r + [q] * (shards - r)
+
+    # The caches are called with the key already built by the wrapper.
+    def call(key, args, kwds):
+        return user_function(*args, **kwds)
+    def get_key(args, kwds, typed):
+        return args[0]
+    caches = [_lru_cache_wrapper(call, size, typed, _CacheInfo,
+                                 _make_key=get_key)
+              for size in sizes]
+    make_key = _make_key
+
+    def wrapper(*args, **kwds):
+        key = make_key(args, kwds, typed)
+        # The dicts of the caches index the keys by the low bits of their
+        # hash, so pick the cache from the high bits of the mixed hash.
+        mixed = (hash(key) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        return caches[((mixed >> 32) * shards) >> 32](key, args, kwds)
+
+    def cache_info():
+        """Report cache statistics"""
+        infos = [cache.cache_info() for cache in caches]
+        return _CacheInfo(sum(info.hits for info in infos),
+                          sum(info.misses for info in infos),
+                          maxsize,
+                          sum(info.currsize for info in infos))
+
+    def cache_clear():
+        """Clear the cache and cache statistics"""
+        for cache in caches:
+            cache.cache_clear()
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    wrapper._shards = shards
     return wrapper
 
 try:
@@ -749,6 +831,339 @@ def cache(user_function, /):
     return lru_cache(maxsize=None)(user_function)
 
 
+################################################################################
+### policy_cache() - cache with expiration, weights and eviction policies
+################################################################################
+
+_PolicyCacheInfo = namedtuple("PolicyCacheInfo",
+                              ("hits", "misses", "maxsize", "currsize",
+                               "evictions", "expirations"))
+
+class _PolicyCache:
+    """Mapping of keys to results used by policy_cache().
+
+    Entries are lists [result, weight, expiration time, segment].  With the
+    "lru" policy there is a single segment ordered by recency.  The "tinylfu"
+    policy (W-TinyLFU) uses a small LRU "window" segment in front of a
+    segmented LRU main area (a "probation" and a "protected" segment); an
+    entry leaving the window is only admitted to the main area if it has been
+    requested more often than the entry it would displace, as estimated by a
+    count-min sketch of recent key frequencies.  This keeps frequently used
+    entries from being flushed by scans of keys used only once.
+
+    The entries dict is kept in order of insertion, which is also the order
+    of expiration, so that expired entries can be purged from its front.
+
+    The caller must hold a lock around all method calls.
+    """
+
+    _WINDOW, _PROBATION, _PROTECTED = range(3)
+
+    def __init__(self, maxsize, ttl, weigher, policy, timer):
+        from collections import OrderedDict
+        if timer is None:
+            from time import monotonic as timer
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.weigher = weigher
+        self.timer = timer
+        self.tinylfu = policy == 'tinylfu'
+        self.entries = {}
+        # One OrderedDict of keys per segment, least recently used first.
+        self.segments = [OrderedDict(), OrderedDict(), OrderedDict()]
+        self.weights = [0, 0, 0]
+        if self.tinylfu:
+            self.window_size = max(maxsize // 100, 1)
+            self.protected_size = (maxsize - self.window_size) * 4 // 5
+            # The sketch has four rows of counters saturating at 15, which
+            # are all halved after a number of increments proportional to
+            # its size so that old popularity fades out.
+            width = 1 << max(4, min(maxsize, 1 << 20).bit_length())
+            self.mask = width - 1
+            self.sketch = [0] * (4 * width)
+            self.additions = 0
+            self.sample_size = 10 * width
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def info(self):
+        return (self.hits, self.misses, self.maxsize, sum(self.weights),
+                self.evictions, self.expirations)
+
+    def clear(self):
+        self.entries.clear()
+        for segment in self.segments:
+            segment.clear()
+        self.weights = [0, 0, 0]
+        if self.tinylfu:
+            self.sketch = [0] * len(self.sketch)
+            self.additions = 0
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def now(self):
+        # Return the current time if entries expire, else None.
+        return None if self.ttl is None else self.timer()
+
+    def _indexes(self, key):
+        h = hash(key) & 0xFFFFFFFFFFFFFFFF
+        mask = self.mask
+        width = mask + 1
+        return (h & mask,
+                width + (((h >> 16) ^ (h * 0x9E3779B1)) & mask),
+                2 * width + (((h >> 32) ^ (h * 0x85EBCA77)) & mask),
+                3 * width + (((h >> 48) ^ (h * 0xC2B2AE3D)) & mask))
+
+    def _increment(self, key):
+        sketch = self.sketch
+        for i in self._indexes(key):
+            if sketch[i] < 15:
+                sketch[i] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self.sketch = [c >> 1 for c in sketch]
+            self.additions //= 2
+
+    def _frequency(self, key):
+        sketch = self.sketch
+        return min(sketch[i] for i in self._indexes(key))
+
+    def _unlink(self, key, entry):
+        del self.segments[entry[3]][key]
+        self.weights[entry[3]] -= entry[1]
+
+    def _link(self, key, entry, segment):
+        entry[3] = segment
+        self.segments[segment][key] = None
+        self.weights[segment] += entry[1]
+
+    def _remove(self, key):
+        entry = self.entries.pop(key)
+        self._unlink(key, entry)
+        return entry
+
+    def _move(self, key, segment):
+        entry = self.entries[key]
+        self._unlink(key, entry)
+        self._link(key, entry, segment)
+
+    def _purge(self, now):
+        # Drop the expired entries, which are at the front of the entries.
+        entries = self.entries
+        while entries:
+            key = next(iter(entries))
+            if entries[key][2] > now:
+                break
+            self._remove(key)
+            self.expirations += 1
+
+    def get(self, key, now, default=None):
+        if self.tinylfu:
+            self._increment(key)
+        if now is not None:
+            self._purge(now)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        if now is not None and entry[2] <= now:
+            # Only reached if the timer went backwards.
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self.hits += 1
+        segment = entry[3]
+        if segment == self._PROBATION:
+            # Promote to the protected segment, demoting its least recently
+            # used entries to probation if it gets too large.
+            self._move(key, self._PROTECTED)
+            protected = self.segments[self._PROTECTED]
+            while (self.weights[self._PROTECTED] > self.protected_size
+                   and len(protected) > 1):
+                self._move(next(iter(protected)), self._PROBATION)
+        else:
+            self.segments[segment].move_to_end(key)
+        return entry[0]
+
+    def put(self, key, result, weight, now):
+        if weight < 0:
+            raise ValueError("weigher returned a negative weight")
+        maxsize = self.maxsize
+        if now is not None:
+            self._purge(now)
+        if key in self.entries:
+            self._remove(key)
+        if maxsize is not None and weight > maxsize:
+            # Too large to ever fit in the cache.
+            self.evictions += 1
+            return
+        expires = None if now is None else now + self.ttl
+        entry = [result, weight, expires, None]
+        self.entries[key] = entry
+        self._link(key, entry, self._WINDOW)
+        window = self.segments[self._WINDOW]
+        if not self.tinylfu:
+            if maxsize is not None:
+                while self.weights[self._WINDOW] > maxsize:
+                    self._evict(next(iter(window)), now)
+            return
+        while self.weights[self._WINDOW] > self.window_size:
+            self._admit(next(iter(window)), now)
+
+    def _evict(self, key, now):
+        # Drop an entry to make room.
+        entry = self._remove(key)
+        if now is not None and entry[2] <= now:
+            self.expirations += 1
+        else:
+            self.evictions += 1
+
+    def _admit(self, key, now):
+        # Move an entry leaving the window to the main area if it is more
+        # popular than the entries which have to be evicted to make room.
+        weight = self.entries[key][1]
+        main_size = self.maxsize - self.window_size
+        probation = self.segments[self._PROBATION]
+        protected = self.segments[self._PROTECTED]
+        victims = []
+        room = main_size - self.weights[self._PROBATION] - \
+            self.weights[self._PROTECTED]
+        for segment in (probation, protected):
+            for victim in segment:
+                if room >= weight:
+                    break
+                victims.append(victim)
+                room += self.entries[victim][1]
+        if room < weight:
+            admit = False
+        elif victims:
+            frequency = self._frequency(key)
+            admit = all(frequency > self._frequency(victim)
+                        for victim in victims)
+        else:
+            admit = True
+        if admit:
+            for victim in victims:
+                self._evict(victim, now)
+            self._move(key, self._PROBATION)
+        else:
+            self._evict(key, now)
+
+
+def _check_policy_cache_args(maxsize, ttl, weigher, policy, timer):
+    # Validate the arguments of policy_cache() and return the normalized
+    # maxsize and timer.
+    if maxsize is not None:
+        # Negative maxsize is treated as 0
+        if maxsize < 0:
+            maxsize = 0
+    if ttl is not None and ttl <= 0:
+        raise ValueError('ttl must be greater than 0')
+    if weigher is not None and not callable(weigher):
+        raise TypeError('weigher must be callable')
+    if policy not in ('lru', 'tinylfu'):
+        raise ValueError(f'unknown cache policy: {policy!r}')
+    if policy == 'tinylfu' and maxsize is None:
+        raise ValueError('the tinylfu policy requires a maxsize')
+    if timer is None:
+        from time import monotonic as timer
+    return maxsize, timer
+
+def policy_cache(maxsize=128, *, typed=False, ttl=None, weigher=None,
+                 policy='lru', timer=None):
+    """Memoizing cache decorator with expiration and eviction policies.
+
+    Up to *maxsize* results are kept; if *weigher* is given, it is called
+    with each result and the sum of the returned integer weights is bounded
+    by *maxsize* instead.  If *maxsize* is None, the cache can grow without
+    bound.  If *ttl* is not None, results expire that many seconds after
+    they were computed, as measured by *timer* (time.monotonic() by default).
+
+    *policy* selects the entries evicted when the cache is full: "lru"
+    evicts the least recently used entries, "tinylfu" uses the W-TinyLFU
+    policy which also takes the frequency of use into account and resists
+    scans.  *typed* has the same meaning as for lru_cache().
+
+    View the cache statistics named tuple (hits, misses, maxsize, currsize,
+    evictions, expirations) with f.cache_info().  Clear the cache and
+    statistics with f.cache_clear().  Access the underlying function with
+    f.__wrapped__.
+    """
+    if callable(maxsize) and isinstance(typed, bool):
+        # The user_function was passed in directly via the maxsize argument
+        return policy_cache(typed=typed, ttl=ttl, weigher=weigher,
+                            policy=policy, timer=timer)(maxsize)
+    elif maxsize is not None and not isinstance(maxsize, int):
+        raise TypeError(
+            'Expected first argument to be an integer, a callable, or None')
+
+    # The wrappers read the monotonic clock directly if timer is None.
+    wrapper_timer = timer
+    maxsize, timer = _check_policy_cache_args(maxsize, ttl, weigher, policy,
+                                              timer)
+
+    def decorating_function(user_function):
+        wrapper = _policy_cache_wrapper(user_function, maxsize, typed, ttl,
+                                        weigher, policy, wrapper_timer,
+                                        _PolicyCacheInfo)
+        wrapper.cache_parameters = lambda : {
+            'maxsize': maxsize, 'typed': typed, 'ttl': ttl,
+            'weigher': weigher, 'policy': policy, 'timer': timer}
+        return update_wrapper(wrapper, user_function)
+
+    return decorating_function
+
+def _policy_cache_wrapper(user_function, maxsize, typed, ttl, weigher,
+                          policy, timer, _PolicyCacheInfo):
+    from operator import index
+    sentinel = object()
+    make_key = _make_key
+    cache = _PolicyCache(maxsize, ttl, weigher, policy, timer)
+    now = cache.now
+    lock = RLock()
+
+    if maxsize == 0:
+
+        def wrapper(*args, **kwds):
+            with lock:
+                cache.misses += 1
+            return user_function(*args, **kwds)
+
+    else:
+
+        def wrapper(*args, **kwds):
+            key = make_key(args, kwds, typed)
+            time = now()
+            with lock:
+                result = cache.get(key, time, sentinel)
+            if result is not sentinel:
+                return result
+            result = user_function(*args, **kwds)
+            weight = 1 if weigher is None else index(weigher(result))
+            time = now()
+            with lock:
+                cache.put(key, result, weight, time)
+            return result
+
+    def cache_info():
+        """Report cache statistics"""
+        with lock:
+            return _PolicyCacheInfo(*cache.info())
+
+    def cache_clear():
+        """Clear the cache and cache statistics"""
+        with lock:
+            cache.clear()
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    return wrapper
+
+try:
+    from _functools import _policy_cache_wrapper
+except ImportError:
+    pass
+
+
 ################################################################################
 ### singledispatch() - single-dispatch generic function decorator
 ################################################################################
@@ -15,7 +15,8 @@
 import zlib
 from compression._common import _streams
 
-__all__ = ["BadGzipFile", "GzipFile", "open", "compress", "decompress"]
+__all__ = ["BadGzipFile", "GzipFile", "GzipIndex", "open", "compress",
+           "decompress"]
 
 FTEXT, FHCRC, FEXTRA, FNAME, FCOMMENT = 1, 2, 4, 8, 16
 
@@ -29,9 +30,19 @@
 READ_BUFFER_SIZE = 128 * 1024
 _WRITE_BUFFER_SIZE = 4 * io.DEFAULT_BUFFER_SIZE
 
+# Default distance between access points of a GzipIndex, in bytes of
+# uncompressed data, and the size of the deflate window saved with each.
+_INDEX_SPACING = 1024 * 1024
+_WINDOW_SIZE = 32 * 1024
+
+# Size of the blocks of uncompressed data compressed by each thread when
+# compressing with multiple workers.
+_PARALLEL_BLOCK_SIZE = 128 * 1024
+
 
 def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_TRADEOFF,
-         encoding=None, errors=None, newline=None):
+         encoding=None, errors=None, newline=None, *, index=None,
+         workers=None):
     """Open a gzip-compressed file in binary or text mode.
 
     The filename argument can be an actual filename (a str or bytes object), or
@@ -42,8 +53,9 @@ def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_TRADEOFF,
     "rb", and the default compresslevel is 9.
 
     For binary mode, this function is equivalent to the GzipFile constructor:
-    GzipFile(filename, mode, compresslevel). In this case, the encoding, errors
-    and newline arguments must not be provided.
+    GzipFile(filename, mode, compresslevel, index=index, workers=workers).
+    In this case, the encoding, errors and newline arguments must not be
+    provided.
 
     For text mode, a GzipFile object is created, and wrapped in an
     io.TextIOWrapper instance with the specified encoding, error handling
@@ -63,9 +75,11 @@ def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_TRADEOFF,
 
     gz_mode = mode.replace("t", "")
     if isinstance(filename, (str, bytes, os.PathLike)):
-        binary_file = GzipFile(filename, gz_mode, compresslevel)
+        binary_file = GzipFile(filename, gz_mode, compresslevel,
+                               index=index, workers=workers)
     elif hasattr(filename, "read") or hasattr(filename, "write"):
-        binary_file = GzipFile(None, gz_mode, compresslevel, filename)
+        binary_file = GzipFile(None, gz_mode, compresslevel, filename,
+                               index=index, workers=workers)
     else:
         raise TypeError("filename must be a str or bytes object, or a file")
 
@@ -118,6 +132,11 @@ def seek(self, off):
         self._buffer = None
         return self.file.seek(off)
 
+    def tell(self):
+        if self._read is None:
+            return self.file.tell()
+        return self.file.tell() - (self._length - self._read)
+
     def seekable(self):
         return True  # Allows fast-forwarding even in unseekable streams
 
@@ -158,7 +177,8 @@ class GzipFile(_streams.BaseStream):
     myfileobj = None
 
     def __init__(self, filename=None, mode=None,
-                 compresslevel=_COMPRESS_LEVEL_TRADEOFF, fileobj=None, mtime=None):
+                 compresslevel=_COMPRESS_LEVEL_TRADEOFF, fileobj=None, mtime=None,
+                 *, index=None, workers=None):
         """Constructor for the GzipFile class.
 
         At least one of fileobj and filename must be given a
@@ -191,6 +211,13 @@ def __init__(self, filename=None, mode=None,
         If mtime is omitted or None, the current time is used. Use mtime = 0
         to generate a compressed stream that does not depend on creation time.
 
+        The optional index argument is a GzipIndex previously built for the
+        same file, which is used to speed up seeking when reading.
+
+        If workers is greater than 1, data is compressed in blocks by a pool
+        of that many threads when writing.  The output is still a single
+        gzip member, slightly larger than with a single thread.
+
         """
 
         # Ensure attributes exist at __del__
@@ -202,6 +229,8 @@ def __init__(self, filename=None, mode=None,
             raise ValueError("Invalid mode: {!r}".format(mode))
         if mode and 'b' not in mode:
             mode += 'b'
+        if workers is not None and workers <= 0:
+            raise ValueError("workers must be greater than 0")
 
         try:
             if fileobj is None:
@@ -220,6 +249,8 @@ def __init__(self, filename=None, mode=None,
             if mode.startswith('r'):
                 self.mode = READ
                 raw = _GzipReader(fileobj)
+                if index is not None:
+                    raw._set_index(index)
                 self._buffer = io.BufferedReader(raw)
                 self.name = filename
 
@@ -233,17 +264,25 @@ def __init__(self, filename=None, mode=None,
                         FutureWarning, 2)
                 self.mode = WRITE
                 self._init_write(filename)
-                self.compress = zlib.compressobj(compresslevel,
-                                                 zlib.DEFLATED,
-                                                 -zlib.MAX_WBITS,
-                                                 zlib.DEF_MEM_LEVEL,
-                                                 0)
+                if workers is None or workers == 1:
+                    self.compress = zlib.compressobj(compresslevel,
+                                                     zlib.DEFLATED,
+                                                     -zlib.MAX_WBITS,
+                                                     zlib.DEF_MEM_LEVEL,
+                                                     0)
+                else:
+                    self.compress = _ParallelCompressor(compresslevel,
+                                                        workers)
                 self._write_mtime = mtime
                 self._buffer_size = _WRITE_BUFFER_SIZE
                 self._buffer = io.BufferedWriter(_WriteBufferStream(self),
                                                  buffer_size=self._buffer_size)
             else:
                 raise ValueError("Invalid mode: {!r}".format(mode))
+            if index is not None and self.mode != READ:
+                raise ValueError("index is only supported for reading")
+            if workers is not None and self.mode != WRITE:
+                raise ValueError("workers is only supported for writing")
 
             self.fileobj = fileobj
 
@@ -330,7 +369,10 @@ def _write_raw(self, data):
         if length > 0:
             self.fileobj.write(self.compress.compress(data))
             self.size += length
-            self.crc = zlib.crc32(data, self.crc)
+            if not isinstance(self.compress, _ParallelCompressor):
+                # The parallel compressor computes the CRC of each block
+                # in its worker threads.
+                self.crc = zlib.crc32(data, self.crc)
             self.offset += length
 
         return length
@@ -386,6 +428,8 @@ def close(self):
             if self.mode == WRITE:
                 self._buffer.flush()
                 fileobj.write(self.compress.flush())
+                if isinstance(self.compress, _ParallelCompressor):
+                    self.crc = self.compress.crc
                 write32u(fileobj, self.crc)
                 # self.size may exceed 2 GiB, or even 4 GiB
                 write32u(fileobj, self.size & 0xffffffff)
@@ -396,6 +440,9 @@ def close(self):
 
     def _close(self):
         self.fileobj = None
+        compress = getattr(self, 'compress', None)
+        if isinstance(compress, _ParallelCompressor):
+            compress.close()
         myfileobj = self.myfileobj
         if myfileobj is not None:
             self.myfileobj = None
@@ -417,6 +464,27 @@ def fileno(self):
         """
         return self.fileobj.fileno()
 
+    def build_index(self, spacing=_INDEX_SPACING):
+        """Build a GzipIndex of the whole file and use it for seeking.
+
+        An access point is recorded about every *spacing* bytes of
+        uncompressed data, so that seek() never has to decompress more than
+        that to reach any position.  The index is returned so that it can
+        be saved and reused with later GzipFile objects for the same file.
+        """
+        self._check_not_closed()
+        self._check_read("build_index")
+        if spacing <= 0:
+            raise ValueError("spacing must be greater than 0")
+        fileobj = self.fileobj
+        pos = fileobj.tell()
+        try:
+            index = _build_index(fileobj, spacing)
+        finally:
+            fileobj.seek(pos)
+        self._buffer.raw._set_index(index)
+        return index
+
     def rewind(self):
         '''Return the uncompressed stream file position indicator to the
         beginning of the file'''
@@ -468,6 +536,110 @@ def __del__(self):
 
         super().__del__()
 
+def _compress_block(data, level, zdict, last):
+    if zdict:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS,
+                                      zlib.DEF_MEM_LEVEL, 0, zdict)
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS,
+                                      zlib.DEF_MEM_LEVEL, 0)
+    output = compressor.compress(data)
+    output += compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+    return output, zlib.crc32(data), len(data)
+
+
+class _ParallelCompressor:
+    """Raw deflate compressor using a pool of threads.
+
+    The input is split in blocks which are compressed independently, each
+    with the end of the previous block as preset dictionary and ending
+    with a sync flush, so that the outputs concatenate to a single deflate
+    stream.  The CRC-32 of the blocks are combined in the crc attribute.
+    It supports the compress() and flush() methods of zlib.compressobj().
+    """
+
+    def __init__(self, level, workers, block_size=_PARALLEL_BLOCK_SIZE):
+        from concurrent.futures import ThreadPoolExecutor
+        self._level = level
+        self._block_size = block_size
+        self._executor = ThreadPoolExecutor(workers)
+        # Bound the amount of data held in memory by unfinished blocks:
+        # compress() waits for the oldest block before submitting another.
+        self._max_pending = 2 * workers
+        self._pending = []
+        self._buffer = bytearray()
+        self._zdict = b""
+        self.crc = zlib.crc32(b"")
+
+    def _submit(self, data, last=False):
+        future = self._executor.submit(_compress_block, data, self._level,
+                                       self._zdict, last)
+        self._pending.append(future)
+        self._zdict = data[-_WINDOW_SIZE:]
+
+    def _collect(self, wait):
+        # Return the output of the finished blocks, in order.
+        chunks = []
+        done = 0
+        for future in self._pending:
+            if not (wait or len(self._pending) - done >= self._max_pending
+                    or future.done()):
+                break
+            output, crc, length = future.result()
+            self.crc = zlib.crc32_combine(self.crc, crc, length)
+            chunks.append(output)
+            done += 1
+        del self._pending[:done]
+        return b"".join(chunks)
+
+    def compress(self, data):
+        size = self._block_size
+        buffer = self._buffer
+        chunks = []
+        with memoryview(data) as view, view.cast('B') as view:
+            start = 0
+            if buffer:
+                # Complete the block started by the previous calls.
+                start = min(size - len(buffer), len(view))
+                buffer += view[:start]
+                if len(buffer) < size:
+                    return self._collect(False)
+                block = bytes(buffer)
+                buffer.clear()
+                if len(self._pending) >= self._max_pending:
+                    chunks.append(self._collect(False))
+                self._submit(block)
+            # The other blocks are sliced from the data, so that a large
+            # write is neither copied at once nor queued at once.
+            while len(view) - start >= size:
+                if len(self._pending) >= self._max_pending:
+                    chunks.append(self._collect(False))
+                self._submit(bytes(view[start:start + size]))
+                start += size
+            buffer += view[start:]
+        chunks.append(self._collect(False))
+        return b"".join(chunks)
+
+    def flush(self, mode=zlib.Z_FINISH):
+        if mode == zlib.Z_NO_FLUSH:
+            return self._collect(False)
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        if mode == zlib.Z_FINISH:
+            self._submit(data, last=True)
+        elif data:
+            self._submit(data)
+        if mode == zlib.Z_FULL_FLUSH:
+            self._zdict = b""
+        output = self._collect(True)
+        if mode == zlib.Z_FINISH:
+            self.close()
+        return output
+
+    def close(self):
+        self._executor.shutdown(cancel_futures=True)
+
+
 def _read_exact(fp, n):
     '''Read exactly *n* bytes from `fp`
 
@@ -521,6 +693,143 @@ def _read_gzip_header(fp):
     return last_mtime
 
 
+class GzipIndex:
+    """Index of access points into a gzip file.
+
+    An access point records the state needed to resume decompression at
+    some offset of the uncompressed data: the position in the compressed
+    stream and the last 32 KiB of uncompressed data of the member.  Use
+    GzipFile.build_index() to create an index and pass it as the index
+    argument of GzipFile to seek quickly within a large file.
+    """
+
+    _HEADER = struct.Struct("<8sHQQQQ")
+    _POINT = struct.Struct("<QQbI")
+    _MAGIC = b"PyGzIdx\0"
+    _VERSION = 1
+
+    def __init__(self, points, spacing, size, compressed_size):
+        # Each point is a tuple (uncompressed offset, compressed offset,
+        # bits, window); window is None for the start of a member, bits
+        # is the number of bits of the preceding byte that belong to the
+        # deflate block starting at the point.
+        self._points = points
+        self._offsets = [point[0] for point in points]
+        self.spacing = spacing
+        self.size = size
+        self.compressed_size = compressed_size
+
+    def __repr__(self):
+        return "<%s size=%d points=%d>" % (self.__class__.__name__,
+                                           self.size, len(self._points))
+
+    def __len__(self):
+        return len(self._points)
+
+    def _find(self, offset):
+        """Return the last access point at or before *offset*."""
+        from bisect import bisect_right
+        i = bisect_right(self._offsets, offset)
+        return self._points[i - 1] if i else None
+
+    def save(self, file):
+        """Write the index to *file*, a path or a binary file object."""
+        if isinstance(file, (str, bytes, os.PathLike)):
+            with builtins.open(file, "wb") as f:
+                self.save(f)
+            return
+        file.write(self._HEADER.pack(self._MAGIC, self._VERSION, self.spacing,
+                                     self.size, self.compressed_size,
+                                     len(self._points)))
+        for out, pos, bits, window in self._points:
+            if window is None:
+                file.write(self._POINT.pack(out, pos, -1, 0))
+            else:
+                window = zlib.compress(window)
+                file.write(self._POINT.pack(out, pos, bits, len(window)))
+                file.write(window)
+
+    @classmethod
+    def load(cls, file):
+        """Read an index written by save() from *file*, a path or a binary
+        file object."""
+        if isinstance(file, (str, bytes, os.PathLike)):
+            with builtins.open(file, "rb") as f:
+                return cls.load(f)
+        try:
+            (magic, version, spacing, size, compressed_size,
+             count) = cls._HEADER.unpack(_read_exact(file, cls._HEADER.size))
+            if magic != cls._MAGIC or version != cls._VERSION:
+                raise ValueError("not a gzip index")
+            points = []
+            for _ in range(count):
+                out, pos, bits, length = cls._POINT.unpack(
+                    _read_exact(file, cls._POINT.size))
+                if bits < 0:
+                    points.append((out, pos, 0, None))
+                else:
+                    window = zlib.decompress(_read_exact(file, length))
+                    points.append((out, pos, bits, window))
+        except (EOFError, struct.error, zlib.error):
+            raise ValueError("not a gzip index") from None
+        return cls(points, spacing, size, compressed_size)
+
+
+def _build_index(fileobj, spacing):
+    """Read the whole gzip file *fileobj* and return a GzipIndex for it."""
+    fileobj.seek(0)
+    fp = _PaddedFile(fileobj)
+    points = []
+    out = 0
+    while True:
+        start = fp.tell()
+        if _read_gzip_header(fp) is None:
+            break
+        points.append((out, start, 0, None))
+        last = out
+        data_start = fp.tell()
+        decompressor = zlib._ZlibDecompressor(wbits=-zlib.MAX_WBITS)
+        crc = zlib.crc32(b"")
+        member_size = 0
+        window = b""
+        while not decompressor.eof:
+            if decompressor.needs_input:
+                buf = fp.read(READ_BUFFER_SIZE)
+                if not buf:
+                    raise EOFError("Compressed file ended before the "
+                                   "end-of-stream marker was reached")
+            else:
+                buf = b""
+            data, total_in, data_type = decompressor._decompress_block(buf)
+            if data:
+                crc = zlib.crc32(data, crc)
+                member_size += len(data)
+                out += len(data)
+                window = (window + data)[-_WINDOW_SIZE:]
+            # Add an access point at the end of a deflate block which is
+            # not the last one of the member.
+            if (data_type & 128 and not data_type & 64
+                    and out - last >= spacing):
+                points.append((out, data_start + total_in, data_type & 7,
+                               window))
+                last = out
+        fp.prepend(decompressor.unused_data)
+        crc32, isize = struct.unpack("<II", _read_exact(fp, 8))
+        if crc32 != crc:
+            raise BadGzipFile("CRC check failed %s != %s" % (hex(crc32),
+                                                             hex(crc)))
+        elif isize != (member_size & 0xffffffff):
+            raise BadGzipFile("Incorrect length of data produced")
+        # Skip zero padding between members.
+        c = b"\x00"
+        while c == b"\x00":
+            c = fp.read(1)
+        if c:
+            fp.prepend(c)
+    compressed_size = fileobj.seek(0, io.SEEK_END)
+    return GzipIndex(points, spacing, out, compressed_size)
+
+
 class _GzipReader(_streams.DecompressReader):
     def __init__(self, fp):
         super().__init__(_PaddedFile(fp), zlib._ZlibDecompressor,
@@ -528,10 +837,63 @@ def __init__(self, fp):
         # Set flag indicating start of a new member
         self._new_member = True
         self._last_mtime = None
+        self._index = None
 
     def _init_read(self):
         self._crc = zlib.crc32(b"")
         self._stream_size = 0  # Decompressed size of unconcatenated stream
+        # False when reading started in the middle of the member
+        self._check_crc = True
+
+    def _set_index(self, index):
+        file = self._fp.file
+        pos = file.tell()
+        try:
+            compressed_size = file.seek(0, io.SEEK_END)
+        finally:
+            file.seek(pos)
+        if compressed_size != index.compressed_size:
+            raise ValueError("the index does not match the file")
+        self._index = index
+        self._size = index.size
+
+    def _restore(self, point):
+        """Continue reading from the access point *point* of the index."""
+        out, pos, bits, window = point
+        self._eof = False
+        self._pos = out
+        if window is None:
+            # Start of a member
+            self._fp.seek(pos)
+            self._new_member = True
+            self._decompressor = self._decomp_factory(**self._decomp_args)
+            return
+        self._fp.seek(pos - 1 if bits else pos)
+        self._decompressor = zlib._ZlibDecompressor(wbits=-zlib.MAX_WBITS,
+                                                    zdict=window)
+        if bits:
+            byte = _read_exact(self._fp, 1)[0]
+            self._decompressor._prime(bits, byte >> (8 - bits))
+        self._new_member = False
+        self._init_read()
+        self._check_crc = False
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if self._index is not None:
+            if whence == io.SEEK_CUR:
+                offset = self._pos + offset
+                whence = io.SEEK_SET
+            elif whence == io.SEEK_END:
+                offset = self._index.size + offset
+                whence = io.SEEK_SET
+            if whence == io.SEEK_SET:
+                point = self._index._find(offset)
+                # Jump to the access point unless the current position is
+                # already between it and the target.
+                if point is not None and (offset < self._pos or
+                                          point[0] > self._pos):
+                    self._restore(point)
+        return super().seek(offset, whence)
 
     def _read_gzip_header(self):
         last_mtime = _read_gzip_header(self._fp)
@@ -599,7 +961,11 @@ def _read_eof(self):
         # uncompressed data matches the stored values.  Note that the size
         # stored is the true file size mod 2**32.
         crc32, isize = struct.unpack("<II", _read_exact(self._fp, 8))
-        if crc32 != self._crc:
+        if not self._check_crc:
+            # Reading started at an access point of the index; the CRC
+            # and size of the whole member cannot be checked.
+            pass
+        elif crc32 != self._crc:
             raise BadGzipFile("CRC check failed %s != %s" % (hex(crc32),
                                                              hex(self._crc)))
         elif isize != (self._stream_size & 0xffffffff):
@@ -619,13 +985,24 @@ def _rewind(self):
         self._new_member = True
 
 
-def compress(data, compresslevel=_COMPRESS_LEVEL_TRADEOFF, *, mtime=0):
+def compress(data, compresslevel=_COMPRESS_LEVEL_TRADEOFF, *, mtime=0,
+             workers=None):
     """Compress data in one shot and return the compressed string.
 
     compresslevel sets the compression level in range of 0-9.
     mtime can be used to set the modification time.
     The modification time is set to 0 by default, for reproducibility.
+    If workers is greater than 1, data is compressed in blocks by a pool
+    of that many threads.
     """
+    if workers is not None and workers != 1:
+        if workers <= 0:
+            raise ValueError("workers must be greater than 0")
+        buf = io.BytesIO()
+        with GzipFile(fileobj=buf, mode="wb", compresslevel=compresslevel,
+                      mtime=mtime, workers=workers) as f:
+            f.write(data)
+        return buf.getvalue()
     # Wbits=31 automatically includes a gzip header and trailer.
     gzip_data = zlib.compress(data, level=compresslevel, wbits=31)
     if mtime is None:
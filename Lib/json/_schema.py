@@ -0,0 +1,183 @@
+"""Compile dataclasses and classes with __slots__ for the JSON encoder
+and decoder.
+
+The encoder and the decoder do not inspect these classes for every object.
+Instead, the classes are compiled once to plans: tuples which the C
+accelerator and the pure Python implementation walk directly.
+"""
+import dataclasses
+import types
+import typing
+
+from json.scanner import PLAN_LIST, PLAN_TUPLE, PLAN_DICT, PLAN_OBJECT
+
+
+def _is_record(tp):
+    # A dataclass or a class with __slots__, other than a builtin type.
+    # Named tuples declare empty __slots__, but are encoded as arrays.
+    if not isinstance(tp, type) or issubclass(tp, tuple):
+        return False
+    if dataclasses.is_dataclass(tp):
+        return True
+    return any('__slots__' in vars(klass) for klass in tp.__mro__[:-1])
+
+
+def _is_namedtuple(tp):
+    return (isinstance(tp, type) and issubclass(tp, tuple) and
+            isinstance(getattr(tp, '_fields', None), tuple))
+
+
+def _descriptor(cls, name):
+    # Return the member descriptor of a slot, or None if the attribute
+    # is stored in the instance dictionary or computed by a property.
+    for klass in cls.__mro__:
+        value = vars(klass).get(name)
+        if value is not None:
+            if isinstance(value, types.MemberDescriptorType):
+                return value
+            return None
+    return None
+
+
+def _slot_names(cls):
+    names = []
+    for klass in reversed(cls.__mro__[:-1]):
+        slots = vars(klass).get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name in ('__dict__', '__weakref__'):
+                continue
+            if name.startswith('__') and not name.endswith('__'):
+                name = '_%s%s' % (klass.__name__.lstrip('_'), name)
+            if name not in names:
+                names.append(name)
+    return names
+
+
+def _fields(cls):
+    """Return a list of (name, type, descriptor, init) tuples for the
+    fields of a dataclass or a class with __slots__."""
+    hints = typing.get_type_hints(cls)
+    if dataclasses.is_dataclass(cls):
+        return [(f.name, hints.get(f.name), _descriptor(cls, f.name), f.init)
+                for f in dataclasses.fields(cls)]
+    return [(name, hints.get(name), _descriptor(cls, name), True)
+            for name in _slot_names(cls)]
+
+
+def _nested_records(tp, _seen=None):
+    if _is_record(tp):
+        yield tp
+    elif _is_namedtuple(tp):
+        # The fields of a named tuple can be records.
+        if _seen is None:
+            _seen = set()
+        if tp not in _seen:
+            _seen.add(tp)
+            hints = typing.get_type_hints(tp)
+            for name in tp._fields:
+                yield from _nested_records(hints.get(name), _seen)
+    else:
+        for arg in typing.get_args(tp):
+            yield from _nested_records(arg, _seen)
+
+
+def compile_encoder(types, encode_key, sort_keys=False):
+    """Compile the classes in types and the classes of their fields.
+
+    Return a dict which maps each class to a tuple of (name, key,
+    descriptor) tuples, where key is the encoded JSON string of the field
+    name and descriptor is the member descriptor of a slot, or None.
+    """
+    plans = {}
+    todo = []
+    for cls in types:
+        if not _is_record(cls):
+            raise TypeError(f'{cls!r} is not a dataclass or a class '
+                            f'with __slots__')
+        todo.append(cls)
+    while todo:
+        cls = todo.pop()
+        if cls in plans:
+            continue
+        fields = _fields(cls)
+        if sort_keys:
+            fields.sort(key=lambda field: field[0])
+        plans[cls] = tuple((name, encode_key(name), descr)
+                           for name, tp, descr, init in fields)
+        for name, tp, descr, init in fields:
+            todo.extend(_nested_records(tp))
+    return plans
+
+
+def compile_decoder(tp, _plans=None):
+    """Compile the type expression tp.
+
+    Return None if values of type tp are decoded as usual, otherwise one of:
+
+    (PLAN_LIST, item_plan) for list[T],
+    (PLAN_TUPLE, item_plan) for tuple[T, ...],
+    (PLAN_TUPLE, item_plans, cls) for a named tuple.  item_plans is
+        the list of the plans of its fields, and instances are created
+        by calling cls with the items of the array as arguments.
+    (PLAN_DICT, value_plan) for dict[str, T],
+    (PLAN_OBJECT, cls, fields, names, descriptors) for a dataclass or
+        a class with __slots__.  fields maps the name of each field
+        to an (index, plan) tuple, and names is the tuple of field
+        names.  descriptors is None if instances are created by calling
+        cls with the fields as keyword arguments.  Otherwise instances
+        are created by cls.__new__(cls), and descriptors is a tuple of
+        the member descriptors of the fields, or None for fields which
+        are set with setattr().
+    """
+    if _plans is None:
+        _plans = {}
+    if _is_record(tp):
+        if tp in _plans:
+            return _plans[tp]
+        init = dataclasses.is_dataclass(tp)
+        fields = {}
+        names = []
+        descrs = []
+        for name, ftp, descr, settable in _fields(tp):
+            if init and not settable:
+                continue
+            names.append(name)
+            descrs.append(descr)
+        plan = (PLAN_OBJECT, tp, fields, tuple(names),
+                None if init else tuple(descrs))
+        # Register the plan before compiling the fields to support
+        # recursive types.
+        _plans[tp] = plan
+        hints = {name: ftp for name, ftp, descr, settable in _fields(tp)}
+        for index, name in enumerate(names):
+            fields[name] = (index, compile_decoder(hints[name], _plans))
+        return plan
+    if _is_namedtuple(tp):
+        if tp in _plans:
+            return _plans[tp]
+        item_plans = []
+        plan = (PLAN_TUPLE, item_plans, tp)
+        # Register the plan before compiling the fields to support
+        # recursive types.
+        _plans[tp] = plan
+        hints = typing.get_type_hints(tp)
+        for name in tp._fields:
+            item_plans.append(compile_decoder(hints.get(name), _plans))
+        return plan
+
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+    if origin is list and len(args) == 1:
+        return (PLAN_LIST, compile_decoder(args[0], _plans))
+    if origin is tuple and len(args) == 2 and args[1] is Ellipsis:
+        return (PLAN_TUPLE, compile_decoder(args[0], _plans))
+    if origin is dict and len(args) == 2:
+        return (PLAN_DICT, compile_decoder(args[1], _plans))
+    if origin is typing.Union or origin is types.UnionType:
+        # null is always accepted, so T | None is decoded as T.
+        args = [arg for arg in args if arg is not type(None)]
+        if len(args) == 1:
+            return compile_decoder(args[0], _plans)
+    return None
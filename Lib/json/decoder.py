@@ -1,14 +1,16 @@
 """Implementation of JSONDecoder
 """
+import codecs
 import re
 
 from json import scanner
+from json.scanner import PLAN_TUPLE, PLAN_DICT, PLAN_OBJECT
 try:
     from _json import scanstring as c_scanstring
 except ImportError:
     c_scanstring = None
 
-__all__ = ['JSONDecoder', 'JSONDecodeError']
+__all__ = ['JSONDecoder', 'JSONDecodeError', 'JSONStreamDecoder']
 
 FLAGS = re.VERBOSE | re.MULTILINE | re.DOTALL
 
@@ -132,11 +134,19 @@ def py_scanstring(s, end, strict=True,
 
 WHITESPACE = re.compile(r'[ \t\n\r]*', FLAGS)
 WHITESPACE_STR = ' \t\n\r'
+WHITESPACE_BYTES = re.compile(rb'[ \t\n\r]*', FLAGS)
 
 
 def JSONObject(s_and_end, strict, scan_once, object_hook, object_pairs_hook,
-               memo=None, _w=WHITESPACE.match, _ws=WHITESPACE_STR):
+               memo=None, _w=WHITESPACE.match, _ws=WHITESPACE_STR, _plan=None):
     s, end = s_and_end
+    if _plan is not None:
+        # The hooks are not called for typed values.
+        object_hook = object_pairs_hook = None
+        if _plan[0] == PLAN_DICT:
+            value_plan = _plan[1]
+        else:
+            fields = _plan[2]
     pairs = []
     pairs_append = pairs.append
     # Backwards compatibility
@@ -153,6 +163,8 @@ def JSONObject(s_and_end, strict, scan_once, object_hook, object_pairs_hook,
             nextchar = s[end:end + 1]
         # Trivial empty object
         if nextchar == '}':
+            if _plan is not None and _plan[0] == PLAN_OBJECT:
+                return _construct(_plan, pairs), end + 1
             if object_pairs_hook is not None:
                 result = object_pairs_hook(pairs)
                 return result, end + 1
@@ -184,7 +196,14 @@ def JSONObject(s_and_end, strict, scan_once, object_hook, object_pairs_hook,
             pass
 
         try:
-            value, end = scan_once(s, end)
+            if _plan is None:
+                value, end = scan_once(s, end)
+            elif _plan[0] == PLAN_DICT:
+                value, end = scan_once(s, end, value_plan)
+            else:
+                field = fields.get(key)
+                value, end = scan_once(s, end,
+                                       None if field is None else field[1])
         except StopIteration as err:
             raise JSONDecodeError("Expecting value", s, err.value) from None
         pairs_append((key, value))
@@ -210,6 +229,8 @@ def JSONObject(s_and_end, strict, scan_once, object_hook, object_pairs_hook,
                 raise JSONDecodeError("Illegal trailing comma before end of object", s, comma_idx)
             raise JSONDecodeError(
                 "Expecting property name enclosed in double quotes", s, end - 1)
+    if _plan is not None and _plan[0] == PLAN_OBJECT:
+        return _construct(_plan, pairs), end
     if object_pairs_hook is not None:
         result = object_pairs_hook(pairs)
         return result, end
@@ -218,7 +239,101 @@ def JSONObject(s_and_end, strict, scan_once, object_hook, object_pairs_hook,
         pairs = object_hook(pairs)
     return pairs, end
 
-def JSONArray(s_and_end, scan_once, _w=WHITESPACE.match, _ws=WHITESPACE_STR):
+def JSONColumns(s_and_end, strict, scan_once, object_hook, object_pairs_hook,
+                memo=None, _w=WHITESPACE.match, _ws=WHITESPACE_STR):
+    # Decode an array whose items are objects with the same keys in the
+    # same order as a single object which maps each key to the list of its
+    # values.  Other arrays are decoded as lists.
+    s, end = s_and_end
+    def make_object(pairs):
+        if object_pairs_hook is not None:
+            return object_pairs_hook(pairs)
+        result = dict(pairs)
+        if object_hook is not None:
+            result = object_hook(result)
+        return result
+
+    keys = columns = None
+    values = None
+    nextchar = s[end:end + 1]
+    if nextchar in _ws:
+        end = _w(s, end + 1).end()
+        nextchar = s[end:end + 1]
+    # Look-ahead for trivial empty array
+    if nextchar == ']':
+        return [], end + 1
+    while True:
+        if values is None and nextchar == '{':
+            pairs, end = JSONObject((s, end + 1), strict, scan_once,
+                                    None, list, memo)
+            if keys is None and pairs:
+                keys = [key for key, value in pairs]
+                columns = [[value] for key, value in pairs]
+            elif (keys is not None and len(pairs) == len(keys) and
+                  all(key == k for (key, _), k in zip(pairs, keys))):
+                for (_, value), column in zip(pairs, columns):
+                    column.append(value)
+            else:
+                # Not homogeneous: decode the rows decoded so far.
+                values = []
+                if keys is not None:
+                    for row in zip(*columns):
+                        values.append(make_object(list(zip(keys, row))))
+                values.append(make_object(pairs))
+        else:
+            if values is None:
+                values = []
+                if keys is not None:
+                    for row in zip(*columns):
+                        values.append(make_object(list(zip(keys, row))))
+            try:
+                value, end = scan_once(s, end)
+            except StopIteration as err:
+                raise JSONDecodeError("Expecting value", s, err.value) from None
+            values.append(value)
+        nextchar = s[end:end + 1]
+        if nextchar in _ws:
+            end = _w(s, end + 1).end()
+            nextchar = s[end:end + 1]
+        end += 1
+        if nextchar == ']':
+            break
+        elif nextchar != ',':
+            raise JSONDecodeError("Expecting ',' delimiter", s, end - 1)
+        comma_idx = end - 1
+        try:
+            if s[end] in _ws:
+                end += 1
+                if s[end] in _ws:
+                    end = _w(s, end + 1).end()
+            nextchar = s[end:end + 1]
+        except IndexError:
+            nextchar = ''
+        if nextchar == ']':
+            raise JSONDecodeError("Illegal trailing comma before end of array", s, comma_idx)
+
+    if values is not None:
+        return values, end
+    return make_object(list(zip(keys, columns))), end
+
+def _construct(plan, pairs):
+    # Create an instance of a record class from the decoded fields.
+    _, cls, fields, names, descrs = plan
+    if descrs is None:
+        return cls(**{key: value for key, value in pairs if key in fields})
+    obj = cls.__new__(cls)
+    for key, value in pairs:
+        field = fields.get(key)
+        if field is not None:
+            descr = descrs[field[0]]
+            if descr is None:
+                setattr(obj, key, value)
+            else:
+                descr.__set__(obj, value)
+    return obj
+
+def JSONArray(s_and_end, scan_once, _w=WHITESPACE.match, _ws=WHITESPACE_STR,
+              _plan=None):
     s, end = s_and_end
     values = []
     nextchar = s[end:end + 1]
@@ -227,11 +342,24 @@ def JSONArray(s_and_end, scan_once, _w=WHITESPACE.match, _ws=WHITESPACE_STR):
         nextchar = s[end:end + 1]
     # Look-ahead for trivial empty array
     if nextchar == ']':
+        if _plan is not None and _plan[0] == PLAN_TUPLE:
+            return _make_tuple(_plan, values), end + 1
         return values, end + 1
     _append = values.append
+    item_plans = None
+    if _plan is not None and len(_plan) == 3:
+        # A named tuple: every item has its own plan.
+        item_plans = _plan[1]
     while True:
         try:
-            value, end = scan_once(s, end)
+            if _plan is None:
+                value, end = scan_once(s, end)
+            elif item_plans is None:
+                value, end = scan_once(s, end, _plan[1])
+            elif len(values) < len(item_plans):
+                value, end = scan_once(s, end, item_plans[len(values)])
+            else:
+                value, end = scan_once(s, end)
         except StopIteration as err:
             raise JSONDecodeError("Expecting value", s, err.value) from None
         _append(value)
@@ -256,8 +384,16 @@ def JSONArray(s_and_end, scan_once, _w=WHITESPACE.match, _ws=WHITESPACE_STR):
         if nextchar == ']':
             raise JSONDecodeError("Illegal trailing comma before end of array", s, comma_idx)
 
+    if _plan is not None and _plan[0] == PLAN_TUPLE:
+        return _make_tuple(_plan, values), end
     return values, end
 
+def _make_tuple(plan, values):
+    # Create a tuple, or an instance of the named tuple class of the plan.
+    if len(plan) == 3:
+        return plan[2](*values)
+    return tuple(values)
+
 
 class JSONDecoder(object):
     """Simple JSON <https://json.org> decoder
@@ -289,9 +425,12 @@ class JSONDecoder(object):
 
     """
 
+    _type_plan = None
+
     def __init__(self, *, object_hook=None, parse_float=None,
             parse_int=None, parse_constant=None, strict=True,
-            object_pairs_hook=None):
+            object_pairs_hook=None, type=None, columnar=False,
+            key_cache_size=0):
         """``object_hook``, if specified, will be called with the result
         of every JSON object decoded and its return value will be used in
         place of the given ``dict``.  This can be used to provide custom
@@ -323,6 +462,24 @@ def __init__(self, *, object_hook=None, parse_float=None,
         characters will be allowed inside strings.  Control characters in
         this context are those with character codes in the 0-31 range,
         including ``'\\t'`` (tab), ``'\\n'``, ``'\\r'`` and ``'\\0'``.
+
+        ``type``, if specified, is the expected type of the decoded value.
+        JSON objects are decoded directly to instances of dataclasses and
+        classes with ``__slots__``, without creating a ``dict`` first.
+        ``list[T]``, ``tuple[T, ...]``, ``dict[str, T]`` and ``T | None``
+        are supported for nesting; values of other types are decoded as
+        usual.  ``object_hook`` and ``object_pairs_hook`` are not called for
+        typed values.
+
+        If ``columnar`` is true, an array whose items are objects with the
+        same keys in the same order is decoded as a single object which maps
+        each key to the list of its values, without creating an object for
+        every item.  ``object_hook`` and ``object_pairs_hook`` are called
+        once with the columns instead of once for every item.
+
+        ``key_cache_size`` is the number of object keys which are kept in
+        ``memo`` between calls, so that the keys of all decoded objects are
+        shared.  By default, ``memo`` is cleared after every call.
         """
         self.object_hook = object_hook
         self.parse_float = parse_float or float
@@ -333,7 +490,12 @@ def __init__(self, *, object_hook=None, parse_float=None,
         self.parse_object = JSONObject
         self.parse_array = JSONArray
         self.parse_string = scanstring
+        self.columnar = columnar
+        self.key_cache_size = key_cache_size
         self.memo = {}
+        if type is not None:
+            from json._schema import compile_decoder
+            self._type_plan = compile_decoder(type)
         self.scan_once = scanner.make_scanner(self)
 
 
@@ -362,3 +524,249 @@ def raw_decode(self, s, idx=0):
         except StopIteration as err:
             raise JSONDecodeError("Expecting value", s, err.value) from None
         return obj, end
+
+    def _decode_utf8(self, b, _w=WHITESPACE_BYTES.match):
+        # Decode UTF-8 encoded bytes.  The C scanner parses them directly,
+        # without decoding the whole document to str first.
+        if (type(self.scan_once) is not scanner.c_make_scanner or
+                type(self).decode is not JSONDecoder.decode or
+                type(self).raw_decode is not JSONDecoder.raw_decode):
+            return self.decode(b.decode('utf-8', 'surrogatepass'))
+        try:
+            obj, end = self.scan_once(b, _w(b, 0).end())
+        except StopIteration as err:
+            raise _utf8_error("Expecting value", b, err.value) from None
+        end = _w(b, end).end()
+        if end != len(b):
+            raise _utf8_error("Extra data", b, end)
+        return obj
+
+
+def _utf8_error(msg, b, pos):
+    # Report the position in the decoded document.
+    return JSONDecodeError(msg, b.decode('utf-8', 'surrogatepass'),
+                           len(b[:pos].decode('utf-8', 'surrogatepass')))
+
+
+# Text at the end of the data which may be the start of a valid token:
+# a partial literal, number or string escape.
+_INCOMPLETE = re.compile(r'[^ \t\n\r,:\[\]{}"]{0,15}\Z')
+
+# States of JSONStreamDecoder
+_VALUES = 0         # Between top-level values
+_ITEMS_START = 1    # Before the opening bracket of the array
+_ITEMS_FIRST = 2    # After the opening bracket
+_ITEMS_NEXT = 3     # After an item
+_ITEMS_VALUE = 4    # After a comma
+_ITEMS_END = 5      # After the closing bracket
+
+
+class JSONStreamDecoder(object):
+    """Incremental JSON decoder.
+
+    Decode JSON data fed in chunks with the ``feed()`` method, which
+    returns the values completed by each chunk, so that a large input does
+    not have to be held in memory at once.  Only the data of an incomplete
+    value is buffered between calls.
+
+    By default, the data is a sequence of top-level JSON values, optionally
+    separated by whitespace, such as newline-delimited JSON.  If ``items``
+    is true, the data is a single JSON array and its items are returned
+    instead.
+
+    ``decoder`` is the ``JSONDecoder`` instance used to decode the values;
+    by default a ``JSONDecoder`` with default arguments is used.
+
+    """
+
+    def __init__(self, decoder=None, *, items=False):
+        if decoder is None:
+            decoder = JSONDecoder()
+        self._scan_once = decoder.scan_once
+        self._items = items
+        self._state = _ITEMS_START if items else _VALUES
+        self._buffer = ''
+        self._bytes = None      # Data received before the encoding is known
+        self._textdecoder = None
+        self._text = None       # Whether the data is str or bytes
+        self._closed = False
+        # Position of self._buffer in the whole document
+        self._offset = 0
+        self._lineno = 1
+        self._column = 0
+
+    def feed(self, data):
+        """Feed ``data`` (a ``str``, ``bytes`` or ``bytearray`` instance) to
+        the decoder and return a list of the values which it completes.
+
+        Bytes are decoded from UTF-8, UTF-16 or UTF-32, as detected from
+        the start of the data.  All the chunks must be of the same type.
+
+        """
+        if self._closed:
+            raise ValueError('feed() called after close()')
+        self._buffer += self._decode_text(data, False)
+        return self._parse(False)
+
+    def close(self):
+        """Signal the end of the data and return a list of the remaining
+        values.
+
+        Raise a ``JSONDecodeError`` if the data ends in an incomplete value.
+
+        """
+        if self._closed:
+            return []
+        self._closed = True
+        self._buffer += self._decode_text(b'' if self._text is False else '',
+                                          True)
+        values = self._parse(True)
+        s = self._buffer
+        state = self._state
+        if state in (_ITEMS_START, _ITEMS_FIRST):
+            raise self._error("Expecting value", s, len(s))
+        if state == _ITEMS_NEXT:
+            raise self._error("Expecting ',' delimiter", s, len(s))
+        self._buffer = ''
+        return values
+
+    def _decode_text(self, data, final):
+        if isinstance(data, str):
+            if self._text is None:
+                if data.startswith('\ufeff'):
+                    raise JSONDecodeError(
+                        "Unexpected UTF-8 BOM (decode using utf-8-sig)",
+                        data, 0)
+                if data:
+                    self._text = True
+            elif not self._text:
+                raise TypeError('expected bytes or bytearray, not str')
+            return data
+
+        if not isinstance(data, (bytes, bytearray)):
+            raise TypeError(f'the JSON object must be str, bytes or '
+                            f'bytearray, not {data.__class__.__name__}')
+        if self._text:
+            raise TypeError(f'expected str, not {data.__class__.__name__}')
+        if self._textdecoder is None:
+            if self._bytes is None:
+                if not data and not final:
+                    return ''
+                self._text = False
+                self._bytes = b''
+            data = self._bytes + data
+            if (len(data) < 4 and not final and
+                    (len(data) < 2 or not data[0] or not data[1] or
+                     data[0] in b'\xef\xfe\xff')):
+                # Not enough data to detect the encoding.  A document
+                # starting with two non-null bytes which do not start a BOM
+                # is UTF-8.
+                self._bytes = data
+                return ''
+            self._bytes = None
+            from json import detect_encoding
+            encoding = detect_encoding(data)
+            self._textdecoder = codecs.getincrementaldecoder(encoding)(
+                'surrogatepass')
+        return self._textdecoder.decode(data, final)
+
+    def _parse(self, final, _w=WHITESPACE.match):
+        s = self._buffer
+        n = len(s)
+        scan_once = self._scan_once
+        items = self._items
+        state = self._state
+        values = []
+        pos = comma = 0
+        try:
+            while True:
+                pos = _w(s, pos).end()
+                if pos == n:
+                    break
+                nextchar = s[pos]
+                if state == _ITEMS_START:
+                    if nextchar != '[':
+                        raise self._error("Expecting '['", s, pos)
+                    pos += 1
+                    state = _ITEMS_FIRST
+                    continue
+                if state == _ITEMS_NEXT:
+                    if nextchar == ',':
+                        comma = pos
+                        pos += 1
+                        state = _ITEMS_VALUE
+                    elif nextchar == ']':
+                        pos += 1
+                        state = _ITEMS_END
+                    else:
+                        raise self._error("Expecting ',' delimiter", s, pos)
+                    continue
+                if nextchar == ']':
+                    if state == _ITEMS_FIRST:
+                        pos += 1
+                        state = _ITEMS_END
+                        continue
+                    if state == _ITEMS_VALUE:
+                        raise self._error(
+                            "Illegal trailing comma before end of array",
+                            s, comma)
+                if state == _ITEMS_END:
+                    raise self._error("Extra data", s, pos)
+
+                try:
+                    value, end = scan_once(s, pos)
+                except StopIteration as err:
+                    msg = "Expecting value"
+                    errpos = err.value
+                except JSONDecodeError as err:
+                    msg = err.msg
+                    errpos = err.pos
+                else:
+                    if (not final and s[end - 1] not in '"]}' and
+                            _INCOMPLETE.match(s, end)):
+                        # A number or a literal may continue in the next
+                        # chunk.
+                        break
+                    values.append(value)
+                    pos = end
+                    state = _ITEMS_NEXT if items else _VALUES
+                    continue
+                if final or not (msg.startswith("Unterminated string") or
+                                 _INCOMPLETE.match(s, errpos)):
+                    raise self._error(msg, s, errpos)
+                # The value is not complete yet.
+                break
+        finally:
+            if state == _ITEMS_VALUE:
+                # Keep the comma to report a trailing comma.
+                pos = comma
+                state = _ITEMS_NEXT
+            self._consume(pos)
+            self._state = state
+        return values
+
+    def _consume(self, pos):
+        # Discard the data before pos.
+        if not pos:
+            return
+        s = self._buffer
+        newlines = s.count('\n', 0, pos)
+        if newlines:
+            self._lineno += newlines
+            self._column = pos - s.rfind('\n', 0, pos) - 1
+        else:
+            self._column += pos
+        self._offset += pos
+        self._buffer = s[pos:]
+
+    def _error(self, msg, doc, pos):
+        err = JSONDecodeError(msg, doc, pos)
+        if self._offset:
+            # Report the position in the whole document.
+            if err.lineno == 1:
+                err.colno += self._column
+            err.lineno += self._lineno - 1
+            err.pos += self._offset
+            err.args = ('%s: line %d column %d (char %d)' %
+                        (msg, err.lineno, err.colno, err.pos),)
+        return err
@@ -102,9 +102,10 @@ class JSONEncoder(object):
     """
     item_separator = ', '
     key_separator = ': '
+    _type_plans = None
     def __init__(self, *, skipkeys=False, ensure_ascii=True,
             check_circular=True, allow_nan=True, sort_keys=False,
-            indent=None, separators=None, default=None):
+            indent=None, separators=None, default=None, types=None):
         """Constructor for JSONEncoder, with sensible defaults.
 
         If skipkeys is false, then it is a TypeError to attempt
@@ -145,6 +146,13 @@ def __init__(self, *, skipkeys=False, ensure_ascii=True,
         that can't otherwise be serialized.  It should return a JSON
         encodable version of the object or raise a ``TypeError``.
 
+        If specified, types should be an iterable of dataclasses or
+        classes with ``__slots__``.  Their instances, and instances of
+        the record classes used in the type hints of their fields, are
+        encoded as JSON objects whose members are the fields, in
+        definition order.  The classes are inspected only once, when the
+        encoder is created.
+
         """
 
         self.skipkeys = skipkeys
@@ -159,6 +167,12 @@ def __init__(self, *, skipkeys=False, ensure_ascii=True,
             self.item_separator = ','
         if default is not None:
             self.default = default
+        if types is not None:
+            from json._schema import compile_encoder
+            self._type_plans = compile_encoder(
+                types,
+                encode_basestring_ascii if ensure_ascii else encode_basestring,
+                sort_keys)
 
     def default(self, o):
         """Implement this method in a subclass such that it returns
@@ -204,6 +218,40 @@ def encode(self, o):
             chunks = list(chunks)
         return ''.join(chunks)
 
+    def _c_encoder(self):
+        # Return a C encoder for the current settings, or None if it is
+        # not available or encode() or iterencode() are overridden.
+        if (c_make_encoder is None or
+                type(self).encode is not JSONEncoder.encode or
+                type(self).iterencode is not JSONEncoder.iterencode):
+            return None
+        if self.indent is None or isinstance(self.indent, str):
+            indent = self.indent
+        else:
+            indent = ' ' * self.indent
+        return c_make_encoder(
+            {} if self.check_circular else None, self.default,
+            encode_basestring_ascii if self.ensure_ascii else encode_basestring,
+            indent, self.key_separator, self.item_separator, self.sort_keys,
+            self.skipkeys, self.allow_nan, self._type_plans)
+
+    def _encode_utf8(self, o):
+        # Return the JSON representation of o encoded with UTF-8.  The C
+        # encoder writes UTF-8 directly, without creating a str first.
+        c_encoder = self._c_encoder()
+        if c_encoder is None:
+            return self.encode(o).encode('utf-8')
+        return c_encoder(o, 0, utf8=True)[0]
+
+    def _dump(self, o, write, utf8=False):
+        # Pass the JSON representation of o to write() in chunks.
+        c_encoder = self._c_encoder()
+        if c_encoder is None:
+            for chunk in self.iterencode(o):
+                write(chunk.encode('utf-8') if utf8 else chunk)
+        else:
+            c_encoder(o, 0, utf8=utf8, write=write)
+
     def iterencode(self, o, _one_shot=False):
         """Encode the given object and yield each string
         representation as available.
@@ -254,16 +302,17 @@ def floatstr(o, allow_nan=self.allow_nan,
             _iterencode = c_make_encoder(
                 markers, self.default, _encoder, indent,
                 self.key_separator, self.item_separator, self.sort_keys,
-                self.skipkeys, self.allow_nan)
+                self.skipkeys, self.allow_nan, self._type_plans)
         else:
             _iterencode = _make_iterencode(
                 markers, self.default, _encoder, indent, floatstr,
                 self.key_separator, self.item_separator, self.sort_keys,
-                self.skipkeys, _one_shot)
+                self.skipkeys, _one_shot, self._type_plans)
         return _iterencode(o, 0)
 
 def _make_iterencode(markers, _default, _encoder, _indent, _floatstr,
         _key_separator, _item_separator, _sort_keys, _skipkeys, _one_shot,
+        _types=None,
     ):
 
     def _iterencode_list(lst, _current_indent_level):
@@ -412,6 +461,46 @@ def _iterencode_dict(dct, _current_indent_level):
         if markers is not None:
             del markers[markerid]
 
+    def _iterencode_record(o, fields, _current_indent_level):
+        if not fields:
+            yield '{}'
+            return
+        if markers is not None:
+            markerid = id(o)
+            if markerid in markers:
+                raise ValueError("Circular reference detected")
+            markers[markerid] = o
+        yield '{'
+        if _indent is not None:
+            _current_indent_level += 1
+            newline_indent = '\n' + _indent * _current_indent_level
+            item_separator = _item_separator + newline_indent
+            yield newline_indent
+        else:
+            newline_indent = None
+            item_separator = _item_separator
+        first = True
+        for name, key, _ in fields:
+            if first:
+                first = False
+            else:
+                yield item_separator
+            yield key
+            yield _key_separator
+            try:
+                yield from _iterencode(getattr(o, name), _current_indent_level)
+            except GeneratorExit:
+                raise
+            except BaseException as exc:
+                exc.add_note(f'when serializing {type(o).__name__} field {name!r}')
+                raise
+        if newline_indent is not None:
+            _current_indent_level -= 1
+            yield '\n' + _indent * _current_indent_level
+        yield '}'
+        if markers is not None:
+            del markers[markerid]
+
     def _iterencode(o, _current_indent_level):
         if isinstance(o, str):
             yield _encoder(o)
@@ -431,6 +520,9 @@ def _iterencode(o, _current_indent_level):
             yield from _iterencode_list(o, _current_indent_level)
         elif isinstance(o, dict):
             yield from _iterencode_dict(o, _current_indent_level)
+        elif _types is not None and type(o) in _types:
+            yield from _iterencode_record(o, _types[type(o)],
+                                          _current_indent_level)
         else:
             if markers is not None:
                 markerid = id(o)
@@ -450,10 +542,12 @@ def _iterencode(o, _current_indent_level):
 
     def _iterencode_once(o, _current_indent_level):
         nonlocal _iterencode, _iterencode_dict, _iterencode_list
+        nonlocal _iterencode_record
         try:
             yield from _iterencode(o, _current_indent_level)
         finally:
             # Break reference cycles due to mutually recursive closures:
             del _iterencode, _iterencode_dict, _iterencode_list
+            del _iterencode_record
 
     return _iterencode_once
@@ -1,6 +1,7 @@
 """JSON token scanner
 """
 import re
+from json import decoder
 try:
     from _json import make_scanner as c_make_scanner
 except ImportError:
@@ -12,6 +13,12 @@
     r'(-?(?:0|[1-9][0-9]*))(\.[0-9]+)?([eE][-+]?[0-9]+)?',
     (re.VERBOSE | re.MULTILINE | re.DOTALL))
 
+# Kinds of the decoding plans compiled from the type of JSONDecoder
+PLAN_LIST = 0
+PLAN_TUPLE = 1
+PLAN_DICT = 2
+PLAN_OBJECT = 3
+
 def py_make_scanner(context):
     parse_object = context.parse_object
     parse_array = context.parse_array
@@ -24,19 +31,39 @@ def py_make_scanner(context):
     object_hook = context.object_hook
     object_pairs_hook = context.object_pairs_hook
     memo = context.memo
+    type_plan = getattr(context, '_type_plan', None)
+    JSONDecodeError = decoder.JSONDecodeError
+    columnar = getattr(context, 'columnar', False)
+    key_cache_size = getattr(context, 'key_cache_size', 0)
+    if columnar:
+        parse_columns = decoder.JSONColumns
 
-    def _scan_once(string, idx):
+    def _scan_once(string, idx, plan=None):
         try:
             nextchar = string[idx]
         except IndexError:
             raise StopIteration(idx) from None
 
+        if plan is not None and nextchar != 'n':
+            if nextchar == '{' and plan[0] in (PLAN_DICT, PLAN_OBJECT):
+                return parse_object((string, idx + 1), strict,
+                    _scan_once, object_hook, object_pairs_hook, memo,
+                    _plan=plan)
+            if nextchar == '[' and plan[0] in (PLAN_LIST, PLAN_TUPLE):
+                return parse_array((string, idx + 1), _scan_once, _plan=plan)
+            if plan[0] in (PLAN_LIST, PLAN_TUPLE):
+                raise JSONDecodeError("Expecting array", string, idx)
+            raise JSONDecodeError("Expecting object", string, idx)
+
         if nextchar == '"':
             return parse_string(string, idx + 1, strict)
         elif nextchar == '{':
             return parse_object((string, idx + 1), strict,
                 _scan_once, object_hook, object_pairs_hook, memo)
         elif nextchar == '[':
+            if columnar:
+                return parse_columns((string, idx + 1), strict,
+                    _scan_once, object_hook, object_pairs_hook, memo)
             return parse_array((string, idx + 1), _scan_once)
         elif nextchar == 'n' and string[idx:idx + 4] == 'null':
             return None, idx + 4
@@ -64,9 +91,10 @@ def _scan_once(string, idx):
 
     def scan_once(string, idx):
         try:
-            return _scan_once(string, idx)
+            return _scan_once(string, idx, type_plan)
         finally:
-            memo.clear()
+            if len(memo) > key_cache_size:
+                memo.clear()
 
     return scan_once
 
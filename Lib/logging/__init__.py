@@ -39,7 +39,8 @@
            'info', 'log', 'makeLogRecord', 'setLoggerClass', 'shutdown',
            'warn', 'warning', 'getLogRecordFactory', 'setLogRecordFactory',
            'lastResort', 'raiseExceptions', 'getLevelNamesMapping',
-           'getHandlerByName', 'getHandlerNames']
+           'getHandlerByName', 'getHandlerNames', 'LazyLogRecord',
+           'JSONFormatter']
 
 import threading
 
@@ -191,12 +192,34 @@ def currentframe():
 # The following is based on warnings._is_internal_frame. It makes sure that
 # frames of the import mechanism are skipped when logging at module level and
 # using a stacklevel value greater than one.
+#
+# The result is cached per source file, since the same code locations log
+# over and over again.
+#
+_internal_filenames = {}
+
 def _is_internal_frame(frame):
     """Signal whether the frame is a CPython or logging module internal."""
-    filename = os.path.normcase(frame.f_code.co_filename)
-    return filename == _srcfile or (
+    co_filename = frame.f_code.co_filename
+    try:
+        return _internal_filenames[co_filename]
+    except KeyError:
+        pass
+    filename = os.path.normcase(co_filename)
+    internal = filename == _srcfile or (
         "importlib" in filename and "_bootstrap" in filename
     )
+    if len(_internal_filenames) >= 1000:
+        _internal_filenames.clear()
+    _internal_filenames[co_filename] = internal
+    return internal
+
+# The location of the caller is cached per code object and instruction
+# offset, since computing the line number of a frame is slow in long
+# functions.  The code object is kept in the value, so that its id cannot
+# be reused while the entry exists.
+#
+_caller_locations = {}
 
 
 def _checkLevel(level):
@@ -248,6 +271,9 @@ def _afterFork():
     _lock.release()
 
 
+# The process ID of LazyLogRecord instances, updated in a forked child.
+_pid = os.getpid() if hasattr(os, 'getpid') else None
+
 # Prevent a held logging lock from blocking a child from logging.
 
 if not hasattr(os, 'register_at_fork'):  # Windows and friends.
@@ -264,6 +290,9 @@ def _register_at_fork_reinit_lock(instance):
             _at_fork_reinit_lock_weakset.add(instance)
 
     def _after_at_fork_child_reinit_locks():
+        global _pid
+        _pid = os.getpid()
+
         for handler in _at_fork_reinit_lock_weakset:
             handler._at_fork_reinit()
 
@@ -325,12 +354,7 @@ def __init__(self, name, level, pathname, lineno,
         self.levelname = getLevelName(level)
         self.levelno = level
         self.pathname = pathname
-        try:
-            self.filename = os.path.basename(pathname)
-            self.module = os.path.splitext(self.filename)[0]
-        except (TypeError, ValueError, AttributeError):
-            self.filename = pathname
-            self.module = "Unknown module"
+        self.filename, self.module = _split_pathname(pathname)
         self.exc_info = exc_info
         self.exc_text = None      # used to cache the traceback text
         self.stack_info = sinfo
@@ -397,6 +421,191 @@ def getMessage(self):
             msg = msg % self.args
         return msg
 
+_pathname_parts = {}
+
+def _split_pathname(pathname):
+    """Return the filename and module name of a source file, cached."""
+    try:
+        return _pathname_parts[pathname]
+    except (KeyError, TypeError):
+        pass
+    try:
+        filename = os.path.basename(pathname)
+        parts = filename, os.path.splitext(filename)[0]
+    except (TypeError, ValueError, AttributeError):
+        return pathname, "Unknown module"
+    if len(_pathname_parts) >= 1000:
+        _pathname_parts.clear()
+    _pathname_parts[pathname] = parts
+    return parts
+
+def _lazy_created(d):
+    ct = d._ct
+    msecs = (ct % 1_000_000_000) // 1_000_000 + 0.0
+    if msecs == 999.0 and int(ct / 1e9) != ct // 1_000_000_000:
+        msecs = 0.0
+    d['created'] = ct / 1e9
+    d['msecs'] = msecs
+    d['relativeCreated'] = (ct - _startTime) / 1e6
+
+def _lazy_filename(d):
+    d['filename'], d['module'] = _split_pathname(d['pathname'])
+
+def _lazy_process_name(d):
+    name = None
+    if logMultiprocessing:
+        name = 'MainProcess'
+        mp = sys.modules.get('multiprocessing')
+        if mp is not None:
+            try:
+                name = mp.current_process().name
+            except Exception: #pragma: no cover
+                pass
+    d['processName'] = name
+
+def _lazy_task_name(d):
+    try:
+        name = d._task.get_name() if d._task is not None else None
+    except Exception:
+        name = None
+    d['taskName'] = name
+
+def _lazy_levelname(d):
+    d['levelname'] = getLevelName(d['levelno'])
+
+def _lazy_thread_name(d):
+    d['threadName'] = d._thread.name if d._thread is not None else None
+
+#
+# The attributes of a LazyLogRecord which are computed on first access, from
+# the record dictionary and the state captured when the record was created.
+# Each function stores the attribute, and the attributes computed from the
+# same state, in the record dictionary.
+#
+_lazy_record_attrs = {
+    'levelname': _lazy_levelname,
+    'filename': _lazy_filename,
+    'module': _lazy_filename,
+    'created': _lazy_created,
+    'msecs': _lazy_created,
+    'relativeCreated': _lazy_created,
+    'threadName': _lazy_thread_name,
+    'processName': _lazy_process_name,
+    'taskName': _lazy_task_name,
+}
+
+class _LazyRecordDict(dict):
+    """
+    The __dict__ of a LazyLogRecord.
+
+    Missing lazy attributes are computed when they are looked up, and all of
+    them when the dictionary is iterated or copied, so that formatters,
+    copy.copy() and pickle see the complete record.
+    """
+    __slots__ = ('_ct', '_thread', '_task')
+
+    def __missing__(self, key):
+        try:
+            compute = _lazy_record_attrs[key]
+        except KeyError:
+            raise KeyError(key) from None
+        compute(self)
+        return dict.__getitem__(self, key)
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or key in _lazy_record_attrs
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def _materialize(self):
+        for key in _lazy_record_attrs:
+            if not dict.__contains__(self, key):
+                self[key]
+
+    def __iter__(self):
+        self._materialize()
+        return dict.__iter__(self)
+
+    def keys(self):
+        self._materialize()
+        return dict.keys(self)
+
+    def values(self):
+        self._materialize()
+        return dict.values(self)
+
+    def items(self):
+        self._materialize()
+        return dict.items(self)
+
+    def copy(self):
+        self._materialize()
+        return dict(self)
+
+    def __reduce__(self):
+        return dict, (self.copy(),)
+
+class LazyLogRecord(LogRecord):
+    """
+    A LogRecord which computes most of its attributes on first access.
+
+    The time, thread, process and asyncio task of the event are captured
+    when the record is created, but the derived attributes (such as
+    levelname, filename, created, threadName, processName and taskName)
+    are only computed if a filter, formatter or handler uses them. Use
+    setLogRecordFactory(LazyLogRecord) to create such records.
+    """
+    def __init__(self, name, level, pathname, lineno,
+                 msg, args, exc_info, func=None, sinfo=None, **kwargs):
+        """
+        Initialize a logging record with the information which cannot be
+        computed later.
+        """
+        ct = time.time_ns()
+        thread = threading.current_thread() if logThreads else None
+        task = None
+        if logAsyncioTasks:
+            asyncio = sys.modules.get('asyncio')
+            if asyncio:
+                try:
+                    if asyncio._get_running_loop() is not None:
+                        task = asyncio.current_task()
+                except Exception:
+                    pass
+        # See LogRecord.__init__() for why a mapping is unpacked.
+        if (args and len(args) == 1 and isinstance(args[0], collections.abc.Mapping)
+            and args[0]):
+            args = args[0]
+        # Build the dictionary at once: setting the attributes one by one
+        # is slower once __dict__ has been replaced.
+        d = _LazyRecordDict(
+            name=name,
+            msg=msg,
+            args=args,
+            levelno=level,
+            pathname=pathname,
+            exc_info=exc_info,
+            exc_text=None,      # used to cache the traceback text
+            stack_info=sinfo,
+            lineno=lineno,
+            funcName=func,
+            thread=thread.ident if thread is not None else None,
+            process=_pid if logProcesses else None,
+        )
+        d._ct = ct
+        d._thread = thread
+        d._task = task
+        self.__dict__ = d
+
+    def __getattr__(self, name):
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            ) from None
+
 #
 #   Determine which class to use when instantiating log records.
 #
@@ -730,6 +939,167 @@ def format(self, record):
 #
 _defaultFormatter = Formatter()
 
+_MISSING = object()
+
+class JSONFormatter(Formatter):
+    """
+    Formatter instances which convert a LogRecord to a JSON object.
+
+    The fields of the object are given as a sequence of LogRecord attribute
+    names, or as a mapping of JSON keys to attribute names.  The fields are
+    compiled once, when the formatter is created: the JSON keys are encoded
+    in advance and the values are encoded with the C accelerator of the
+    json module.  Attributes which the record does not have are left out,
+    unless a default value is given for them in defaults.
+
+    The "message" and "asctime" attributes are computed as by Formatter.
+    The text of the exception and of the stack information, if any, is
+    added as "exc_info" and "stack_info", unless these are fields already.
+    """
+
+    default_fields = ('asctime', 'levelname', 'name', 'message')
+
+    def __init__(self, fields=None, datefmt=None, *, defaults=None,
+                 ensure_ascii=True):
+        """
+        Initialize the formatter with the specified fields and date format.
+
+        Use datefmt as for Formatter.  Values which are not strings,
+        numbers, booleans, None, lists or dicts are converted by str().
+        """
+        import json
+        from json import encoder
+        super().__init__(None, datefmt, defaults=defaults)
+        self._defaults = defaults or {}
+        if fields is None:
+            fields = self.default_fields
+        if isinstance(fields, str):
+            fields = fields.split()
+        if isinstance(fields, collections.abc.Mapping):
+            items = list(fields.items())
+        else:
+            items = [(name, name) for name in fields]
+        if ensure_ascii:
+            self._encode_str = encoder.encode_basestring_ascii
+        else:
+            self._encode_str = encoder.encode_basestring
+        self._encoder = json.JSONEncoder(ensure_ascii=ensure_ascii,
+                                         default=str,
+                                         separators=(',', ':'))
+        # The plan is a tuple of (prefix, attribute, getter) tuples where
+        # prefix is the encoded key followed by a colon, and getter computes
+        # the value of the special attributes.  The exception and stack
+        # information which are not fields are in a separate plan, which is
+        # only used for the records which have them.
+        getters = {
+            'message': self._get_message,
+            'asctime': self._get_asctime,
+            'exc_info': self._get_exc_text,
+            'stack_info': self._get_stack_info,
+        }
+        plan = []
+        attrs = set()
+        for key, attr in items:
+            if not isinstance(key, str) or not isinstance(attr, str):
+                raise TypeError('JSONFormatter fields must be strings')
+            plan.append((self._encode_str(key) + ':', attr, getters.get(attr)))
+            attrs.add(attr)
+        extra_plan = []
+        for attr in ('exc_info', 'stack_info'):
+            if attr not in attrs:
+                step = (self._encode_str(attr) + ':', attr, getters[attr])
+                if attr in self._defaults:
+                    plan.append(step)
+                else:
+                    extra_plan.append(step)
+        self._plan = tuple(plan)
+        self._extra_plan = tuple(extra_plan)
+        self._uses_time = 'asctime' in attrs
+        # The time formatted by strftime(), cached for a second.
+        self._time_cache = (None, None, None)
+
+    def usesTime(self):
+        """
+        Check if the fields include the creation time of the record.
+        """
+        return self._uses_time
+
+    def formatTime(self, record, datefmt=None):
+        """
+        Return the creation time of the specified LogRecord as formatted text.
+
+        This is like Formatter.formatTime(), but time.strftime() is only
+        called once per second.
+        """
+        second = record.created // 1
+        cached_second, cached_datefmt, s = self._time_cache
+        if cached_second != second or cached_datefmt != datefmt:
+            ct = self.converter(record.created)
+            s = time.strftime(datefmt or self.default_time_format, ct)
+            self._time_cache = (second, datefmt, s)
+        if not datefmt and self.default_msec_format:
+            s = self.default_msec_format % (s, record.msecs)
+        return s
+
+    def _get_message(self, record):
+        record.message = value = record.getMessage()
+        return value
+
+    def _get_asctime(self, record):
+        record.asctime = value = self.formatTime(record, self.datefmt)
+        return value
+
+    def _get_exc_text(self, record):
+        if record.exc_info and not record.exc_text:
+            # Cache the traceback text as Formatter.format() does.
+            record.exc_text = self.formatException(record.exc_info)
+        return record.exc_text or _MISSING
+
+    def _get_stack_info(self, record):
+        if record.stack_info:
+            return self.formatStack(record.stack_info)
+        return _MISSING
+
+    def _encode_value(self, value):
+        tp = type(value)
+        if tp is str:
+            return self._encode_str(value)
+        if value is None:
+            return 'null'
+        if value is True:
+            return 'true'
+        if value is False:
+            return 'false'
+        if tp is int:
+            return int.__repr__(value)
+        return self._encoder.encode(value)
+
+    def format(self, record):
+        """
+        Format the specified record as a JSON object.
+        """
+        parts = []
+        plan = self._plan
+        if self._extra_plan and (record.exc_info or record.exc_text
+                                 or record.stack_info):
+            plan += self._extra_plan
+        encode_str = self._encode_str
+        for prefix, attr, getter in plan:
+            if getter is None:
+                value = getattr(record, attr, _MISSING)
+            else:
+                value = getter(record)
+            if type(value) is str:
+                # The most common case, encoded without a method call.
+                parts.append(prefix + encode_str(value))
+                continue
+            if value is _MISSING:
+                value = self._defaults.get(attr, _MISSING)
+                if value is _MISSING:
+                    continue
+            parts.append(prefix + self._encode_value(value))
+        return '{' + ','.join(parts) + '}'
+
 class BufferingFormatter(object):
     """
     A formatter suitable for formatting a number of records.
@@ -1607,10 +1977,21 @@ def findCaller(self, stack_info=False, stacklevel=1):
                 ## If we want to be pedantic:
                 #raise ValueError("call stack is not deep enough")
             f = next_f
-            if not _is_internal_frame(f):
+            try:
+                internal = _internal_filenames[f.f_code.co_filename]
+            except KeyError:
+                internal = _is_internal_frame(f)
+            if not internal:
                 stacklevel -= 1
         co = f.f_code
-        sinfo = None
+        key = (id(co), f.f_lasti)
+        try:
+            rv = _caller_locations[key][1]
+        except KeyError:
+            rv = co.co_filename, f.f_lineno, co.co_name, None
+            if len(_caller_locations) >= 1000:
+                _caller_locations.clear()
+            _caller_locations[key] = (co, rv)
         if stack_info:
             with io.StringIO() as sio:
                 sio.write("Stack (most recent call last):\n")
@@ -1618,7 +1999,8 @@ def findCaller(self, stack_info=False, stacklevel=1):
                 sinfo = sio.getvalue()
                 if sinfo[-1] == '\n':
                     sinfo = sinfo[:-1]
-        return co.co_filename, f.f_lineno, co.co_name, sinfo
+            rv = rv[:3] + (sinfo,)
+        return rv
 
     def makeRecord(self, name, level, fn, lno, msg, args, exc_info,
                    func=None, extra=None, sinfo=None):
@@ -23,6 +23,7 @@
 To use, simply 'import logging.handlers' and log away!
 """
 
+import collections
 import copy
 import io
 import logging
@@ -32,6 +33,7 @@
 import re
 import socket
 import struct
+import sys
 import threading
 import time
 
@@ -1656,3 +1658,372 @@ def stop(self):
             self.enqueue_sentinel()
             self._thread.join()
             self._thread = None
+
+
+def _batchable(handler):
+    # Records for a StreamHandler can be formatted and written in one go,
+    # unless a subclass customizes emit() (e.g. to rotate files).
+    emit = type(handler).emit
+    if emit is logging.FileHandler.emit:
+        return handler.stream is not None
+    return emit is logging.StreamHandler.emit
+
+
+class BackgroundHandler(logging.Handler):
+    """
+    This handler passes records to a background thread, which formats them
+    and writes them to a list of handlers in batches. The logging calls do
+    not wait for formatting and I/O, and do not acquire any lock unless the
+    buffer is full.
+
+    The records are not copied, so the arguments of a logging call should
+    not be mutated after it returns.
+    """
+    _OVERFLOW_POLICIES = ('block', 'drop', 'drop_oldest')
+
+    def __init__(self, *handlers, capacity=10000, overflow='block',
+                 batch_size=1000):
+        """
+        Initialise an instance with the specified handlers.
+
+        At most ``capacity`` records are buffered. When the buffer is full,
+        ``overflow`` determines what happens to a new record: 'block' waits
+        until the background thread has written a batch, 'drop' discards
+        the new record and 'drop_oldest' discards the oldest buffered
+        record. The ``dropped`` and ``blocked`` attributes count the
+        discarded records and the logging calls which had to wait.
+        """
+        if overflow not in self._OVERFLOW_POLICIES:
+            raise ValueError("overflow must be one of %s, not %r" %
+                             (', '.join(map(repr, self._OVERFLOW_POLICIES)),
+                              overflow))
+        if capacity <= 0:
+            raise ValueError("capacity must be greater than 0")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be greater than 0")
+        logging.Handler.__init__(self)
+        self.handlers = handlers
+        self.capacity = capacity
+        self.overflow = overflow
+        self.batch_size = batch_size
+        self.dropped = 0
+        self.blocked = 0
+        self._closed = False
+        self._reset()
+
+    def _reset(self):
+        # deque.append() and deque.popleft() are atomic, so the buffer is
+        # shared by the logging threads and the background thread without
+        # a lock. The condition protects the counters and the waiters.
+        self._buffer = collections.deque()
+        self._cond = threading.Condition()
+        self._wakeup = threading.Event()
+        self._idle = False
+        self._busy = False
+        self._waiting = 0
+        self._thread = None
+
+    def _at_fork_reinit(self):
+        # The background thread does not exist in the child process, and
+        # the buffered records are written by the parent.
+        logging.Handler._at_fork_reinit(self)
+        self._reset()
+
+    def handle(self, record):
+        """
+        Conditionally emit the specified logging record.
+
+        Unlike the base class, this does not acquire the handler lock.
+        """
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return rv
+
+    def emit(self, record):
+        """
+        Emit a record.
+
+        Append the record to the buffer and wake up the background thread
+        if it is idle. If the handler is closed, the record is handled in
+        the calling thread.
+        """
+        if self._thread is None and not self._start():
+            self._drain()
+            self.handle_batch([record])
+            return
+        buffer = self._buffer
+        if len(buffer) >= self.capacity and not self._make_room():
+            return
+        buffer.append(record)
+        if self._idle:
+            self._wakeup.set()
+
+    def _start(self):
+        with self._cond:
+            if self._closed:
+                return False
+            if self._thread is None:
+                self._thread = t = threading.Thread(
+                    target=self._monitor, name='BackgroundHandler',
+                    daemon=True)
+                t.start()
+            return True
+
+    def _make_room(self):
+        # Apply the overflow policy to a full buffer. Return true if the
+        # record should be added to the buffer.
+        with self._cond:
+            if threading.current_thread() is self._thread:
+                # A handler is logging: never wait for ourselves.
+                return self.overflow != 'drop'
+            if self.overflow == 'block':
+                self.blocked += 1
+                self._waiting += 1
+                try:
+                    while (len(self._buffer) >= self.capacity
+                           and self._thread is not None):
+                        self._wakeup.set()
+                        self._cond.wait()
+                finally:
+                    self._waiting -= 1
+                return True
+            self.dropped += 1
+            if self.overflow == 'drop':
+                return False
+            try:
+                self._buffer.popleft()
+            except IndexError:
+                pass
+            return True
+
+    def handle_batch(self, records):
+        """
+        Handle a list of records.
+
+        Records for a StreamHandler or FileHandler are formatted and written
+        to the stream at once, and the stream is flushed once per batch.
+        Other handlers handle each record in turn. The level of each handler
+        is respected.
+        """
+        for handler in self.handlers:
+            if _batchable(handler):
+                self._write_batch(handler, records)
+                continue
+            for record in records:
+                if record.levelno >= handler.level:
+                    try:
+                        handler.handle(record)
+                    except RecursionError:
+                        raise
+                    except Exception:
+                        self.handleError(record)
+
+    def _write_batch(self, handler, records):
+        with handler.lock:
+            parts = []
+            for record in records:
+                if record.levelno < handler.level:
+                    continue
+                try:
+                    rv = handler.filter(record)
+                    if not rv:
+                        continue
+                    if isinstance(rv, logging.LogRecord):
+                        record = rv
+                    parts.append(handler.format(record) + handler.terminator)
+                except RecursionError:
+                    raise
+                except Exception:
+                    handler.handleError(record)
+            if parts:
+                try:
+                    handler.stream.write(''.join(parts))
+                    handler.flush()
+                except RecursionError:
+                    raise
+                except Exception:
+                    handler.handleError(record)
+
+    def _monitor(self):
+        """
+        Write the buffered records in batches.
+
+        This method runs on a separate, internal thread, which terminates
+        when the handler is closed and the buffer is empty. An exception
+        raised by handle_batch() is reported by handleError() and the
+        thread goes on with the next batch.
+        """
+        buffer = self._buffer
+        try:
+            while True:
+                if not buffer:
+                    if self._closed:
+                        break
+                    # Tell emit() to wake us up, and check again to not miss
+                    # a record appended before.
+                    self._idle = True
+                    if not buffer and not self._closed:
+                        self._wakeup.wait()
+                    self._wakeup.clear()
+                    self._idle = False
+                    continue
+                self._busy = True
+                batch = []
+                try:
+                    for _ in range(self.batch_size):
+                        batch.append(buffer.popleft())
+                except IndexError:
+                    pass
+                try:
+                    self.handle_batch(batch)
+                except Exception:
+                    self.handleError(batch[-1])
+                finally:
+                    self._busy = False
+                if self._waiting:
+                    with self._cond:
+                        self._cond.notify_all()
+        finally:
+            # If the thread dies from another exception, the records are
+            # handled in the logging threads from now on, as after close().
+            with self._cond:
+                self._closed = True
+                if self._thread is threading.current_thread():
+                    self._thread = None
+                self._cond.notify_all()
+
+    def _drain(self):
+        # Handle the records left in the buffer by a background thread
+        # which died.
+        if self._thread is None and self._buffer:
+            records = []
+            try:
+                while True:
+                    records.append(self._buffer.popleft())
+            except IndexError:
+                pass
+            self.handle_batch(records)
+
+    def flush(self):
+        """
+        Wait until the background thread has written the buffered records.
+        """
+        with self._cond:
+            if self._thread is threading.current_thread():
+                return
+            self._waiting += 1
+            try:
+                while (self._buffer or self._busy) and self._thread is not None:
+                    self._wakeup.set()
+                    self._cond.wait()
+            finally:
+                self._waiting -= 1
+        self._drain()
+
+    def close(self):
+        """
+        Write the buffered records, stop the background thread and close
+        the handler. The handlers it writes to are not closed.
+        """
+        with self._cond:
+            self._closed = True
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            self._wakeup.set()
+            thread.join()
+        with self._cond:
+            self._thread = None
+        self._drain()
+        logging.Handler.close(self)
+
+
+class AsyncioHandler(BackgroundHandler):
+    """
+    A BackgroundHandler for asyncio applications. The logging calls never
+    wait for the background thread, so they do not block the event loop,
+    and the longest time spent in a logging call is recorded.
+
+    When a record is logged by a coroutine, the handler registers with the
+    running event loop, so that the buffered records are written when
+    loop.shutdown_asyncgens() is called, as by asyncio.run().
+    """
+    _OVERFLOW_POLICIES = ('drop', 'drop_oldest')
+
+    def __init__(self, *handlers, capacity=10000, overflow='drop_oldest',
+                 batch_size=1000):
+        """
+        Initialise an instance with the specified handlers.
+
+        The arguments are as for BackgroundHandler, except that the 'block'
+        overflow policy is not allowed. The ``max_stall`` attribute is the
+        longest time in seconds that a logging call has spent in this
+        handler.
+        """
+        BackgroundHandler.__init__(self, *handlers, capacity=capacity,
+                                   overflow=overflow, batch_size=batch_size)
+        self.max_stall = 0.0
+        # Maps the event loops to the asynchronous generators which flush
+        # the handler on shutdown, or to None once they have done so.
+        self._loops = {}
+
+    def handle(self, record):
+        """
+        Conditionally emit the specified logging record.
+
+        Unlike the base class, this does not acquire the handler lock.
+        """
+        start = time.perf_counter()
+        asyncio = sys.modules.get('asyncio')
+        if asyncio is not None:
+            loop = asyncio._get_running_loop()
+            if loop is not None and loop not in self._loops:
+                self._attach(loop)
+        rv = BackgroundHandler.handle(self, record)
+        stall = time.perf_counter() - start
+        if stall > self.max_stall:
+            self.max_stall = stall
+        return rv
+
+    def _attach(self, loop):
+        # Start an asynchronous generator in the event loop. The loop
+        # tracks it through its asyncgen hooks and closes it in
+        # shutdown_asyncgens(), which awaits the flush in its finally
+        # clause.
+        with self._cond:
+            if loop in self._loops or self._closed:
+                return
+            for other in [l for l in self._loops if l.is_closed()]:
+                del self._loops[other]
+            self._loops[loop] = agen = self._flush_on_shutdown(loop)
+        try:
+            agen.__anext__().send(None)
+        except StopIteration:
+            pass
+
+    async def _flush_on_shutdown(self, loop):
+        try:
+            yield
+        finally:
+            if loop in self._loops:
+                self._loops[loop] = None
+            await self.aflush()
+
+    async def aflush(self):
+        """
+        Wait until the background thread has written the buffered records,
+        without blocking the event loop.
+        """
+        import asyncio
+        await asyncio.get_running_loop().run_in_executor(None, self.flush)
+
+    def close(self):
+        """
+        Write the buffered records, stop the background thread and close
+        the handler. The handlers it writes to are not closed.
+        """
+        BackgroundHandler.close(self)
+        with self._cond:
+            self._loops.clear()
@@ -113,11 +113,11 @@ def SimpleQueue(self):
         return SimpleQueue(ctx=self.get_context())
 
     def Pool(self, processes=None, initializer=None, initargs=(),
-             maxtasksperchild=None):
+             maxtasksperchild=None, *, preload=None):
         '''Returns a process pool object'''
         from .pool import Pool
         return Pool(processes, initializer, initargs, maxtasksperchild,
-                    context=self.get_context())
+                    context=self.get_context(), preload=preload)
 
     def RawValue(self, typecode_or_type, *args):
         '''Returns a shared object'''
@@ -82,6 +82,22 @@ def set_forkserver_preload(self, modules_names, *, on_error='ignore'):
         self._preload_modules = modules_names
         self._preload_on_error = on_error
 
+    def _add_preload(self, module_names):
+        '''Add modules to the preload list if the fork server is not running.
+
+        The fork server is shared by all the processes started with the
+        forkserver start method, so the modules stay in the list for the
+        lifetime of the process.  If the fork server is already running, the
+        list is left unchanged and the processes import the modules
+        themselves.
+        '''
+        with self._lock:
+            if self._forkserver_pid is None:
+                self._preload_modules = (
+                    list(self._preload_modules) +
+                    [name for name in module_names
+                     if name not in self._preload_modules])
+
     def get_inherited_fds(self):
         '''Return list of fds inherited from parent process.
 
@@ -181,7 +181,7 @@ def Process(ctx, *args, **kwds):
         return ctx.Process(*args, **kwds)
 
     def __init__(self, processes=None, initializer=None, initargs=(),
-                 maxtasksperchild=None, context=None):
+                 maxtasksperchild=None, context=None, *, preload=None):
         # Attributes initialized early to make sure that they exist in
         # __del__() if __init__() raises an exception
         self._pool = []
@@ -209,6 +209,9 @@ def __init__(self, processes=None, initializer=None, initargs=(),
 
         if initializer is not None and not callable(initializer):
             raise TypeError('initializer must be a callable')
+        if preload is not None:
+            self._initializer, self._initargs = util._setup_preload(
+                self._ctx, preload, initializer, initargs)
 
         self._processes = processes
         try:
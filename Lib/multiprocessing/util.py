@@ -8,6 +8,7 @@
 #
 
 import os
+import functools
 import itertools
 import sys
 import weakref
@@ -511,6 +512,37 @@ def _flush_std_streams():
     except (AttributeError, ValueError):
         pass
 
+#
+# Preload modules in the worker processes of a pool
+#
+
+def _preload_initializer(module_names, initializer, initargs):
+    for name in module_names:
+        __import__(name)
+    if initializer is not None:
+        initializer(*initargs)
+
+def _setup_preload(ctx, module_names, initializer, initargs):
+    '''
+    Return the initializer and initargs of pool workers which import
+    module_names before calling initializer(*initargs).
+
+    With the forkserver start method, the modules are also added to the
+    modules preloaded by the fork server if it is not running yet, so that
+    the workers inherit them instead of importing them.  They stay
+    preloaded for all the processes started later by the fork server.
+    '''
+    if isinstance(module_names, str):
+        raise TypeError('preload must be a list of module names')
+    module_names = list(module_names)
+    if not all(type(name) is str for name in module_names):
+        raise TypeError('preload must be a list of module names')
+    if ctx.get_start_method(allow_none=False) == 'forkserver':
+        from . import forkserver
+        forkserver._forkserver._add_preload(module_names)
+    return (functools.partial(_preload_initializer, module_names,
+                              initializer, initargs), ())
+
 #
 # Start a program with only specified fds kept open
 #
@@ -1955,9 +1955,11 @@ def taropen(cls, name, mode="r", fileobj=None, **kwargs):
         return cls(name, mode, fileobj, **kwargs)
 
     @classmethod
-    def gzopen(cls, name, mode="r", fileobj=None, compresslevel=6, **kwargs):
+    def gzopen(cls, name, mode="r", fileobj=None, compresslevel=6, *,
+               index=None, **kwargs):
         """Open gzip compressed tar archive name for reading or writing.
-           Appending is not allowed.
+           Appending is not allowed. A gzip.GzipIndex of the archive can
+           be passed as index to speed up seeking when reading.
         """
         if mode not in ("r", "w", "x"):
             raise ValueError("mode must be 'r', 'w' or 'x'")
@@ -1968,7 +1970,8 @@ def gzopen(cls, name, mode="r", fileobj=None, compresslevel=6, **kwargs):
             raise CompressionError("gzip module is not available") from None
 
         try:
-            fileobj = GzipFile(name, mode + "b", compresslevel, fileobj)
+            fileobj = GzipFile(name, mode + "b", compresslevel, fileobj,
+                               index=index)
         except OSError as e:
             if fileobj is not None and mode == 'r':
                 raise ReadError("not a gzip file") from e
@@ -5423,6 +5423,18 @@ def test_pool_initializer(self):
         p.join()
         self.assertEqual(self.ns.test, 1)
 
+    @warnings_helper.ignore_fork_in_thread_deprecation_warnings()
+    def test_pool_preload(self):
+        self.assertRaises(TypeError, multiprocessing.Pool, preload='colorsys')
+        self.assertRaises(TypeError, multiprocessing.Pool, preload=[1])
+        with multiprocessing.Pool(1, initializer, (self.ns,),
+                                  preload=['colorsys']) as p:
+            self.assertIn('colorsys', p.apply(_imported_modules))
+        self.assertEqual(self.ns.test, 1)
+
+def _imported_modules():
+    return list(sys.modules)
+
 #
 # Issue 5155, 5313, 5331: Test process in processes
 # Verifies os.close(sys.stdin.fileno) vs. sys.stdin.close() behavior
@@ -6000,6 +6012,21 @@ def test_context_check_module_types(self):
         with self.assertRaisesRegex(TypeError, 'module_names must be a list of strings'):
             ctx.set_forkserver_preload([1, 2, 3])
 
+    def test_forkserver_add_preload(self):
+        try:
+            multiprocessing.get_context('forkserver')
+        except ValueError:
+            raise unittest.SkipTest('forkserver should be available')
+        from multiprocessing import forkserver
+        fs = forkserver.ForkServer()
+        fs.set_forkserver_preload(['__main__', 'colorsys'])
+        fs._add_preload(['colorsys', 'json'])
+        self.assertEqual(fs._preload_modules, ['__main__', 'colorsys', 'json'])
+        # The list is not changed once the fork server is running.
+        fs._forkserver_pid = -1
+        fs._add_preload(['csv'])
+        self.assertEqual(fs._preload_modules, ['__main__', 'colorsys', 'json'])
+
     @warnings_helper.ignore_fork_in_thread_deprecation_warnings()
     def test_set_get(self):
         multiprocessing.set_forkserver_preload(PRELOAD)
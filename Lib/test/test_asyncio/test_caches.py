@@ -0,0 +1,166 @@
+"""Tests for asyncio/caches.py"""
+
+import asyncio
+import inspect
+import unittest
+
+
+def tearDownModule():
+    asyncio.events._set_event_loop_policy(None)
+
+
+class CachedTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.calls = []
+        self.now = 0.0
+
+    def timer(self):
+        return self.now
+
+    async def test_cached(self):
+        @asyncio.cached(maxsize=2)
+        async def double(x):
+            self.calls.append(x)
+            await asyncio.sleep(0)
+            return x * 2
+
+        self.assertTrue(inspect.iscoroutinefunction(double))
+        self.assertEqual(await double(1), 2)
+        self.assertEqual(await double(1), 2)
+        self.assertEqual(await double(2), 4)
+        self.assertEqual(await double(3), 6)
+        self.assertEqual(await double(1), 2)
+        self.assertEqual(self.calls, [1, 2, 3, 1])
+        self.assertEqual(double.cache_info(), (1, 4, 2, 2, 2, 0))
+        double.cache_clear()
+        self.assertEqual(double.cache_info(), (0, 0, 2, 0, 0, 0))
+        self.assertEqual(double.__name__, 'double')
+
+    async def test_bare_decorator(self):
+        @asyncio.cached
+        async def double(x):
+            self.calls.append(x)
+            return x * 2
+
+        self.assertTrue(inspect.iscoroutinefunction(double))
+        self.assertEqual(await double(1), 2)
+        self.assertEqual(await double(1), 2)
+        self.assertEqual(self.calls, [1])
+        self.assertEqual(double.cache_info(), (1, 1, 128, 1, 0, 0))
+        self.assertEqual(double.cache_parameters()['maxsize'], 128)
+        self.assertEqual(double.__name__, 'double')
+
+    async def test_coalesce(self):
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        @asyncio.cached()
+        async def fetch(x):
+            self.calls.append(x)
+            started.set()
+            await release.wait()
+            return [x]
+
+        callers = [asyncio.create_task(fetch(1)) for _ in range(5)]
+        other = asyncio.create_task(fetch(2))
+        await started.wait()
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*callers)
+        self.assertEqual(await other, [2])
+        self.assertEqual(self.calls, [1, 2])
+        # All the callers got the same object.
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual(fetch.cache_info()[:4], (4, 2, 128, 2))
+
+    async def test_exception_not_cached(self):
+        @asyncio.cached()
+        async def fail(x):
+            self.calls.append(x)
+            await asyncio.sleep(0)
+            raise ValueError(x)
+
+        results = await asyncio.gather(fail(1), fail(1),
+                                       return_exceptions=True)
+        self.assertEqual([type(r) for r in results], [ValueError] * 2)
+        with self.assertRaises(ValueError):
+            await fail(1)
+        self.assertEqual(self.calls, [1, 1])
+        self.assertEqual(fail.cache_info().currsize, 0)
+
+    async def test_cancel_one_caller(self):
+        release = asyncio.Event()
+
+        @asyncio.cached()
+        async def fetch(x):
+            self.calls.append(x)
+            await release.wait()
+            return x
+
+        first = asyncio.create_task(fetch(1))
+        second = asyncio.create_task(fetch(1))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        self.assertEqual(await second, 1)
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+        self.assertEqual(self.calls, [1])
+        self.assertEqual(await fetch(1), 1)
+        self.assertEqual(self.calls, [1])
+
+    async def test_ttl(self):
+        @asyncio.cached(ttl=10, timer=self.timer)
+        async def fetch(x):
+            self.calls.append(x)
+            return x
+
+        await fetch(1)
+        self.now = 9
+        await fetch(1)
+        self.now = 10
+        await fetch(1)
+        self.assertEqual(self.calls, [1, 1])
+        self.assertEqual(fetch.cache_info().expirations, 1)
+        self.assertEqual(fetch.cache_parameters()['ttl'], 10)
+
+    async def test_maxsize_zero(self):
+        @asyncio.cached(maxsize=0)
+        async def fetch(x):
+            self.calls.append(x)
+            return x
+
+        await fetch(1)
+        await fetch(1)
+        self.assertEqual(self.calls, [1, 1])
+        self.assertEqual(fetch.cache_info(), (0, 2, 0, 0, 0, 0))
+
+    async def test_method(self):
+        calls = self.calls
+
+        class Service:
+            def __init__(self, name):
+                self.name = name
+
+            @asyncio.cached()
+            async def lookup(self, x):
+                calls.append((self.name, x))
+                return f'{self.name}:{x}'
+
+        a, b = Service('a'), Service('b')
+        self.assertEqual(await a.lookup(1), 'a:1')
+        self.assertEqual(await b.lookup(1), 'b:1')
+        self.assertEqual(await a.lookup(1), 'a:1')
+        self.assertEqual(calls, [('a', 1), ('b', 1)])
+
+    def test_errors(self):
+        self.assertRaises(ValueError, asyncio.cached, ttl=-1)
+        self.assertRaises(ValueError, asyncio.cached, policy='fifo')
+        self.assertRaises(TypeError, asyncio.cached, weigher='len')
+        self.assertRaises(TypeError, asyncio.cached, 1.5)
+        self.assertRaises(TypeError, asyncio.cached, '128')
+
+
+if __name__ == "__main__":
+    unittest.main()
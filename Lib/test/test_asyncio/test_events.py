@@ -2358,6 +2358,13 @@ class EPollEventLoopTests(EventLoopTestsMixin,
             def create_event_loop(self):
                 return asyncio.SelectorEventLoop(selectors.EpollSelector())
 
+    class IoUringEventLoopTests(EventLoopTestsMixin,
+                                SubprocessTestsMixin,
+                                test_utils.TestCase):
+
+        def create_event_loop(self):
+            return asyncio.IoUringEventLoop()
+
     if hasattr(selectors, 'PollSelector'):
         class PollEventLoopTests(EventLoopTestsMixin,
                                  SubprocessTestsMixin,
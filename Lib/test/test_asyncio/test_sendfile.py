@@ -566,6 +566,12 @@ class EPollEventLoopTests(SendfileTestsBase,
             def create_event_loop(self):
                 return asyncio.SelectorEventLoop(selectors.EpollSelector())
 
+    class IoUringEventLoopTests(SendfileTestsBase,
+                                test_utils.TestCase):
+
+        def create_event_loop(self):
+            return asyncio.IoUringEventLoop()
+
     if hasattr(selectors, 'PollSelector'):
         class PollEventLoopTests(SendfileTestsBase,
                                  test_utils.TestCase):
@@ -660,6 +660,12 @@ class EPollEventLoopTests(BaseSockTestsMixin,
             def create_event_loop(self):
                 return asyncio.SelectorEventLoop(selectors.EpollSelector())
 
+    class IoUringEventLoopTests(BaseSockTestsMixin,
+                                test_utils.TestCase):
+
+        def create_event_loop(self):
+            return asyncio.IoUringEventLoop()
+
     if hasattr(selectors, 'PollSelector'):
         class PollEventLoopTests(BaseSockTestsMixin,
                                  test_utils.TestCase):
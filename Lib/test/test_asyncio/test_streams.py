@@ -583,6 +583,239 @@ def test_readexactly_exception(self):
         self.assertRaises(
             ValueError, self.loop.run_until_complete, stream.readexactly(2))
 
+    def test_readinto(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        buf = bytearray(10)
+        read_task = self.loop.create_task(stream.readinto(buf))
+
+        def cb():
+            stream.feed_data(b'line1')
+            stream.feed_data(b'line2')
+        self.loop.call_soon(cb)
+
+        n = self.loop.run_until_complete(read_task)
+        self.assertEqual(n, 10)
+        self.assertEqual(buf, b'line1line2')
+        self.assertEqual(b'', stream._buffer)
+
+        stream.feed_data(b'abc')
+        n = self.loop.run_until_complete(stream.readinto(memoryview(buf)[2:]))
+        self.assertEqual(n, 3)
+        self.assertEqual(buf, b'liabcline2')
+        self.assertEqual(b'', stream._buffer)
+
+        stream.feed_data(self.DATA)
+        n = self.loop.run_until_complete(stream.readinto(bytearray(0)))
+        self.assertEqual(n, 0)
+        self.assertEqual(self.DATA, stream._buffer)
+
+        import array
+        buf = array.array('i', [0, 0])
+        n = self.loop.run_until_complete(stream.readinto(buf))
+        self.assertEqual(n, 8)
+        self.assertEqual(buf.tobytes(), self.DATA[:8])
+        # The buffer can be resized again
+        buf.append(0)
+
+        with self.assertRaises(TypeError):
+            self.loop.run_until_complete(stream.readinto(b'readonly'))
+        self.assertEqual(self.DATA[8:], stream._buffer)
+
+    def test_readinto_eof(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'data')
+        stream.feed_eof()
+        buf = bytearray(10)
+        n = self.loop.run_until_complete(stream.readinto(buf))
+        self.assertEqual(n, 4)
+        n = self.loop.run_until_complete(stream.readinto(buf))
+        self.assertEqual(n, 0)
+        self.assertEqual(buf, b'data' + bytes(6))
+        self.assertTrue(stream.at_eof())
+
+    def test_readinto_exception(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.set_exception(ValueError())
+        self.assertRaises(
+            ValueError, self.loop.run_until_complete,
+            stream.readinto(bytearray(10)))
+
+    def test_read_view(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        read_task = self.loop.create_task(stream.read_view(8))
+
+        def cb():
+            stream.feed_data(b'line1')
+            stream.feed_data(b'line2')
+        self.loop.call_soon(cb)
+
+        view = self.loop.run_until_complete(read_task)
+        self.assertIsInstance(view, memoryview)
+        self.assertTrue(view.readonly)
+        self.assertEqual(view, b'line1lin')
+        self.assertEqual(b'e2', stream._buffer)
+
+        # The view stays valid when more data is received.
+        stream.feed_data(b'x' * 100_000)
+        self.assertEqual(view, b'line1lin')
+
+        # It is released by the next read.
+        data = self.loop.run_until_complete(stream.readexactly(2))
+        self.assertEqual(data, b'e2')
+        self.assertRaises(ValueError, len, view)
+
+        view = self.loop.run_until_complete(stream.read_view(0))
+        self.assertEqual(view, b'')
+        self.assertEqual(stream._buffer, b'x' * 100_000)
+
+        with self.assertRaisesRegex(ValueError, 'less than zero'):
+            self.loop.run_until_complete(stream.read_view(-1))
+
+    def test_read_view_eof(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(self.DATA)
+        stream.feed_eof()
+        with self.assertRaises(asyncio.IncompleteReadError) as cm:
+            self.loop.run_until_complete(stream.read_view(100))
+        self.assertEqual(cm.exception.partial, self.DATA)
+        self.assertEqual(cm.exception.expected, 100)
+        self.assertEqual(b'', stream._buffer)
+
+    def test_read_view_exception(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'line\n')
+        stream.set_exception(ValueError())
+        self.assertRaises(
+            ValueError, self.loop.run_until_complete, stream.read_view(2))
+
+    def test_buffered_protocol(self):
+        stream = asyncio.StreamReader(limit=10, loop=self.loop)
+        protocol = asyncio.StreamReaderProtocol(stream, loop=self.loop)
+        self.assertIsInstance(protocol, asyncio.BufferedProtocol)
+        transport = mock.Mock()
+        protocol.connection_made(transport)
+
+        buf = protocol.get_buffer(-1)
+        self.assertGreater(len(buf), 0)
+        buf[:5] = b'spam\n'
+        protocol.buffer_updated(5)
+        self.assertEqual(b'spam\n', stream._buffer)
+        self.assertFalse(transport.pause_reading.called)
+
+        # The data is received directly into the storage of the stream.
+        buf = protocol.get_buffer(100)
+        self.assertGreaterEqual(len(buf), 100)
+        buf[:20] = b'eggs\n' * 4
+        protocol.buffer_updated(20)
+        self.assertEqual(b'spam\n' + b'eggs\n' * 4, stream._buffer)
+        self.assertTrue(transport.pause_reading.called)
+
+        line = self.loop.run_until_complete(stream.readline())
+        self.assertEqual(line, b'spam\n')
+        self.assertFalse(transport.resume_reading.called)
+        data = self.loop.run_until_complete(stream.read(10))
+        self.assertEqual(data, b'eggs\neggs\n')
+        self.assertTrue(transport.resume_reading.called)
+
+        protocol.eof_received()
+        data = self.loop.run_until_complete(stream.read())
+        self.assertEqual(data, b'eggs\neggs\n')
+        self.assertTrue(stream.at_eof())
+
+    def test_data_received_override(self):
+        # Subclasses which override data_received() still receive the data
+        # through it.
+        class Protocol(asyncio.StreamReaderProtocol):
+            def data_received(self, data):
+                received.append(data)
+                super().data_received(data.upper())
+
+        received = []
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = Protocol(stream, loop=self.loop)
+        protocol.connection_made(mock.Mock())
+        buf = protocol.get_buffer(-1)
+        buf[:5] = b'spam\n'
+        protocol.buffer_updated(5)
+        self.assertEqual(received, [b'spam\n'])
+        line = self.loop.run_until_complete(stream.readline())
+        self.assertEqual(line, b'SPAM\n')
+
+        rsock, wsock = socket.socketpair()
+        self.addCleanup(wsock.close)
+        stream = asyncio.StreamReader(loop=self.loop)
+        transport, _ = self.loop.run_until_complete(
+            self.loop.create_connection(
+                lambda: Protocol(stream, loop=self.loop), sock=rsock))
+        self.addCleanup(transport.close)
+        wsock.sendall(b'eggs\n')
+        line = self.loop.run_until_complete(stream.readline())
+        self.assertEqual(line, b'EGGS\n')
+        self.assertEqual(received[1:], [b'eggs\n'])
+
+        # The direct path is kept by the other subclasses.
+        class Other(asyncio.StreamReaderProtocol):
+            pass
+        self.assertIs(Other.get_buffer, asyncio.StreamReaderProtocol.get_buffer)
+
+    def test_buffer_reuse(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.StreamReaderProtocol(stream, loop=self.loop)
+        buf = protocol.get_buffer(-1)
+        buf[:4] = b'data'
+        protocol.buffer_updated(4)
+        view = self.loop.run_until_complete(stream.read_view(4))
+        self.assertEqual(view, b'data')
+
+        # Data received while the view is in use does not overwrite it.
+        for i in range(10):
+            buf = protocol.get_buffer(-1)
+            buf[:4] = b'%4d' % i
+            protocol.buffer_updated(4)
+            self.assertEqual(view, b'data')
+
+        storage = stream._storage
+        for i in range(10):
+            data = self.loop.run_until_complete(stream.read_view(4))
+            self.assertEqual(data, b'%4d' % i)
+        self.assertEqual(b'', stream._buffer)
+
+        # Once the data was consumed, the storage is reused.
+        buf = protocol.get_buffer(-1)
+        buf[:4] = b'more'
+        protocol.buffer_updated(4)
+        self.assertEqual(b'more', stream._buffer)
+        data = self.loop.run_until_complete(stream.read(4))
+        self.assertEqual(data, b'more')
+        self.assertIs(stream._storage, storage)
+
+    def test_read_view_exported(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'data')
+        view = self.loop.run_until_complete(stream.read_view(4))
+        derived = memoryview(view)
+        exported = pickle.PickleBuffer(view)
+
+        # The data the view refers to is not overwritten while it is still
+        # exported after the next read.
+        stream.feed_data(b'more')
+        data = self.loop.run_until_complete(stream.read(4))
+        self.assertEqual(data, b'more')
+        self.assertEqual(view, b'data')
+        for i in range(10):
+            stream.feed_data(b'%4d' % i)
+            data = self.loop.run_until_complete(stream.read(4))
+            self.assertEqual(data, b'%4d' % i)
+            self.assertEqual(derived, b'data')
+            self.assertEqual(exported.raw(), b'data')
+
+        del exported
+        view = self.loop.run_until_complete(stream.read_view(0))
+        stream.feed_data(b'more')
+        data = self.loop.run_until_complete(stream.read(4))
+        self.assertEqual(data, b'more')
+        self.assertEqual(derived, b'data')
+
     def test_exception(self):
         stream = asyncio.StreamReader(loop=self.loop)
         self.assertIsNone(stream.exception())
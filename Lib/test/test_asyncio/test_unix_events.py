@@ -6,6 +6,8 @@
 import multiprocessing
 from multiprocessing.util import _cleanup_tests as multiprocessing_cleanup_tests
 import os
+import select
+import selectors
 import signal
 import socket
 import stat
@@ -656,6 +658,123 @@ def test_sock_sendfile_exception(self):
         self.assertEqual(1000, self.file.tell())
 
 
+def _io_uring_available():
+    try:
+        select.io_uring().close()
+    except (AttributeError, OSError):
+        return False
+    return True
+
+
+class _RingSpy:
+    # Count the calls to io_uring.wait(), which submit the queued requests.
+
+    def __init__(self, ring):
+        self._ring = ring
+        self.waits = 0
+
+    def __getattr__(self, name):
+        return getattr(self._ring, name)
+
+    def wait(self, timeout=None):
+        self.waits += 1
+        return self._ring.wait(timeout)
+
+
+class IoUringEventLoopTests(test_utils.TestCase):
+
+    def socketpair(self):
+        a, b = socket.socketpair()
+        self.addCleanup(a.close)
+        self.addCleanup(b.close)
+        a.setblocking(False)
+        b.setblocking(False)
+        return a, b
+
+    def test_fallback(self):
+        with mock.patch('select.io_uring', create=True,
+                        side_effect=PermissionError(errno.EPERM, 'disabled')):
+            loop = asyncio.IoUringEventLoop()
+        self.set_event_loop(loop)
+        self.assertIsNone(loop._proactor)
+        self.assertIsInstance(loop._selector, selectors.DefaultSelector)
+        a, b = self.socketpair()
+        loop.run_until_complete(loop.sock_sendall(a, b'spam'))
+        self.assertEqual(loop.run_until_complete(loop.sock_recv(b, 10)),
+                         b'spam')
+
+    @unittest.skipUnless(_io_uring_available(), 'requires io_uring')
+    def test_batched_submission(self):
+        loop = asyncio.IoUringEventLoop()
+        self.set_event_loop(loop)
+        spy = loop._proactor._ring = _RingSpy(loop._proactor._ring)
+        pairs = [self.socketpair() for _ in range(10)]
+
+        async def echo(a, b, data):
+            await loop.sock_sendall(a, data)
+            return await loop.sock_recv(b, 100)
+
+        async def main():
+            return await asyncio.gather(
+                *[echo(a, b, b'%d' % i) for i, (a, b) in enumerate(pairs)])
+
+        results = loop.run_until_complete(main())
+        self.assertEqual(results, [b'%d' % i for i in range(10)])
+        # The 10 sends, then the 10 receives, were submitted together.
+        self.assertLessEqual(spy.waits, 4)
+
+    @unittest.skipUnless(_io_uring_available(), 'requires io_uring')
+    def test_close_cancels_requests(self):
+        loop = asyncio.IoUringEventLoop()
+        a, b = self.socketpair()
+        buf = bytearray(10)
+        fut = loop._proactor.recv_into(a, buf)
+        loop.run_until_complete(asyncio.sleep(0.01))
+        self.assertFalse(fut.done())
+        loop.close()
+        self.assertTrue(fut.cancelled())
+        # The request was cancelled: the buffer is no longer in use.
+        buf.extend(b'spam')
+
+    @unittest.skipUnless(_io_uring_available(), 'requires io_uring')
+    def test_cancel_request(self):
+        loop = asyncio.IoUringEventLoop()
+        self.set_event_loop(loop)
+        a, b = self.socketpair()
+        task = loop.create_task(loop.sock_recv(a, 10))
+        loop.run_until_complete(asyncio.sleep(0.01))
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            loop.run_until_complete(task)
+        loop.run_until_complete(asyncio.sleep(0.01))
+        self.assertEqual(loop._proactor._cache, {})
+        b.send(b'spam')
+        self.assertEqual(loop.run_until_complete(loop.sock_recv(a, 10)),
+                         b'spam')
+
+    @unittest.skipUnless(_io_uring_available(), 'requires io_uring')
+    def test_close_after_reset(self):
+        loop = asyncio.IoUringEventLoop()
+        self.set_event_loop(loop)
+        a, b = self.socketpair()
+        lost = loop.create_future()
+
+        class Protocol(asyncio.Protocol):
+            def connection_lost(self, exc):
+                lost.set_result(exc)
+
+        transport, _ = loop.run_until_complete(
+            loop.create_connection(Protocol, sock=a))
+        self.assertIsInstance(transport, unix_events._IoUringSocketTransport)
+        # shutdown() fails with ENOTCONN if the peer reset the connection,
+        # which must not prevent closing the socket.
+        with mock.patch.object(socket.socket, 'shutdown',
+                               side_effect=OSError(errno.ENOTCONN, 'reset')):
+            transport.close()
+            self.assertIsNone(loop.run_until_complete(lost))
+        self.assertEqual(a.fileno(), -1)
+
+
 class UnixReadPipeTransportTests(test_utils.TestCase):
 
     def setUp(self):
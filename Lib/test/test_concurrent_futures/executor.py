@@ -59,6 +59,21 @@ def test_submit_keyword(self):
         with self.assertRaises(TypeError):
             self.executor.submit(arg=1)
 
+    @warnings_helper.ignore_fork_in_thread_deprecation_warnings()
+    def test_submit_many(self):
+        fs = self.executor.submit_many(pow, range(10), range(10))
+        self.assertEqual(len(fs), 10)
+        self.assertEqual([f.result() for f in fs],
+                         list(map(pow, range(10), range(10))))
+
+        fs = self.executor.submit_many(divmod, [1, 1], [2, 0])
+        self.assertEqual(fs[0].result(), (0, 1))
+        self.assertRaises(ZeroDivisionError, fs[1].result)
+
+        self.assertEqual(self.executor.submit_many(pow, []), [])
+        with self.assertRaises(TypeError):
+            self.executor.submit_many(fn=pow)
+
     @warnings_helper.ignore_fork_in_thread_deprecation_warnings()
     def test_map(self):
         self.assertEqual(
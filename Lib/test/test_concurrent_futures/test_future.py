@@ -3,25 +3,39 @@
 import unittest
 from concurrent import futures
 from concurrent.futures._base import (
-    PENDING, RUNNING, CANCELLED, CANCELLED_AND_NOTIFIED, FINISHED, Future)
+    PENDING, RUNNING, CANCELLED, CANCELLED_AND_NOTIFIED, FINISHED)
+from concurrent.futures import _base
 
 from test import support
 from test.support import threading_helper
 
-from .util import (
-    PENDING_FUTURE, RUNNING_FUTURE, CANCELLED_FUTURE,
-    CANCELLED_AND_NOTIFIED_FUTURE, EXCEPTION_FUTURE, SUCCESSFUL_FUTURE,
-    BaseTestCase, create_future, setup_module)
+from .util import BaseTestCase, create_future, setup_module
 
 
-class FutureTests(BaseTestCase):
+class BaseFutureTests:
+    Future = None
+
+    def setUp(self):
+        super().setUp()
+        self.PENDING_FUTURE = self.create_future(state=PENDING)
+        self.RUNNING_FUTURE = self.create_future(state=RUNNING)
+        self.CANCELLED_FUTURE = self.create_future(state=CANCELLED)
+        self.CANCELLED_AND_NOTIFIED_FUTURE = self.create_future(
+            state=CANCELLED_AND_NOTIFIED)
+        self.EXCEPTION_FUTURE = self.create_future(state=FINISHED,
+                                                   exception=OSError())
+        self.SUCCESSFUL_FUTURE = self.create_future(state=FINISHED, result=42)
+
+    def create_future(self, **kwargs):
+        return create_future(future_class=self.Future, **kwargs)
+
     def test_done_callback_with_result(self):
         callback_result = None
         def fn(callback_future):
             nonlocal callback_result
             callback_result = callback_future.result()
 
-        f = Future()
+        f = self.Future()
         f.add_done_callback(fn)
         f.set_result(5)
         self.assertEqual(5, callback_result)
@@ -32,7 +46,7 @@ def fn(callback_future):
             nonlocal callback_exception
             callback_exception = callback_future.exception()
 
-        f = Future()
+        f = self.Future()
         f.add_done_callback(fn)
         f.set_exception(Exception('test'))
         self.assertEqual(('test',), callback_exception.args)
@@ -43,7 +57,7 @@ def fn(callback_future):
             nonlocal was_cancelled
             was_cancelled = callback_future.cancelled()
 
-        f = Future()
+        f = self.Future()
         f.add_done_callback(fn)
         self.assertTrue(f.cancel())
         self.assertTrue(was_cancelled)
@@ -62,7 +76,7 @@ def fn(callback_future):
                 nonlocal fn_was_called
                 fn_was_called = True
 
-            f = Future()
+            f = self.Future()
             f.add_done_callback(raising_fn)
             f.add_done_callback(fn)
             f.set_result(5)
@@ -76,7 +90,7 @@ def fn(callback_future):
             nonlocal callback_result
             callback_result = callback_future.result()
 
-        f = Future()
+        f = self.Future()
         f.set_result(5)
         f.add_done_callback(fn)
         self.assertEqual(5, callback_result)
@@ -87,7 +101,7 @@ def fn(callback_future):
             nonlocal callback_exception
             callback_exception = callback_future.exception()
 
-        f = Future()
+        f = self.Future()
         f.set_exception(Exception('test'))
         f.add_done_callback(fn)
         self.assertEqual(('test',), callback_exception.args)
@@ -98,7 +112,7 @@ def fn(callback_future):
             nonlocal was_cancelled
             was_cancelled = callback_future.cancelled()
 
-        f = Future()
+        f = self.Future()
         self.assertTrue(f.cancel())
         f.add_done_callback(fn)
         self.assertTrue(was_cancelled)
@@ -108,7 +122,7 @@ def test_done_callback_raises_already_succeeded(self):
             def raising_fn(callback_future):
                 raise Exception('doh!')
 
-            f = Future()
+            f = self.Future()
 
             # Set the result first to simulate a future that runs instantly,
             # effectively allowing the callback to be run immediately.
@@ -120,28 +134,28 @@ def raising_fn(callback_future):
 
 
     def test_repr(self):
-        self.assertRegex(repr(PENDING_FUTURE),
+        self.assertRegex(repr(self.PENDING_FUTURE),
                          '<Future at 0x[0-9a-f]+ state=pending>')
-        self.assertRegex(repr(RUNNING_FUTURE),
+        self.assertRegex(repr(self.RUNNING_FUTURE),
                          '<Future at 0x[0-9a-f]+ state=running>')
-        self.assertRegex(repr(CANCELLED_FUTURE),
+        self.assertRegex(repr(self.CANCELLED_FUTURE),
                          '<Future at 0x[0-9a-f]+ state=cancelled>')
-        self.assertRegex(repr(CANCELLED_AND_NOTIFIED_FUTURE),
+        self.assertRegex(repr(self.CANCELLED_AND_NOTIFIED_FUTURE),
                          '<Future at 0x[0-9a-f]+ state=cancelled>')
         self.assertRegex(
-                repr(EXCEPTION_FUTURE),
+                repr(self.EXCEPTION_FUTURE),
                 '<Future at 0x[0-9a-f]+ state=finished raised OSError>')
         self.assertRegex(
-                repr(SUCCESSFUL_FUTURE),
+                repr(self.SUCCESSFUL_FUTURE),
                 '<Future at 0x[0-9a-f]+ state=finished returned int>')
 
     def test_cancel(self):
-        f1 = create_future(state=PENDING)
-        f2 = create_future(state=RUNNING)
-        f3 = create_future(state=CANCELLED)
-        f4 = create_future(state=CANCELLED_AND_NOTIFIED)
-        f5 = create_future(state=FINISHED, exception=OSError())
-        f6 = create_future(state=FINISHED, result=5)
+        f1 = self.create_future(state=PENDING)
+        f2 = self.create_future(state=RUNNING)
+        f3 = self.create_future(state=CANCELLED)
+        f4 = self.create_future(state=CANCELLED_AND_NOTIFIED)
+        f5 = self.create_future(state=FINISHED, exception=OSError())
+        f6 = self.create_future(state=FINISHED, result=5)
 
         self.assertTrue(f1.cancel())
         self.assertEqual(f1._state, CANCELLED)
@@ -162,40 +176,40 @@ def test_cancel(self):
         self.assertEqual(f6._state, FINISHED)
 
     def test_cancelled(self):
-        self.assertFalse(PENDING_FUTURE.cancelled())
-        self.assertFalse(RUNNING_FUTURE.cancelled())
-        self.assertTrue(CANCELLED_FUTURE.cancelled())
-        self.assertTrue(CANCELLED_AND_NOTIFIED_FUTURE.cancelled())
-        self.assertFalse(EXCEPTION_FUTURE.cancelled())
-        self.assertFalse(SUCCESSFUL_FUTURE.cancelled())
+        self.assertFalse(self.PENDING_FUTURE.cancelled())
+        self.assertFalse(self.RUNNING_FUTURE.cancelled())
+        self.assertTrue(self.CANCELLED_FUTURE.cancelled())
+        self.assertTrue(self.CANCELLED_AND_NOTIFIED_FUTURE.cancelled())
+        self.assertFalse(self.EXCEPTION_FUTURE.cancelled())
+        self.assertFalse(self.SUCCESSFUL_FUTURE.cancelled())
 
     def test_done(self):
-        self.assertFalse(PENDING_FUTURE.done())
-        self.assertFalse(RUNNING_FUTURE.done())
-        self.assertTrue(CANCELLED_FUTURE.done())
-        self.assertTrue(CANCELLED_AND_NOTIFIED_FUTURE.done())
-        self.assertTrue(EXCEPTION_FUTURE.done())
-        self.assertTrue(SUCCESSFUL_FUTURE.done())
+        self.assertFalse(self.PENDING_FUTURE.done())
+        self.assertFalse(self.RUNNING_FUTURE.done())
+        self.assertTrue(self.CANCELLED_FUTURE.done())
+        self.assertTrue(self.CANCELLED_AND_NOTIFIED_FUTURE.done())
+        self.assertTrue(self.EXCEPTION_FUTURE.done())
+        self.assertTrue(self.SUCCESSFUL_FUTURE.done())
 
     def test_running(self):
-        self.assertFalse(PENDING_FUTURE.running())
-        self.assertTrue(RUNNING_FUTURE.running())
-        self.assertFalse(CANCELLED_FUTURE.running())
-        self.assertFalse(CANCELLED_AND_NOTIFIED_FUTURE.running())
-        self.assertFalse(EXCEPTION_FUTURE.running())
-        self.assertFalse(SUCCESSFUL_FUTURE.running())
+        self.assertFalse(self.PENDING_FUTURE.running())
+        self.assertTrue(self.RUNNING_FUTURE.running())
+        self.assertFalse(self.CANCELLED_FUTURE.running())
+        self.assertFalse(self.CANCELLED_AND_NOTIFIED_FUTURE.running())
+        self.assertFalse(self.EXCEPTION_FUTURE.running())
+        self.assertFalse(self.SUCCESSFUL_FUTURE.running())
 
     def test_result_with_timeout(self):
         self.assertRaises(futures.TimeoutError,
-                          PENDING_FUTURE.result, timeout=0)
+                          self.PENDING_FUTURE.result, timeout=0)
         self.assertRaises(futures.TimeoutError,
-                          RUNNING_FUTURE.result, timeout=0)
+                          self.RUNNING_FUTURE.result, timeout=0)
         self.assertRaises(futures.CancelledError,
-                          CANCELLED_FUTURE.result, timeout=0)
+                          self.CANCELLED_FUTURE.result, timeout=0)
         self.assertRaises(futures.CancelledError,
-                          CANCELLED_AND_NOTIFIED_FUTURE.result, timeout=0)
-        self.assertRaises(OSError, EXCEPTION_FUTURE.result, timeout=0)
-        self.assertEqual(SUCCESSFUL_FUTURE.result(timeout=0), 42)
+                          self.CANCELLED_AND_NOTIFIED_FUTURE.result, timeout=0)
+        self.assertRaises(OSError, self.EXCEPTION_FUTURE.result, timeout=0)
+        self.assertEqual(self.SUCCESSFUL_FUTURE.result(timeout=0), 42)
 
     def test_result_with_success(self):
         # TODO(brian@sweetapp.com): This test is timing dependent.
@@ -204,7 +218,7 @@ def notification():
             time.sleep(1)
             f1.set_result(42)
 
-        f1 = create_future(state=PENDING)
+        f1 = self.create_future(state=PENDING)
         t = threading.Thread(target=notification)
         t.start()
 
@@ -218,7 +232,7 @@ def notification():
             time.sleep(1)
             f1.cancel()
 
-        f1 = create_future(state=PENDING)
+        f1 = self.create_future(state=PENDING)
         t = threading.Thread(target=notification)
         t.start()
 
@@ -228,16 +242,16 @@ def notification():
 
     def test_exception_with_timeout(self):
         self.assertRaises(futures.TimeoutError,
-                          PENDING_FUTURE.exception, timeout=0)
+                          self.PENDING_FUTURE.exception, timeout=0)
         self.assertRaises(futures.TimeoutError,
-                          RUNNING_FUTURE.exception, timeout=0)
+                          self.RUNNING_FUTURE.exception, timeout=0)
         self.assertRaises(futures.CancelledError,
-                          CANCELLED_FUTURE.exception, timeout=0)
+                          self.CANCELLED_FUTURE.exception, timeout=0)
         self.assertRaises(futures.CancelledError,
-                          CANCELLED_AND_NOTIFIED_FUTURE.exception, timeout=0)
-        self.assertTrue(isinstance(EXCEPTION_FUTURE.exception(timeout=0),
+                          self.CANCELLED_AND_NOTIFIED_FUTURE.exception, timeout=0)
+        self.assertTrue(isinstance(self.EXCEPTION_FUTURE.exception(timeout=0),
                                    OSError))
-        self.assertEqual(SUCCESSFUL_FUTURE.exception(timeout=0), None)
+        self.assertEqual(self.SUCCESSFUL_FUTURE.exception(timeout=0), None)
 
     def test_exception_with_success(self):
         def notification():
@@ -248,7 +262,7 @@ def notification():
                 f1._exception = OSError()
                 f1._condition.notify_all()
 
-        f1 = create_future(state=PENDING)
+        f1 = self.create_future(state=PENDING)
         t = threading.Thread(target=notification)
         t.start()
 
@@ -256,7 +270,7 @@ def notification():
         t.join()
 
     def test_multiple_set_result(self):
-        f = create_future(state=PENDING)
+        f = self.create_future(state=PENDING)
         f.set_result(1)
 
         with self.assertRaisesRegex(
@@ -270,7 +284,7 @@ def test_multiple_set_result(self):
         self.assertEqual(f.result(), 1)
 
     def test_multiple_set_exception(self):
-        f = create_future(state=PENDING)
+        f = self.create_future(state=PENDING)
         e = ValueError()
         f.set_exception(e)
 
@@ -286,7 +300,7 @@ def test_multiple_set_exception(self):
     def test_get_snapshot(self):
         """Test the _get_snapshot method for atomic state retrieval."""
         # Test with a pending future
-        f = Future()
+        f = self.Future()
         done, cancelled, result, exception = f._get_snapshot()
         self.assertFalse(done)
         self.assertFalse(cancelled)
@@ -294,7 +308,7 @@ def test_get_snapshot(self):
         self.assertIsNone(exception)
 
         # Test with a finished future (successful result)
-        f = Future()
+        f = self.Future()
         f.set_result(42)
         done, cancelled, result, exception = f._get_snapshot()
         self.assertTrue(done)
@@ -303,7 +317,7 @@ def test_get_snapshot(self):
         self.assertIsNone(exception)
 
         # Test with a finished future (exception)
-        f = Future()
+        f = self.Future()
         exc = ValueError("test error")
         f.set_exception(exc)
         done, cancelled, result, exception = f._get_snapshot()
@@ -313,7 +327,7 @@ def test_get_snapshot(self):
         self.assertIs(exception, exc)
 
         # Test with a cancelled future
-        f = Future()
+        f = self.Future()
         f.cancel()
         done, cancelled, result, exception = f._get_snapshot()
         self.assertTrue(done)
@@ -322,7 +336,7 @@ def test_get_snapshot(self):
         self.assertIsNone(exception)
 
         # Test concurrent access (basic thread safety check)
-        f = Future()
+        f = self.Future()
         f.set_result(100)
         results = []
 
@@ -340,6 +354,53 @@ def get_snapshot():
             self.assertEqual(result, expected)
 
 
+class PyFutureTests(BaseFutureTests, BaseTestCase):
+    Future = _base._PyFuture
+
+
+@unittest.skipUnless(hasattr(_base, '_CFuture'),
+                     'requires the _concurrent_futures module')
+class CFutureTests(BaseFutureTests, BaseTestCase):
+    Future = getattr(_base, '_CFuture', None)
+
+    def test_is_default(self):
+        self.assertIs(futures.Future, self.Future)
+
+    def test_subclass(self):
+        class MyFuture(self.Future):
+            pass
+
+        f = MyFuture()
+        f.attr = 'spam'
+        f.set_result(1)
+        self.assertEqual(f.attr, 'spam')
+        self.assertEqual(f.result(), 1)
+        self.assertRegex(repr(f), '<MyFuture at 0x[0-9a-f]+ state=finished')
+
+    def test_set_invalid_state(self):
+        f = self.Future()
+        with self.assertRaises(ValueError):
+            f._state = 'SPAM'
+        with self.assertRaises(ValueError):
+            f._state = 1
+        self.assertEqual(f._state, PENDING)
+
+    def test_condition_is_reentrant(self):
+        f = self.Future()
+        with f._condition:
+            with f._condition:
+                self.assertFalse(f.done())
+            f.set_result(1)
+        self.assertEqual(f.result(), 1)
+
+    def test_condition_release_unowned(self):
+        f = self.Future()
+        with self.assertRaises(RuntimeError):
+            f._condition.release()
+        with self.assertRaises(RuntimeError):
+            f._condition.notify_all()
+
+
 def setUpModule():
     setup_module()
 
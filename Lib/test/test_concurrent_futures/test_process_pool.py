@@ -41,6 +41,20 @@ def _put_wait_put(queue, event):
     queue.put('finished')
 
 
+def _echo(*args, **kwargs):
+    return args, kwargs
+
+
+def _raise_value_error(data):
+    raise ValueError(len(data))
+
+
+def _is_imported(name):
+    if name not in sys.modules:
+        raise ImportError(name)
+    return True
+
+
 class ProcessPoolExecutorTest(ExecutorTest):
 
     @unittest.skipUnless(sys.platform=='win32', 'Windows-only process limit')
@@ -79,6 +93,44 @@ def bad_map():
             ref)
         self.assertRaises(ValueError, bad_map)
 
+    @warnings_helper.ignore_fork_in_thread_deprecation_warnings()
+    def test_map_adaptive_chunksize(self):
+        ref = list(map(pow, range(40), range(40)))
+        self.assertEqual(
+            list(self.executor.map(pow, range(40), range(40), chunksize=None)),
+            ref)
+        self.assertEqual(
+            list(self.executor.map(pow, iter(range(40)), range(40),
+                                   chunksize=None)),
+            ref)
+        self.assertEqual(
+            list(self.executor.map(pow, range(40), range(40), chunksize=None,
+                                   buffersize=2)),
+            ref)
+        self.assertEqual(list(self.executor.map(pow, [], chunksize=None)), [])
+        self.assertEqual(list(self.executor.map(abs, chunksize=None)), [])
+
+        # Fast calls are grouped into larger chunks.
+        queue_count = self.executor._queue_count
+        self.assertEqual(
+            list(self.executor.map(abs, range(1000), chunksize=None)),
+            list(range(1000)))
+        self.assertLess(self.executor._queue_count - queue_count, 500)
+
+        it = self.executor.map(int, ['1', 'x', '3'], chunksize=None)
+        self.assertEqual(next(it), 1)
+        self.assertRaises(ValueError, next, it)
+
+        it = self.executor.map(time.sleep, [0, 2],
+                               chunksize=None, timeout=0.1)
+        self.assertIsNone(next(it))
+        self.assertRaises(futures.TimeoutError, next, it)
+        it.close()
+
+        with self.assertRaises(ValueError):
+            self.executor.map(pow, range(4), range(4), chunksize=None,
+                              buffersize=0)
+
     @classmethod
     def _test_traceback(cls):
         raise RuntimeError(123) # some comment
@@ -228,6 +280,129 @@ def test_max_tasks_early_shutdown(self):
         for i, future in enumerate(futures):
             self.assertEqual(future.result(), mul(i, i))
 
+    def test_max_tasks_per_child_replaces_workers(self):
+        context = self.get_context()
+        if context.get_start_method(allow_none=False) == "fork":
+            raise unittest.SkipTest("Incompatible with the fork start method.")
+        # gh-115634: the pool must not stall when workers exit while
+        # others are idle.
+        with self.executor_type(2, mp_context=context,
+                                max_tasks_per_child=2) as executor:
+            self.assertEqual(list(executor.map(abs, range(-10, 10))),
+                             list(map(abs, range(-10, 10))))
+
+    def test_preload(self):
+        with self.executor_type(
+                1, mp_context=self.get_context(), preload=['colorsys'],
+                initializer=_is_imported, initargs=('colorsys',)) as executor:
+            self.assertTrue(executor.submit(_is_imported, 'colorsys').result())
+
+    def test_preload_invalid(self):
+        with self.assertRaises(TypeError):
+            self.executor_type(1, preload='colorsys')
+        with self.assertRaises(TypeError):
+            self.executor_type(1, preload=[1])
+
+    def test_preload_import_error(self):
+        with self.executor_type(
+                1, mp_context=self.get_context(),
+                preload=['test.nonexistent_module']) as executor:
+            with self.assertRaises(BrokenProcessPool):
+                executor.submit(mul, 2, 3).result()
+
+    def test_spare_workers(self):
+        context = self.get_context()
+        if context.get_start_method(allow_none=False) == "fork":
+            max_tasks_per_child = None
+        else:
+            max_tasks_per_child = 2
+        with self.executor_type(
+                2, mp_context=context, max_tasks_per_child=max_tasks_per_child,
+                spare_workers=1) as executor:
+            self.assertEqual(list(executor.map(mul, range(20), range(20))),
+                             [mul(i, i) for i in range(20)])
+            # Exited workers are replaced asynchronously.
+            for _ in support.sleeping_retry(support.SHORT_TIMEOUT):
+                if len(executor._processes) == 3:
+                    break
+
+    def test_spare_workers_invalid(self):
+        with self.assertRaises(TypeError):
+            self.executor_type(1, spare_workers=1.0)
+        with self.assertRaises(ValueError):
+            self.executor_type(1, spare_workers=-1)
+
+    def test_shared_memory(self):
+        try:
+            from multiprocessing.shared_memory import SharedMemory
+        except ImportError:
+            raise unittest.SkipTest("requires multiprocessing.shared_memory")
+        executor = self.executor_type(
+                2, mp_context=self.get_context(), shared_memory_threshold=1000)
+        self.addCleanup(executor.shutdown)
+        large = bytes(range(256)) * 10
+        args = (large, bytearray(large), b'small', [1, 2])
+        kwargs = {'key': bytearray(large), 'other': large[:999]}
+        result = executor.submit(_echo, *args, **kwargs).result()
+        self.assertEqual(result, (args, kwargs))
+        self.assertIs(type(result[0][1]), bytearray)
+        self.assertIs(type(result[1]['key']), bytearray)
+        self.assertEqual(executor.submit(_echo, b'small').result(),
+                         ((b'small',), {}))
+
+        with self.assertRaises(ValueError) as cm:
+            executor.submit(_raise_value_error, large).result()
+        self.assertEqual(cm.exception.args, (2560,))
+        # Pickling errors are set on the future.
+        future = executor.submit(_echo, large, threading.Lock())
+        self.assertRaises(TypeError, future.result)
+
+        # The segments are reused by later calls.
+        pool = executor._shared_memory_pool
+        segments = list(pool._free)
+        self.assertEqual(len(segments), 3)
+        for _ in range(3):
+            self.assertEqual(executor.submit(_echo, large).result(),
+                             ((large,), {}))
+        self.assertEqual(len(pool._free), 3)
+        self.assertTrue(all(shm in segments for shm in pool._free))
+
+        executor.shutdown()
+        if os.name == 'posix':
+            # The segments are unlinked at shutdown.
+            for shm in segments:
+                self.assertRaises(FileNotFoundError, SharedMemory, shm.name,
+                                  track=False)
+
+    def test_shared_memory_map(self):
+        try:
+            from multiprocessing.shared_memory import SharedMemory  # noqa: F401
+        except ImportError:
+            raise unittest.SkipTest("requires multiprocessing.shared_memory")
+        large = bytes(range(256)) * 10
+        items = [large, bytearray(large), b'small', large[:999], large]
+        with self.executor_type(
+                2, mp_context=self.get_context(),
+                shared_memory_threshold=1000) as executor:
+            pool = executor._shared_memory_pool
+            for chunksize in (1, 2, None):
+                with self.subTest(chunksize=chunksize):
+                    results = executor.map(_echo, items, range(5),
+                                           chunksize=chunksize)
+                    self.assertEqual(list(results),
+                                     [((item, i), {})
+                                      for i, item in enumerate(items)])
+            # The arguments of the chunks were passed in shared memory.
+            self.assertTrue(pool._free)
+            self.assertEqual(list(executor.map(len, [b'small'] * 3,
+                                               chunksize=2)), [5] * 3)
+
+    def test_shared_memory_threshold_invalid(self):
+        with self.assertRaises(TypeError):
+            self.executor_type(1, shared_memory_threshold=1.5)
+        with self.assertRaises(ValueError):
+            self.executor_type(1, shared_memory_threshold=0)
+
     @warnings_helper.ignore_fork_in_thread_deprecation_warnings()
     def test_python_finalization_error(self):
         # gh-109047: Catch RuntimeError on thread creation
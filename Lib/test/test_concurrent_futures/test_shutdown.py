@@ -27,6 +27,9 @@ def test_run_after_shutdown(self):
         self.assertRaises(RuntimeError,
                           self.executor.submit,
                           pow, 2, 5)
+        self.assertRaises(RuntimeError,
+                          self.executor.submit_many,
+                          pow, [2], [5])
 
     def test_interpreter_shutdown(self):
         # Test the atexit hook for shutdown of worker threads and processes
@@ -261,6 +264,36 @@ def test_cancel_futures_wait_false(self):
         self.assertIn(out.strip(), [b"apple", b""])
 
 
+class ThreadPoolWorkStealingShutdownTest(ThreadPoolMixin, ExecutorShutdownTest,
+                                         BaseTestCase):
+    executor_kwargs = {'work_stealing': True}
+
+    def test_interpreter_shutdown_work_stealing(self):
+        rc, out, err = assert_python_ok('-c', """if 1:
+            from concurrent.futures import ThreadPoolExecutor
+            from test.test_concurrent_futures.test_shutdown import sleep_and_print
+            if __name__ == "__main__":
+                t = ThreadPoolExecutor(5, work_stealing=True)
+                for i in range(5):
+                    t.submit(sleep_and_print, .1, "apple")
+            """)
+        self.assertFalse(err)
+        self.assertEqual(out.strip().split(), [b"apple"] * 5)
+
+    @warnings_helper.ignore_fork_in_thread_deprecation_warnings()
+    def test_del_shutdown_work_stealing(self):
+        executor = futures.ThreadPoolExecutor(max_workers=5,
+                                              work_stealing=True)
+        res = executor.map(abs, range(-5, 5))
+        threads = executor._threads
+        del executor
+
+        for t in threads:
+            t.join()
+
+        self.assertEqual(list(res), [abs(v) for v in range(-5, 5)])
+
+
 class ProcessPoolShutdownTest(ExecutorShutdownTest):
     @warnings_helper.ignore_fork_in_thread_deprecation_warnings()
     def test_processes_terminate(self):
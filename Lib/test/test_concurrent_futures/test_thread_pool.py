@@ -4,6 +4,7 @@
 import multiprocessing.util
 import os
 import threading
+import time
 import unittest
 from concurrent import futures
 from test import support
@@ -116,6 +117,61 @@ def log_n_wait(ident):
         self.assertListEqual(log, ["ident='first' started", "ident='first' stopped"])
 
 
+class ThreadPoolWorkStealingExecutorTest(ThreadPoolMixin, ExecutorTest,
+                                         BaseTestCase):
+    executor_kwargs = {'work_stealing': True}
+
+    def test_work_stealing(self):
+        # The calls queued for a blocked worker are run by the other worker.
+        event = threading.Event()
+        with self.executor_type(2, work_stealing=True) as executor:
+            blocked = executor.submit(event.wait, support.SHORT_TIMEOUT)
+            fs = [executor.submit(mul, i, 2) for i in range(10)]
+            self.assertEqual([f.result(timeout=support.SHORT_TIMEOUT)
+                              for f in fs],
+                             [mul(i, 2) for i in range(10)])
+            self.assertFalse(blocked.done())
+            event.set()
+            self.assertTrue(blocked.result())
+
+    def test_idle_workers_are_woken_up(self):
+        with self.executor_type(4, work_stealing=True) as executor:
+            for _ in range(10):
+                fs = executor.submit_many(mul, range(8), range(8))
+                self.assertEqual([f.result(timeout=support.SHORT_TIMEOUT)
+                                  for f in fs],
+                                 [mul(i, i) for i in range(8)])
+                # Let the workers park.
+                time.sleep(0.01)
+
+    def test_submit_from_workers(self):
+        def fib(n):
+            if n < 2:
+                return n
+            fs = executor.submit_many(fib, [n - 1, n - 2])
+            return sum(f.result() for f in fs)
+
+        # The workers block on the results of the calls they submit.
+        with self.executor_type(20, work_stealing=True) as executor:
+            self.assertEqual(executor.submit(fib, 5).result(), 5)
+
+    def test_shutdown_cancel_futures(self):
+        event = threading.Event()
+        executor = self.executor_type(2, work_stealing=True)
+        try:
+            blocked = executor.submit(event.wait, support.SHORT_TIMEOUT)
+            fs = [executor.submit(event.wait, support.SHORT_TIMEOUT)
+                  for _ in range(10)]
+            executor.shutdown(wait=False, cancel_futures=True)
+        finally:
+            event.set()
+            executor.shutdown(wait=True)
+        self.assertTrue(blocked.result())
+        self.assertTrue(any(f.cancelled() for f in fs))
+        for f in fs:
+            self.assertTrue(f.cancelled() or f.result())
+
+
 def setUpModule():
     setup_module()
 
@@ -13,8 +13,9 @@
 from test.support import threading_helper, warnings_helper
 
 
-def create_future(state=PENDING, exception=None, result=None):
-    f = Future()
+def create_future(state=PENDING, exception=None, result=None, *,
+                  future_class=Future):
+    f = future_class()
     f._state = state
     f._exception = exception
     f._result = result
@@ -1,6 +1,7 @@
 # Copyright (C) 2001 Python Software Foundation
 # csv package unit tests
 
+import array
 import copy
 import sys
 import unittest
@@ -552,6 +553,161 @@ def test_roundtrip_escaped_unquoted_newlines(self):
                                                        escapechar="\\")):
                         self.assertEqual(row, rows[i])
 
+    def test_read_columns(self):
+        r = csv.reader(['1,2.5,a', '', '-3, 4e1 ,b', '5,6,"c,d"'])
+        self.assertEqual(r.read_columns(2, types=[int, float, None]),
+                         [array.array('q', [1, -3]),
+                          array.array('d', [2.5, 40.0]),
+                          ['a', 'b']])
+        self.assertEqual(r.line_num, 3)
+        self.assertEqual(r.read_columns(types=(float, str, None)),
+                         [array.array('d', [5.0]), ['6'], ['c,d']])
+        self.assertEqual(r.read_columns(), [])
+        r = csv.reader(['1,a', '2,b'])
+        self.assertEqual(r.read_columns(), [['1', '2'], ['a', 'b']])
+        self.assertEqual(csv.reader([]).read_columns(types=[int]), [])
+        # Non-string fields are converted by int() and float().
+        r = csv.reader(['1,"x"', '2.5,""'], quoting=csv.QUOTE_STRINGS)
+        self.assertEqual(r.read_columns(types=[int, str]),
+                         [array.array('q', [1, 2]), ['x', '']])
+
+    def test_read_columns_errors(self):
+        r = csv.reader(['1,a', '2'])
+        with self.assertRaisesRegex(csv.Error, 'expected 2 fields, got 1'):
+            r.read_columns()
+        with self.assertRaisesRegex(csv.Error, 'expected 1 fields, got 2'):
+            csv.reader(['1,a']).read_columns(types=[int])
+        r = csv.reader(['1', 'x'])
+        with self.assertRaises(ValueError) as cm:
+            r.read_columns(types=[int])
+        self.assertEqual(cm.exception.__notes__,
+                         ['when converting field 0 of line 2'])
+        self.assertRaises(OverflowError,
+                          csv.reader(['1' * 30]).read_columns, types=[int])
+        self.assertRaises(ValueError,
+                          csv.reader(['1x']).read_columns, types=[float])
+        self.assertRaises(ValueError,
+                          csv.reader(['1.5\x00x,2\n']).read_columns,
+                          types=[float, int])
+        self.assertRaises(TypeError,
+                          csv.reader(['1']).read_columns, types=[bytes])
+        self.assertRaises(TypeError, csv.reader(['1']).read_columns, 'x')
+
+    def test_read_converters(self):
+        r = csv.reader(['1,2.5,a,b', '-3, 4e1 ,c', '1_0,1e400,d,e,f'],
+                       converters=[int, float, str.upper, None])
+        self.assertEqual(r.converters, (int, float, str.upper, None))
+        self.assertEqual(list(r), [[1, 2.5, 'A', 'b'],
+                                   [-3, 40.0, 'C'],
+                                   [10, float('inf'), 'D', 'e', 'f']])
+        self.assertEqual(list(csv.reader(['12345678901234567890123'],
+                                         converters=[int])),
+                         [[12345678901234567890123]])
+        # None and non-string fields are passed to the converters
+        # unchanged.
+        self.assertEqual(list(csv.reader(['1,', '2.5,"3"'],
+                                         quoting=csv.QUOTE_STRINGS,
+                                         converters=[int, int])),
+                         [[1, None], [2, 3]])
+        r = csv.reader(['1,2', '3,4'], converters=[int])
+        self.assertEqual(next(r), [1, '2'])
+        r.converters = [None, int]
+        self.assertEqual(r.converters, (None, int))
+        self.assertEqual(next(r), ['3', 4])
+        r.converters = None
+        self.assertIsNone(r.converters)
+        r = csv.reader(['1;2'], converters=None, delimiter=';')
+        self.assertEqual(r.dialect.delimiter, ';')
+        self.assertEqual(next(r), ['1', '2'])
+
+    def test_read_converters_errors(self):
+        r = csv.reader(['1,2', '3,x', '5,6'], converters=[int, float])
+        self.assertEqual(next(r), [1, 2.0])
+        with self.assertRaises(ValueError) as cm:
+            next(r)
+        self.assertEqual(cm.exception.__notes__,
+                         ['when converting field 1 of line 2'])
+        self.assertEqual(next(r), [5, 6.0])
+        # The fast paths reject embedded null characters like int() and
+        # float() do.
+        self.assertRaises(ValueError, list,
+                          csv.reader(['1.5\x00x,2'], converters=[float, int]))
+        self.assertRaises(ValueError, list,
+                          csv.reader(['12\x00x'], converters=[int]))
+        self.assertRaises(TypeError, csv.reader, [], converters=[int, 1])
+        self.assertRaises(TypeError, csv.reader, [], converters=1)
+        r = csv.reader([])
+        with self.assertRaises(TypeError):
+            r.converters = ['x']
+        self.assertIsNone(r.converters)
+        with self.assertRaises(ZeroDivisionError):
+            next(csv.reader(['1'], converters=[lambda x: 1/0]))
+
+    def test_parallel_reader(self):
+        rows = [[str(i), 'a "b"\r\nc' if i % 7 == 0 else 'd,e', '']
+                for i in range(500)]
+        fileobj = StringIO()
+        csv.writer(fileobj).writerows(rows)
+        data = fileobj.getvalue()
+        for max_workers in 1, 3:
+            for chunk_size in 1, 10, 1000, 100000:
+                with self.subTest(max_workers=max_workers,
+                                  chunk_size=chunk_size):
+                    self.assertEqual(list(csv.parallel_reader(
+                        StringIO(data), chunk_size=chunk_size,
+                        max_workers=max_workers)), rows)
+                    chunks = list(csv.parallel_reader(
+                        StringIO(data), chunk_size=chunk_size,
+                        max_workers=max_workers, columns=True,
+                        types=[int, None, str]))
+                    self.assertEqual(
+                        [x for c in chunks for x in c[0]], list(range(500)))
+                    self.assertEqual(
+                        [x for c in chunks for x in c[1]], [r[1] for r in rows])
+        self.assertEqual(list(csv.parallel_reader(StringIO(''))), [])
+        self.assertEqual(list(csv.parallel_reader(StringIO('1\n\n2'),
+                                                  columns=True)),
+                         [[['1', '2']]])
+        self.assertEqual(list(csv.parallel_reader(StringIO('1,2\n3,4\n'),
+                                                  chunk_size=1,
+                                                  max_workers=2,
+                                                  converters=[int])),
+                         [[1, '2'], [3, '4']])
+        field = 'x\n"y"\n' * 1000
+        data = 'a,"%s"\nb,c\n' % field.replace('"', '""')
+        self.assertEqual(list(csv.parallel_reader(StringIO(data),
+                                                  chunk_size=7)),
+                         [['a', field], ['b', 'c']])
+
+    def test_parallel_reader_dialect(self):
+        data = "a;'b;\nc'\nd\\;e;f\n"
+        self.assertEqual(list(csv.parallel_reader(StringIO(data),
+                                                  chunk_size=1,
+                                                  delimiter=';',
+                                                  quotechar="'")),
+                         [['a', 'b;\nc'], ['d\\', 'e', 'f']])
+        self.assertEqual(list(csv.parallel_reader(StringIO(data),
+                                                  chunk_size=1,
+                                                  delimiter=';',
+                                                  quotechar="'",
+                                                  escapechar='\\')),
+                         [['a', 'b;\nc'], ['d;e', 'f']])
+        self.assertEqual(list(csv.parallel_reader(StringIO('a,"b\nc"\n'),
+                                                  chunk_size=1,
+                                                  quoting=csv.QUOTE_NONE)),
+                         [['a', '"b'], ['c"']])
+        # Invalid arguments are rejected before the input is read.
+        self.assertRaises(TypeError, csv.parallel_reader, StringIO(''),
+                          types=[int])
+        self.assertRaises(ValueError, csv.parallel_reader, StringIO(''),
+                          max_workers=0)
+        self.assertRaises(csv.Error, csv.parallel_reader, StringIO(''),
+                          'nonesuch')
+        self.assertRaises(TypeError, csv.parallel_reader, StringIO(''),
+                          delimiter=None)
+        with self.assertRaises(csv.Error):
+            list(csv.parallel_reader(StringIO('a,b\n1\n'), columns=True))
+
 
 class TestDialectRegistry(unittest.TestCase):
     def test_registry_badargs(self):
@@ -1021,6 +1177,37 @@ def test_read_short(self):
                                              "4": 'DEFAULT', "5": 'DEFAULT',
                                              "6": 'DEFAULT'})
 
+    def test_read_dict_converters(self):
+        data = ['id,score,name\r\n', '1,2.5,a\r\n', '2,3\r\n']
+        reader = csv.DictReader(data, converters=[int, float])
+        self.assertEqual(list(reader), [{'id': 1, 'score': 2.5, 'name': 'a'},
+                                        {'id': 2, 'score': 3.0, 'name': None}])
+        reader = csv.DictReader(data[1:], fieldnames=['a', 'b'],
+                                converters=[int])
+        self.assertEqual(next(reader), {'a': 1, 'b': '2.5', None: ['a']})
+
+    def test_tuple_reader(self):
+        data = ['id,score,class\r\n', '1,2.5,a\r\n', '\r\n', '2,3\r\n']
+        reader = csv.TupleReader(data, converters=[int, float])
+        rows = list(reader)
+        self.assertEqual(rows, [(1, 2.5, 'a'), (2, 3.0, None)])
+        self.assertEqual(reader.line_num, 4)
+        self.assertEqual(rows[0].id, 1)
+        self.assertEqual(rows[0]._fields, ('id', 'score', '_2'))
+        self.assertIs(type(rows[1]), reader.rowtype)
+        reader = csv.TupleReader(data, restval='', named=False)
+        self.assertIs(reader.rowtype, tuple)
+        self.assertEqual(list(reader), [('1', '2.5', 'a'), ('2', '3', '')])
+        reader = csv.TupleReader(data[1:], fieldnames=['a', 'b', 'c'])
+        self.assertEqual(next(reader).a, '1')
+        self.assertEqual(list(csv.TupleReader([])), [])
+
+    def test_tuple_reader_long_row(self):
+        reader = csv.TupleReader(['a,b\r\n', '1,2,3\r\n', '4,5\r\n'])
+        with self.assertRaisesRegex(csv.Error, 'expected 2 fields, got 3'):
+            next(reader)
+        self.assertEqual(next(reader), ('4', '5'))
+
     def test_read_multi(self):
         sample = [
             '2147483648,43.0e12,17,abc,def\r\n',
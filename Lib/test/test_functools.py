@@ -2072,6 +2072,131 @@ def f():
             return 1
         self.assertEqual(f.cache_parameters(), {'maxsize': 1000, "typed": True})
 
+    def test_lru_cache_shards(self):
+        calls = []
+        @self.module.lru_cache(maxsize=20, shards=4)
+        def f(x):
+            calls.append(x)
+            return x * 2
+        self.assertEqual(f.cache_parameters(),
+                         {'maxsize': 20, 'typed': False, 'shards': 4})
+        for x in range(10):
+            self.assertEqual(f(x), x * 2)
+        for x in range(10):
+            self.assertEqual(f(x), x * 2)
+        self.assertEqual(calls, list(range(10)))
+        self.assertEqual(f.cache_info(), (10, 10, 20, 10))
+        for x in range(100):
+            f(x)
+        hits, misses, maxsize, currsize = f.cache_info()
+        self.assertEqual(maxsize, 20)
+        self.assertLessEqual(currsize, 20)
+        self.assertEqual(hits + misses, 120)
+        f.cache_clear()
+        self.assertEqual(f.cache_info(), (0, 0, 20, 0))
+        self.assertEqual(f(3, ), 6)
+        self.assertEqual(f(x=3), 6)
+        self.assertEqual(f.cache_info(), (0, 2, 20, 2))
+
+    def test_lru_cache_shards_spread(self):
+        # Keys whose hashes share their low bits are spread across the
+        # shards: with 4 shards of 100 entries, 200 such keys fit.
+        @self.module.lru_cache(maxsize=400, shards=4)
+        def f(x):
+            return x
+        keys = [x * 64 for x in range(200)]
+        for x in keys:
+            f(x)
+        self.assertEqual(f.cache_info().currsize, 200)
+        for x in keys:
+            f(x)
+        self.assertEqual(f.cache_info().hits, 200)
+
+    def test_lru_cache_shards_key_built_once(self):
+        class Key:
+            hashed = 0
+            def __hash__(self):
+                Key.hashed += 1
+                return 1
+        @self.module.lru_cache(maxsize=10, shards=2)
+        def f(x):
+            return 42
+        key = Key()
+        self.assertEqual(f(key), 42)
+        self.assertEqual(f(key), 42)
+        self.assertEqual(Key.hashed, 2)
+
+    def test_lru_cache_shards_unbounded(self):
+        @self.module.lru_cache(maxsize=None, shards=3)
+        def f(x, *, y=0):
+            return x + y
+        for x in range(50):
+            self.assertEqual(f(x, y=1), x + 1)
+            self.assertEqual(f(x, y=1), x + 1)
+        self.assertEqual(f.cache_info(), (50, 50, None, 50))
+
+    def test_lru_cache_shards_typed(self):
+        @self.module.lru_cache(maxsize=10, typed=True, shards=2)
+        def f(x):
+            return type(x)
+        self.assertIs(f(1), int)
+        self.assertIs(f(1.0), float)
+        self.assertEqual(f.cache_info().currsize, 2)
+
+    def test_lru_cache_shards_small(self):
+        # There are never more shards than entries.
+        @self.module.lru_cache(maxsize=2, shards=8)
+        def f(x):
+            return x
+        for x in range(10):
+            f(x)
+        self.assertEqual(f.cache_info(), (0, 10, 2, 2))
+        # The number of shards actually used is reported.
+        self.assertEqual(f.cache_parameters(),
+                         {'maxsize': 2, 'typed': False, 'shards': 2})
+
+        @self.module.lru_cache(maxsize=0, shards=8)
+        def f(x):
+            return x
+        f(1), f(1)
+        self.assertEqual(f.cache_info(), (0, 2, 0, 0))
+        self.assertEqual(f.cache_parameters(), {'maxsize': 0, 'typed': False})
+
+        f = self.module.lru_cache(shards=200)(lambda x: x)
+        self.assertEqual(f.cache_parameters(),
+                         {'maxsize': 128, 'typed': False, 'shards': 128})
+        f = self.module.lru_cache(maxsize=None, shards=200)(lambda x: x)
+        self.assertEqual(f.cache_parameters(),
+                         {'maxsize': None, 'typed': False, 'shards': 200})
+
+    def test_lru_cache_shards_invalid(self):
+        with self.assertRaises(ValueError):
+            self.module.lru_cache(maxsize=10, shards=0)
+        with self.assertRaises(TypeError):
+            self.module.lru_cache(maxsize=10, shards=2.0)
+        with self.assertRaises(ValueError):
+            self.module._lru_cache_wrapper(len, 10, False,
+                                           self.module._CacheInfo, shards=-1)
+
+    @threading_helper.requires_working_threading()
+    def test_lru_cache_shards_threaded(self):
+        n, m = 8, 200
+        def orig(x):
+            return 3 * x
+        f = self.module.lru_cache(maxsize=64, shards=4)(orig)
+        start = threading.Barrier(n)
+        def run(k):
+            start.wait()
+            for i in range(m):
+                x = (i * k) % 100
+                self.assertEqual(f(x), orig(x))
+        threads = [threading.Thread(target=run, args=[k]) for k in range(n)]
+        with threading_helper.start_threads(threads):
+            pass
+        hits, misses, maxsize, currsize = f.cache_info()
+        self.assertEqual(hits + misses, n * m)
+        self.assertLessEqual(currsize, 64)
+
     def test_lru_cache_weakrefable(self):
         @self.module.lru_cache
         def test_function(x):
@@ -2205,6 +2330,229 @@ def cached_staticmeth(x, y):
             return 3 * x + y
 
 
+class TestPolicyCache:
+
+    def setUp(self):
+        self.now = 0.0
+
+    def timer(self):
+        return self.now
+
+    def test_lru(self):
+        calls = []
+        @self.module.policy_cache(maxsize=3)
+        def f(x):
+            calls.append(x)
+            return x * 2
+        self.assertEqual([f(x) for x in (1, 2, 3, 1, 4, 2)],
+                         [2, 4, 6, 2, 8, 4])
+        # 2 was the least recently used entry when 4 was added.
+        self.assertEqual(calls, [1, 2, 3, 4, 2])
+        self.assertEqual(f.cache_info(), (1, 5, 3, 3, 2, 0))
+        self.assertEqual(f.cache_info().evictions, 2)
+        f.cache_clear()
+        self.assertEqual(f.cache_info(), (0, 0, 3, 0, 0, 0))
+        self.assertEqual(f.__wrapped__(5), 10)
+
+    def test_ttl(self):
+        @self.module.policy_cache(maxsize=None, ttl=10, timer=self.timer)
+        def f(x, *, y=0):
+            return [x, y]
+        a = f(1)
+        self.now = 5
+        self.assertIs(f(1), a)
+        self.assertIsNot(f(1, y=2), a)
+        self.now = 10
+        b = f(1)
+        self.assertIsNot(b, a)
+        self.assertEqual(b, a)
+        self.now = 14.5
+        self.assertIs(f(1), b)
+        self.assertEqual(f.cache_info(), (2, 3, None, 2, 0, 1))
+
+    def test_weigher(self):
+        @self.module.policy_cache(maxsize=100, weigher=len)
+        def f(n):
+            return 'x' * n
+        for n in (10, 20, 30, 50):
+            f(n)
+        self.assertEqual(f.cache_info().currsize, 100)
+        f(15)  # evicts 10 and 20
+        self.assertEqual(f.cache_info()[2:], (100, 95, 2, 0))
+        f(101)  # never cached
+        self.assertEqual(f.cache_info()[2:], (100, 95, 3, 0))
+        f(50)
+        self.assertEqual(f.cache_info().hits, 1)
+
+    def test_weigher_negative(self):
+        @self.module.policy_cache(weigher=lambda result: -1)
+        def f(x):
+            return x
+        self.assertRaises(ValueError, f, 1)
+
+    def test_tinylfu_scan_resistance(self):
+        import random
+        def run(policy):
+            @self.module.policy_cache(maxsize=100, policy=policy)
+            def f(x):
+                return x
+            rnd = random.Random(42)
+            for n in range(20000):
+                if n % 2:
+                    f(rnd.randrange(50))  # frequently used keys
+                else:
+                    f(1000 + n)  # scan of keys used once
+            info = f.cache_info()
+            self.assertEqual(info.hits + info.misses, 20000)
+            self.assertLessEqual(info.currsize, 100)
+            return info.hits
+        self.assertGreater(run('tinylfu'), run('lru') * 1.2)
+
+    def test_tinylfu_ttl(self):
+        @self.module.policy_cache(maxsize=10, ttl=1, policy='tinylfu',
+                                timer=self.timer)
+        def f(x):
+            return x
+        for x in range(5):
+            f(x), f(x)
+        self.assertEqual(f.cache_info()[:2], (5, 5))
+        self.now = 2
+        for x in range(5):
+            f(x)
+        self.assertEqual(f.cache_info().expirations, 5)
+
+    def test_maxsize_zero(self):
+        @self.module.policy_cache(maxsize=0)
+        def f(x):
+            return x
+        f(1), f(1)
+        self.assertEqual(f.cache_info(), (0, 2, 0, 0, 0, 0))
+
+    def test_parameters(self):
+        @self.module.policy_cache(maxsize=10, ttl=5, policy='tinylfu')
+        def f(x):
+            return x
+        params = f.cache_parameters()
+        self.assertEqual(params['maxsize'], 10)
+        self.assertEqual(params['ttl'], 5)
+        self.assertEqual(params['policy'], 'tinylfu')
+        self.assertFalse(params['typed'])
+        self.assertIsNone(params['weigher'])
+
+    def test_errors(self):
+        self.assertRaises(ValueError, self.module.policy_cache, ttl=0)
+        self.assertRaises(ValueError, self.module.policy_cache, policy='lfu')
+        self.assertRaises(ValueError, self.module.policy_cache, maxsize=None,
+                          policy='tinylfu')
+        self.assertRaises(TypeError, self.module.policy_cache, weigher=1)
+
+    def test_callable_first_argument(self):
+        @self.module.policy_cache
+        def f(x):
+            return x * 2
+        self.assertEqual(f(3), 6)
+        self.assertEqual(f(3), 6)
+        self.assertEqual(f.cache_info(), (1, 1, 128, 1, 0, 0))
+        self.assertEqual(f.cache_parameters()['maxsize'], 128)
+        self.assertEqual(f.__wrapped__(4), 8)
+        self.assertRaises(TypeError, self.module.policy_cache, 'x')
+
+    def test_expired_entries_purged(self):
+        @self.module.policy_cache(maxsize=None, ttl=10, timer=self.timer)
+        def f(x):
+            return x
+        for x in range(5):
+            f(x)
+        self.now = 5
+        f(5)
+        self.now = 10
+        # The entries added at time 0 are dropped by any call.
+        f(5)
+        self.assertEqual(f.cache_info(), (1, 6, None, 1, 0, 5))
+        self.now = 100
+        f(6)
+        self.assertEqual(f.cache_info(), (1, 7, None, 1, 0, 6))
+
+    def test_weigher_not_integer(self):
+        @self.module.policy_cache(weigher=lambda result: 1.5)
+        def f(x):
+            return x
+        self.assertRaises(TypeError, f, 1)
+        self.assertEqual(f.cache_info().currsize, 0)
+
+    def test_timer_error(self):
+        def timer():
+            raise ZeroDivisionError
+        @self.module.policy_cache(ttl=1, timer=timer)
+        def f(x):
+            return x
+        self.assertRaises(ZeroDivisionError, f, 1)
+
+    def test_method(self):
+        class A:
+            @self.module.policy_cache(maxsize=10)
+            def f(self, x):
+                return (self, x)
+        a = A()
+        self.assertEqual(a.f(1), (a, 1))
+        self.assertEqual(a.f(1), (a, 1))
+        self.assertEqual(A.f.cache_info().hits, 1)
+
+    @threading_helper.requires_working_threading()
+    def test_threaded(self):
+        @self.module.policy_cache(maxsize=20, policy='tinylfu')
+        def f(x):
+            return x * 3
+        start = threading.Barrier(4)
+        def run(k):
+            start.wait()
+            for i in range(500):
+                self.assertEqual(f(i * k % 37), i * k % 37 * 3)
+        threads = [threading.Thread(target=run, args=[k]) for k in range(4)]
+        with threading_helper.start_threads(threads):
+            pass
+        info = f.cache_info()
+        self.assertEqual(info.hits + info.misses, 2000)
+        self.assertLessEqual(info.currsize, 20)
+
+
+class TestPolicyCachePy(TestPolicyCache, unittest.TestCase):
+    module = py_functools
+
+
+@unittest.skipUnless(c_functools, 'requires the C _functools module')
+class TestPolicyCacheC(TestPolicyCache, unittest.TestCase):
+    module = c_functools
+
+    def test_c_wrapper(self):
+        @self.module.policy_cache(maxsize=10)
+        def f(x):
+            return x
+        self.assertIsInstance(f, c_functools._policy_cache_wrapper)
+
+    def test_same_as_python(self):
+        import random
+        def run(module, policy, ttl, weigher):
+            now = 0.0
+            @module.policy_cache(maxsize=30, policy=policy, ttl=ttl,
+                                 weigher=weigher, timer=lambda: now)
+            def f(x):
+                return x
+            rnd = random.Random(7)
+            for n in range(5000):
+                now += rnd.random() / 100
+                f(rnd.randrange(20) if n % 2 else rnd.randrange(1000))
+            return f.cache_info()
+        for policy in ('lru', 'tinylfu'):
+            for ttl in (None, 3):
+                for weigher in (None, lambda result: result % 4):
+                    with self.subTest(policy=policy, ttl=ttl,
+                                      weigher=weigher):
+                        self.assertEqual(
+                            run(c_functools, policy, ttl, weigher),
+                            run(py_functools, policy, ttl, weigher))
+
+
 class TestSingleDispatch(unittest.TestCase):
     def test_simple_overloads(self):
         @functools.singledispatch
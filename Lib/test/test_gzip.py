@@ -12,8 +12,8 @@
 from subprocess import PIPE, Popen
 from test.support import catch_unraisable_exception
 from test.support import force_not_colorized_test_class, import_helper
-from test.support import os_helper
-from test.support import _4G, bigmemtest, requires_subprocess
+from test.support import os_helper, threading_helper
+from test.support import _4G, bigmemtest, requires_subprocess, swap_attr
 from test.support.script_helper import assert_python_ok, assert_python_failure
 
 gzip = import_helper.import_module('gzip')
@@ -319,6 +319,134 @@ def test_seek_write(self):
                 f.seek(pos)
                 f.write(b'GZ\n')
 
+    def make_indexed_data(self):
+        # Two members with zero padding between them, each large enough
+        # to be split into several deflate blocks.
+        data = b''.join(b'%d:%x ' % (i, i * i * 7919) for i in range(300000))
+        self.assertGreater(len(data), 4000000)
+        half = len(data) // 2
+        with open(self.filename, 'wb') as f:
+            f.write(gzip.compress(data[:half]))
+            f.write(b'\0' * 8)
+            f.write(gzip.compress(data[half:]))
+        return data
+
+    def test_build_index(self):
+        data = self.make_indexed_data()
+        with gzip.GzipFile(self.filename) as f:
+            f.read(100)
+            index = f.build_index(spacing=100000)
+            self.assertEqual(f.tell(), 100)
+            self.assertEqual(f.read(100), data[100:200])
+            self.assertEqual(index.size, len(data))
+            self.assertEqual(index.compressed_size,
+                             os.path.getsize(self.filename))
+            self.assertGreater(len(index), 10)
+            for offset in [len(data) - 1, 0, len(data) // 2,
+                           len(data) // 2 - 3, 1234567, 1234566, 1]:
+                f.seek(offset)
+                self.assertEqual(f.tell(), offset)
+                self.assertEqual(f.read(1000), data[offset:offset + 1000])
+            f.seek(-10, io.SEEK_END)
+            self.assertEqual(f.read(), data[-10:])
+            f.seek(100)
+            f.seek(2000000, io.SEEK_CUR)
+            self.assertEqual(f.read(10), data[2000100:2000110])
+            f.seek(0)
+            self.assertEqual(f.read(), data)
+
+    def test_index_save_load(self):
+        data = self.make_indexed_data()
+        with gzip.GzipFile(self.filename) as f:
+            index = f.build_index(spacing=500000)
+        indexname = self.filename + '.idx'
+        self.addCleanup(os_helper.unlink, indexname)
+        index.save(indexname)
+        index = gzip.GzipIndex.load(indexname)
+        self.assertEqual(index.size, len(data))
+        with gzip.open(self.filename, index=index) as f:
+            for offset in [3000000, 17, 2500000, len(data) - 5]:
+                f.seek(offset)
+                self.assertEqual(f.read(50), data[offset:offset + 50])
+        with open(indexname, 'rb') as f:
+            index = gzip.GzipIndex.load(f)
+        with gzip.GzipFile(self.filename, index=index) as f:
+            self.assertEqual(f.read(), data)
+
+    def test_index_errors(self):
+        self.make_indexed_data()
+        with gzip.GzipFile(self.filename) as f:
+            index = f.build_index()
+            self.assertRaises(ValueError, f.build_index, spacing=0)
+        with self.assertRaises(ValueError):
+            gzip.GzipFile(fileobj=io.BytesIO(gzip.compress(b'x')),
+                          index=index)
+        with self.assertRaises(ValueError):
+            gzip.GzipFile(fileobj=io.BytesIO(), mode='wb', index=index)
+        with self.assertRaises(ValueError):
+            gzip.GzipIndex.load(io.BytesIO(b'not an index'))
+        with gzip.GzipFile(fileobj=io.BytesIO(), mode='wb') as f:
+            self.assertRaises(OSError, f.build_index)
+        with gzip.GzipFile(fileobj=io.BytesIO(gzip.compress(b'x')[:-1])) as f:
+            self.assertRaises(EOFError, f.build_index)
+
+    @threading_helper.requires_working_threading()
+    def test_write_workers(self):
+        data = b''.join(b'%d:%x ' % (i, i * i * 7919) for i in range(100000))
+        self.assertGreater(len(data), 4 * gzip._PARALLEL_BLOCK_SIZE)
+        with gzip.GzipFile(self.filename, 'wb', workers=3) as f:
+            for i in range(0, len(data), 10000):
+                f.write(data[i:i + 10000])
+                if i % 200000 == 0:
+                    f.flush()
+            f.write(memoryview(data)[:100])
+        with open(self.filename, 'rb') as f:
+            compressed = f.read()
+        # A single member: the whole stream is one deflate stream.
+        d = zlib.decompressobj(wbits=31)
+        self.assertEqual(d.decompress(compressed), data + data[:100])
+        self.assertTrue(d.eof)
+        self.assertEqual(d.unused_data, b'')
+        with gzip.open(self.filename) as f:
+            self.assertEqual(f.read(), data + data[:100])
+
+    @threading_helper.requires_working_threading()
+    def test_write_workers_bounded(self):
+        # A large write does not submit all its blocks at once.
+        size = gzip._PARALLEL_BLOCK_SIZE
+        data = bytes(range(256)) * (size * 20 // 256) + b'tail'
+        pending = []
+        orig_submit = gzip._ParallelCompressor._submit
+        def submit(self, block, last=False):
+            orig_submit(self, block, last)
+            pending.append(len(self._pending))
+        with swap_attr(gzip._ParallelCompressor, '_submit', submit):
+            buf = io.BytesIO()
+            with gzip.GzipFile(fileobj=buf, mode='wb', workers=2) as f:
+                f.write(data[:1000])
+                f.write(data[1000:])
+                self.assertEqual(bytes(f.compress._buffer),
+                                 data[len(data) // size * size:])
+        self.assertEqual(len(pending), len(data) // size + 1)
+        self.assertLessEqual(max(pending), 4)
+        self.assertEqual(gzip.decompress(buf.getvalue()), data)
+        self.assertEqual(gzip.decompress(gzip.compress(data, workers=2)), data)
+
+    @threading_helper.requires_working_threading()
+    def test_write_workers_empty(self):
+        with gzip.GzipFile(self.filename, 'wb', workers=2):
+            pass
+        with gzip.open(self.filename) as f:
+            self.assertEqual(f.read(), b'')
+
+    def test_workers_errors(self):
+        self.assertRaises(ValueError, gzip.GzipFile, self.filename, 'wb',
+                          workers=0)
+        self.test_write()
+        self.assertRaises(ValueError, gzip.GzipFile, self.filename, 'rb',
+                          workers=2)
+        self.assertRaises(ValueError, gzip.compress, data1, workers=-1)
+
     def test_mode(self):
         self.test_write()
         with gzip.GzipFile(self.filename, 'r') as f:
@@ -736,6 +864,16 @@ def test_compress(self):
                 with gzip.GzipFile(fileobj=io.BytesIO(datac), mode="rb") as f:
                     self.assertEqual(f.read(), data)
 
+    @threading_helper.requires_working_threading()
+    def test_compress_workers(self):
+        data = data1 * 10000
+        for workers in (1, 2, 4):
+            with self.subTest(workers=workers):
+                datac = gzip.compress(data, workers=workers)
+                self.assertEqual(gzip.decompress(datac), data)
+                self.assertEqual(datac[4:8], b'\0\0\0\0')  # mtime
+        self.assertEqual(gzip.decompress(gzip.compress(b'', workers=2)), b'')
+
     def test_compress_mtime(self):
         mtime = 123456789
         for data in [data1, data2]:
@@ -0,0 +1,190 @@
+"""
+Tests for io_uring wrapper.
+"""
+import errno
+import os
+import select
+import socket
+import time
+import unittest
+from test.support import os_helper
+
+if not hasattr(select, "io_uring"):
+    raise unittest.SkipTest("test works only on Linux 5.11+")
+
+try:
+    select.io_uring().close()
+except OSError as e:
+    raise unittest.SkipTest(f"io_uring is not available: {e}")
+
+
+class TestIoUring(unittest.TestCase):
+
+    def setUp(self):
+        self.ring = select.io_uring(8)
+        self.addCleanup(self.ring.close)
+
+    def socketpair(self):
+        a, b = socket.socketpair()
+        self.addCleanup(a.close)
+        self.addCleanup(b.close)
+        a.setblocking(False)
+        b.setblocking(False)
+        return a, b
+
+    def test_create(self):
+        ring = select.io_uring()
+        self.assertGreater(ring.fileno(), 0)
+        self.assertFalse(ring.closed)
+        self.assertFalse(os.get_inheritable(ring.fileno()))
+        ring.close()
+        self.assertTrue(ring.closed)
+        self.assertRaises(ValueError, ring.fileno)
+        self.assertRaises(ValueError, ring.nop, 1)
+        self.assertRaises(ValueError, ring.wait)
+        ring.close()
+
+        self.assertRaises(ValueError, select.io_uring, 0)
+        self.assertRaises(TypeError, select.io_uring, 1.0)
+
+    def test_context_manager(self):
+        with select.io_uring() as ring:
+            self.assertFalse(ring.closed)
+        self.assertTrue(ring.closed)
+        with self.assertRaises(ValueError):
+            with ring:
+                pass
+
+    def test_nop(self):
+        ring = self.ring
+        self.assertEqual(ring.submit(), 0)
+        self.assertEqual(ring.wait(0), [])
+        ring.nop(1)
+        ring.nop(2)
+        self.assertEqual(ring.submit(), 2)
+        self.assertEqual(sorted(ring.wait()), [(1, 0, 0), (2, 0, 0)])
+
+    def test_user_data(self):
+        ring = self.ring
+        ring.nop(2**64 - 2)
+        self.assertRaises(ValueError, ring.nop, 2**64 - 2)
+        self.assertEqual(ring.wait(), [(2**64 - 2, 0, 0)])
+        # user_data can be reused once the request completed
+        ring.nop(2**64 - 2)
+        self.assertEqual(ring.wait(), [(2**64 - 2, 0, 0)])
+        self.assertRaises(ValueError, ring.nop, 2**64 - 1)
+        self.assertRaises(OverflowError, ring.nop, 2**64)
+        self.assertRaises(ValueError, ring.nop, -1)
+
+    def test_full_submission_queue(self):
+        ring = self.ring
+        for i in range(20):
+            ring.nop(i)
+        results = []
+        while len(results) < 20:
+            results += ring.wait()
+        self.assertEqual(sorted(results), [(i, 0, 0) for i in range(20)])
+
+    def test_recv_send(self):
+        ring = self.ring
+        a, b = self.socketpair()
+        buf = bytearray(10)
+        ring.recv(1, a, buf)
+        self.assertEqual(ring.wait(0.01), [])
+        ring.send(2, b, b'spam')
+        results = []
+        while len(results) < 2:
+            results += ring.wait()
+        self.assertEqual(sorted(results), [(1, 4, 0), (2, 4, 0)])
+        self.assertEqual(buf[:4], b'spam')
+
+        self.assertRaises(TypeError, ring.recv, 3, a, b'readonly')
+        self.assertRaises(TypeError, ring.recv, 3, a, 'str')
+        self.assertRaises(TypeError, ring.send, 3, b, 'str')
+        self.assertEqual(ring.wait(0), [])
+
+    def test_recv_error(self):
+        ring = self.ring
+        r, w = os.pipe()
+        self.addCleanup(os.close, r)
+        self.addCleanup(os.close, w)
+        ring.recv(1, r, bytearray(1))
+        self.assertEqual(ring.wait(), [(1, -errno.ENOTSOCK, 0)])
+
+    def test_read_write(self):
+        ring = self.ring
+        filename = os_helper.TESTFN
+        self.addCleanup(os_helper.unlink, filename)
+        with open(filename, 'wb+') as f:
+            ring.write(1, f, b'eggs and spam', 0)
+            self.assertEqual(ring.wait(), [(1, 13, 0)])
+            buf = bytearray(4)
+            ring.read(2, f, buf, 9)
+            self.assertEqual(ring.wait(), [(2, 4, 0)])
+            self.assertEqual(buf, b'spam')
+            ring.read(3, f.fileno(), buf, 100)
+            self.assertEqual(ring.wait(), [(3, 0, 0)])
+
+    def test_accept(self):
+        ring = self.ring
+        with socket.create_server(('127.0.0.1', 0)) as server:
+            ring.accept(1, server, socket.SOCK_CLOEXEC)
+            self.assertEqual(ring.wait(0), [])
+            with socket.create_connection(server.getsockname()) as client:
+                [(user_data, fd, flags)] = ring.wait()
+                self.assertEqual(user_data, 1)
+                with socket.socket(fileno=fd) as conn:
+                    self.assertEqual(conn.getpeername(),
+                                     client.getsockname())
+                    self.assertFalse(conn.get_inheritable())
+
+    def test_poll_add(self):
+        ring = self.ring
+        a, b = self.socketpair()
+        ring.poll_add(1, a, select.POLLIN)
+        ring.poll_add(2, b, select.POLLOUT)
+        self.assertEqual(ring.wait(), [(2, select.POLLOUT, 0)])
+        b.send(b'x')
+        self.assertEqual(ring.wait(), [(1, select.POLLIN, 0)])
+
+    def test_cancel(self):
+        ring = self.ring
+        a, b = self.socketpair()
+        buf = bytearray(10)
+        ring.recv(1, a, buf)
+        ring.submit()
+        ring.cancel(2, 1)
+        results = []
+        while len(results) < 2:
+            results += ring.wait()
+        self.assertEqual(sorted(results),
+                         [(1, -errno.ECANCELED, 0), (2, 0, 0)])
+        ring.cancel(3, 1)
+        self.assertEqual(ring.wait(), [(3, -errno.ENOENT, 0)])
+
+    def test_wait_timeout(self):
+        ring = self.ring
+        a, b = self.socketpair()
+        ring.recv(1, a, bytearray(1))
+        t = time.monotonic()
+        self.assertEqual(ring.wait(0.1), [])
+        self.assertGreaterEqual(time.monotonic() - t, 0.09)
+        self.assertEqual(ring.wait(0), [])
+        self.assertRaises(TypeError, ring.wait, 'spam')
+
+    def test_close_with_requests_in_flight(self):
+        a, b = self.socketpair()
+        ring = select.io_uring()
+        buf = bytearray(10)
+        ring.recv(1, a, buf)
+        ring.recv(2, b, bytearray(10))
+        ring.submit()
+        ring.close()
+        # The requests were cancelled: the buffer is no longer in use.
+        buf.extend(b'spam')
+        b.send(b'eggs')
+        self.assertEqual(a.recv(10), b'eggs')
+
+
+if __name__ == "__main__":
+    unittest.main()
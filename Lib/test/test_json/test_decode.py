@@ -89,6 +89,70 @@ def test_keys_reuse(self):
         self.check_keys_reuse(s, decoder.decode)
         self.assertFalse(decoder.memo)
 
+    def test_key_cache(self):
+        decoder = self.json.JSONDecoder(key_cache_size=2)
+        a = decoder.decode('{"a_key": 1, "b_\xe9": 2}')
+        self.assertEqual(decoder.memo, {'a_key': 'a_key', 'b_\xe9': 'b_\xe9'})
+        b = decoder.decode(b'{"b_\xc3\xa9": 3, "a_key": 4}'.decode())
+        for key_a, key_b in zip(sorted(a), sorted(b)):
+            self.assertIs(key_a, key_b)
+        self.assertEqual(len(decoder.memo), 2)
+        c = decoder._decode_utf8(b'[{"b_\xc3\xa9": 5}]')
+        self.assertIs(next(iter(c[0])), next(iter(b)))
+        # The cache is cleared when it grows too large.
+        decoder.decode('{"a_key": 1, "c": 2}')
+        self.assertFalse(decoder.memo)
+        self.assertEqual(decoder.key_cache_size, 2)
+
+    def test_columnar(self):
+        loads = self.loads
+        self.assertEqual(loads('[{"a": 1, "b": "x"}, {"a": 2, "b": null}]',
+                               columnar=True),
+                         {'a': [1, 2], 'b': ['x', None]})
+        self.assertEqual(loads('{"rows": [{"a": [{"b": 1}, {"b": 2}]}]}',
+                               columnar=True),
+                         {'rows': {'a': [{'b': [1, 2]}]}})
+        # Other arrays are decoded as lists.
+        for s in ['[]', '[1, 2]', '[{}]', '[{}, {}]', '[{"a": 1}, 2]',
+                  '[2, {"a": 1}]', '[{"a": 1}, {"b": 2}]',
+                  '[{"a": 1}, {"a": 2, "b": 3}]', '[{"a": 1, "b": 2}, {"a": 3}]',
+                  '[{"a": 1, "b": 2}, {"b": 3, "a": 4}, {"a": 5, "b": 6}]']:
+            with self.subTest(s=s):
+                self.assertEqual(loads(s, columnar=True), loads(s))
+
+    def test_columnar_hooks(self):
+        calls = []
+        def hook(pairs):
+            calls.append(pairs)
+            return OrderedDict(pairs)
+        s = '[{"a": 1, "b": {"c": 2}}, {"a": 3, "b": {"c": 4}}]'
+        self.assertEqual(self.loads(s, columnar=True, object_pairs_hook=hook),
+                         OrderedDict([('a', [1, 3]), ('b', [{'c': 2}, {'c': 4}])]))
+        self.assertEqual(calls, [[('c', 2)], [('c', 4)],
+                                 [('a', [1, 3]), ('b', [{'c': 2}, {'c': 4}])]])
+        # The hook is called for the items if the array is not homogeneous.
+        calls.clear()
+        s = '[{"a": 1}, {"a": 2}, {"b": 3}]'
+        self.assertEqual(self.loads(s, columnar=True, object_pairs_hook=hook),
+                         [{'a': 1}, {'a': 2}, {'b': 3}])
+        self.assertEqual(calls, [[('a', 1)], [('a', 2)], [('b', 3)]])
+        self.assertEqual(self.loads(s, columnar=True, object_hook=len),
+                         [1, 1, 1])
+
+    def test_columnar_errors(self):
+        for s, msg, pos in [
+            ('[{"a": 1}, {"a": 2},]', 'Illegal trailing comma', 19),
+            ('[{"a": 1} {"a": 2}]', "Expecting ','", 10),
+            ('[{"a": 1}, {"a": 2', "Expecting ','", 18),
+            ('[{"a": 1}, {"a" 2}]', "Expecting ':'", 16),
+            ('[{"a": 1}, ', 'Expecting value', 11),
+            ('[{"a": 1}, 2', "Expecting ','", 12),
+        ]:
+            with self.subTest(s=s):
+                with self.assertRaisesRegex(self.JSONDecodeError, msg) as cm:
+                    self.loads(s, columnar=True)
+                self.assertEqual(cm.exception.pos, pos)
+
     def test_extra_data(self):
         s = '[1, 2, 3]5'
         msg = 'Extra data'
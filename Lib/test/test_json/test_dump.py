@@ -1,4 +1,4 @@
-from io import StringIO
+from io import BytesIO, StringIO
 from test.test_json import PyTest, CTest
 
 from test.support import bigmemtest, _1G
@@ -12,6 +12,79 @@ def test_dump(self):
     def test_dumps(self):
         self.assertEqual(self.dumps({}), '{}')
 
+    def test_dumpb(self):
+        self.assertEqual(self.json.dumpb({}), b'{}')
+        values = [
+            None, True, False, 0, -1, 2**63, 10**30, 1.5, -0.0, 1e300,
+            float('inf'), float('nan'), '', 'spam', '\x00\x1f\x7f"\\/\t\n',
+            'caf\xe9', '\u20ac', '\U0001f600', 'x' * 10000,
+            [1, [2, []], {}], (), {'a': {'b': [None, 'c']}},
+            {1: 2, 1.5: 3, True: 4, None: 5, '\xe9': 6},
+        ]
+        for value in values:
+            for kw in ({}, {'ensure_ascii': False}, {'indent': 2},
+                       {'separators': ('\u2022', '\u2192')}):
+                with self.subTest(value=value, **kw):
+                    self.assertEqual(self.json.dumpb(value, **kw),
+                                     self.dumps(value, **kw).encode())
+        self.assertEqual(self.json.dumpb({'b': 1, 'a': 2}, sort_keys=True),
+                         b'{"a": 2, "b": 1}')
+
+    def test_dumpb_surrogates(self):
+        self.assertEqual(self.json.dumpb('\ud800'), b'"\\ud800"')
+        self.assertRaises(UnicodeEncodeError,
+                          self.json.dumpb, '\ud800', ensure_ascii=False)
+        self.assertRaises(UnicodeEncodeError,
+                          self.json.dumpb, {'\udcff': 1}, ensure_ascii=False)
+
+    def test_dumpb_cls(self):
+        class Encoder(self.json.JSONEncoder):
+            def default(self, o):
+                return list(o)
+        self.assertEqual(self.json.dumpb({'a': {1, 2}}, cls=Encoder,
+                                         sort_keys=True),
+                         b'{"a": [1, 2]}')
+
+        class Encoder(self.json.JSONEncoder):
+            def encode(self, o):
+                return super().encode(o).upper()
+        self.assertEqual(self.json.dumpb(['a'], cls=Encoder), b'["A"]')
+
+    def test_dump_binary(self):
+        bio = BytesIO()
+        self.json.dump({'\xe9': ['\u20ac']}, bio, ensure_ascii=False)
+        self.assertEqual(bio.getvalue(), '{"\xe9": ["\u20ac"]}'.encode())
+        bio = BytesIO()
+        self.json.dump({'\xe9': ['\u20ac']}, bio)
+        self.assertEqual(bio.getvalue(), b'{"\\u00e9": ["\\u20ac"]}')
+
+    def test_dump_chunks(self):
+        value = [{'key': 'x' * 100, 'value': list(range(20))}] * 2000
+        expected = self.dumps(value, indent=1)
+        for fp in StringIO(), BytesIO():
+            with self.subTest(type(fp)):
+                writes = []
+                def write(data, write=fp.write):
+                    writes.append(data)
+                    return write(data)
+                fp.write = write
+                self.json.dump(value, fp, indent=1)
+                output = fp.getvalue()
+                if isinstance(output, bytes):
+                    output = output.decode()
+                self.assertEqual(output, expected)
+                self.assertGreater(len(writes), 1)
+
+    def test_dump_error(self):
+        sio = StringIO()
+        with self.assertRaises(TypeError):
+            self.json.dump([1, 2, object()], sio)
+        class BrokenFile:
+            def write(self, data):
+                raise OSError('broken')
+        with self.assertRaisesRegex(OSError, 'broken'):
+            self.json.dump(['x' * 100] * 10000, BrokenFile())
+
     def test_dump_skipkeys(self):
         v = {b'invalid_key': False, 'valid_key': True}
         with self.assertRaises(TypeError):
@@ -0,0 +1,248 @@
+from io import BytesIO, StringIO
+from collections import OrderedDict
+from test.test_json import PyTest, CTest
+
+
+DOCS = [
+    '{"a": [1, 2.5, -3e-2], "b": {"c": null, "d": [true, false]}}',
+    '"sp\\u00e4m \\ud834\\udd1e \\"eggs\\\\"',
+    '[]',
+    '{}',
+    '-1234567890',
+    '1.5E+10',
+    'true',
+    'NaN',
+    '-Infinity',
+    '[[[[["deep"]]]], {"x": {}}]',
+]
+
+
+class TestStreamDecoder:
+    def feed_all(self, decoder, chunks):
+        values = []
+        for chunk in chunks:
+            values += decoder.feed(chunk)
+        values += decoder.close()
+        return values
+
+    def split(self, data, size=1):
+        return [data[i:i + size] for i in range(0, len(data), size)]
+
+    def test_values(self):
+        expected = [self.loads(doc) for doc in DOCS]
+        for sep in ('\n', ' ', '\r\n', ' \t'):
+            data = sep.join(DOCS) + sep
+            for size in (1, 2, 3, 7, len(data)):
+                with self.subTest(sep=sep, size=size):
+                    decoder = self.json.JSONStreamDecoder()
+                    values = self.feed_all(decoder, self.split(data, size))
+                    self.assertEqual(repr(values), repr(expected))
+
+    def test_values_without_separator(self):
+        decoder = self.json.JSONStreamDecoder()
+        values = self.feed_all(decoder, self.split('{"a":1}[2]"3"{}', 1))
+        self.assertEqual(values, [{'a': 1}, [2], '3', {}])
+
+    def test_value_completed_by_chunk(self):
+        decoder = self.json.JSONStreamDecoder()
+        self.assertEqual(decoder.feed('{"a": '), [])
+        self.assertEqual(decoder.feed('[1, 2]'), [])
+        self.assertEqual(decoder.feed('}\n{"b"'), [{'a': [1, 2]}])
+        self.assertEqual(decoder.feed(': 3}'), [{'b': 3}])
+        # A number or a literal may continue in the next chunk.
+        self.assertEqual(decoder.feed('12'), [])
+        self.assertEqual(decoder.feed('34'), [])
+        self.assertEqual(decoder.feed('.5 tr'), [1234.5])
+        self.assertEqual(decoder.feed('ue'), [])
+        self.assertEqual(decoder.close(), [True])
+        self.assertEqual(decoder.close(), [])
+
+    def test_items(self):
+        data = '[' + ', '.join(DOCS) + ']'
+        expected = self.loads(data)
+        for size in (1, 2, 3, 7, len(data)):
+            with self.subTest(size=size):
+                decoder = self.json.JSONStreamDecoder(items=True)
+                values = self.feed_all(decoder, self.split(data, size))
+                self.assertEqual(repr(values), repr(expected))
+
+        decoder = self.json.JSONStreamDecoder(items=True)
+        self.assertEqual(decoder.feed(' [ 1 ,'), [1])
+        self.assertEqual(decoder.feed('2,'), [2])
+        self.assertEqual(decoder.feed('{"a": "b"} ] '), [{'a': 'b'}])
+        self.assertEqual(decoder.feed('\n'), [])
+        self.assertEqual(decoder.close(), [])
+
+        for data in ('[]', ' [ ] ', '[\n]\n'):
+            decoder = self.json.JSONStreamDecoder(items=True)
+            self.assertEqual(self.feed_all(decoder, self.split(data)), [])
+
+    def test_split_everywhere(self):
+        data = '[' + ',\n'.join(DOCS) + ']'
+        expected = repr(self.loads(data))
+        for i in range(0, len(data), 3):
+            for j in range(i, len(data), 7):
+                chunks = [data[:i], data[i:j], data[j:]]
+                decoder = self.json.JSONStreamDecoder(items=True)
+                self.assertEqual(repr(self.feed_all(decoder, chunks)),
+                                 expected)
+                decoder = self.json.JSONStreamDecoder()
+                self.assertEqual(repr(self.feed_all(decoder, chunks)[0]),
+                                 expected)
+
+    def test_bytes(self):
+        data = '\n'.join(DOCS) + '\n'
+        expected = repr([self.loads(doc) for doc in DOCS])
+        for encoding in ('utf-8', 'utf-8-sig', 'utf-16', 'utf-16-le',
+                         'utf-16-be', 'utf-32', 'utf-32-le', 'utf-32-be'):
+            encoded = data.encode(encoding)
+            for size in (1, 3, len(encoded)):
+                with self.subTest(encoding=encoding, size=size):
+                    decoder = self.json.JSONStreamDecoder()
+                    values = self.feed_all(decoder, self.split(encoded, size))
+                    self.assertEqual(repr(values), expected)
+
+        decoder = self.json.JSONStreamDecoder()
+        self.assertEqual(decoder.feed(bytearray(b'1 ')), [1])
+        self.assertEqual(decoder.feed(b''), [])
+        self.assertEqual(decoder.feed(b'"\xc3'), [])
+        self.assertEqual(decoder.feed(b'\xa4"'), ['\xe4'])
+        self.assertEqual(decoder.close(), [])
+
+        # A document shorter than 4 bytes
+        decoder = self.json.JSONStreamDecoder()
+        self.assertEqual(decoder.feed(b'1'), [])
+        self.assertEqual(decoder.close(), [1])
+        decoder = self.json.JSONStreamDecoder()
+        self.assertEqual(decoder.close(), [])
+
+    def test_invalid_type(self):
+        decoder = self.json.JSONStreamDecoder()
+        self.assertRaises(TypeError, decoder.feed, 1)
+        self.assertRaises(TypeError, decoder.feed, memoryview(b'1'))
+        decoder.feed('1')
+        self.assertRaises(TypeError, decoder.feed, b'1')
+        decoder = self.json.JSONStreamDecoder()
+        decoder.feed(b'1')
+        self.assertRaises(TypeError, decoder.feed, '1')
+
+    def test_bom(self):
+        decoder = self.json.JSONStreamDecoder()
+        with self.assertRaisesRegex(self.JSONDecodeError, 'BOM'):
+            decoder.feed('\ufeff1')
+
+    def test_feed_after_close(self):
+        decoder = self.json.JSONStreamDecoder()
+        decoder.feed('1')
+        self.assertEqual(decoder.close(), [1])
+        self.assertRaises(ValueError, decoder.feed, '2')
+
+    def check_error(self, data, msg, pos, lineno, colno, items=False):
+        for size in (1, 4, max(len(data), 1)):
+            with self.subTest(data=data, size=size):
+                decoder = self.json.JSONStreamDecoder(items=items)
+                with self.assertRaises(self.JSONDecodeError) as cm:
+                    self.feed_all(decoder, self.split(data, size))
+                err = cm.exception
+                self.assertEqual(err.msg, msg)
+                self.assertEqual(err.pos, pos)
+                self.assertEqual(err.lineno, lineno)
+                self.assertEqual(err.colno, colno)
+                self.assertEqual(str(err),
+                                 '%s: line %d column %d (char %d)' %
+                                 (msg, lineno, colno, pos))
+
+    def test_errors(self):
+        self.check_error('{"a": 1}\n{"a" 1}', "Expecting ':' delimiter",
+                         14, 2, 6)
+        self.check_error('1\n2\n  3 x\n', 'Expecting value', 8, 3, 5)
+        self.check_error('[1, 2]\n[1, 2,]', 'Illegal trailing comma before '
+                         'end of array', 12, 2, 6)
+        self.check_error('"spam', 'Unterminated string starting at', 0, 1, 1)
+        self.check_error('1 2 tru', 'Expecting value', 4, 1, 5)
+        self.check_error('{"a": [1, 2', "Expecting ',' delimiter", 11, 1, 12)
+
+    def test_items_errors(self):
+        self.check_error('', 'Expecting value', 0, 1, 1, items=True)
+        self.check_error(' \n', 'Expecting value', 2, 2, 1, items=True)
+        self.check_error(' {}', "Expecting '['", 1, 1, 2, items=True)
+        self.check_error('[', 'Expecting value', 1, 1, 2, items=True)
+        self.check_error('[1,\n2', "Expecting ',' delimiter", 5, 2, 2,
+                         items=True)
+        self.check_error('[1,\n2 3]', "Expecting ',' delimiter", 6, 2, 3,
+                         items=True)
+        self.check_error('[1, 2, ]', 'Illegal trailing comma before end of '
+                         'array', 5, 1, 6, items=True)
+        self.check_error('[1, 2] [3]', 'Extra data', 7, 1, 8, items=True)
+        self.check_error('[1, [2, ]]', 'Illegal trailing comma before end of '
+                         'array', 6, 1, 7, items=True)
+
+    def test_decoder(self):
+        decoder = self.json.JSONDecoder(object_pairs_hook=OrderedDict,
+                                        parse_int=str)
+        stream = self.json.JSONStreamDecoder(decoder, items=True)
+        values = self.feed_all(stream, self.split('[{"b": 1, "a": 2}, 3]'))
+        self.assertEqual(values, [OrderedDict([('b', '1'), ('a', '2')]), '3'])
+        self.assertIsInstance(values[0], OrderedDict)
+
+    def test_iterload(self):
+        data = '\n'.join(DOCS) + '\n'
+        expected = repr([self.loads(doc) for doc in DOCS])
+        self.assertEqual(repr(list(self.json.iterload(StringIO(data)))),
+                         expected)
+        fp = BytesIO(data.encode('utf-16'))
+        self.assertEqual(repr(list(self.json.iterload(fp))), expected)
+
+        data = '[' + ', '.join(DOCS) + ']'
+        expected = repr(self.loads(data))
+        it = self.json.iterload(StringIO(data), items=True)
+        self.assertEqual(repr(list(it)), expected)
+
+        self.assertEqual(list(self.json.iterload(StringIO(''))), [])
+        with self.assertRaises(self.JSONDecodeError):
+            list(self.json.iterload(StringIO(''), items=True))
+
+    def test_iterload_lazy(self):
+        fp = StringIO('[1, 2, 3')
+        it = self.json.iterload(fp, items=True)
+        self.assertEqual(next(it), 1)
+        self.assertEqual(list(fp.read()), [])
+        self.assertEqual(next(it), 2)
+        with self.assertRaisesRegex(self.JSONDecodeError,
+                                    "Expecting ',' delimiter"):
+            next(it)
+
+    def test_iterload_large_value(self):
+        value = {'key%d' % i: 'x' * 1000 for i in range(1000)}
+        data = self.dumps([value, 'small', value])
+
+        reads = []
+        class Reader(StringIO):
+            def read(self, size=-1):
+                reads.append(size)
+                return super().read(size)
+
+        it = self.json.iterload(Reader(data), items=True)
+        self.assertEqual(list(it), [value, 'small', value])
+        # The read size grows with the incomplete value.
+        self.assertLess(len(reads), len(data) // 2 ** 16)
+
+    def test_iterload_hooks(self):
+        fp = StringIO('{"b": 1.5, "a": NaN}\n[1]')
+        values = list(self.json.iterload(fp, object_pairs_hook=OrderedDict,
+                                         parse_float=str,
+                                         parse_constant=str.lower))
+        self.assertEqual(values, [OrderedDict([('b', '1.5'), ('a', 'nan')]),
+                                  [1]])
+        self.assertIsInstance(values[0], OrderedDict)
+
+        class Decoder(self.json.JSONDecoder):
+            def __init__(self, *, spam, **kw):
+                super().__init__(**kw, parse_int=lambda s: spam)
+        fp = StringIO('[1, 2]')
+        self.assertEqual(list(self.json.iterload(fp, cls=Decoder, spam='x')),
+                         [['x', 'x']])
+
+
+class TestPyStreamDecoder(TestStreamDecoder, PyTest): pass
+class TestCStreamDecoder(TestStreamDecoder, CTest): pass
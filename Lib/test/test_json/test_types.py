@@ -0,0 +1,278 @@
+from collections import namedtuple
+from dataclasses import dataclass, field
+from io import BytesIO, StringIO
+from typing import NamedTuple
+from test.test_json import PyTest, CTest
+
+
+@dataclass
+class Point:
+    x: int
+    y: int = 0
+
+@dataclass
+class Polygon:
+    name: str
+    points: list[Point]
+    center: Point | None = None
+    tags: dict[str, Point] = field(default_factory=dict)
+
+@dataclass
+class Node:
+    value: int
+    children: tuple['Node', ...] = ()
+
+@dataclass
+class Counter:
+    name: str
+    count: int = field(default=0, init=False)
+
+class Slotted:
+    __slots__ = ('a', '__b')
+    a: str
+    __b: Point
+
+    def __init__(self, a, b):
+        self.a = a
+        self.__b = b
+
+    def get_b(self):
+        return self.__b
+
+class SlottedChild(Slotted):
+    __slots__ = ('c', '__dict__')
+    c: list[Point]
+
+class Empty:
+    __slots__ = ()
+
+Coords = namedtuple('Coords', 'x y')
+
+class Pair(NamedTuple):
+    first: Point
+    second: int = 0
+
+@dataclass
+class Segment:
+    coords: Coords
+    pair: Pair | None = None
+
+
+class TestTypes:
+    def test_encode_dataclass(self):
+        p = Polygon('tri', [Point(0, 1), Point(2)], Point(1, 1),
+                    {'a': Point(5, 6)})
+        self.assertEqual(self.dumps(p, types=[Polygon]),
+            '{"name": "tri", "points": [{"x": 0, "y": 1}, {"x": 2, "y": 0}], '
+            '"center": {"x": 1, "y": 1}, "tags": {"a": {"x": 5, "y": 6}}}')
+        self.assertEqual(self.dumps([Point(1, 2), {'p': Point(3)}],
+                                    types=[Point], separators=(',', ':')),
+                         '[{"x":1,"y":2},{"p":{"x":3,"y":0}}]')
+        self.assertEqual(self.dumps(Node(1, (Node(2),)), types=[Node]),
+            '{"value": 1, "children": [{"value": 2, "children": []}]}')
+        counter = Counter('spam')
+        self.assertEqual(self.dumps(counter, types=[Counter]),
+                         '{"name": "spam", "count": 0}')
+
+    def test_encode_slots(self):
+        obj = SlottedChild('x', Point(1))
+        obj.c = [Point(2)]
+        obj.d = 'not a field'
+        self.assertEqual(self.dumps(obj, types=[SlottedChild]),
+            '{"a": "x", "_Slotted__b": {"x": 1, "y": 0}, "c": [{"x": 2, "y": 0}]}')
+        self.assertEqual(self.dumps(Empty(), types=[Empty]), '{}')
+
+    def test_encode_options(self):
+        p = Polygon('\xe9', [Point(1, 2)])
+        self.assertEqual(self.dumps(p, types=[Polygon], sort_keys=True,
+                                    ensure_ascii=False),
+            '{"center": null, "name": "\xe9", "points": [{"x": 1, "y": 2}], '
+            '"tags": {}}')
+        self.assertEqual(self.dumps(Point(1, 2), types=[Point], indent=2),
+                         '{\n  "x": 1,\n  "y": 2\n}')
+        self.assertEqual(self.json.dumpb(Point(1), types=[Point]),
+                         b'{"x": 1, "y": 0}')
+        fp = StringIO()
+        self.json.dump([Point(1)], fp, types=[Point])
+        self.assertEqual(fp.getvalue(), '[{"x": 1, "y": 0}]')
+        fp = BytesIO()
+        self.json.dump([Point(1)], fp, types=[Point])
+        self.assertEqual(fp.getvalue(), b'[{"x": 1, "y": 0}]')
+
+    def test_encode_unknown_type(self):
+        # Only the given types and the types of their fields are encoded.
+        with self.assertRaisesRegex(TypeError, 'Point is not JSON serializable'):
+            self.dumps(Point(1))
+        with self.assertRaisesRegex(TypeError, 'Point is not JSON serializable'):
+            self.dumps(Point(1), types=[Node])
+        self.assertEqual(self.dumps(Point(1), types=[Node],
+                                    default=lambda o: 'point'),
+                         '"point"')
+        with self.assertRaisesRegex(TypeError, 'not a dataclass'):
+            self.json.JSONEncoder(types=[dict])
+        with self.assertRaisesRegex(TypeError, 'not a dataclass'):
+            self.json.JSONEncoder(types=[Point(1)])
+
+    def test_encode_errors(self):
+        with self.assertRaises(TypeError) as cm:
+            self.dumps(Polygon('p', [Point(object())]), types=[Polygon])
+        self.assertEqual(cm.exception.__notes__,
+                         ["when serializing Point field 'x'",
+                          "when serializing list item 0",
+                          "when serializing Polygon field 'points'"])
+        obj = Slotted('a', Point(1))
+        del obj.a
+        with self.assertRaises(AttributeError) as cm:
+            self.dumps(obj, types=[Slotted])
+        self.assertEqual(cm.exception.__notes__,
+                         ["when serializing Slotted field 'a'"])
+
+        node = Node(1)
+        node.children = (node,)
+        with self.assertRaisesRegex(ValueError, 'Circular reference'):
+            self.dumps(node, types=[Node])
+
+    def test_decode_dataclass(self):
+        s = ('{"name": "tri", "points": [{"x": 0, "y": 1}, {"x": 2}], '
+             '"center": {"y": 1, "x": 1}, "tags": {"a": {"x": 5, "y": 6}}}')
+        p = self.loads(s, type=Polygon)
+        self.assertEqual(p, Polygon('tri', [Point(0, 1), Point(2)],
+                                    Point(1, 1), {'a': Point(5, 6)}))
+        self.assertEqual(self.loads(s.encode(), type=Polygon), p)
+        self.assertEqual(self.loads('{"name": "e", "points": [], '
+                                    '"center": null}', type=Polygon),
+                         Polygon('e', []))
+        self.assertEqual(self.loads('{"value": 1, "children": '
+                                    '[{"value": 2}]}', type=Node),
+                         Node(1, (Node(2),)))
+
+    def test_decode_containers(self):
+        self.assertEqual(self.loads('[{"x": 1}, null]', type=list[Point]),
+                         [Point(1), None])
+        self.assertEqual(self.loads('[]', type=tuple[Point, ...]), ())
+        self.assertEqual(self.loads('[{"x": 1}]', type=tuple[Point, ...]),
+                         (Point(1),))
+        self.assertEqual(self.loads('{"a": {"x": 1}}', type=dict[str, Point]),
+                         {'a': Point(1)})
+        self.assertEqual(self.loads('[[{"x": 1}]]', type=list[list[Point]]),
+                         [[Point(1)]])
+        # Untyped values are decoded as usual.
+        self.assertEqual(self.loads('[1, "a", {"b": [2]}]', type=list[int]),
+                         [1, 'a', {'b': [2]}])
+        self.assertEqual(self.loads('{"a": [1]}', type=int), {'a': [1]})
+        self.assertIsNone(self.loads('null', type=Point))
+
+    def test_decode_ignores_unknown_members(self):
+        self.assertEqual(self.loads('{"x": 1, "z": {"a": [1, 2]}, "y": 2}',
+                                    type=Point),
+                         Point(1, 2))
+        # The last duplicate member wins.
+        self.assertEqual(self.loads('{"x": 1, "x": 3}', type=Point), Point(3))
+        # Fields which are not passed to __init__() are ignored.
+        self.assertEqual(self.loads('{"name": "a", "count": 5}',
+                                    type=Counter),
+                         Counter('a'))
+
+    def test_decode_slots(self):
+        obj = self.loads('{"a": "x", "_Slotted__b": {"x": 1}, "c": []}',
+                         type=SlottedChild)
+        self.assertIs(type(obj), SlottedChild)
+        self.assertEqual(obj.a, 'x')
+        self.assertEqual(obj.get_b(), Point(1))
+        self.assertEqual(obj.c, [])
+        self.assertEqual(obj.__dict__, {})
+        # __init__() is not called; missing fields are not set.
+        obj = self.loads('{}', type=Slotted)
+        self.assertFalse(hasattr(obj, 'a'))
+        self.assertIs(type(self.loads('{}', type=Empty)), Empty)
+
+    def test_decode_hooks(self):
+        # The hooks are only called for untyped objects.
+        calls = []
+        def hook(pairs):
+            calls.append(pairs)
+            return dict(pairs)
+        self.assertEqual(self.loads('[{"x": 1, "y": {"a": 1}}]',
+                                    type=list[Point], object_pairs_hook=hook),
+                         [Point(1, {'a': 1})])
+        self.assertEqual(calls, [[('a', 1)]])
+        self.assertEqual(self.loads('{"x": 1.5}', type=Point,
+                                    parse_float=str),
+                         Point('1.5'))
+
+    def test_decode_errors(self):
+        for s, msg, pos in [
+            ('[]', 'Expecting object', 0),
+            ('"x"', 'Expecting object', 0),
+            ('1', 'Expecting object', 0),
+            ('[{"x": 1}, {"x": 2, "y": 3,}]', 'Illegal trailing comma', 18),
+        ]:
+            with self.subTest(s=s):
+                tp = Point if s[0] != '[' or s == '[]' else list[Point]
+                with self.assertRaisesRegex(self.JSONDecodeError, msg) as cm:
+                    self.loads(s, type=tp)
+                if msg != 'Illegal trailing comma':
+                    self.assertEqual(cm.exception.pos, pos)
+        with self.assertRaises(self.JSONDecodeError) as cm:
+            self.loads('{"points": {}}', type=Polygon)
+        self.assertEqual(cm.exception.msg, 'Expecting array')
+        self.assertEqual(cm.exception.pos, 11)
+        with self.assertRaises(self.JSONDecodeError) as cm:
+            self.loads('{"a": [1]}', type=dict[str, Point])
+        self.assertEqual(cm.exception.msg, 'Expecting object')
+        self.assertEqual(cm.exception.pos, 6)
+        # Errors of __init__() are propagated.
+        with self.assertRaisesRegex(TypeError, "'x'"):
+            self.loads('{"y": 1}', type=Point)
+
+    def test_round_trip(self):
+        p = Polygon('tri', [Point(0, 1), Point(2)], None, {'a': Point(5, 6)})
+        s = self.dumps(p, types=[Polygon])
+        self.assertEqual(self.loads(s, type=Polygon), p)
+        self.assertEqual(self.json.loads(self.json.dumpb([p], types=[Polygon]),
+                                         type=list[Polygon]),
+                         [p])
+
+    def test_namedtuple(self):
+        # Named tuples are encoded as arrays and decoded from arrays.
+        seg = Segment(Coords(1, 2), Pair(Point(3), 4))
+        s = self.dumps(seg, types=[Segment])
+        self.assertEqual(s, '{"coords": [1, 2], '
+                            '"pair": [{"x": 3, "y": 0}, 4]}')
+        obj = self.loads(s, type=Segment)
+        self.assertEqual(obj, seg)
+        self.assertIs(type(obj.coords), Coords)
+        self.assertIs(type(obj.pair), Pair)
+        self.assertEqual(self.loads(self.dumps(Segment(Coords(1, 2)),
+                                               types=[Segment]),
+                                    type=Segment),
+                         Segment(Coords(1, 2)))
+
+        obj = self.loads(self.dumps(Coords(1, 2)), type=Coords)
+        self.assertEqual(obj, Coords(1, 2))
+        self.assertIs(type(obj), Coords)
+        obj = self.loads(self.dumps(Pair(Point(1, 2)), types=[Point]),
+                         type=Pair)
+        self.assertEqual(obj, Pair(Point(1, 2)))
+        self.assertIs(type(obj), Pair)
+        self.assertEqual(self.loads(b'[[{"x": 1}], null]', type=list[Pair]),
+                         [Pair(Point(1)), None])
+
+        with self.assertRaisesRegex(TypeError, 'not a dataclass'):
+            self.json.JSONEncoder(types=[Coords])
+        with self.assertRaisesRegex(self.JSONDecodeError, 'Expecting array'):
+            self.loads('{"x": 1, "y": 2}', type=Coords)
+        with self.assertRaisesRegex(TypeError, "'y'"):
+            self.loads('[1]', type=Coords)
+
+    def test_iterload(self):
+        data = '{"x": 1}\n{"x": 2, "y": 3}\n'
+        self.assertEqual(list(self.json.iterload(StringIO(data), type=Point)),
+                         [Point(1), Point(2, 3)])
+        it = self.json.iterload(StringIO('[{"x": 1}, {"x": 2}]'), items=True,
+                                type=Point)
+        self.assertEqual(list(it), [Point(1), Point(2)])
+
+
+class TestPyTypes(TestTypes, PyTest): pass
+class TestCTypes(TestTypes, CTest): pass
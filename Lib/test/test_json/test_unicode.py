@@ -119,6 +119,41 @@ def test_bytes_decode(self):
         self.assertEqual(self.loads(b'\x007'), 7)
         self.assertEqual(self.loads(b'57'), 57)
 
+    def test_bytes_decode_utf8(self):
+        data = ['a\xb5\u20ac\U0001d120', {'\xe9': 'x\ny', 'k': [1.5, None]},
+                'x' * 1000 + '\u20ac' + '\\"', '\ud800']
+        for ensure_ascii in (True, False):
+            encoded = self.dumps(data, ensure_ascii=ensure_ascii).encode(
+                'utf-8', 'surrogatepass')
+            self.assertEqual(self.loads(encoded), data)
+            self.assertEqual(self.loads(bytearray(encoded)), data)
+            self.assertEqual(self.loads(encoded, object_pairs_hook=list),
+                             [data[0], [('\xe9', 'x\ny'), ('k', [1.5, None])],
+                              data[2], data[3]])
+        self.assertEqual(self.loads(b' \n"\xe2\x82\xac" '), '\u20ac')
+
+    def test_bytes_decode_utf8_errors(self):
+        for data, msg, pos in [
+                ('["\u20ac", x]', 'Expecting value', 6),
+                ('{"\xe9\xe9": 1,\n"\u20ac" 2}', "Expecting ':' delimiter", 14),
+                ('["\u20ac"] ["\u20ac"]', 'Extra data', 6),
+                (' \n ', 'Expecting value', 3),
+                ('"\u20ac', 'Unterminated string starting at', 0),
+            ]:
+            with self.subTest(data=data):
+                with self.assertRaises(self.JSONDecodeError) as cm:
+                    self.loads(data.encode())
+                err = cm.exception
+                self.assertEqual(err.msg, msg)
+                self.assertEqual(err.doc, data)
+                self.assertEqual(err.pos, pos)
+                with self.assertRaises(self.JSONDecodeError) as cm:
+                    self.loads(data)
+                self.assertEqual(str(err), str(cm.exception))
+        self.assertRaises(UnicodeDecodeError, self.loads, b'["\xff"]')
+        self.assertRaises(UnicodeDecodeError, self.loads, b'[1, \xff]')
+        self.assertRaises(UnicodeDecodeError, self.loads, b'"\xe2\x82"')
+
     def test_object_pairs_hook_with_unicode(self):
         s = '{"xkd":1, "kcw":2, "art":3, "hxm":4, "qrt":5, "pad":6, "hoy":7}'
         p = [("xkd", 1), ("kcw", 2), ("art", 3), ("hxm", 4),
@@ -4539,6 +4539,258 @@ def test_calls_task_done_after_stop(self):
                 log_queue.task_done()
 
 
+class BlockingHandler(logging.Handler):
+    """A handler which waits for an event before handling each record."""
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.started = threading.Event()
+        self.event = threading.Event()
+        self.records = []
+
+    def emit(self, record):
+        self.started.set()
+        self.event.wait(support.SHORT_TIMEOUT)
+        self.records.append(record.getMessage())
+
+
+@threading_helper.requires_working_threading()
+class BackgroundHandlerTest(BaseTest):
+    expected_log_pat = r"^[\w.]+ -> (\w+): (\d+)$"
+
+    def setUp(self):
+        BaseTest.setUp(self)
+        self.logger = logging.getLogger('bg')
+        self.logger.propagate = False
+        self.logger.setLevel(logging.DEBUG)
+
+    def make_handler(self, *handlers, **kwargs):
+        handler = logging.handlers.BackgroundHandler(*handlers, **kwargs)
+        self.addCleanup(handler.close)
+        self.addCleanup(self.logger.removeHandler, handler)
+        self.logger.addHandler(handler)
+        return handler
+
+    def test_stream_handler(self):
+        self.root_hdlr.setLevel(logging.INFO)
+        handler = self.make_handler(self.root_hdlr, batch_size=3)
+        self.assertIsNone(handler._thread)
+        self.logger.debug(self.next_message())
+        for i in range(10):
+            self.logger.info(self.next_message())
+        handler.flush()
+        self.assert_log_lines([('INFO', str(i)) for i in range(2, 12)])
+        self.logger.error(self.next_message())
+        handler.close()
+        self.assert_log_lines([('INFO', str(i)) for i in range(2, 12)] +
+                              [('ERROR', '12')])
+        # After close, the records are handled in the calling thread.
+        self.logger.error(self.next_message())
+        self.assert_log_lines([('INFO', str(i)) for i in range(2, 12)] +
+                              [('ERROR', '12'), ('ERROR', '13')])
+        self.assertEqual((handler.dropped, handler.blocked), (0, 0))
+
+    def test_other_handlers(self):
+        matcher = TestHandler(support.Matcher())
+        matcher.setLevel(logging.WARNING)
+        handler = self.make_handler(matcher, self.root_hdlr)
+        handler.setLevel(logging.INFO)
+        self.logger.debug(self.next_message())
+        self.logger.info(self.next_message())
+        self.logger.warning(self.next_message())
+        handler.close()
+        self.assertEqual([r['message'] for r in matcher.buffer], ['3'])
+        self.assert_log_lines([('INFO', '2'), ('WARNING', '3')])
+
+    def test_multiple_threads(self):
+        handler = self.make_handler(self.root_hdlr, capacity=10)
+        def log(n):
+            for i in range(100):
+                self.logger.info('%d', n * 100 + i)
+        with threading_helper.start_threads(
+                threading.Thread(target=log, args=(n,)) for n in range(4)):
+            pass
+        handler.close()
+        lines = self.stream.getvalue().splitlines()
+        self.assertEqual(sorted(int(line.split()[-1]) for line in lines),
+                         list(range(400)))
+        self.assertEqual(handler.dropped, 0)
+
+    def check_overflow(self, overflow):
+        blocking = BlockingHandler()
+        handler = self.make_handler(blocking, capacity=3, overflow=overflow)
+        self.logger.info('0')
+        self.assertTrue(blocking.started.wait(support.SHORT_TIMEOUT))
+        for i in range(1, 10):
+            self.logger.info('%d', i)
+        self.assertEqual(handler.dropped, 6)
+        self.assertEqual(handler.blocked, 0)
+        blocking.event.set()
+        handler.close()
+        return blocking.records
+
+    def test_overflow_drop(self):
+        self.assertEqual(self.check_overflow('drop'), ['0', '1', '2', '3'])
+
+    def test_overflow_drop_oldest(self):
+        self.assertEqual(self.check_overflow('drop_oldest'),
+                         ['0', '7', '8', '9'])
+
+    def test_overflow_block(self):
+        blocking = BlockingHandler()
+        handler = self.make_handler(blocking, capacity=3, batch_size=1)
+        self.logger.info('0')
+        self.assertTrue(blocking.started.wait(support.SHORT_TIMEOUT))
+        for i in range(1, 4):
+            self.logger.info('%d', i)
+        timer = threading.Timer(0.1, blocking.event.set)
+        timer.start()
+        self.logger.info('4')
+        timer.join()
+        self.assertEqual(handler.blocked, 1)
+        handler.close()
+        self.assertEqual(blocking.records, ['0', '1', '2', '3', '4'])
+        self.assertEqual(handler.dropped, 0)
+
+    def test_handle_batch_error(self):
+        class FailingHandler(logging.handlers.BackgroundHandler):
+            def handle_batch(self, records):
+                if records[0].getMessage() == 'bad':
+                    raise RuntimeError('boom')
+                super().handle_batch(records)
+
+        handler = FailingHandler(self.root_hdlr, batch_size=1)
+        self.addCleanup(handler.close)
+        self.addCleanup(self.logger.removeHandler, handler)
+        self.logger.addHandler(handler)
+        with support.captured_stderr() as stderr:
+            self.logger.info('bad')
+            self.logger.info('%d', 1)
+            handler.flush()
+        self.assertIn('RuntimeError: boom', stderr.getvalue())
+        # The thread went on with the next batch.
+        self.assertIsNotNone(handler._thread)
+        self.assert_log_lines([('INFO', '1')])
+
+    def test_thread_dies(self):
+        class DyingHandler(logging.handlers.BackgroundHandler):
+            def handle_batch(self, records):
+                if threading.current_thread() is self._thread:
+                    blocking.started.set()
+                    blocking.event.wait(support.SHORT_TIMEOUT)
+                    raise SystemExit
+                super().handle_batch(records)
+
+        blocking = BlockingHandler()
+        handler = DyingHandler(self.root_hdlr, capacity=2, batch_size=1)
+        self.addCleanup(handler.close)
+        self.addCleanup(self.logger.removeHandler, handler)
+        self.logger.addHandler(handler)
+        with threading_helper.catch_threading_exception() as cm:
+            self.logger.info('0')
+            self.assertTrue(blocking.started.wait(support.SHORT_TIMEOUT))
+            thread = handler._thread
+            self.logger.info('%d', 1)
+            self.logger.info('%d', 2)
+            # The buffer is full: this waits until the thread dies.
+            timer = threading.Timer(0.1, blocking.event.set)
+            timer.start()
+            self.logger.info('%d', 3)
+            timer.join()
+            thread.join()
+            self.assertIs(cm.exc_type, SystemExit)
+        self.assertIsNone(handler._thread)
+        # flush() does not hang, and writes the records left by the thread.
+        handler.flush()
+        self.assert_log_lines([('INFO', '1'), ('INFO', '2'), ('INFO', '3')])
+        # The next records are handled in the logging thread.
+        self.logger.info('%d', 4)
+        self.assert_log_lines([('INFO', str(i)) for i in range(1, 5)])
+
+    def test_invalid_arguments(self):
+        BackgroundHandler = logging.handlers.BackgroundHandler
+        self.assertRaises(ValueError, BackgroundHandler, overflow='wait')
+        self.assertRaises(ValueError, BackgroundHandler, capacity=0)
+        self.assertRaises(ValueError, BackgroundHandler, batch_size=0)
+
+
+@threading_helper.requires_working_threading()
+@support.requires_working_socket()
+class AsyncioHandlerTest(BaseTest):
+    expected_log_pat = r"^[\w.]+ -> (\w+): (\d+)$"
+
+    def setUp(self):
+        BaseTest.setUp(self)
+        self.logger = logging.getLogger('aio')
+        self.logger.propagate = False
+        self.logger.setLevel(logging.DEBUG)
+        self.addCleanup(asyncio.events._set_event_loop_policy, None)
+
+    def make_handler(self, *handlers, **kwargs):
+        handler = logging.handlers.AsyncioHandler(*handlers, **kwargs)
+        self.addCleanup(handler.close)
+        self.addCleanup(self.logger.removeHandler, handler)
+        self.logger.addHandler(handler)
+        return handler
+
+    def test_flush_on_shutdown(self):
+        blocking = BlockingHandler()
+        handler = self.make_handler(blocking)
+        async def main():
+            for i in range(5):
+                self.logger.info('%d', i)
+            self.assertTrue(blocking.started.wait(support.SHORT_TIMEOUT))
+            self.assertEqual(blocking.records, [])
+            # The records are written while the loop shuts down.
+            asyncio.get_running_loop().call_soon(blocking.event.set)
+        asyncio.run(main())
+        self.assertEqual(blocking.records, ['0', '1', '2', '3', '4'])
+        self.assertGreater(handler.max_stall, 0.0)
+        # Another event loop is flushed too.
+        blocking.event.clear()
+        async def main2():
+            self.logger.info('5')
+            asyncio.get_running_loop().call_soon(blocking.event.set)
+        asyncio.run(main2())
+        self.assertEqual(blocking.records, ['0', '1', '2', '3', '4', '5'])
+
+    def test_aflush(self):
+        stream = io.StringIO()
+        handler = self.make_handler(logging.StreamHandler(stream))
+        async def main():
+            self.logger.info('%d', 1)
+            await handler.aflush()
+            self.assertEqual(stream.getvalue(), '1\n')
+        asyncio.run(main())
+
+    def test_overflow(self):
+        blocking = BlockingHandler()
+        handler = self.make_handler(blocking, capacity=3)
+        async def main():
+            self.logger.info('0')
+            self.assertTrue(blocking.started.wait(support.SHORT_TIMEOUT))
+            # The loop is not blocked while the buffer is full.
+            for i in range(1, 10):
+                self.logger.info('%d', i)
+            self.assertEqual(handler.dropped, 6)
+            blocking.event.set()
+        asyncio.run(main())
+        self.assertEqual(blocking.records, ['0', '7', '8', '9'])
+        self.assertEqual(handler.blocked, 0)
+
+    def test_without_loop(self):
+        handler = self.make_handler(self.root_hdlr, overflow='drop')
+        self.logger.info('%d', 1)
+        handler.close()
+        self.assert_log_lines([('INFO', '1')])
+        self.assertEqual(handler._loops, {})
+
+    def test_invalid_arguments(self):
+        AsyncioHandler = logging.handlers.AsyncioHandler
+        self.assertRaises(ValueError, AsyncioHandler, overflow='block')
+        self.assertRaises(ValueError, AsyncioHandler, capacity=0)
+
+
 ZERO = datetime.timedelta(0)
 
 class UTC(datetime.tzinfo):
@@ -4915,6 +5167,156 @@ def test_relativeCreated_has_higher_precision(self):
                 self.assertAlmostEqual(relativeCreated, offset_ns / 1e6, places=7)
 
 
+class JSONFormatterTest(unittest.TestCase):
+    def get_record(self, **kwargs):
+        d = {
+            'name': 'formatter.test',
+            'levelno': logging.WARNING,
+            'levelname': 'WARNING',
+            'msg': 'Message with %d %s',
+            'args': (2, 'placeholders'),
+            'created': 1700000000.125,
+            'msecs': 125.0,
+        }
+        d.update(kwargs)
+        return logging.makeLogRecord(d)
+
+    def test_default_fields(self):
+        f = logging.JSONFormatter(datefmt='%Y')
+        r = self.get_record()
+        s = f.format(r)
+        self.assertEqual(list(json.loads(s).items()), [
+            ('asctime', time.strftime('%Y', time.localtime(r.created))),
+            ('levelname', 'WARNING'),
+            ('name', 'formatter.test'),
+            ('message', 'Message with 2 placeholders'),
+        ])
+        self.assertEqual(r.message, 'Message with 2 placeholders')
+        self.assertTrue(f.usesTime())
+
+    def test_fields(self):
+        r = self.get_record(custom=[1, {'a': None}], flag=True)
+        f = logging.JSONFormatter('levelno message custom flag')
+        self.assertEqual(f.format(r),
+                         '{"levelno":30,"message":"Message with 2 placeholders",'
+                         '"custom":[1,{"a":null}],"flag":true}')
+        self.assertFalse(f.usesTime())
+        f = logging.JSONFormatter({'lvl': 'levelname', 'msg': 'message'})
+        self.assertEqual(f.format(r),
+                         '{"lvl":"WARNING","msg":"Message with 2 placeholders"}')
+        f = logging.JSONFormatter([])
+        self.assertEqual(f.format(r), '{}')
+        self.assertRaises(TypeError, logging.JSONFormatter, [1])
+        self.assertRaises(TypeError, logging.JSONFormatter, {'a': 1})
+
+    def test_missing_and_defaults(self):
+        r = self.get_record()
+        f = logging.JSONFormatter(['message', 'custom'])
+        self.assertEqual(json.loads(f.format(r)),
+                         {'message': 'Message with 2 placeholders'})
+        f = logging.JSONFormatter(['message', 'custom'],
+                                  defaults={'custom': 'x'})
+        self.assertEqual(json.loads(f.format(r)),
+                         {'message': 'Message with 2 placeholders',
+                          'custom': 'x'})
+        r.custom = 'y'
+        self.assertEqual(json.loads(f.format(r))['custom'], 'y')
+
+    def test_values(self):
+        class Obj:
+            def __str__(self):
+                return 'obj'
+        r = self.get_record(msg='caf\xe9 € "q"\n', args=(),
+                            obj=Obj(), num=1.5, nan=float('nan'),
+                            big=2**70)
+        f = logging.JSONFormatter('message obj num nan big')
+        s = f.format(r)
+        self.assertTrue(s.isascii())
+        self.assertEqual(json.loads(s)['message'], 'caf\xe9 € "q"\n')
+        self.assertEqual(json.loads(s)['obj'], 'obj')
+        self.assertEqual(json.loads(s)['num'], 1.5)
+        self.assertEqual(json.loads(s)['big'], 2**70)
+        self.assertIn('"nan":NaN', s)
+        f = logging.JSONFormatter('message', ensure_ascii=False)
+        s = f.format(r)
+        self.assertEqual(s, '{"message":"caf\xe9 € \\"q\\"\\n"}')
+
+    def test_exc_info_and_stack_info(self):
+        try:
+            raise RuntimeError('deliberate mistake')
+        except RuntimeError:
+            exc_info = sys.exc_info()
+        r = self.get_record(exc_info=exc_info, stack_info='Stack (most recent)')
+        f = logging.JSONFormatter('message')
+        d = json.loads(f.format(r))
+        self.assertEqual(list(d), ['message', 'exc_info', 'stack_info'])
+        self.assertStartsWith(d['exc_info'], 'Traceback (most recent call last)')
+        self.assertEndsWith(d['exc_info'], 'RuntimeError: deliberate mistake')
+        self.assertEqual(r.exc_text, d['exc_info'])
+        self.assertEqual(d['stack_info'], 'Stack (most recent)')
+        f = logging.JSONFormatter({'stack': 'stack_info', 'msg': 'message'})
+        d = json.loads(f.format(r))
+        self.assertEqual(list(d), ['stack', 'msg', 'exc_info'])
+        r = self.get_record(exc_text='Traceback text')
+        self.assertEqual(json.loads(f.format(r))['exc_info'], 'Traceback text')
+        r = self.get_record()
+        self.assertEqual(list(json.loads(f.format(r))), ['msg'])
+        f = logging.JSONFormatter('message', defaults={'exc_info': None})
+        self.assertEqual(json.loads(f.format(r)),
+                         {'message': 'Message with 2 placeholders',
+                          'exc_info': None})
+
+    def test_time_cache(self):
+        f = logging.JSONFormatter(['asctime'])
+        r1 = self.get_record()
+        r2 = self.get_record(created=r1.created + 0.5, msecs=625.0)
+        r3 = self.get_record(created=r1.created + 1, msecs=125.0)
+        t1 = json.loads(f.format(r1))['asctime']
+        t2 = json.loads(f.format(r2))['asctime']
+        t3 = json.loads(f.format(r3))['asctime']
+        self.assertEndsWith(t1, ',125')
+        self.assertEqual(t2, t1[:-3] + '625')
+        self.assertNotEqual(t3[:-4], t1[:-4])
+        self.assertEqual(t1, logging.Formatter().formatTime(r1))
+        self.assertEqual(t3, logging.Formatter().formatTime(r3))
+        self.assertEqual(f.formatTime(r1, '%Y'),
+                         time.strftime('%Y', time.localtime(r1.created)))
+
+    def test_formatter_attributes(self):
+        f = logging.JSONFormatter(datefmt='%Y', defaults={'custom': 'x'})
+        self.assertEqual(f.datefmt, '%Y')
+        self.assertEqual(f._fmt, logging.PercentStyle.default_format)
+        r = self.get_record()
+        r.message = r.getMessage()
+        self.assertEqual(f.formatMessage(r), 'Message with 2 placeholders')
+
+    def test_lazy_record(self):
+        r = logging.LazyLogRecord('formatter.test', logging.INFO, __file__, 42,
+                                  'lazy %s', ('message',), None)
+        f = logging.JSONFormatter('message threadName process')
+        d = json.loads(f.format(r))
+        self.assertEqual(d, {'message': 'lazy message',
+                             'threadName': threading.current_thread().name,
+                             'process': os.getpid()})
+
+    def test_dict_config(self):
+        config = {
+            'version': 1,
+            'formatters': {
+                'json': {
+                    '()': 'logging.JSONFormatter',
+                    'fields': ['levelname', 'message'],
+                },
+            },
+        }
+        f = logging.config.dictConfigClass(config).configure_formatter(
+            config['formatters']['json'])
+        self.assertIsInstance(f, logging.JSONFormatter)
+        self.assertEqual(f.format(self.get_record()),
+                         '{"levelname":"WARNING",'
+                         '"message":"Message with 2 placeholders"}')
+
+
 class TestBufferingFormatter(logging.BufferingFormatter):
     def formatHeader(self, records):
         return '[(%d)' % len(records)
@@ -5442,6 +5844,116 @@ def test_taskName_without_asyncio_imported(self):
             asyncio.events._set_event_loop_policy(None)
 
 
+class LazyLogRecordTest(BaseTest):
+    args = ('name', logging.WARNING, '/spam/ham.py', 42, 'msg %s', ('arg',),
+            None, 'func')
+
+    def setUp(self):
+        BaseTest.setUp(self)
+        self.orig_factory = logging.getLogRecordFactory()
+        logging.setLogRecordFactory(logging.LazyLogRecord)
+        self.addCleanup(logging.setLogRecordFactory, self.orig_factory)
+
+    def test_attributes(self):
+        lazy = logging.LazyLogRecord(*self.args)
+        record = logging.LogRecord(*self.args)
+        self.assertFalse(dict.__contains__(lazy.__dict__, 'levelname'))
+        self.assertIn('levelname', lazy.__dict__)
+        self.assertEqual(lazy.levelname, 'WARNING')
+        self.assertTrue(dict.__contains__(lazy.__dict__, 'levelname'))
+        self.assertFalse(dict.__contains__(lazy.__dict__, 'filename'))
+        self.assertEqual(vars(lazy).keys(), vars(record).keys())
+        for key in vars(record):
+            if key not in ('created', 'msecs', 'relativeCreated'):
+                self.assertEqual(getattr(lazy, key), getattr(record, key), key)
+        self.assertAlmostEqual(lazy.created, record.created, delta=1)
+        self.assertEqual(lazy.getMessage(), 'msg arg')
+        self.assertEqual(lazy.__dict__.get('module'), 'ham')
+        self.assertIsNone(lazy.__dict__.get('spam'))
+        with self.assertRaises(AttributeError):
+            lazy.spam
+        lazy.levelname = 'changed'
+        self.assertEqual(lazy.levelname, 'changed')
+
+    def test_captured_state(self):
+        # The thread is captured when the record is created.
+        records = []
+        t = threading.Thread(name='spam', target=lambda: records.append(
+            logging.LazyLogRecord(*self.args)))
+        t.start()
+        t.join()
+        self.assertEqual(records[0].threadName, 'spam')
+        self.assertEqual(records[0].thread, t.ident)
+
+    def test_formatters(self):
+        record = logging.LazyLogRecord(*self.args)
+        for fmt, style in [('%(levelname)s %(module)s %(message)s', '%'),
+                           ('{levelname} {module} {message}', '{'),
+                           ('$levelname $module $message', '$')]:
+            with self.subTest(style=style):
+                f = logging.Formatter(fmt, style=style)
+                self.assertEqual(f.format(record), 'WARNING ham msg arg')
+        f = logging.Formatter('%(threadName)s %(spam)s',
+                              defaults={'spam': 'eggs'})
+        self.assertEqual(f.format(record), 'MainThread eggs')
+
+    def test_copy_and_pickle(self):
+        record = logging.LazyLogRecord(*self.args)
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(proto=proto):
+                r = pickle.loads(pickle.dumps(record, proto))
+                self.assertIs(type(r), logging.LazyLogRecord)
+                self.assertEqual(r.filename, 'ham.py')
+                self.assertEqual(r.processName, 'MainProcess')
+        record = logging.LazyLogRecord(*self.args)
+        r = copy.copy(record)
+        self.assertEqual(r.levelname, 'WARNING')
+        self.assertEqual(vars(r), dict(record.__dict__))
+
+    def test_logger(self):
+        h = RecordingHandler()
+        logger = logging.getLogger('lazy')
+        logger.addHandler(h)
+        self.addCleanup(logger.removeHandler, h)
+        logger.warning('less is %(less)s', {'less': 'more'})
+        record = h.records[0]
+        self.assertIs(type(record), logging.LazyLogRecord)
+        self.assertEqual(record.getMessage(), 'less is more')
+        self.assertEqual(record.funcName, 'test_logger')
+        self.assertEqual(record.filename, os.path.basename(__file__))
+        with self.assertRaises(KeyError):
+            logger.warning('msg', extra={'threadName': 'spam'})
+        logger.warning('msg', extra={'spam': 'eggs'})
+        self.assertEqual(h.records[1].spam, 'eggs')
+
+    @warnings_helper.ignore_fork_in_thread_deprecation_warnings()
+    @support.requires_fork()
+    def test_process_after_fork(self):
+        r, w = os.pipe()
+        self.addCleanup(os.close, r)
+        pid = os.fork()
+        if pid == 0:
+            # Child process
+            try:
+                record = logging.LazyLogRecord(*self.args)
+                os.write(w, str(record.process == os.getpid()).encode())
+            finally:
+                os._exit(0)
+        os.close(w)
+        support.wait_process(pid, exitcode=0)
+        self.assertEqual(os.read(r, 10), b'True')
+        self.assertEqual(logging.LazyLogRecord(*self.args).process,
+                         os.getpid())
+
+    def test_task_name(self):
+        async def make_record():
+            return logging.LazyLogRecord(*self.args)
+        with asyncio.Runner() as runner:
+            task_name = runner.run(make_record()).taskName
+        self.assertStartsWith(task_name, 'Task-')
+        self.assertIsNone(logging.LazyLogRecord(*self.args).taskName)
+
+
 class BasicConfigTest(unittest.TestCase):
 
     """Test suite for logging.basicConfig."""
@@ -6158,6 +6670,33 @@ def outer():
         self.assertEqual(records[-1].funcName, 'test_find_caller_with_stacklevel')
         self.assertGreater(records[-1].lineno, lineno)
 
+    def test_find_caller_location_cache(self):
+        # The location is cached per code object and instruction offset.
+        records = self.recording.records
+        for i in range(3):
+            self.logger.warning('first')
+            self.logger.warning('second')
+        first, second = records[0].lineno, records[1].lineno
+        self.assertGreater(second, first)
+        self.assertEqual([r.lineno for r in records], [first, second] * 3)
+        self.assertEqual({r.funcName for r in records},
+                         {'test_find_caller_location_cache'})
+
+        # The same code in different files has different locations.
+        source = 'def spam(logger):\n    logger.warning("spam")\n'
+        for filename in ('spam.py', 'ham.py', 'spam.py'):
+            ns = {}
+            exec(compile(source, filename, 'exec'), ns)
+            ns['spam'](self.logger)
+            self.assertEqual(records[-1].pathname, filename)
+            self.assertEqual(records[-1].lineno, 2)
+            self.assertEqual(records[-1].funcName, 'spam')
+
+        self.logger.warning('third', stack_info=True)
+        self.logger.warning('third')
+        self.assertIsNotNone(records[-2].stack_info)
+        self.assertIsNone(records[-1].stack_info)
+
     def test_make_record_with_extra_overwrite(self):
         name = 'my record'
         level = 13
@@ -896,7 +896,20 @@ class MiscReadTest(MiscReadTestBase, unittest.TestCase):
     test_fail_comp = None
 
 class GzipMiscReadTest(GzipTest, MiscReadTestBase, unittest.TestCase):
-    pass
+    def test_index(self):
+        import gzip
+        with gzip.GzipFile(self.tarname) as f:
+            index = f.build_index(spacing=4096)
+        with tarfile.open(self.tarname, "r:gz", index=index) as tar1, \
+             tarfile.open(self.tarname, "r:gz") as tar2:
+            members = tar1.getmembers()
+            self.assertEqual([t.name for t in members], tar2.getnames())
+            for t1 in reversed(members):
+                if not t1.isreg():
+                    continue
+                with tar1.extractfile(t1) as f1, \
+                     tar2.extractfile(t1.name) as f2:
+                    self.assertEqual(f1.read(), f2.read())
 
 class Bz2MiscReadTest(Bz2Test, MiscReadTestBase, unittest.TestCase):
     pass
@@ -1415,6 +1415,51 @@ def test_zipwritefile_attrs(self):
             self.assertIs(fid.writable(), True)
             self.assertIs(fid.seekable(), False)
 
+    def test_writeall_workers(self):
+        with temp_dir() as srcdir:
+            files = []
+            for i in range(10):
+                name = os.path.join(srcdir, 'file%d' % i)
+                with open(name, 'wb') as f:
+                    f.write(randbytes(1000 * i) + b'a' * 10000)
+                files.append((name, 'file%d' % i))
+            subdir = os.path.join(srcdir, 'subdir')
+            os.mkdir(subdir)
+            files.append((subdir, 'subdir'))
+            files.append(files[0][0])
+
+            with zipfile.ZipFile(TESTFN2, "w", self.compression) as zipf:
+                zipf.writeall(files, workers=4)
+            with zipfile.ZipFile(TESTFN2, "r") as zipf:
+                self.assertIsNone(zipf.testzip())
+                infos = zipf.infolist()
+                self.assertEqual(len(infos), len(files))
+                for (name, arcname), zinfo in zip(files[:10], infos):
+                    self.assertEqual(zinfo.filename, arcname)
+                    self.assertEqual(zinfo.compress_type, self.compression)
+                    with open(name, 'rb') as f:
+                        self.assertEqual(zipf.read(zinfo), f.read())
+                self.assertTrue(infos[10].is_dir())
+                self.assertEqual(infos[10].filename, 'subdir/')
+                self.assertEqual(zipf.read(infos[11]), zipf.read(infos[0]))
+
+    def test_writeall_matches_write(self):
+        with open(TESTFN, 'wb') as f:
+            f.write(b'content' * 1000)
+        self.addCleanup(unlink, TESTFN)
+        buffers = []
+        for workers in (None, 2):
+            f = io.BytesIO()
+            with zipfile.ZipFile(f, "w", self.compression) as zipf:
+                zipf.writeall([TESTFN, (TESTFN, 'copy')], workers=workers)
+            buffers.append(f.getvalue())
+        self.assertEqual(buffers[0], buffers[1])
+
+    def test_writeall_invalid_workers(self):
+        with zipfile.ZipFile(TESTFN2, "w", self.compression) as zipf:
+            self.assertRaises(ValueError, zipf.writeall, [], workers=0)
+
+
 class StoredWriterTests(AbstractWriterTests, unittest.TestCase):
     compression = zipfile.ZIP_STORED
 
@@ -1715,6 +1760,86 @@ def test_extract_all_with_target_pathlike(self):
         with temp_dir() as extdir:
             self._test_extract_all_with_target(FakePath(extdir))
 
+    def test_extract_all_workers(self):
+        with temp_dir() as extdir:
+            self.make_test_file()
+            with zipfile.ZipFile(TESTFN2, "r") as zipfp:
+                zipfp.extractall(extdir, workers=3)
+                for fpath, fdata in SMALL_TEST_DATA:
+                    self.check_file(os.path.join(extdir, fpath),
+                                    fdata.encode())
+            unlink(TESTFN2)
+
+    def test_extract_all_workers_file_object(self):
+        f = io.BytesIO()
+        with zipfile.ZipFile(f, "w", zipfile.ZIP_DEFLATED) as zipfp:
+            zipfp.mkdir('dir')
+            for fpath, fdata in SMALL_TEST_DATA:
+                zipfp.writestr(fpath, fdata * 1000)
+        with temp_dir() as extdir:
+            with zipfile.ZipFile(f, "r") as zipfp:
+                zipfp.extractall(extdir, workers=2)
+            self.assertTrue(os.path.isdir(os.path.join(extdir, 'dir')))
+            for fpath, fdata in SMALL_TEST_DATA:
+                self.check_file(os.path.join(extdir, fpath),
+                                fdata.encode() * 1000)
+
+    def test_extract_all_workers_refcount(self):
+        f = io.BytesIO()
+        with zipfile.ZipFile(f, "w", zipfile.ZIP_DEFLATED) as zipfp:
+            for i in range(20):
+                zipfp.writestr(f'file{i}', b'data' * 1000)
+        with temp_dir() as extdir:
+            with zipfile.ZipFile(f, "r") as zipfp:
+                zipfp.extractall(extdir, workers=4)
+                self.assertEqual(zipfp._fileRefCnt, 1)
+            self.assertEqual(len(os.listdir(extdir)), 20)
+
+    def test_extract_all_workers_duplicate_names(self):
+        with zipfile.ZipFile(TESTFN2, "w", zipfile.ZIP_DEFLATED) as zipfp:
+            with self.assertWarns(UserWarning):
+                for i in range(10):
+                    zipfp.writestr('dup', str(i).encode() * 10000)
+                    zipfp.writestr(f'other{i}', b'other')
+        with temp_dir() as extdir:
+            with zipfile.ZipFile(TESTFN2, "r") as zipfp:
+                zipfp.extractall(extdir, members=zipfp.infolist(), workers=4)
+            self.check_file(os.path.join(extdir, 'dup'), b'9' * 10000)
+            self.assertEqual(len(os.listdir(extdir)), 11)
+        unlink(TESTFN2)
+
+    def test_extract_all_workers_members(self):
+        with temp_dir() as extdir:
+            self.make_test_file()
+            fpath, fdata = SMALL_TEST_DATA[1]
+            with zipfile.ZipFile(TESTFN2, "r") as zipfp:
+                zipfp.extractall(extdir, members=[fpath], workers=2)
+            self.check_file(os.path.join(extdir, fpath), fdata.encode())
+            self.assertFalse(os.path.exists(
+                os.path.join(extdir, SMALL_TEST_DATA[0][0])))
+            unlink(TESTFN2)
+
+    def test_extract_all_workers_bad_crc(self):
+        with temp_dir() as extdir:
+            self.make_test_file()
+            with open(TESTFN2, "r+b") as f:
+                data = f.read()
+                f.seek(data.index(SMALL_TEST_DATA[2][1].encode()))
+                f.write(b'X')
+            with zipfile.ZipFile(TESTFN2, "r") as zipfp:
+                with self.assertRaises(zipfile.BadZipFile):
+                    zipfp.extractall(extdir, workers=2)
+            unlink(TESTFN2)
+
+    def test_extract_all_invalid_workers(self):
+        self.make_test_file()
+        with zipfile.ZipFile(TESTFN2, "r") as zipfp:
+            for workers in (0, -1):
+                with self.assertRaises(ValueError):
+                    zipfp.extractall(TESTFN, workers=workers)
+        self.assertFalse(os.path.exists(TESTFN))
+        unlink(TESTFN2)
+
     def check_file(self, filename, content):
         self.assertTrue(os.path.isfile(filename))
         with open(filename, 'rb') as f:
@@ -3852,5 +3977,165 @@ def test_stored_seek_and_read(self):
                 self.assertEqual(arr, txt[current_pos - read_length:current_pos])
 
 
+class LazyIndexTests(unittest.TestCase):
+
+    def setUp(self):
+        self.addCleanup(unlink, TESTFN2)
+        self.addCleanup(unlink, TESTFN)
+        with zipfile.ZipFile(TESTFN2, "w") as zipf:
+            zipf.writestr("a.txt", b"spam")
+            zipf.mkdir("dir")
+            zipf.writestr("dir/b.txt", b"eggs", zipfile.ZIP_DEFLATED)
+            # Member whose name is overridden by a Unicode Path extra field
+            zinfo = zipfile.ZipInfo("c.txt")
+            uname = "\u00e9t\u00e9.txt".encode()
+            zinfo.extra = struct.pack('<HHBL', 0x7075, 5 + len(uname), 1,
+                                      zipfile.crc32(b"c.txt")) + uname
+            zipf.writestr(zinfo, b"ham")
+            with self.assertWarns(UserWarning):
+                zipf.writestr("a.txt", b"duplicate")
+
+    def check_same_contents(self, zipf):
+        with zipfile.ZipFile(TESTFN2) as eager:
+            self.assertEqual(zipf.namelist(), eager.namelist())
+            self.assertEqual(len(zipf.filelist), len(eager.filelist))
+            for lazy_info, eager_info in zip(zipf.infolist(), eager.infolist()):
+                for attr in zipfile.ZipInfo.__slots__:
+                    self.assertEqual(getattr(lazy_info, attr),
+                                     getattr(eager_info, attr), attr)
+            self.assertEqual(sorted(zipf.NameToInfo), sorted(eager.NameToInfo))
+        self.assertEqual(zipf.read("a.txt"), b"duplicate")
+        self.assertEqual(zipf.read("dir/b.txt"), b"eggs")
+        self.assertEqual(zipf.read("\u00e9t\u00e9.txt"), b"ham")
+        self.assertIsNone(zipf.testzip())
+
+    def test_lazy_index(self):
+        with zipfile.ZipFile(TESTFN2, lazy_index=True) as zipf:
+            self.assertIsNone(zipf.filelist._infos[0])
+            info = zipf.getinfo("dir/b.txt")
+            self.assertIs(zipf.getinfo("dir/b.txt"), info)
+            self.assertIs(zipf.filelist[2], info)
+            self.assertIn("dir/", zipf.NameToInfo)
+            self.assertNotIn("missing", zipf.NameToInfo)
+            self.assertRaises(KeyError, zipf.getinfo, "missing")
+            self.check_same_contents(zipf)
+
+    def test_index_file(self):
+        with zipfile.ZipFile(TESTFN2, index_file=FakePath(TESTFN)) as zipf:
+            self.check_same_contents(zipf)
+        self.assertTrue(os.path.exists(TESTFN))
+        with mock.patch.object(zipfile._ZipIndex, 'build') as build:
+            with zipfile.ZipFile(TESTFN2, index_file=TESTFN) as zipf:
+                self.check_same_contents(zipf)
+            build.assert_not_called()
+
+    def test_index_file_stale(self):
+        with zipfile.ZipFile(TESTFN2, index_file=TESTFN) as zipf:
+            zipf.namelist()
+        with zipfile.ZipFile(TESTFN2, "a") as zipf:
+            zipf.writestr("new.txt", b"new")
+        with zipfile.ZipFile(TESTFN2, index_file=TESTFN) as zipf:
+            self.assertIn("new.txt", zipf.namelist())
+            self.assertEqual(zipf.read("new.txt"), b"new")
+
+    def test_index_file_same_size_and_mtime(self):
+        # A change of the central directory which keeps the size and the
+        # mtime of the archive is detected.
+        with zipfile.ZipFile(TESTFN2, index_file=TESTFN) as zipf:
+            zipf.namelist()
+        st = os.stat(TESTFN2)
+        with open(TESTFN2, "r+b") as f:
+            data = f.read()
+            # Rename the first member in the central directory.
+            f.seek(data.index(b"PK\x01\x02") + 46)
+            f.write(b"z")
+        os.utime(TESTFN2, ns=(st.st_atime_ns, st.st_mtime_ns))
+        with zipfile.ZipFile(TESTFN2, index_file=TESTFN) as zipf:
+            self.assertEqual(zipf.namelist()[0], "z.txt")
+
+    def test_lazy_index_reads_records(self):
+        with zipfile.ZipFile(TESTFN2, lazy_index=True) as zipf:
+            # The central directory is not kept in memory.
+            self.assertNotIn("_data", vars(zipf.filelist))
+            info = zipf.getinfo("a.txt")
+        self.assertEqual(info.filename, "a.txt")
+        with self.assertRaises(ValueError):
+            zipf.getinfo("dir/b.txt")
+
+    def test_index_file_corrupt(self):
+        for data in (b"", b"garbage", b"PyZipIdx" + b"\xff" * 100):
+            with open(TESTFN, "wb") as f:
+                f.write(data)
+            with zipfile.ZipFile(TESTFN2, index_file=TESTFN) as zipf:
+                self.check_same_contents(zipf)
+
+    def test_index_file_unwritable(self):
+        index_file = os.path.join(TESTFN, "missing", "index")
+        with zipfile.ZipFile(TESTFN2, index_file=index_file) as zipf:
+            self.check_same_contents(zipf)
+
+    def test_lazy_index_requires_read_mode(self):
+        for mode in "wxa":
+            with self.assertRaises(ValueError):
+                zipfile.ZipFile(TESTFN, mode, lazy_index=True)
+            with self.assertRaises(ValueError):
+                zipfile.ZipFile(TESTFN, mode, index_file=TESTFN2)
+
+
+class GetBufferTests(unittest.TestCase):
+
+    def setUp(self):
+        self.data = randbytes(100000)
+        with zipfile.ZipFile(TESTFN2, "w") as zipf:
+            zipf.writestr("stored", self.data)
+            zipf.writestr("empty", b"")
+            zipf.writestr("deflated", self.data, zipfile.ZIP_DEFLATED)
+        self.addCleanup(unlink, TESTFN2)
+
+    def test_getbuffer(self):
+        with zipfile.ZipFile(TESTFN2) as zipf:
+            view = zipf.getbuffer("stored")
+            self.assertIsInstance(view, memoryview)
+            self.assertTrue(view.readonly)
+            self.assertEqual(view, self.data)
+            self.assertEqual(view[10:20], self.data[10:20])
+            self.assertEqual(zipf.getbuffer(zipf.getinfo("stored")),
+                             self.data)
+            self.assertEqual(zipf.getbuffer("empty"), b"")
+            view.release()
+
+    def test_getbuffer_outlives_zipfile(self):
+        with zipfile.ZipFile(TESTFN2) as zipf:
+            view = zipf.getbuffer("stored")
+        self.assertEqual(bytes(view), self.data)
+        view.release()
+
+    def test_getbuffer_file_object(self):
+        with open(TESTFN2, "rb") as f:
+            with zipfile.ZipFile(f) as zipf:
+                with zipf.getbuffer("stored") as view:
+                    self.assertEqual(view, self.data)
+        with open(TESTFN2, "rb") as f:
+            data = f.read()
+        with zipfile.ZipFile(io.BytesIO(data)) as zipf:
+            view = zipf.getbuffer("stored")
+            self.assertTrue(view.readonly)
+            self.assertEqual(view, self.data)
+
+    def test_getbuffer_errors(self):
+        with zipfile.ZipFile(TESTFN2) as zipf:
+            self.assertRaises(ValueError, zipf.getbuffer, "deflated")
+            self.assertRaises(KeyError, zipf.getbuffer, "missing")
+        self.assertRaises(ValueError, zipf.getbuffer, "stored")
+        with zipfile.ZipFile(TESTFN2, "a") as zipf:
+            self.assertRaises(ValueError, zipf.getbuffer, "stored")
+
+    def test_getbuffer_bad_header(self):
+        with open(TESTFN2, "r+b") as f:
+            f.write(b"XXXX")
+        with zipfile.ZipFile(TESTFN2) as zipf:
+            self.assertRaises(zipfile.BadZipFile, zipf.getbuffer, "stored")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1089,6 +1089,17 @@ def testEOFError(self):
         self.assertRaises(EOFError, zlibd.decompress, b"anything")
         self.assertRaises(EOFError, zlibd.decompress, b"")
 
+    def test_prime(self):
+        # Feed the first byte of a raw deflate stream with _prime().
+        co = zlib.compressobj(wbits=-15)
+        data = co.compress(self.TEXT) + co.flush()
+        zlibd = zlib._ZlibDecompressor(-15)
+        zlibd._prime(8, data[0])
+        self.assertEqual(zlibd.decompress(data[1:]), self.TEXT)
+        self.assertTrue(zlibd.eof)
+        with self.assertRaisesRegex(ValueError, 'uninitialized decompressor'):
+            zlibd._prime(3, 0)
+
     @support.skip_if_pgo_task
     @bigmemtest(size=_4G + 100, memuse=3.3)
     def testDecompress4G(self, size):
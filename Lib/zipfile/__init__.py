@@ -13,6 +13,7 @@
 import sys
 import threading
 import time
+from collections.abc import Mapping, Sequence
 
 try:
     import zlib # We may need its compression method
@@ -104,6 +105,7 @@ class LargeZipFile(Exception):
 structCentralDir = "<4s4B4HL2L5H2L"
 stringCentralDir = b"PK\001\002"
 sizeCentralDir = struct.calcsize(structCentralDir)
+_centDirStruct = struct.Struct(structCentralDir)
 
 # indexes of entries in the central directory structure
 _CD_SIGNATURE = 0
@@ -881,6 +883,271 @@ def _get_decompressor(compress_type):
             raise NotImplementedError("compression type %d" % (compress_type,))
 
 
+def _read_centdir(data, pos, concat, metadata_encoding, debug=0):
+    """Decode the central directory record at offset 'pos' of 'data'.
+
+    Return the new ZipInfo instance and the offset of the next record.
+    """
+    centdir = data[pos:pos + sizeCentralDir]
+    if len(centdir) != sizeCentralDir:
+        raise BadZipFile("Truncated central directory")
+    centdir = struct.unpack(structCentralDir, centdir)
+    if centdir[_CD_SIGNATURE] != stringCentralDir:
+        raise BadZipFile("Bad magic number for central directory")
+    if debug > 2:
+        print(centdir)
+    pos += sizeCentralDir
+    filename = data[pos:pos + centdir[_CD_FILENAME_LENGTH]]
+    pos += centdir[_CD_FILENAME_LENGTH]
+    orig_filename_crc = crc32(filename)
+    flags = centdir[_CD_FLAG_BITS]
+    if flags & _MASK_UTF_FILENAME:
+        # UTF-8 file names extension
+        filename = filename.decode('utf-8')
+    else:
+        # Historical ZIP filename encoding
+        filename = filename.decode(metadata_encoding or 'cp437')
+    # Create ZipInfo instance to store file information
+    x = ZipInfo(filename)
+    x.extra = data[pos:pos + centdir[_CD_EXTRA_FIELD_LENGTH]]
+    pos += centdir[_CD_EXTRA_FIELD_LENGTH]
+    x.comment = data[pos:pos + centdir[_CD_COMMENT_LENGTH]]
+    pos += centdir[_CD_COMMENT_LENGTH]
+    x.header_offset = centdir[_CD_LOCAL_HEADER_OFFSET]
+    (x.create_version, x.create_system, x.extract_version, x.reserved,
+     x.flag_bits, x.compress_type, t, d,
+     x.CRC, x.compress_size, x.file_size) = centdir[1:12]
+    if x.extract_version > MAX_EXTRACT_VERSION:
+        raise NotImplementedError("zip file version %.1f" %
+                                  (x.extract_version / 10))
+    x.volume, x.internal_attr, x.external_attr = centdir[15:18]
+    # Convert date/time code to (year, month, day, hour, min, sec)
+    x._raw_time = t
+    x.date_time = ( (d>>9)+1980, (d>>5)&0xF, d&0x1F,
+                    t>>11, (t>>5)&0x3F, (t&0x1F) * 2 )
+    x._decodeExtra(orig_filename_crc)
+    x.header_offset = x.header_offset + concat
+    return x, pos
+
+
+def _read_centdir_record(fp):
+    """Read the raw central directory record at the position of 'fp'."""
+    record = fp.read(sizeCentralDir)
+    if len(record) == sizeCentralDir:
+        centdir = _centDirStruct.unpack(record)
+        record += fp.read(centdir[_CD_FILENAME_LENGTH]
+                          + centdir[_CD_EXTRA_FIELD_LENGTH]
+                          + centdir[_CD_COMMENT_LENGTH])
+    return record
+
+
+class _ZipIndex(Sequence):
+    """Compact index of the central directory of an archive.
+
+    Only the member names and the file offsets of their central directory
+    records are kept; ZipInfo objects are created when first accessed, by
+    reading their record from the archive.  Used as ZipFile.filelist when
+    the archive is opened with lazy_index.
+    """
+
+    # Header of an index file: magic, format version, archive size and
+    # mtime, start and size of the central directory, prepended data
+    # size, CRC of the first central directory record, member count and
+    # length of the metadata encoding name.
+    _HEADER = struct.Struct('<8sHQqQQqIQH')
+    _MAGIC = b'PyZipIdx'
+    _VERSION = 2
+
+    def __init__(self, fp, lock, concat, metadata_encoding,
+                 names, offsets, end_offsets):
+        self._fp = fp
+        self._lock = lock
+        self._concat = concat
+        self._metadata_encoding = metadata_encoding
+        self._offsets = offsets
+        self._end_offsets = end_offsets
+        self._infos = [None] * len(names)
+        self.names = names
+        self.name_to_index = dict(zip(names, range(len(names))))
+
+    @classmethod
+    def build(cls, fp, lock, data, size_cd, concat, start_dir,
+              metadata_encoding):
+        """Index the raw central directory 'data' read from 'fp'."""
+        from array import array
+
+        unpack_from = _centDirStruct.unpack_from
+        names = []
+        offsets = array('Q')
+        header_offsets = []
+        infos = {}
+        pos = 0
+        while pos < size_cd:
+            if pos + sizeCentralDir > len(data):
+                raise BadZipFile("Truncated central directory")
+            centdir = unpack_from(data, pos)
+            if centdir[_CD_SIGNATURE] != stringCentralDir:
+                raise BadZipFile("Bad magic number for central directory")
+            if centdir[_CD_EXTRACT_VERSION] > MAX_EXTRACT_VERSION:
+                raise NotImplementedError("zip file version %.1f" %
+                                          (centdir[_CD_EXTRACT_VERSION] / 10))
+            start = pos + sizeCentralDir
+            name_end = start + centdir[_CD_FILENAME_LENGTH]
+            extra = data[name_end:name_end + centdir[_CD_EXTRA_FIELD_LENGTH]]
+            offsets.append(start_dir + pos)
+            if b'\x01\x00' in extra or b'up' in extra:
+                # A ZIP64 (0x0001) or Unicode Path (0x7075) extra field may
+                # change the offset or the name; decode the record fully.
+                zinfo, pos = _read_centdir(data, pos, concat,
+                                           metadata_encoding)
+                infos[len(names)] = zinfo
+                names.append(zinfo.filename)
+                header_offsets.append(zinfo.header_offset)
+                continue
+            filename = data[start:name_end]
+            if centdir[_CD_FLAG_BITS] & _MASK_UTF_FILENAME:
+                filename = filename.decode('utf-8')
+            else:
+                filename = filename.decode(metadata_encoding or 'cp437')
+            names.append(_sanitize_filename(filename))
+            header_offsets.append(centdir[_CD_LOCAL_HEADER_OFFSET] + concat)
+            pos = (name_end + centdir[_CD_EXTRA_FIELD_LENGTH]
+                   + centdir[_CD_COMMENT_LENGTH])
+
+        end_offsets = array('Q', bytes(8 * len(names)))
+        end_offset = start_dir
+        for i in sorted(range(len(names)), key=header_offsets.__getitem__,
+                        reverse=True):
+            end_offsets[i] = end_offset
+            end_offset = header_offsets[i]
+
+        index = cls(fp, lock, concat, metadata_encoding,
+                    names, offsets, end_offsets)
+        for i, zinfo in infos.items():
+            zinfo._end_offset = end_offsets[i]
+            index._infos[i] = zinfo
+        return index
+
+    @classmethod
+    def load(cls, filename, key, fp, lock, concat, metadata_encoding):
+        """Read the index saved in 'filename'.
+
+        Return None if the file is missing, corrupt, or was not created
+        for the archive state described by 'key'.
+        """
+        from array import array
+
+        try:
+            with open(filename, 'rb') as f:
+                raw = f.read()
+        except OSError:
+            return None
+        header_size = cls._HEADER.size
+        if len(raw) < header_size:
+            return None
+        (magic, version, size, mtime_ns, start_dir, size_cd, prepended,
+         crc, count, enc_len) = cls._HEADER.unpack_from(raw)
+        if magic != cls._MAGIC or version != cls._VERSION:
+            return None
+        pos = header_size + enc_len
+        encoding = raw[header_size:pos].decode('ascii', 'replace')
+        if (size, mtime_ns, start_dir, size_cd, prepended, crc,
+            encoding) != key:
+            return None
+        offsets = array('Q', raw[pos:pos + 8 * count])
+        pos += 8 * count
+        end_offsets = array('Q', raw[pos:pos + 8 * count])
+        pos += 8 * count
+        if len(end_offsets) != count:
+            return None
+        if sys.byteorder == 'big':
+            offsets.byteswap()
+            end_offsets.byteswap()
+        names = raw[pos:].decode('utf-8', 'surrogatepass').split('\0')
+        if not count:
+            names = []
+        if len(names) != count:
+            return None
+        return cls(fp, lock, concat, metadata_encoding,
+                   names, offsets, end_offsets)
+
+    def save(self, filename, key):
+        """Write the index to 'filename', ignoring errors."""
+        size, mtime_ns, start_dir, size_cd, concat, crc, encoding = key
+        encoding = encoding.encode('ascii', 'replace')
+        offsets = self._offsets
+        end_offsets = self._end_offsets
+        if sys.byteorder == 'big':
+            offsets = type(offsets)(offsets)
+            offsets.byteswap()
+            end_offsets = type(end_offsets)(end_offsets)
+            end_offsets.byteswap()
+        header = self._HEADER.pack(self._MAGIC, self._VERSION, size, mtime_ns,
+                                   start_dir, size_cd, concat, crc,
+                                   len(self.names), len(encoding))
+        names = '\0'.join(self.names).encode('utf-8', 'surrogatepass')
+        # Write to a temporary file first so that readers never see a
+        # partially written index.
+        tmpname = '%s.%d.tmp' % (filename, os.getpid())
+        try:
+            with open(tmpname, 'wb') as f:
+                f.write(header)
+                f.write(encoding)
+                f.write(offsets)
+                f.write(end_offsets)
+                f.write(names)
+            os.replace(tmpname, filename)
+        except OSError:
+            try:
+                os.unlink(tmpname)
+            except OSError:
+                pass
+
+    def __len__(self):
+        return len(self._infos)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        zinfo = self._infos[i]
+        if zinfo is None:
+            if i < 0:
+                i += len(self._infos)
+            zinfo, _ = _read_centdir(self._read_record(self._offsets[i]), 0,
+                                     self._concat, self._metadata_encoding)
+            zinfo._end_offset = self._end_offsets[i]
+            self._infos[i] = zinfo
+        return zinfo
+
+    def _read_record(self, offset):
+        """Return the raw central directory record at 'offset'."""
+        with self._lock:
+            self._fp.seek(offset)
+            return _read_centdir_record(self._fp)
+
+
+class _ZipIndexMapping(Mapping):
+    """Read-only mapping of names to ZipInfo objects backed by a _ZipIndex.
+
+    Used as ZipFile.NameToInfo when the archive is opened with lazy_index.
+    """
+
+    def __init__(self, index):
+        self._index = index
+
+    def __getitem__(self, name):
+        return self._index[self._index.name_to_index[name]]
+
+    def __contains__(self, name):
+        return name in self._index.name_to_index
+
+    def __iter__(self):
+        return iter(self._index.name_to_index)
+
+    def __len__(self):
+        return len(self._index.name_to_index)
+
+
 class _SharedFile:
     def __init__(self, file, pos, close, lock, writing):
         self._file = file
@@ -1380,6 +1647,45 @@ def close(self):
             self._zipfile._writing = False
 
 
+# Chunk size used when compressing a member in a worker thread, and the
+# size above which its compressed data is spooled to a temporary file.
+_PARALLEL_CHUNK_SIZE = 1 << 20
+_PARALLEL_SPOOL_SIZE = 1 << 24
+
+def _compress_member(filename, zinfo):
+    """Compress the file 'filename' as described by 'zinfo'.
+
+    Update the CRC and sizes of 'zinfo' and return a file object, positioned
+    at the start, holding the compressed data.  Used by ZipFile.writeall()
+    to compress members outside of the archive lock.
+    """
+    import tempfile
+
+    compressor = _get_compressor(zinfo.compress_type, zinfo.compress_level)
+    dest = tempfile.SpooledTemporaryFile(max_size=_PARALLEL_SPOOL_SIZE)
+    crc = file_size = compress_size = 0
+    try:
+        with open(filename, "rb") as src:
+            while data := src.read(_PARALLEL_CHUNK_SIZE):
+                file_size += len(data)
+                crc = crc32(data, crc)
+                if compressor:
+                    data = compressor.compress(data)
+                compress_size += len(data)
+                dest.write(data)
+        if compressor:
+            data = compressor.flush()
+            compress_size += len(data)
+            dest.write(data)
+        dest.seek(0)
+    except:
+        dest.close()
+        raise
+    zinfo.CRC = crc
+    zinfo.file_size = file_size
+    zinfo.compress_size = compress_size
+    return dest
+
 
 class ZipFile:
     """ Class with methods to open, read, write, close, list zip files.
@@ -1409,10 +1715,12 @@ class ZipFile:
     """
 
     fp = None                   # Set here since __del__ checks it
+    _mmap = None                # Memory map of the archive, see getbuffer()
     _windows_illegal_name_trans_table = None
 
     def __init__(self, file, mode="r", compression=ZIP_STORED, allowZip64=True,
-                 compresslevel=None, *, strict_timestamps=True, metadata_encoding=None):
+                 compresslevel=None, *, strict_timestamps=True, metadata_encoding=None,
+                 lazy_index=False, index_file=None):
         """Open the ZIP file with mode read 'r', write 'w', exclusive create 'x',
         or append 'a'."""
         if mode not in ('r', 'w', 'x', 'a'):
@@ -1438,6 +1746,15 @@ def __init__(self, file, mode="r", compression=ZIP_STORED, allowZip64=True,
             raise ValueError(
                 "metadata_encoding is only supported for reading files")
 
+        if index_file is not None:
+            index_file = os.fspath(index_file)
+            lazy_index = True
+        if lazy_index and mode != 'r':
+            raise ValueError(
+                "lazy_index and index_file are only supported for reading files")
+        self._lazy_index = lazy_index
+        self._index_file = index_file
+
         # Check if we were passed a file-like object
         if isinstance(file, os.PathLike):
             file = os.fspath(file)
@@ -1549,55 +1866,19 @@ def _RealGetContents(self):
             raise BadZipFile("Bad offset for central directory")
         fp.seek(self.start_dir, 0)
         size_cd = endrec[_ECD_SIZE]
+        if self._lazy_index:
+            self._load_index(size_cd, concat)
+            return
         data = fp.read(size_cd)
-        fp = io.BytesIO(data)
-        total = 0
-        while total < size_cd:
-            centdir = fp.read(sizeCentralDir)
-            if len(centdir) != sizeCentralDir:
-                raise BadZipFile("Truncated central directory")
-            centdir = struct.unpack(structCentralDir, centdir)
-            if centdir[_CD_SIGNATURE] != stringCentralDir:
-                raise BadZipFile("Bad magic number for central directory")
-            if self.debug > 2:
-                print(centdir)
-            filename = fp.read(centdir[_CD_FILENAME_LENGTH])
-            orig_filename_crc = crc32(filename)
-            flags = centdir[_CD_FLAG_BITS]
-            if flags & _MASK_UTF_FILENAME:
-                # UTF-8 file names extension
-                filename = filename.decode('utf-8')
-            else:
-                # Historical ZIP filename encoding
-                filename = filename.decode(self.metadata_encoding or 'cp437')
-            # Create ZipInfo instance to store file information
-            x = ZipInfo(filename)
-            x.extra = fp.read(centdir[_CD_EXTRA_FIELD_LENGTH])
-            x.comment = fp.read(centdir[_CD_COMMENT_LENGTH])
-            x.header_offset = centdir[_CD_LOCAL_HEADER_OFFSET]
-            (x.create_version, x.create_system, x.extract_version, x.reserved,
-             x.flag_bits, x.compress_type, t, d,
-             x.CRC, x.compress_size, x.file_size) = centdir[1:12]
-            if x.extract_version > MAX_EXTRACT_VERSION:
-                raise NotImplementedError("zip file version %.1f" %
-                                          (x.extract_version / 10))
-            x.volume, x.internal_attr, x.external_attr = centdir[15:18]
-            # Convert date/time code to (year, month, day, hour, min, sec)
-            x._raw_time = t
-            x.date_time = ( (d>>9)+1980, (d>>5)&0xF, d&0x1F,
-                            t>>11, (t>>5)&0x3F, (t&0x1F) * 2 )
-            x._decodeExtra(orig_filename_crc)
-            x.header_offset = x.header_offset + concat
+        pos = 0
+        while pos < size_cd:
+            x, pos = _read_centdir(data, pos, concat, self.metadata_encoding,
+                                   self.debug)
             self.filelist.append(x)
             self.NameToInfo[x.filename] = x
 
-            # update total bytes read from central directory
-            total = (total + sizeCentralDir + centdir[_CD_FILENAME_LENGTH]
-                     + centdir[_CD_EXTRA_FIELD_LENGTH]
-                     + centdir[_CD_COMMENT_LENGTH])
-
             if self.debug > 2:
-                print("total", total)
+                print("total", pos)
 
         end_offset = self.start_dir
         for zinfo in reversed(sorted(self.filelist,
@@ -1605,13 +1886,49 @@ def _RealGetContents(self):
             zinfo._end_offset = end_offset
             end_offset = zinfo.header_offset
 
+    def _load_index(self, size_cd, concat):
+        """Set up a lazily materialized index of the central directory,
+        reusing the index file if it is up to date."""
+        fp = self.fp
+        key = None
+        if self._index_file is not None:
+            try:
+                st = os.fstat(fp.fileno())
+            except (AttributeError, OSError, ValueError):
+                pass
+            else:
+                # The archive is identified by its size and mtime, by the
+                # end of central directory record and by the first record
+                # of the central directory, so a valid index file spares
+                # reading the whole central directory.
+                crc = crc32(_read_centdir_record(fp) if size_cd else b'')
+                key = (st.st_size, st.st_mtime_ns, self.start_dir, size_cd,
+                       concat, crc, self.metadata_encoding or '')
+        index = None
+        if key is not None:
+            index = _ZipIndex.load(self._index_file, key, fp, self._lock,
+                                   concat, self.metadata_encoding)
+        if index is None:
+            fp.seek(self.start_dir, 0)
+            data = fp.read(size_cd)
+            index = _ZipIndex.build(fp, self._lock, data, size_cd, concat,
+                                    self.start_dir, self.metadata_encoding)
+            if key is not None:
+                index.save(self._index_file, key)
+        self.filelist = index
+        self.NameToInfo = _ZipIndexMapping(index)
+
     def namelist(self):
         """Return a list of file names in the archive."""
+        if isinstance(self.filelist, _ZipIndex):
+            return list(self.filelist.names)
         return [data.filename for data in self.filelist]
 
     def infolist(self):
         """Return a list of class ZipInfo instances for files in the
         archive."""
+        if isinstance(self.filelist, _ZipIndex):
+            return list(self.filelist)
         return self.filelist
 
     def printdir(self, file=None):
@@ -1681,6 +1998,78 @@ def read(self, name, pwd=None):
         with self.open(name, "r", pwd) as fp:
             return fp.read()
 
+    def getbuffer(self, name):
+        """Return a read-only memoryview of the bytes of member 'name'.
+
+        The member must be stored without compression or encryption.  When
+        the archive is backed by a real file the view refers directly to a
+        memory map of the archive, so no data is copied; the CRC of the
+        member is not checked.
+        """
+        if self.mode != 'r':
+            raise ValueError('getbuffer() requires mode "r"')
+        if not self.fp:
+            raise ValueError(
+                "Attempt to use ZIP archive that was already closed")
+
+        if isinstance(name, ZipInfo):
+            zinfo = name
+        else:
+            zinfo = self.getinfo(name)
+        if zinfo.compress_type != ZIP_STORED:
+            raise ValueError("getbuffer() requires a member stored with "
+                             "ZIP_STORED, got %r" % zinfo.filename)
+        if zinfo.flag_bits & _MASK_ENCRYPTED:
+            raise ValueError("getbuffer() does not support encrypted "
+                             "member %r" % zinfo.filename)
+
+        mapping = self._get_mmap()
+        if mapping is None:
+            # No file descriptor to map (e.g. an in-memory archive)
+            return memoryview(self.read(zinfo)).toreadonly()
+
+        offset = zinfo.header_offset
+        fheader = mapping[offset:offset + sizeFileHeader]
+        if len(fheader) != sizeFileHeader:
+            raise BadZipFile("Truncated file header")
+        fheader = struct.unpack(structFileHeader, fheader)
+        if fheader[_FH_SIGNATURE] != stringFileHeader:
+            raise BadZipFile("Bad magic number for file header")
+        offset += sizeFileHeader
+        fname = mapping[offset:offset + fheader[_FH_FILENAME_LENGTH]]
+        if fheader[_FH_GENERAL_PURPOSE_FLAG_BITS] & _MASK_UTF_FILENAME:
+            fname_str = fname.decode("utf-8")
+        else:
+            fname_str = fname.decode(self.metadata_encoding or "cp437")
+        if fname_str != zinfo.orig_filename:
+            raise BadZipFile(
+                'File name in directory %r and header %r differ.'
+                % (zinfo.orig_filename, fname))
+
+        start = (offset + fheader[_FH_FILENAME_LENGTH]
+                 + fheader[_FH_EXTRA_FIELD_LENGTH])
+        end = start + zinfo.compress_size
+        if zinfo._end_offset is not None and end > zinfo._end_offset:
+            raise BadZipFile(
+                f"Overlapped entries: {zinfo.orig_filename!r} "
+                f"(possible zip bomb)")
+        if end > len(mapping):
+            raise BadZipFile("Truncated file data for %r" % zinfo.filename)
+        return memoryview(mapping)[start:end].toreadonly()
+
+    def _get_mmap(self):
+        """Return a read-only memory map of the archive, or None if the
+        underlying file cannot be mapped."""
+        with self._lock:
+            if self._mmap is None:
+                import mmap
+                try:
+                    fileno = self.fp.fileno()
+                    self._mmap = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+                except (AttributeError, OSError, ValueError):
+                    return None
+            return self._mmap
+
     def open(self, name, mode="r", pwd=None, *, force_zip64=False):
         """Return file-like object for 'name'.
 
@@ -1726,9 +2115,18 @@ def open(self, name, mode="r", pwd=None, *, force_zip64=False):
                     "Close the writing handle before trying to read.")
 
         # Open for reading:
-        self._fileRefCnt += 1
+        with self._lock:
+            self._fileRefCnt += 1
         zef_file = _SharedFile(self.fp, zinfo.header_offset,
                                self._fpclose, self._lock, lambda: self._writing)
+        return self._open_to_read(zef_file, name, zinfo, pwd)
+
+    def _open_to_read(self, zef_file, name, zinfo, pwd):
+        """Return a ZipExtFile reading 'zinfo' through 'zef_file'.
+
+        'zef_file' is a _SharedFile positioned at the member's local header;
+        it is closed if the header turns out to be invalid.
+        """
         try:
             # Skip the file header:
             fheader = zef_file.read(sizeFileHeader)
@@ -1787,7 +2185,7 @@ def open(self, name, mode="r", pwd=None, *, force_zip64=False):
             else:
                 pwd = None
 
-            return ZipExtFile(zef_file, mode + 'b', zinfo, pwd, True)
+            return ZipExtFile(zef_file, 'rb', zinfo, pwd, True)
         except:
             zef_file.close()
             raise
@@ -1848,13 +2246,17 @@ def extract(self, member, path=None, pwd=None):
 
         return self._extract_member(member, path, pwd)
 
-    def extractall(self, path=None, members=None, pwd=None):
+    def extractall(self, path=None, members=None, pwd=None, *, workers=None):
         """Extract all members from the archive to the current working
            directory. 'path' specifies a different directory to extract to.
            'members' is optional and must be a subset of the list returned
            by namelist(). You can specify the password to decrypt all files
-           using 'pwd'.
+           using 'pwd'. If 'workers' is greater than 1, up to that many
+           members are decompressed concurrently by a pool of threads.
         """
+        if workers is not None and workers <= 0:
+            raise ValueError("workers must be greater than 0")
+
         if members is None:
             members = self.namelist()
 
@@ -1863,8 +2265,69 @@ def extractall(self, path=None, members=None, pwd=None):
         else:
             path = os.fspath(path)
 
+        if workers is None or workers == 1:
+            for zipinfo in members:
+                self._extract_member(zipinfo, path, pwd)
+        else:
+            self._extractall_parallel(path, members, pwd, workers)
+
+    def _extractall_parallel(self, path, members, pwd, workers):
+        """Extract 'members' to 'path' using a pool of 'workers' threads."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        if not self.fp:
+            raise ValueError(
+                "Attempt to use ZIP archive that was already closed")
+
+        if self.mode == 'r' and not self._filePassed:
+            # Give every worker thread a private handle on the archive so
+            # that reads of different members never wait on each other.
+            local = threading.local()
+            handles = []
+
+            def open_member(member, pwd=None):
+                fp = getattr(local, 'fp', None)
+                if fp is None:
+                    fp = local.fp = io.open(self.filename, 'rb')
+                    local.lock = threading.Lock()
+                    handles.append(fp)
+                zef_file = _SharedFile(fp, member.header_offset,
+                                       lambda fp: None, local.lock,
+                                       lambda: self._writing)
+                return self._open_to_read(zef_file, member, member, pwd)
+        else:
+            # The file object was passed in (or may have pending writes):
+            # fall back to the shared handle.  Decompression still runs
+            # concurrently, only the raw reads are serialized.
+            handles = []
+            open_member = self.open
+
+        # Several members can be extracted to the same path, e.g. when the
+        # archive has duplicate names.  Like the sequential extraction, keep
+        # only the last of them, so that no two threads write the same file.
+        targets = {}
         for zipinfo in members:
-            self._extract_member(zipinfo, path, pwd)
+            if not isinstance(zipinfo, ZipInfo):
+                zipinfo = self.getinfo(zipinfo)
+            targetpath = self._get_targetpath(zipinfo, path)
+            targets.pop(targetpath, None)
+            targets[targetpath] = zipinfo
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(self._extract_member,
+                                           zipinfo, path, pwd, open_member)
+                           for zipinfo in targets.values()]
+                try:
+                    for future in futures:
+                        future.result()
+                except:
+                    for future in futures:
+                        future.cancel()
+                    raise
+        finally:
+            for fp in handles:
+                fp.close()
 
     @classmethod
     def _sanitize_windows_name(cls, arcname, pathsep):
@@ -1881,13 +2344,10 @@ def _sanitize_windows_name(cls, arcname, pathsep):
         arcname = pathsep.join(x for x in arcname if x)
         return arcname
 
-    def _extract_member(self, member, targetpath, pwd):
-        """Extract the ZipInfo object 'member' to a physical
-           file on the path targetpath.
+    def _get_targetpath(self, member, targetpath):
+        """Return the path to which the ZipInfo object 'member' is
+           extracted below the directory targetpath.
         """
-        if not isinstance(member, ZipInfo):
-            member = self.getinfo(member)
-
         # build the destination pathname, replacing
         # forward slashes to platform specific separators.
         arcname = member.filename.replace('/', os.path.sep)
@@ -1908,7 +2368,18 @@ def _extract_member(self, member, targetpath, pwd):
             raise ValueError("Empty filename.")
 
         targetpath = os.path.join(targetpath, arcname)
-        targetpath = os.path.normpath(targetpath)
+        return os.path.normpath(targetpath)
+
+    def _extract_member(self, member, targetpath, pwd, open_member=None):
+        """Extract the ZipInfo object 'member' to a physical
+           file on the path targetpath.
+        """
+        if open_member is None:
+            open_member = self.open
+        if not isinstance(member, ZipInfo):
+            member = self.getinfo(member)
+
+        targetpath = self._get_targetpath(member, targetpath)
 
         # Create all upper directories if necessary.
         upperdirs = os.path.dirname(targetpath)
@@ -1924,7 +2395,7 @@ def _extract_member(self, member, targetpath, pwd):
                         raise
             return targetpath
 
-        with self.open(member, pwd=pwd) as source, \
+        with open_member(member, pwd=pwd) as source, \
              open(targetpath, "wb") as target:
             shutil.copyfileobj(source, target)
 
@@ -1986,6 +2457,112 @@ def write(self, filename, arcname=None,
             with open(filename, "rb") as src, self.open(zinfo, 'w') as dest:
                 shutil.copyfileobj(src, dest, 1024*8)
 
+    def writeall(self, files, compress_type=None, compresslevel=None, *,
+                 workers=None):
+        """Put the bytes from every file in 'files' into the archive.
+
+        Each item of 'files' is either a filename or a (filename, arcname)
+        pair, as accepted by write().  If 'workers' is greater than 1, up
+        to that many members are compressed concurrently by a pool of
+        threads; only writing the compressed data to the archive is
+        serialized, and members are stored in the order given.
+        """
+        if workers is not None and workers <= 0:
+            raise ValueError("workers must be greater than 0")
+        if not self.fp:
+            raise ValueError(
+                "Attempt to write to ZIP archive that was already closed")
+        if self._writing:
+            raise ValueError(
+                "Can't write to ZIP archive while an open writing handle exists"
+            )
+
+        items = []
+        for item in files:
+            if isinstance(item, tuple):
+                filename, arcname = item
+            else:
+                filename, arcname = item, None
+            items.append((filename, arcname))
+
+        if workers is None or workers == 1:
+            for filename, arcname in items:
+                self.write(filename, arcname, compress_type, compresslevel)
+            return
+
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Bound the number of compressed members waiting to be written.
+        max_pending = 2 * workers
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            try:
+                for filename, arcname in items:
+                    zinfo = ZipInfo.from_file(
+                        filename, arcname,
+                        strict_timestamps=self._strict_timestamps)
+                    if zinfo.is_dir():
+                        future = None
+                    else:
+                        if compress_type is not None:
+                            zinfo.compress_type = compress_type
+                        else:
+                            zinfo.compress_type = self.compression
+                        if compresslevel is not None:
+                            zinfo.compress_level = compresslevel
+                        else:
+                            zinfo.compress_level = self.compresslevel
+                        _check_compression(zinfo.compress_type)
+                        future = executor.submit(_compress_member,
+                                                 filename, zinfo)
+                    pending.append((zinfo, future))
+                    if len(pending) > max_pending:
+                        self._write_compressed(*pending.popleft())
+                while pending:
+                    self._write_compressed(*pending.popleft())
+            except:
+                for zinfo, future in pending:
+                    if future is not None and not future.cancel():
+                        try:
+                            future.result().close()
+                        except Exception:
+                            pass
+                raise
+
+    def _write_compressed(self, zinfo, future):
+        """Write a member compressed by _compress_member() to the archive."""
+        if future is None:
+            zinfo.compress_size = 0
+            zinfo.CRC = 0
+            self.mkdir(zinfo)
+            return
+
+        with future.result() as data:
+            zinfo.flag_bits = 0x00
+            if zinfo.compress_type == ZIP_LZMA:
+                # Compressed data includes an end-of-stream (EOS) marker
+                zinfo.flag_bits |= _MASK_COMPRESS_OPTION_1
+            zip64 = (zinfo.file_size > ZIP64_LIMIT or
+                     zinfo.compress_size > ZIP64_LIMIT)
+            if zip64 and not self._allowZip64:
+                raise LargeZipFile("Filesize would require ZIP64 extensions")
+
+            with self._lock:
+                if self._seekable:
+                    self.fp.seek(self.start_dir)
+                zinfo.header_offset = self.fp.tell()
+
+                self._writecheck(zinfo)
+                self._didModify = True
+
+                self.fp.write(zinfo.FileHeader(zip64))
+                shutil.copyfileobj(data, self.fp)
+                self.start_dir = self.fp.tell()
+
+                self.filelist.append(zinfo)
+                self.NameToInfo[zinfo.filename] = zinfo
+
     def writestr(self, zinfo_or_arcname, data,
                  compress_type=None, compresslevel=None):
         """Write a file into the archive.  The contents is 'data', which
@@ -2076,6 +2653,14 @@ def close(self):
                         self.fp.seek(self.start_dir)
                     self._write_end_record()
         finally:
+            if self._mmap is not None:
+                try:
+                    self._mmap.close()
+                except BufferError:
+                    # Buffers returned by getbuffer() are still alive; the
+                    # map is released once the last of them goes away.
+                    pass
+                self._mmap = None
             fp = self.fp
             self.fp = None
             self._fpclose(fp)
@@ -2177,10 +2762,11 @@ def _write_end_record(self):
         self.fp.flush()
 
     def _fpclose(self, fp):
-        assert self._fileRefCnt > 0
-        self._fileRefCnt -= 1
-        if not self._fileRefCnt and not self._filePassed:
-            fp.close()
+        with self._lock:
+            assert self._fileRefCnt > 0
+            self._fileRefCnt -= 1
+            if not self._fileRefCnt and not self._filePassed:
+                fp.close()
 
 
 class PyZipFile(ZipFile):
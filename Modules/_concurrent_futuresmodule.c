@@ -0,0 +1,1432 @@
+/* C implementation of concurrent.futures.Future */
+
+#ifndef Py_BUILD_CORE_BUILTIN
+#  define Py_BUILD_CORE_MODULE 1
+#endif
+
+#include "Python.h"
+#include "pycore_lock.h"          // _PyRecursiveMutex
+#include "pycore_moduleobject.h"  // _PyModule_GetState()
+#include "pycore_parking_lot.h"   // _PyParkingLot_Park()
+#include "pycore_pythread.h"      // PyThread_get_thread_ident_ex()
+#include "pycore_time.h"          // _PyTime_FromSecondsObject()
+
+#include <stddef.h>               // offsetof()
+
+
+/* The states of a future, in the order of concurrent.futures._base. */
+typedef enum {
+    STATE_PENDING,
+    STATE_RUNNING,
+    STATE_CANCELLED,
+    STATE_CANCELLED_AND_NOTIFIED,
+    STATE_FINISHED,
+    NUM_STATES
+} fut_state;
+
+static const char * const state_names[NUM_STATES] = {
+    "PENDING",
+    "RUNNING",
+    "CANCELLED",
+    "CANCELLED_AND_NOTIFIED",
+    "FINISHED",
+};
+
+static const char * const state_descriptions[NUM_STATES] = {
+    "pending",
+    "running",
+    "cancelled",
+    "cancelled",
+    "finished",
+};
+
+typedef struct {
+    PyTypeObject *FutureType;
+    PyTypeObject *FutureConditionType;
+    PyObject *state_names[NUM_STATES];
+    PyObject *str_add_result;
+    PyObject *str_add_exception;
+    PyObject *str_add_cancelled;
+    PyObject *str_exception;
+    /* From concurrent.futures._base */
+    PyObject *CancelledError;
+    PyObject *InvalidStateError;
+    PyObject *logger;
+} futures_state;
+
+static inline futures_state *
+get_futures_state(PyObject *module)
+{
+    futures_state *state = _PyModule_GetState(module);
+    assert(state != NULL);
+    return state;
+}
+
+static struct PyModuleDef _concurrent_futuresmodule;
+
+static inline futures_state *
+get_futures_state_by_type(PyTypeObject *type)
+{
+    PyObject *module = PyType_GetModuleByDef(type, &_concurrent_futuresmodule);
+    assert(module != NULL);
+    return get_futures_state(module);
+}
+
+/* A future is protected by a recursive mutex, which is also exposed to
+   Python code through the _condition attribute, so that wait() and
+   as_completed() can lock several futures while they install their waiters.
+   Threads waiting for a notification park on notify_seq, which
+   notify_all() increments. */
+typedef struct {
+    PyObject_HEAD
+    _PyRecursiveMutex lock;
+    uintptr_t notify_seq;
+    Py_ssize_t num_waiting;
+    int state;
+    PyObject *result;
+    PyObject *exception;
+    /* Created on first use */
+    PyObject *waiters;
+    PyObject *done_callbacks;
+} FutureObject;
+
+typedef struct {
+    PyObject_HEAD
+    FutureObject *future;
+} FutureConditionObject;
+
+#define FutureObject_CAST(op)           ((FutureObject *)(op))
+#define FutureConditionObject_CAST(op)  ((FutureConditionObject *)(op))
+
+/*[clinic input]
+module _concurrent_futures
+class _concurrent_futures.Future "FutureObject *" "get_futures_state_by_type(Py_TYPE(self))->FutureType"
+class _concurrent_futures._FutureCondition "FutureConditionObject *" "get_futures_state_by_type(Py_TYPE(self))->FutureConditionType"
+[clinic start generated code]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=98f78d26dd11147a]*/
+
+
+/* Locking */
+
+static inline void
+future_lock(FutureObject *fut)
+{
+    _PyRecursiveMutex_Lock(&fut->lock);
+}
+
+static inline void
+future_unlock(FutureObject *fut)
+{
+    _PyRecursiveMutex_Unlock(&fut->lock);
+}
+
+static inline int
+future_is_owned(FutureObject *fut)
+{
+    return _PyRecursiveMutex_IsLockedByCurrentThread(&fut->lock);
+}
+
+static inline int
+future_get_state(FutureObject *fut)
+{
+    return _Py_atomic_load_int_acquire(&fut->state);
+}
+
+static inline void
+future_set_state(FutureObject *fut, int state)
+{
+    _Py_atomic_store_int_release(&fut->state, state);
+}
+
+static inline int
+state_is_done(int state)
+{
+    return state >= STATE_CANCELLED;
+}
+
+static inline int
+state_is_cancelled(int state)
+{
+    return state == STATE_CANCELLED || state == STATE_CANCELLED_AND_NOTIFIED;
+}
+
+/* Wake up the threads waiting for a notification.  The lock must be held. */
+static void
+future_notify_all(FutureObject *fut)
+{
+    assert(future_is_owned(fut));
+    if (fut->num_waiting > 0) {
+        _Py_atomic_add_uintptr(&fut->notify_seq, 1);
+        _PyParkingLot_UnparkAll(&fut->notify_seq);
+    }
+}
+
+/* Release the lock, wait for a notification or until timeout (in
+   nanoseconds, -1 for no timeout) and acquire the lock again.  The lock must
+   be held by the current thread, possibly several times.
+
+   Return 1 if the thread may have been notified, 0 if the timeout expired
+   and -1 with an exception set if a signal handler raised one. */
+static int
+future_wait(FutureObject *fut, PyTime_t timeout)
+{
+    assert(future_is_owned(fut));
+    uintptr_t seq = _Py_atomic_load_uintptr_relaxed(&fut->notify_seq);
+    size_t level = fut->lock.level;
+    fut->num_waiting++;
+    fut->lock.level = 0;
+    future_unlock(fut);
+
+    int res = 1;
+    int st = _PyParkingLot_Park(&fut->notify_seq, &seq, sizeof(seq),
+                                timeout, NULL, /* detach */ 1);
+    if (st == Py_PARK_TIMEOUT) {
+        res = 0;
+    }
+    else if (st == Py_PARK_INTR && Py_MakePendingCalls() < 0) {
+        res = -1;
+    }
+
+    future_lock(fut);
+    fut->lock.level = level;
+    fut->num_waiting--;
+    return res;
+}
+
+/* Convert the timeout of Future.result() and Condition.wait(): None waits
+   forever (-1) and a timeout <= 0 does not wait at all (0). */
+static int
+parse_wait_timeout(PyObject *timeout_obj, PyTime_t *timeout)
+{
+    if (timeout_obj == Py_None) {
+        *timeout = -1;
+        return 0;
+    }
+    if (_PyTime_FromSecondsObject(timeout, timeout_obj,
+                                  _PyTime_ROUND_TIMEOUT) < 0) {
+        return -1;
+    }
+    if (*timeout < 0) {
+        *timeout = 0;
+    }
+    return 0;
+}
+
+/* Wait until the future is done or the timeout expires, with the lock held.
+   Return 0 in both cases and -1 with an exception set on error. */
+static int
+future_wait_done(FutureObject *fut, PyObject *timeout_obj)
+{
+    if (state_is_done(future_get_state(fut))) {
+        return 0;
+    }
+    PyTime_t timeout;
+    if (parse_wait_timeout(timeout_obj, &timeout) < 0) {
+        return -1;
+    }
+    if (timeout == 0) {
+        return 0;
+    }
+    PyTime_t deadline = timeout > 0 ? _PyDeadline_Init(timeout) : 0;
+    while (!state_is_done(future_get_state(fut))) {
+        if (deadline) {
+            timeout = _PyDeadline_Get(deadline);
+            if (timeout <= 0) {
+                break;
+            }
+        }
+        if (future_wait(fut, timeout) < 0) {
+            return -1;
+        }
+    }
+    return 0;
+}
+
+
+/* Helpers */
+
+static PyObject *
+get_list(PyObject **list)
+{
+    if (*list == NULL) {
+        *list = PyList_New(0);
+    }
+    return *list;
+}
+
+/* Call method(future) on each waiter.  The lock must be held. */
+static int
+notify_waiters(futures_state *state, FutureObject *fut, PyObject *method)
+{
+    if (fut->waiters == NULL) {
+        return 0;
+    }
+    for (Py_ssize_t i = 0; i < PyList_GET_SIZE(fut->waiters); i++) {
+        PyObject *waiter = PyList_GetItemRef(fut->waiters, i);
+        if (waiter == NULL) {
+            return -1;
+        }
+        PyObject *res = PyObject_CallMethodOneArg(waiter, method,
+                                                  (PyObject *)fut);
+        Py_DECREF(waiter);
+        if (res == NULL) {
+            return -1;
+        }
+        Py_DECREF(res);
+    }
+    return 0;
+}
+
+/* Call fn(future), and log the Exception it raises like
+   concurrent.futures._base.Future does. */
+static int
+call_callback(futures_state *state, FutureObject *fut, PyObject *fn)
+{
+    PyObject *res = PyObject_CallOneArg(fn, (PyObject *)fut);
+    if (res != NULL) {
+        Py_DECREF(res);
+        return 0;
+    }
+    if (!PyErr_ExceptionMatches(PyExc_Exception)) {
+        return -1;
+    }
+    /* LOGGER.exception('exception calling callback for %r', fut) */
+    PyObject *exc = PyErr_GetRaisedException();
+    PyObject *meth = PyObject_GetAttr(state->logger, state->str_exception);
+    if (meth == NULL) {
+        Py_DECREF(exc);
+        return -1;
+    }
+    PyObject *args = Py_BuildValue("(sO)", "exception calling callback for %r",
+                                   (PyObject *)fut);
+    PyObject *kwargs = Py_BuildValue("{sO}", "exc_info", exc);
+    if (args != NULL && kwargs != NULL) {
+        res = PyObject_Call(meth, args, kwargs);
+    }
+    Py_XDECREF(kwargs);
+    Py_XDECREF(args);
+    Py_DECREF(meth);
+    Py_DECREF(exc);
+    if (res == NULL) {
+        return -1;
+    }
+    Py_DECREF(res);
+    return 0;
+}
+
+static int
+invoke_callbacks(FutureObject *fut)
+{
+    if (fut->done_callbacks == NULL ||
+        PyList_GET_SIZE(fut->done_callbacks) == 0)
+    {
+        return 0;
+    }
+    futures_state *state = get_futures_state_by_type(Py_TYPE(fut));
+    for (Py_ssize_t i = 0; i < PyList_GET_SIZE(fut->done_callbacks); i++) {
+        PyObject *fn = PyList_GetItemRef(fut->done_callbacks, i);
+        if (fn == NULL) {
+            return -1;
+        }
+        int res = call_callback(state, fut, fn);
+        Py_DECREF(fn);
+        if (res < 0) {
+            return -1;
+        }
+    }
+    return 0;
+}
+
+/* Raise the exception set by set_exception(), like the raise statement. */
+static PyObject *
+raise_exception(PyObject *exc)
+{
+    if (PyExceptionInstance_Check(exc)) {
+        PyErr_SetObject(PyExceptionInstance_Class(exc), exc);
+    }
+    else if (PyExceptionClass_Check(exc)) {
+        PyErr_SetNone(exc);
+    }
+    else {
+        PyErr_SetString(PyExc_TypeError,
+                        "exceptions must derive from BaseException");
+    }
+    return NULL;
+}
+
+static PyObject *
+invalid_state_error(FutureObject *fut)
+{
+    futures_state *state = get_futures_state_by_type(Py_TYPE(fut));
+    PyErr_Format(state->InvalidStateError, "%U: %R",
+                 state->state_names[future_get_state(fut)], (PyObject *)fut);
+    return NULL;
+}
+
+
+/* Future */
+
+static int
+future_clear(PyObject *op)
+{
+    FutureObject *fut = FutureObject_CAST(op);
+    Py_CLEAR(fut->result);
+    Py_CLEAR(fut->exception);
+    Py_CLEAR(fut->waiters);
+    Py_CLEAR(fut->done_callbacks);
+    PyObject_ClearManagedDict(op);
+    return 0;
+}
+
+static int
+future_traverse(PyObject *op, visitproc visit, void *arg)
+{
+    FutureObject *fut = FutureObject_CAST(op);
+    Py_VISIT(Py_TYPE(fut));
+    Py_VISIT(fut->result);
+    Py_VISIT(fut->exception);
+    Py_VISIT(fut->waiters);
+    Py_VISIT(fut->done_callbacks);
+    PyObject_VisitManagedDict(op, visit, arg);
+    return 0;
+}
+
+static void
+future_dealloc(PyObject *op)
+{
+    PyTypeObject *tp = Py_TYPE(op);
+    PyObject_GC_UnTrack(op);
+    PyObject_ClearWeakRefs(op);
+    (void)future_clear(op);
+    tp->tp_free(op);
+    Py_DECREF(tp);
+}
+
+static PyObject *
+future_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    FutureObject *fut = (FutureObject *)type->tp_alloc(type, 0);
+    if (fut == NULL) {
+        return NULL;
+    }
+    fut->state = STATE_PENDING;
+    fut->result = Py_NewRef(Py_None);
+    fut->exception = Py_NewRef(Py_None);
+    return (PyObject *)fut;
+}
+
+/*[clinic input]
+_concurrent_futures.Future.__init__
+
+Initializes the future. Should not be called by clients.
+[clinic start generated code]*/
+
+static int
+_concurrent_futures_Future___init___impl(FutureObject *self)
+/*[clinic end generated code: output=68c8cff4bdeac26b input=ff88ef8e1b8b19cd]*/
+{
+    PyObject *result, *exception, *waiters, *done_callbacks;
+    future_lock(self);
+    future_set_state(self, STATE_PENDING);
+    result = self->result;
+    exception = self->exception;
+    waiters = self->waiters;
+    done_callbacks = self->done_callbacks;
+    self->result = Py_NewRef(Py_None);
+    self->exception = Py_NewRef(Py_None);
+    self->waiters = NULL;
+    self->done_callbacks = NULL;
+    future_unlock(self);
+    Py_XDECREF(result);
+    Py_XDECREF(exception);
+    Py_XDECREF(waiters);
+    Py_XDECREF(done_callbacks);
+    return 0;
+}
+
+static PyObject *
+future_repr(PyObject *op)
+{
+    FutureObject *fut = FutureObject_CAST(op);
+    PyObject *name = PyType_GetName(Py_TYPE(fut));
+    if (name == NULL) {
+        return NULL;
+    }
+    PyObject *repr = NULL;
+    future_lock(fut);
+    int state = future_get_state(fut);
+    if (state == STATE_FINISHED) {
+        int raised = PyObject_IsTrue(fut->exception);
+        if (raised < 0) {
+            goto done;
+        }
+        PyObject *obj = raised ? fut->exception : fut->result;
+        PyObject *obj_name = PyType_GetName(Py_TYPE(obj));
+        if (obj_name == NULL) {
+            goto done;
+        }
+        repr = PyUnicode_FromFormat("<%U at %p state=%s %s %U>",
+                                    name, fut, state_descriptions[state],
+                                    raised ? "raised" : "returned", obj_name);
+        Py_DECREF(obj_name);
+    }
+    else {
+        repr = PyUnicode_FromFormat("<%U at %p state=%s>",
+                                    name, fut, state_descriptions[state]);
+    }
+done:
+    future_unlock(fut);
+    Py_DECREF(name);
+    return repr;
+}
+
+/*[clinic input]
+_concurrent_futures.Future._invoke_callbacks
+
+Call the done callbacks.
+[clinic start generated code]*/
+
+static PyObject *
+_concurrent_futures_Future__invoke_callbacks_impl(FutureObject *self)
+/*[clinic end generated code: output=81d276ee38281570 input=85b7cd4399c84e17]*/
+{
+    if (invoke_callbacks(self) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+_concurrent_futures.Future.cancel
+
+Cancel the future if possible.
+
+Returns True if the future was cancelled, False otherwise. A future
+cannot be cancelled if it is running or has already completed.
+[clinic start generated code]*/
+
+static PyObject *
+_concurrent_futures_Future_cancel_impl(FutureObject *self)
+/*[clinic end generated code: output=c0449ecf73ed4348 input=795053f858b10fcb]*/
+{
+    future_lock(self);
+    int state = future_get_state(self);
+    if (state == STATE_RUNNING || state == STATE_FINISHED) {
+        future_unlock(self);
+        Py_RETURN_FALSE;
+    }
+    if (state_is_cancelled(state)) {
+        future_unlock(self);
+        Py_RETURN_TRUE;
+    }
+    future_set_state(self, STATE_CANCELLED);
+    future_notify_all(self);
+    future_unlock(self);
+
+    if (invoke_callbacks(self) < 0) {
+        return NULL;
+    }
+    Py_RETURN_TRUE;
+}
+
+/*[clinic input]
+_concurrent_futures.Future.cancelled
+
+Return True if the future was cancelled.
+[clinic start generated code]*/
+
+static PyObject *
+_concurrent_futures_Future_cancelled_impl(FutureObject *self)
+/*[clinic end generated code: output=c4bc85a3d3e96467 input=2181dfd1d84a8ae3]*/
+{
+    return PyBool_FromLong(state_is_cancelled(future_get_state(self)));
+}
+
+/*[clinic input]
+_concurrent_futures.Future.running
+
+Return True if the future is currently executing.
+[clinic start generated code]*/
+
+static PyObject *
+_concurrent_futures_Future_running_impl(FutureObject *self)
+/*[clinic end generated code: output=e2f27a56e4bb4d9b input=e3e423c4b1b10b3a]*/
+{
+    return PyBool_FromLong(future_get_state(self) == STATE_RUNNING);
+}
+
+/*[clinic input]
+_concurrent_futures.Future.done
+
+Return True if the future was cancelled or finished executing.
+[clinic start generated code]*/
+
+static PyObject *
+_concurrent_futures_Future_done_impl(FutureObject *self)
+/*[clinic end generated code: output=667e9a4616186b08 input=8cddd7bceef5e768]*/
+{
+    return PyBool_FromLong(state_is_done(future_get_state(self)));
+}
+
+/*[clinic input]
+_concurrent_futures.Future.add_done_callback
+
+    fn: object
+    /
+
+Attaches a callable that will be called when the future finishes.
+
+Args:
+    fn: A callable that will be called with this future as its only
+        argument when the future completes or is cancelled. The callable
+        will always be called by a thread in the same process in which
+        it was added. If the future has already completed or been
+        cancelled then the callable will be called immediately. These
+        callables are called in the order that they were added.
+[clinic start generated code]*/
+
+static PyObject *
+_concurrent_futures_Future_add_done_callback_impl(FutureObject *self,
+                                                  PyObject *fn)
+/*[clinic end generated code: output=f7fd3fa3b685eb61 input=804fe0a515593b5e]*/
+{
+    future_lock(self);
+    if (!state_is_done(future_get_state(self))) {
+        PyObject *callbacks = get_list(&self->done_callbacks);
+        int res = callbacks == NULL ? -1 : PyList_Append(callbacks, fn);
+        future_unlock(self);
+        if (res < 0) {
+            return NULL;
+        }
+        Py_RETURN_NONE;
+    }
+    future_unlock(self);
+
+    futures_state *state = get_futures_state_by_type(Py_TYPE(self));
+    if (call_callback(state, self, fn) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+_concurrent_futures.Future.result
+
+    timeout: object = None
+
+Return the result of the call that the future represents.
+
+Args:
+    timeout: The number of seconds to wait for the result if the future
+        isn't done. If None, then there is no limit on the wait time.
+
+Returns:
+    The result of the call that the future represents.
+
+Raises:
+    CancelledError: If the future was cancelled.
+    TimeoutError: If the future didn't finish executing before the given
+        timeout.
+    Exception: If the call raised then that exception will be raised.
+[clinic start generated code]*/
+
+static PyObject *
+_concurrent_futures_Future_result_impl(FutureObject *self, PyObject *timeout)
+/*[clinic end generated code: output=3dc290a2d9758370 input=d9f880338cd07c4d]*/
+{
+    /* Fast path: the future finished successfully. */
+    if (future_get_state(self) == STATE_FINISHED) {
+        future_lock(self);
+        if (self->exception == Py_None) {
+            PyObject *result = Py_NewRef(self->result);
+            future_unlock(self);
+            return result;
+        }
+        future_unlock(self);
+    }
+
+    future_lock(self);
+    if (future_wait_done(self, timeout) < 0) {
+        future_unlock(self);
+        return NULL;
+    }
+    int state = future_get_state(self);
+    if (state == STATE_FINISHED) {
+        if (self->exception != Py_None) {
+            PyObject *exc = Py_NewRef(self->exception);
+            future_unlock(self);
+            raise_exception(exc);
+            Py_DECREF(exc);
+            return NULL;
+        }
+        PyObject *result = Py_NewRef(self->result);
+        future_unlock(self);
+        return result;
+    }
+    future_unlock(self);
+    if (state_is_cancelled(state)) {
+        futures_state *st = get_futures_state_by_type(Py_TYPE(self));
+        PyErr_SetNone(st->CancelledError);
+    }
+    else {
+        PyErr_SetNone(PyExc_TimeoutError);
+    }
+    return NULL;
+}
+
+/*[clinic input]
+_concurrent_futures.Future.exception
+
+    timeout: object = None
+
+Return the exception raised by the call that the future represents.
+
+Args:
+    timeout: The number of seconds to wait for the exception if the
+        future isn't done. If None, then there is no limit on the wait
+        time.
+
+Returns:
+    The exception raised by the call that the future represents or None
+    if the call completed without raising.
+
+Raises:
+    CancelledError: If the future was cancelled.
+    TimeoutError: If the future didn't finish executing before the given
+        timeout.
+[clinic start generated code]*/
+
+static PyObject *
+_concurrent_futures_Future_exception_impl(FutureObject *self,
+                                          PyObject *timeout)
+/*[clinic end generated code: output=1d66a8d31d7a3be7 input=7664f1f7be8fa295]*/
+{
+    future_lock(self);
+    if (future_wait_done(self, timeout) < 0) {
+        future_unlock(self);
+        return NULL;
+    }
+    int state = future_get_state(self);
+    if (state == STATE_FINISHED) {
+        PyObject *exc = Py_NewRef(self->exception);
+        future_unlock(self);
+        return exc;
+    }
+    future_unlock(self);
+    if (state_is_cancelled(state)) {
+        futures_state *st = get_futures_state_by_type(Py_TYPE(self));
+        PyErr_SetNone(st->CancelledError);
+    }
+    else {
+        PyErr_SetNone(PyExc_TimeoutError);
+    }
+    return NULL;
+}
+
+/*[clinic input]
+_concurrent_futures.Future.set_running_or_notify_cancel
+
+Mark the future as running or process any cancel notifications.
+
+Should only be used by Executor implementations and unit tests.
+
+If the future has been cancelled (cancel() was called and returned
+True) then any threads waiting on the future completing (though calls
+to as_completed() or wait()) are notified and False is returned.
+
+If the future was not cancelled then it is put in the running state
+(future calls to running() will return True) and True is returned.
+
+This method should be called by Executor implementations before
+executing the work associated with this future. If this method returns
+False then the work should not be executed.
+
+Returns:
+    False if the Future was cancelled, True otherwise.
+
+Raises:
+    RuntimeError: if this method was already called or if set_result()
+        or set_exception() was called.
+[clinic start generated code]*/
+
+static PyObject *
+_concurrent_futures_Future_set_running_or_notify_cancel_impl(FutureObject *self)
+/*[clinic end generated code: output=a457e8a85984d29b input=9b32726ce896f27b]*/
+{
+    future_lock(self);
+    int state = future_get_state(self);
+    if (state == STATE_PENDING) {
+        future_set_state(self, STATE_RUNNING);
+        future_unlock(self);
+        Py_RETURN_TRUE;
+    }
+    futures_state *st = get_futures_state_by_type(Py_TYPE(self));
+    if (state == STATE_CANCELLED) {
+        future_set_state(self, STATE_CANCELLED_AND_NOTIFIED);
+        int res = notify_waiters(st, self, st->str_add_cancelled);
+        /* notify_all() is not necessary because cancel() triggers a
+           notification. */
+        future_unlock(self);
+        if (res < 0) {
+            return NULL;
+        }
+        Py_RETURN_FALSE;
+    }
+    /* LOGGER.critical('Future %s in unexpected state: %s', id(self),
+                       self._state) */
+    PyObject *res = PyObject_CallMethod(st->logger, "critical", "sNO",
+                                        "Future %s in unexpected state: %s",
+                                        PyLong_FromVoidPtr(self),
+                                        st->state_names[state]);
+    future_unlock(self);
+    if (res == NULL) {
+        return NULL;
+    }
+    Py_DECREF(res);
+    PyErr_SetString(PyExc_RuntimeError, "Future in unexpected state");
+    return NULL;
+}
+
+static PyObject *
+future_set_outcome(FutureObject *self, PyObject **field, PyObject *value,
+                   int is_exception)
+{
+    future_lock(self);
+    if (state_is_done(future_get_state(self))) {
+        invalid_state_error(self);
+        future_unlock(self);
+        return NULL;
+    }
+    Py_SETREF(*field, Py_NewRef(value));
+    future_set_state(self, STATE_FINISHED);
+    if (self->waiters != NULL && PyList_GET_SIZE(self->waiters) > 0) {
+        futures_state *st = get_futures_state_by_type(Py_TYPE(self));
+        if (notify_waiters(st, self, is_exception ? st->str_add_exception
+                                                  : st->str_add_result) < 0)
+        {
+            future_unlock(self);
+            return NULL;
+        }
+    }
+    future_notify_all(self);
+    future_unlock(self);
+
+    if (invoke_callbacks(self) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+_concurrent_futures.Future.set_result
+
+    result: object
+    /
+
+Sets the return value of work associated with the future.
+
+Should only be used by Executor implementations and unit tests.
+[clinic start generated code]*/
+
+static PyObject *
+_concurrent_futures_Future_set_result_impl(FutureObject *self,
+                                           PyObject *result)
+/*[clinic end generated code: output=6b890ea4f5b16334 input=13b450b54a506746]*/
+{
+    return future_set_outcome(self, &self->result, result, 0);
+}
+
+/*[clinic input]
+_concurrent_futures.Future.set_exception
+
+    exception: object
+    /
+
+Sets the result of the future as being the given exception.
+
+Should only be used by Executor implementations and unit tests.
+[clinic start generated code]*/
+
+static PyObject *
+_concurrent_futures_Future_set_exception_impl(FutureObject *self,
+                                              PyObject *exception)
+/*[clinic end generated code: output=25c1d4f40b0b97f4 input=5bf21a0783d627f5]*/
+{
+    return future_set_outcome(self, &self->exception, exception, 1);
+}
+
+/*[clinic input]
+_concurrent_futures.Future._get_snapshot
+
+Get a snapshot of the future's current state.
+
+This method atomically retrieves the state in one lock acquisition,
+which is significantly faster than multiple method calls.
+
+Returns:
+    Tuple of (done, cancelled, result, exception)
+    - done: True if the future is done (cancelled or finished)
+    - cancelled: True if the future was cancelled
+    - result: The result if available and not cancelled
+    - exception: The exception if available and not cancelled
+[clinic start generated code]*/
+
+static PyObject *
+_concurrent_futures_Future__get_snapshot_impl(FutureObject *self)
+/*[clinic end generated code: output=c54b7ac0905ed193 input=753c2f4693878e13]*/
+{
+    PyObject *snapshot;
+    future_lock(self);
+    int state = future_get_state(self);
+    if (state == STATE_FINISHED) {
+        snapshot = PyTuple_Pack(4, Py_True, Py_False,
+                                self->result, self->exception);
+    }
+    else if (state_is_cancelled(state)) {
+        snapshot = PyTuple_Pack(4, Py_True, Py_True, Py_None, Py_None);
+    }
+    else {
+        snapshot = PyTuple_Pack(4, Py_False, Py_False, Py_None, Py_None);
+    }
+    future_unlock(self);
+    return snapshot;
+}
+
+/* Attributes of the Python implementation, used by concurrent.futures._base
+   and by tests. */
+
+static PyObject *
+future_get_condition(PyObject *op, void *Py_UNUSED(closure))
+{
+    FutureObject *fut = FutureObject_CAST(op);
+    futures_state *state = get_futures_state_by_type(Py_TYPE(fut));
+    PyTypeObject *tp = state->FutureConditionType;
+    FutureConditionObject *cond = PyObject_GC_New(FutureConditionObject, tp);
+    if (cond == NULL) {
+        return NULL;
+    }
+    cond->future = (FutureObject *)Py_NewRef(fut);
+    PyObject_GC_Track(cond);
+    return (PyObject *)cond;
+}
+
+static PyObject *
+future_get_state_name(PyObject *op, void *Py_UNUSED(closure))
+{
+    FutureObject *fut = FutureObject_CAST(op);
+    futures_state *state = get_futures_state_by_type(Py_TYPE(fut));
+    return Py_NewRef(state->state_names[future_get_state(fut)]);
+}
+
+static int
+future_set_state_name(PyObject *op, PyObject *value, void *Py_UNUSED(closure))
+{
+    FutureObject *fut = FutureObject_CAST(op);
+    if (value == NULL) {
+        PyErr_SetString(PyExc_AttributeError, "cannot delete attribute");
+        return -1;
+    }
+    futures_state *state = get_futures_state_by_type(Py_TYPE(fut));
+    for (int i = 0; i < NUM_STATES; i++) {
+        int eq = PyObject_RichCompareBool(value, state->state_names[i], Py_EQ);
+        if (eq < 0) {
+            return -1;
+        }
+        if (eq) {
+            future_lock(fut);
+            future_set_state(fut, i);
+            future_unlock(fut);
+            return 0;
+        }
+    }
+    PyErr_Format(PyExc_ValueError, "invalid future state: %R", value);
+    return -1;
+}
+
+static PyObject *
+future_get_field(FutureObject *fut, PyObject **field)
+{
+    future_lock(fut);
+    PyObject *value = Py_NewRef(*field);
+    future_unlock(fut);
+    return value;
+}
+
+static int
+future_set_field(FutureObject *fut, PyObject **field, PyObject *value)
+{
+    if (value == NULL) {
+        PyErr_SetString(PyExc_AttributeError, "cannot delete attribute");
+        return -1;
+    }
+    future_lock(fut);
+    PyObject *old = *field;
+    *field = Py_NewRef(value);
+    future_unlock(fut);
+    Py_DECREF(old);
+    return 0;
+}
+
+static PyObject *
+future_get_result(PyObject *op, void *Py_UNUSED(closure))
+{
+    FutureObject *fut = FutureObject_CAST(op);
+    return future_get_field(fut, &fut->result);
+}
+
+static int
+future_set_result_attr(PyObject *op, PyObject *value,
+                       void *Py_UNUSED(closure))
+{
+    FutureObject *fut = FutureObject_CAST(op);
+    return future_set_field(fut, &fut->result, value);
+}
+
+static PyObject *
+future_get_exception(PyObject *op, void *Py_UNUSED(closure))
+{
+    FutureObject *fut = FutureObject_CAST(op);
+    return future_get_field(fut, &fut->exception);
+}
+
+static int
+future_set_exception_attr(PyObject *op, PyObject *value,
+                          void *Py_UNUSED(closure))
+{
+    FutureObject *fut = FutureObject_CAST(op);
+    return future_set_field(fut, &fut->exception, value);
+}
+
+static PyObject *
+future_get_list(FutureObject *fut, PyObject **list)
+{
+    future_lock(fut);
+    PyObject *value = Py_XNewRef(get_list(list));
+    future_unlock(fut);
+    return value;
+}
+
+static PyObject *
+future_get_waiters(PyObject *op, void *Py_UNUSED(closure))
+{
+    FutureObject *fut = FutureObject_CAST(op);
+    return future_get_list(fut, &fut->waiters);
+}
+
+static PyObject *
+future_get_done_callbacks(PyObject *op, void *Py_UNUSED(closure))
+{
+    FutureObject *fut = FutureObject_CAST(op);
+    return future_get_list(fut, &fut->done_callbacks);
+}
+
+static PyGetSetDef future_getsetlist[] = {
+    {"_condition", future_get_condition, NULL, NULL},
+    {"_state", future_get_state_name, future_set_state_name, NULL},
+    {"_result", future_get_result, future_set_result_attr, NULL},
+    {"_exception", future_get_exception, future_set_exception_attr, NULL},
+    {"_waiters", future_get_waiters, NULL, NULL},
+    {"_done_callbacks", future_get_done_callbacks, NULL, NULL},
+    {NULL} /* Sentinel */
+};
+
+
+/* _FutureCondition */
+
+static int
+condition_traverse(PyObject *op, visitproc visit, void *arg)
+{
+    FutureConditionObject *cond = FutureConditionObject_CAST(op);
+    Py_VISIT(Py_TYPE(cond));
+    Py_VISIT(cond->future);
+    return 0;
+}
+
+static int
+condition_clear(PyObject *op)
+{
+    FutureConditionObject *cond = FutureConditionObject_CAST(op);
+    Py_CLEAR(cond->future);
+    return 0;
+}
+
+static void
+condition_dealloc(PyObject *op)
+{
+    PyTypeObject *tp = Py_TYPE(op);
+    PyObject_GC_UnTrack(op);
+    (void)condition_clear(op);
+    tp->tp_free(op);
+    Py_DECREF(tp);
+}
+
+/*[clinic input]
+_concurrent_futures._FutureCondition.acquire
+
+    blocking: bool = True
+    timeout as timeout_obj: object(py_default="-1") = NULL
+
+Acquire the lock of the future.
+[clinic start generated code]*/
+
+static PyObject *
+_concurrent_futures__FutureCondition_acquire_impl(FutureConditionObject *self,
+                                                  int blocking,
+                                                  PyObject *timeout_obj)
+/*[clinic end generated code: output=32d57d39774d0b49 input=c6ef26ab3219c5e4]*/
+{
+    FutureObject *fut = self->future;
+    PyTime_t timeout = -1;
+    if (timeout_obj != NULL) {
+        if (!blocking) {
+            PyErr_SetString(PyExc_ValueError,
+                            "can't specify a timeout for a non-blocking call");
+            return NULL;
+        }
+        if (_PyTime_FromSecondsObject(&timeout, timeout_obj,
+                                      _PyTime_ROUND_TIMEOUT) < 0) {
+            return NULL;
+        }
+        if (timeout < 0 && timeout != _PyTime_FromSeconds(-1)) {
+            PyErr_SetString(PyExc_ValueError,
+                            "timeout value must be a non-negative number");
+            return NULL;
+        }
+        if (timeout < 0) {
+            timeout = -1;
+        }
+    }
+    if (!blocking) {
+        timeout = 0;
+    }
+
+    if (future_is_owned(fut)) {
+        fut->lock.level++;
+        Py_RETURN_TRUE;
+    }
+    PyLockStatus r = _PyMutex_LockTimed(
+        &fut->lock.mutex, timeout,
+        _PY_LOCK_PYTHONLOCK | _PY_LOCK_HANDLE_SIGNALS | _PY_LOCK_DETACH);
+    if (r == PY_LOCK_INTR) {
+        assert(PyErr_Occurred());
+        return NULL;
+    }
+    if (r == PY_LOCK_FAILURE && PyErr_Occurred()) {
+        return NULL;
+    }
+    if (r == PY_LOCK_ACQUIRED) {
+        _Py_atomic_store_ullong_relaxed(&fut->lock.thread,
+                                        PyThread_get_thread_ident_ex());
+        assert(fut->lock.level == 0);
+    }
+    return PyBool_FromLong(r == PY_LOCK_ACQUIRED);
+}
+
+/*[clinic input]
+_concurrent_futures._FutureCondition.__enter__
+
+Acquire the lock of the future.
+[clinic start generated code]*/
+
+static PyObject *
+_concurrent_futures__FutureCondition___enter___impl(FutureConditionObject *self)
+/*[clinic end generated code: output=3901252e8578270c input=a0574ab04aa70527]*/
+{
+    return _concurrent_futures__FutureCondition_acquire_impl(self, 1, NULL);
+}
+
+/*[clinic input]
+_concurrent_futures._FutureCondition.release
+
+Release the lock of the future.
+[clinic start generated code]*/
+
+static PyObject *
+_concurrent_futures__FutureCondition_release_impl(FutureConditionObject *self)
+/*[clinic end generated code: output=f607ff78929e2a52 input=047c3eacbff78d3d]*/
+{
+    if (!future_is_owned(self->future)) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "cannot release un-acquired lock");
+        return NULL;
+    }
+    future_unlock(self->future);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+_concurrent_futures._FutureCondition.__exit__
+
+    exc_type: object
+    exc_value: object
+    exc_tb: object
+    /
+
+Release the lock of the future.
+[clinic start generated code]*/
+
+static PyObject *
+_concurrent_futures__FutureCondition___exit___impl(FutureConditionObject *self,
+                                                   PyObject *exc_type,
+                                                   PyObject *exc_value,
+                                                   PyObject *exc_tb)
+/*[clinic end generated code: output=7e605fee5a075523 input=430aedeccfc9be1f]*/
+{
+    return _concurrent_futures__FutureCondition_release_impl(self);
+}
+
+/*[clinic input]
+_concurrent_futures._FutureCondition.wait
+
+    timeout: object = None
+
+Wait until notified or until a timeout occurs.
+
+The lock of the future must be held.  Return False if the timeout
+expired, True otherwise.
+[clinic start generated code]*/
+
+static PyObject *
+_concurrent_futures__FutureCondition_wait_impl(FutureConditionObject *self,
+                                               PyObject *timeout)
+/*[clinic end generated code: output=02cba36d914c86a8 input=906c04b32d02d25b]*/
+{
+    FutureObject *fut = self->future;
+    if (!future_is_owned(fut)) {
+        PyErr_SetString(PyExc_RuntimeError, "cannot wait on un-acquired lock");
+        return NULL;
+    }
+    PyTime_t timeout_ns;
+    if (parse_wait_timeout(timeout, &timeout_ns) < 0) {
+        return NULL;
+    }
+    if (timeout_ns == 0) {
+        Py_RETURN_FALSE;
+    }
+    int res = future_wait(fut, timeout_ns);
+    if (res < 0) {
+        return NULL;
+    }
+    return PyBool_FromLong(res);
+}
+
+/*[clinic input]
+_concurrent_futures._FutureCondition.notify_all
+
+Wake up all threads waiting on the future.
+
+The lock of the future must be held.
+[clinic start generated code]*/
+
+static PyObject *
+_concurrent_futures__FutureCondition_notify_all_impl(FutureConditionObject *self)
+/*[clinic end generated code: output=b679163108a15a74 input=314594c7f1578cdd]*/
+{
+    if (!future_is_owned(self->future)) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "cannot notify on un-acquired lock");
+        return NULL;
+    }
+    future_notify_all(self->future);
+    Py_RETURN_NONE;
+}
+
+
+#include "clinic/_concurrent_futuresmodule.c.h"
+
+
+static PyMethodDef future_methods[] = {
+    _CONCURRENT_FUTURES_FUTURE__INVOKE_CALLBACKS_METHODDEF
+    _CONCURRENT_FUTURES_FUTURE_CANCEL_METHODDEF
+    _CONCURRENT_FUTURES_FUTURE_CANCELLED_METHODDEF
+    _CONCURRENT_FUTURES_FUTURE_RUNNING_METHODDEF
+    _CONCURRENT_FUTURES_FUTURE_DONE_METHODDEF
+    _CONCURRENT_FUTURES_FUTURE_ADD_DONE_CALLBACK_METHODDEF
+    _CONCURRENT_FUTURES_FUTURE_RESULT_METHODDEF
+    _CONCURRENT_FUTURES_FUTURE_EXCEPTION_METHODDEF
+    _CONCURRENT_FUTURES_FUTURE_SET_RUNNING_OR_NOTIFY_CANCEL_METHODDEF
+    _CONCURRENT_FUTURES_FUTURE_SET_RESULT_METHODDEF
+    _CONCURRENT_FUTURES_FUTURE_SET_EXCEPTION_METHODDEF
+    _CONCURRENT_FUTURES_FUTURE__GET_SNAPSHOT_METHODDEF
+    {"__class_getitem__", Py_GenericAlias, METH_O|METH_CLASS,
+     PyDoc_STR("See PEP 585")},
+    {NULL, NULL}        /* Sentinel */
+};
+
+static PyType_Slot future_slots[] = {
+    {Py_tp_dealloc, future_dealloc},
+    {Py_tp_repr, future_repr},
+    {Py_tp_doc, (void *)"Represents the result of an asynchronous computation."},
+    {Py_tp_traverse, future_traverse},
+    {Py_tp_clear, future_clear},
+    {Py_tp_methods, future_methods},
+    {Py_tp_getset, future_getsetlist},
+    {Py_tp_init, _concurrent_futures_Future___init__},
+    {Py_tp_new, future_new},
+    {0, NULL},
+};
+
+static PyType_Spec future_spec = {
+    .name = "_concurrent_futures.Future",
+    .basicsize = sizeof(FutureObject),
+    .flags = (Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_GC |
+              Py_TPFLAGS_IMMUTABLETYPE | Py_TPFLAGS_MANAGED_DICT |
+              Py_TPFLAGS_MANAGED_WEAKREF),
+    .slots = future_slots,
+};
+
+static PyMethodDef condition_methods[] = {
+    _CONCURRENT_FUTURES__FUTURECONDITION_ACQUIRE_METHODDEF
+    _CONCURRENT_FUTURES__FUTURECONDITION_RELEASE_METHODDEF
+    _CONCURRENT_FUTURES__FUTURECONDITION___ENTER___METHODDEF
+    _CONCURRENT_FUTURES__FUTURECONDITION___EXIT___METHODDEF
+    _CONCURRENT_FUTURES__FUTURECONDITION_WAIT_METHODDEF
+    _CONCURRENT_FUTURES__FUTURECONDITION_NOTIFY_ALL_METHODDEF
+    {NULL, NULL}        /* Sentinel */
+};
+
+static PyType_Slot condition_slots[] = {
+    {Py_tp_dealloc, condition_dealloc},
+    {Py_tp_doc, (void *)"The lock and condition variable of a Future."},
+    {Py_tp_traverse, condition_traverse},
+    {Py_tp_clear, condition_clear},
+    {Py_tp_methods, condition_methods},
+    {0, NULL},
+};
+
+static PyType_Spec condition_spec = {
+    .name = "_concurrent_futures._FutureCondition",
+    .basicsize = sizeof(FutureConditionObject),
+    .flags = (Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC |
+              Py_TPFLAGS_IMMUTABLETYPE | Py_TPFLAGS_DISALLOW_INSTANTIATION),
+    .slots = condition_slots,
+};
+
+
+/* Module */
+
+static int
+module_traverse(PyObject *mod, visitproc visit, void *arg)
+{
+    futures_state *state = get_futures_state(mod);
+    Py_VISIT(state->FutureType);
+    Py_VISIT(state->FutureConditionType);
+    for (int i = 0; i < NUM_STATES; i++) {
+        Py_VISIT(state->state_names[i]);
+    }
+    Py_VISIT(state->str_add_result);
+    Py_VISIT(state->str_add_exception);
+    Py_VISIT(state->str_add_cancelled);
+    Py_VISIT(state->str_exception);
+    Py_VISIT(state->CancelledError);
+    Py_VISIT(state->InvalidStateError);
+    Py_VISIT(state->logger);
+    return 0;
+}
+
+static int
+module_clear(PyObject *mod)
+{
+    futures_state *state = get_futures_state(mod);
+    Py_CLEAR(state->FutureType);
+    Py_CLEAR(state->FutureConditionType);
+    for (int i = 0; i < NUM_STATES; i++) {
+        Py_CLEAR(state->state_names[i]);
+    }
+    Py_CLEAR(state->str_add_result);
+    Py_CLEAR(state->str_add_exception);
+    Py_CLEAR(state->str_add_cancelled);
+    Py_CLEAR(state->str_exception);
+    Py_CLEAR(state->CancelledError);
+    Py_CLEAR(state->InvalidStateError);
+    Py_CLEAR(state->logger);
+    return 0;
+}
+
+static void
+module_free(void *mod)
+{
+    (void)module_clear((PyObject *)mod);
+}
+
+static int
+module_exec(PyObject *mod)
+{
+    futures_state *state = get_futures_state(mod);
+
+    for (int i = 0; i < NUM_STATES; i++) {
+        state->state_names[i] = PyUnicode_InternFromString(state_names[i]);
+        if (state->state_names[i] == NULL) {
+            return -1;
+        }
+    }
+#define INTERN_STRING(name)                                     \
+    do {                                                        \
+        state->str_ ## name = PyUnicode_InternFromString(#name);\
+        if (state->str_ ## name == NULL) {                      \
+            return -1;                                          \
+        }                                                       \
+    } while (0)
+    INTERN_STRING(add_result);
+    INTERN_STRING(add_exception);
+    INTERN_STRING(add_cancelled);
+    INTERN_STRING(exception);
+#undef INTERN_STRING
+
+    /* concurrent.futures._base imports this module after defining these. */
+#define IMPORT_BASE_ATTR(field, name)                                       \
+    do {                                                                    \
+        state->field = PyImport_ImportModuleAttrString(                     \
+            "concurrent.futures._base", name);                             \
+        if (state->field == NULL) {                                         \
+            return -1;                                                      \
+        }                                                                   \
+    } while (0)
+    IMPORT_BASE_ATTR(CancelledError, "CancelledError");
+    IMPORT_BASE_ATTR(InvalidStateError, "InvalidStateError");
+    IMPORT_BASE_ATTR(logger, "LOGGER");
+#undef IMPORT_BASE_ATTR
+
+    state->FutureConditionType = (PyTypeObject *)PyType_FromModuleAndSpec(
+        mod, &condition_spec, NULL);
+    if (state->FutureConditionType == NULL) {
+        return -1;
+    }
+    state->FutureType = (PyTypeObject *)PyType_FromModuleAndSpec(
+        mod, &future_spec, NULL);
+    if (state->FutureType == NULL) {
+        return -1;
+    }
+    if (PyModule_AddType(mod, state->FutureType) < 0) {
+        return -1;
+    }
+    return 0;
+}
+
+static PyModuleDef_Slot module_slots[] = {
+    {Py_mod_exec, module_exec},
+    {Py_mod_multiple_interpreters, Py_MOD_PER_INTERPRETER_GIL_SUPPORTED},
+    {Py_mod_gil, Py_MOD_GIL_NOT_USED},
+    {0, NULL},
+};
+
+PyDoc_STRVAR(module_doc,
+"C implementation of the concurrent.futures Future.\n\
+This module is an implementation detail, please do not use it directly.");
+
+static struct PyModuleDef _concurrent_futuresmodule = {
+    .m_base = PyModuleDef_HEAD_INIT,
+    .m_name = "_concurrent_futures",
+    .m_doc = module_doc,
+    .m_size = sizeof(futures_state),
+    .m_slots = module_slots,
+    .m_traverse = module_traverse,
+    .m_clear = module_clear,
+    .m_free = module_free,
+};
+
+PyMODINIT_FUNC
+PyInit__concurrent_futures(void)
+{
+    return PyModuleDef_Init(&_concurrent_futuresmodule);
+}
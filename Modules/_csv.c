@@ -15,6 +15,7 @@ module instead.
 
 #include "Python.h"
 #include "pycore_pyatomic_ft_wrappers.h"
+#include "pycore_pyerrors.h"      // _PyErr_FormatNote()
 
 #include <stddef.h>               // offsetof()
 #include <stdbool.h>
@@ -134,6 +135,7 @@ typedef struct {
     Py_ssize_t field_len;       /* length of current field */
     bool unquoted_field;        /* true if no quotes around the current field */
     unsigned long line_num;     /* Source-file line number */
+    PyObject *converters;       /* tuple of callables or None, or NULL */
 } ReaderObj;
 
 typedef struct {
@@ -917,6 +919,102 @@ parse_reset(ReaderObj *self)
     return 0;
 }
 
+/* Parse a short decimal number without creating an int object.
+   Return 1 on success and 0 if the field must be parsed by int(). */
+static int
+parse_small_int(PyObject *field, long long *value)
+{
+    if (PyUnicode_IS_ASCII(field)) {
+        Py_ssize_t len = PyUnicode_GET_LENGTH(field);
+        const Py_UCS1 *p = PyUnicode_1BYTE_DATA(field);
+        Py_ssize_t i = (len > 0 && (p[0] == '-' || p[0] == '+'));
+        if (i < len && len <= 18) {
+            long long v = 0;
+            for (; i < len && Py_ISDIGIT(p[i]); i++) {
+                v = v * 10 + (p[i] - '0');
+            }
+            if (i == len) {
+                *value = p[0] == '-' ? -v : v;
+                return 1;
+            }
+        }
+    }
+    return 0;
+}
+
+static int
+parse_double(PyObject *field, double *value)
+{
+    if (PyUnicode_IS_ASCII(field) && PyUnicode_GET_LENGTH(field) > 0) {
+        const char *s = (const char *)PyUnicode_1BYTE_DATA(field);
+        char *end;
+        *value = PyOS_string_to_double(s, &end, NULL);
+        if (*value == -1.0 && PyErr_Occurred()) {
+            PyErr_Clear();
+        }
+        else if (end == s + PyUnicode_GET_LENGTH(field)) {
+            return 0;
+        }
+    }
+    /* Whitespace, underscores, embedded null characters, non-ASCII
+       digits and errors */
+    PyObject *num = PyFloat_FromString(field);
+    if (num == NULL) {
+        return -1;
+    }
+    *value = PyFloat_AS_DOUBLE(num);
+    Py_DECREF(num);
+    return 0;
+}
+
+/* Apply the converter to a field of the record.  int and float are
+   evaluated without calling them for string fields. */
+static PyObject *
+convert_field(PyObject *converter, PyObject *field)
+{
+    if (field == Py_None) {
+        return Py_NewRef(field);
+    }
+    if (PyUnicode_CheckExact(field)) {
+        if (converter == (PyObject *)&PyLong_Type) {
+            long long value;
+            if (parse_small_int(field, &value)) {
+                return PyLong_FromLongLong(value);
+            }
+            return PyLong_FromUnicodeObject(field, 10);
+        }
+        if (converter == (PyObject *)&PyFloat_Type) {
+            double value;
+            if (parse_double(field, &value) < 0) {
+                return NULL;
+            }
+            return PyFloat_FromDouble(value);
+        }
+    }
+    return PyObject_CallOneArg(converter, field);
+}
+
+static int
+convert_fields(ReaderObj *self, PyObject *fields)
+{
+    Py_ssize_t n = Py_MIN(PyList_GET_SIZE(fields),
+                          PyTuple_GET_SIZE(self->converters));
+    for (Py_ssize_t i = 0; i < n; i++) {
+        PyObject *converter = PyTuple_GET_ITEM(self->converters, i);
+        if (converter == Py_None) {
+            continue;
+        }
+        PyObject *value = convert_field(converter, PyList_GET_ITEM(fields, i));
+        if (value == NULL) {
+            _PyErr_FormatNote("when converting field %zd of line %lu",
+                              i, self->line_num);
+            return -1;
+        }
+        PyList_SetItem(fields, i, value);
+    }
+    return 0;
+}
+
 static PyObject *
 Reader_iternext_lock_held(PyObject *op)
 {
@@ -981,6 +1079,9 @@ Reader_iternext_lock_held(PyObject *op)
 
     fields = self->fields;
     self->fields = NULL;
+    if (self->converters != NULL && convert_fields(self, fields) < 0) {
+        Py_CLEAR(fields);
+    }
 err:
     return fields;
 }
@@ -995,6 +1096,286 @@ Reader_iternext(PyObject *op)
     return result;
 }
 
+/* A column of Reader.read_columns(): a list of fields, or a C array of
+   the fields converted by int() or float() */
+typedef struct {
+    char typecode;          /* 0 for a list, 'q' or 'd' for a C array */
+    PyObject *list;
+    char *data;
+    Py_ssize_t len;
+    Py_ssize_t allocated;
+} Column;
+
+static int
+column_grow(Column *col, size_t itemsize)
+{
+    if (col->len < col->allocated) {
+        return 0;
+    }
+    Py_ssize_t allocated = col->allocated ? col->allocated * 2 : 1024;
+    if ((size_t)allocated > PY_SSIZE_T_MAX / itemsize) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    char *data = PyMem_Realloc(col->data, allocated * itemsize);
+    if (data == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    col->data = data;
+    col->allocated = allocated;
+    return 0;
+}
+
+static int
+parse_long_long(PyObject *field, long long *value)
+{
+    if (parse_small_int(field, value)) {
+        return 0;
+    }
+    PyObject *num = PyLong_FromUnicodeObject(field, 10);
+    if (num == NULL) {
+        return -1;
+    }
+    *value = PyLong_AsLongLong(num);
+    Py_DECREF(num);
+    return (*value == -1 && PyErr_Occurred()) ? -1 : 0;
+}
+
+static int
+column_append(Column *col, PyObject *field)
+{
+    if (col->typecode == 'q') {
+        long long value;
+        if (column_grow(col, sizeof(long long)) < 0) {
+            return -1;
+        }
+        if (PyUnicode_Check(field)) {
+            if (parse_long_long(field, &value) < 0) {
+                return -1;
+            }
+        }
+        else {
+            PyObject *num = PyNumber_Long(field);
+            if (num == NULL) {
+                return -1;
+            }
+            value = PyLong_AsLongLong(num);
+            Py_DECREF(num);
+            if (value == -1 && PyErr_Occurred()) {
+                return -1;
+            }
+        }
+        ((long long *)col->data)[col->len++] = value;
+        return 0;
+    }
+    if (col->typecode == 'd') {
+        double value;
+        if (column_grow(col, sizeof(double)) < 0) {
+            return -1;
+        }
+        if (PyUnicode_Check(field)) {
+            if (parse_double(field, &value) < 0) {
+                return -1;
+            }
+        }
+        else {
+            value = PyFloat_AsDouble(field);
+            if (value == -1.0 && PyErr_Occurred()) {
+                return -1;
+            }
+        }
+        ((double *)col->data)[col->len++] = value;
+        return 0;
+    }
+    return PyList_Append(col->list, field);
+}
+
+static PyObject *
+column_finish(Column *col, PyObject *array_type)
+{
+    if (col->typecode == 0) {
+        return Py_NewRef(col->list);
+    }
+    PyObject *result = PyObject_CallFunction(array_type, "C", col->typecode);
+    if (result == NULL) {
+        return NULL;
+    }
+    size_t itemsize = col->typecode == 'q' ? sizeof(long long) : sizeof(double);
+    PyObject *view = PyMemoryView_FromMemory(col->data ? col->data : "",
+                                             col->len * itemsize, PyBUF_READ);
+    if (view == NULL) {
+        Py_DECREF(result);
+        return NULL;
+    }
+    PyObject *res = PyObject_CallMethod(result, "frombytes", "O", view);
+    Py_DECREF(view);
+    if (res == NULL) {
+        Py_DECREF(result);
+        return NULL;
+    }
+    Py_DECREF(res);
+    return result;
+}
+
+static PyObject *
+Reader_read_columns_lock_held(PyObject *op, Py_ssize_t size, PyObject *types)
+{
+    ReaderObj *self = _ReaderObj_CAST(op);
+    _csvstate *module_state = _csv_state_from_type(Py_TYPE(self),
+                                                   "Reader.read_columns");
+    if (module_state == NULL) {
+        return NULL;
+    }
+
+    PyObject *result = NULL;
+    PyObject *array_type = NULL;
+    Column *columns = NULL;
+    Py_ssize_t ncolumns = -1;
+    Py_ssize_t nrows = 0;
+
+    if (types != Py_None) {
+        types = PySequence_Tuple(types);
+        if (types == NULL) {
+            return NULL;
+        }
+        ncolumns = PyTuple_GET_SIZE(types);
+    }
+
+    while (size < 0 || nrows < size) {
+        PyObject *fields = Reader_iternext_lock_held(op);
+        if (fields == NULL) {
+            if (PyErr_Occurred()) {
+                goto done;
+            }
+            break;
+        }
+        if (PyList_GET_SIZE(fields) == 0) {
+            /* Skip blank lines */
+            Py_DECREF(fields);
+            continue;
+        }
+        if (columns == NULL) {
+            if (ncolumns < 0) {
+                ncolumns = PyList_GET_SIZE(fields);
+            }
+            columns = PyMem_Calloc(Py_MAX(ncolumns, 1), sizeof(Column));
+            if (columns == NULL) {
+                PyErr_NoMemory();
+                Py_DECREF(fields);
+                goto done;
+            }
+            for (Py_ssize_t i = 0; i < ncolumns; i++) {
+                PyObject *type = types == Py_None ? Py_None
+                                                  : PyTuple_GET_ITEM(types, i);
+                if (type == (PyObject *)&PyLong_Type) {
+                    columns[i].typecode = 'q';
+                }
+                else if (type == (PyObject *)&PyFloat_Type) {
+                    columns[i].typecode = 'd';
+                }
+                else if (type == Py_None || type == (PyObject *)&PyUnicode_Type) {
+                    columns[i].list = PyList_New(0);
+                    if (columns[i].list == NULL) {
+                        Py_DECREF(fields);
+                        goto done;
+                    }
+                }
+                else {
+                    PyErr_Format(PyExc_TypeError,
+                                 "column types must be int, float, str or "
+                                 "None, not %R", type);
+                    Py_DECREF(fields);
+                    goto done;
+                }
+            }
+        }
+        if (PyList_GET_SIZE(fields) != ncolumns) {
+            PyErr_Format(module_state->error_obj,
+                         "expected %zd fields, got %zd",
+                         ncolumns, PyList_GET_SIZE(fields));
+            Py_DECREF(fields);
+            goto done;
+        }
+        for (Py_ssize_t i = 0; i < ncolumns; i++) {
+            if (column_append(&columns[i], PyList_GET_ITEM(fields, i)) < 0) {
+                _PyErr_FormatNote("when converting field %zd of line %lu",
+                                  i, self->line_num);
+                Py_DECREF(fields);
+                goto done;
+            }
+        }
+        Py_DECREF(fields);
+        nrows++;
+    }
+
+    result = PyList_New(0);
+    if (result == NULL || columns == NULL) {
+        goto done;
+    }
+    if (ncolumns > 0 && types != Py_None) {
+        array_type = PyImport_ImportModuleAttrString("array", "array");
+        if (array_type == NULL) {
+            Py_CLEAR(result);
+            goto done;
+        }
+    }
+    for (Py_ssize_t i = 0; i < ncolumns; i++) {
+        PyObject *column = column_finish(&columns[i], array_type);
+        if (column == NULL || PyList_Append(result, column) < 0) {
+            Py_XDECREF(column);
+            Py_CLEAR(result);
+            goto done;
+        }
+        Py_DECREF(column);
+    }
+
+done:
+    if (columns != NULL) {
+        for (Py_ssize_t i = 0; i < ncolumns; i++) {
+            Py_XDECREF(columns[i].list);
+            PyMem_Free(columns[i].data);
+        }
+        PyMem_Free(columns);
+    }
+    Py_XDECREF(array_type);
+    if (types != Py_None) {
+        Py_DECREF(types);
+    }
+    return result;
+}
+
+PyDoc_STRVAR(Reader_read_columns_doc,
+"read_columns($self, /, size=-1, types=None)\n"
+"--\n\n"
+"Read up to size records and return a list of their columns.\n"
+"\n"
+"Read all the remaining records if size is negative.  Return an empty\n"
+"list at the end of the input.  Empty records are skipped, all the other\n"
+"records must have the same number of fields.\n"
+"\n"
+"If specified, types is a sequence with an item for every field: int and\n"
+"float columns are converted with int() and float() and returned as\n"
+"array.array('q') and array.array('d') objects, str and None columns are\n"
+"returned as lists.");
+
+static PyObject *
+Reader_read_columns(PyObject *op, PyObject *args, PyObject *kwargs)
+{
+    static char *kwlist[] = {"size", "types", NULL};
+    Py_ssize_t size = -1;
+    PyObject *types = Py_None;
+    PyObject *result;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|nO:read_columns", kwlist,
+                                     &size, &types))
+        return NULL;
+    Py_BEGIN_CRITICAL_SECTION(op);
+    result = Reader_read_columns_lock_held(op, size, types);
+    Py_END_CRITICAL_SECTION();
+    return result;
+}
+
 static void
 Reader_dealloc(PyObject *op)
 {
@@ -1017,6 +1398,7 @@ Reader_traverse(PyObject *op, visitproc visit, void *arg)
     Py_VISIT(self->dialect);
     Py_VISIT(self->input_iter);
     Py_VISIT(self->fields);
+    Py_VISIT(self->converters);
     Py_VISIT(Py_TYPE(self));
     return 0;
 }
@@ -1028,9 +1410,67 @@ Reader_clear(PyObject *op)
     Py_CLEAR(self->dialect);
     Py_CLEAR(self->input_iter);
     Py_CLEAR(self->fields);
+    Py_CLEAR(self->converters);
+    return 0;
+}
+
+/* Return a tuple of the converters, or NULL if converters is None. */
+static PyObject *
+make_converters(PyObject *converters)
+{
+    if (converters == Py_None) {
+        return NULL;
+    }
+    PyObject *tuple = PySequence_Tuple(converters);
+    if (tuple == NULL) {
+        return NULL;
+    }
+    for (Py_ssize_t i = 0; i < PyTuple_GET_SIZE(tuple); i++) {
+        PyObject *item = PyTuple_GET_ITEM(tuple, i);
+        if (item != Py_None && !PyCallable_Check(item)) {
+            PyErr_Format(PyExc_TypeError,
+                         "converters must be callables or None, not %.200s",
+                         Py_TYPE(item)->tp_name);
+            Py_DECREF(tuple);
+            return NULL;
+        }
+    }
+    return tuple;
+}
+
+static PyObject *
+Reader_get_converters(PyObject *op, void *Py_UNUSED(ignored))
+{
+    ReaderObj *self = _ReaderObj_CAST(op);
+    PyObject *result;
+    Py_BEGIN_CRITICAL_SECTION(op);
+    result = Py_NewRef(self->converters ? self->converters : Py_None);
+    Py_END_CRITICAL_SECTION();
+    return result;
+}
+
+static int
+Reader_set_converters(PyObject *op, PyObject *value, void *Py_UNUSED(ignored))
+{
+    ReaderObj *self = _ReaderObj_CAST(op);
+    if (value == NULL) {
+        value = Py_None;
+    }
+    PyObject *converters = make_converters(value);
+    if (converters == NULL && PyErr_Occurred()) {
+        return -1;
+    }
+    Py_BEGIN_CRITICAL_SECTION(op);
+    Py_XSETREF(self->converters, converters);
+    Py_END_CRITICAL_SECTION();
     return 0;
 }
 
+static PyGetSetDef Reader_getsetlist[] = {
+    {"converters", Reader_get_converters, Reader_set_converters},
+    {NULL},
+};
+
 PyDoc_STRVAR(Reader_Type_doc,
 "CSV reader\n"
 "\n"
@@ -1039,6 +1479,8 @@ PyDoc_STRVAR(Reader_Type_doc,
 );
 
 static struct PyMethodDef Reader_methods[] = {
+    { "read_columns", _PyCFunction_CAST(Reader_read_columns),
+        METH_VARARGS | METH_KEYWORDS, Reader_read_columns_doc},
     { NULL, NULL }
 };
 #define R_OFF(x) offsetof(ReaderObj, x)
@@ -1059,6 +1501,7 @@ static PyType_Slot Reader_Type_slots[] = {
     {Py_tp_iternext, Reader_iternext},
     {Py_tp_methods, Reader_methods},
     {Py_tp_members, Reader_memberlist},
+    {Py_tp_getset, Reader_getsetlist},
     {Py_tp_clear, Reader_clear},
     {Py_tp_dealloc, Reader_dealloc},
     {0, NULL}
@@ -1076,7 +1519,7 @@ PyType_Spec Reader_Type_spec = {
 static PyObject *
 csv_reader(PyObject *module, PyObject *args, PyObject *keyword_args)
 {
-    PyObject * iterator, * dialect = NULL;
+    PyObject * iterator, * dialect = NULL, * converters = NULL;
     _csvstate *module_state = get_csv_state(module);
     ReaderObj * self = PyObject_GC_New(
         ReaderObj,
@@ -1091,6 +1534,7 @@ csv_reader(PyObject *module, PyObject *args, PyObject *keyword_args)
     self->field = NULL;
     self->field_size = 0;
     self->line_num = 0;
+    self->converters = NULL;
 
     if (parse_reset(self) < 0) {
         Py_DECREF(self);
@@ -1106,8 +1550,41 @@ csv_reader(PyObject *module, PyObject *args, PyObject *keyword_args)
         Py_DECREF(self);
         return NULL;
     }
+    if (keyword_args != NULL) {
+        /* converters is not a formatting parameter of the dialect */
+        if (PyDict_GetItemStringRef(keyword_args, "converters",
+                                    &converters) < 0) {
+            Py_DECREF(self);
+            return NULL;
+        }
+    }
+    if (converters != NULL) {
+        keyword_args = PyDict_Copy(keyword_args);
+        if (keyword_args == NULL ||
+            PyDict_DelItemString(keyword_args, "converters") < 0)
+        {
+            Py_XDECREF(keyword_args);
+            Py_DECREF(converters);
+            Py_DECREF(self);
+            return NULL;
+        }
+        self->converters = make_converters(converters);
+        Py_DECREF(converters);
+        if (self->converters == NULL && PyErr_Occurred()) {
+            Py_DECREF(keyword_args);
+            Py_DECREF(self);
+            return NULL;
+        }
+        if (PyDict_GET_SIZE(keyword_args) == 0) {
+            Py_SETREF(keyword_args, NULL);
+        }
+    }
+    else {
+        Py_XINCREF(keyword_args);
+    }
     self->dialect = (DialectObj *)_call_dialect(module_state, dialect,
                                                 keyword_args);
+    Py_XDECREF(keyword_args);
     if (self->dialect == NULL) {
         Py_DECREF(self);
         return NULL;
@@ -1719,7 +2196,8 @@ PyType_Spec error_spec = {
 PyDoc_STRVAR(csv_module_doc, "CSV parsing and writing.\n");
 
 PyDoc_STRVAR(csv_reader_doc,
-"reader($module, iterable, /, dialect='excel', **fmtparams)\n"
+"reader($module, iterable, /, dialect='excel', *, converters=None,\n"
+"       **fmtparams)\n"
 "--\n\n"
 "Return a reader object that will process lines from the given iterable.\n"
 "\n"
@@ -1729,6 +2207,10 @@ PyDoc_STRVAR(csv_reader_doc,
 "also accepts optional keyword arguments which override settings\n"
 "provided by the dialect.\n"
 "\n"
+"The optional \"converters\" argument is a sequence of callables, or\n"
+"None for fields which are returned unchanged.  Each field of a row is\n"
+"passed to the converter at the same position.\n"
+"\n"
 "The returned object is an iterator.  Each iteration returns a row\n"
 "of the CSV file (which can span multiple input lines).\n");
 
@@ -14,8 +14,9 @@
 /*[clinic input]
 module _functools
 class _functools._lru_cache_wrapper "PyObject *" "&lru_cache_type_spec"
+class _functools._policy_cache_wrapper "PyObject *" "&policy_cache_type_spec"
 [clinic start generated code]*/
-/*[clinic end generated code: output=da39a3ee5e6b4b0d input=bece4053896b09c0]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=25ea6a5993bb7e77]*/
 
 /* _functools module written and maintained
    by Hye-Shik Chang <perky@FreeBSD.org>
@@ -32,6 +33,7 @@ typedef struct _functools_state {
     PyTypeObject *partial_type;
     PyTypeObject *keyobject_type;
     PyTypeObject *lru_list_elem_type;
+    PyTypeObject *policy_list_elem_type;
 } _functools_state;
 
 static inline _functools_state *
@@ -1141,6 +1143,13 @@ _functools_reduce_impl(PyObject *module, PyObject *func, PyObject *seq,
        from being called more than once.  In the C version, the "known hash"
        variants of dictionary calls as used to the same effect.
 
+   A sharded cache (shards > 1) owns a tuple of independent lru_cache objects
+   of the same kind, each with its own dict, linked list, statistics and
+   critical section.  The key and its hash are computed once by the sharded
+   wrapper, and the mixed hash selects the shard that handles the call, so
+   that concurrent calls with different keys rarely contend on the same
+   lock.
+
 */
 
 struct lru_list_elem;
@@ -1195,6 +1204,8 @@ typedef struct lru_cache_object {
     PyObject *kwd_mark;
     PyTypeObject *lru_list_elem_type;
     PyObject *cache_info_type;
+    /* tuple of lru_cache objects for a sharded cache, or NULL */
+    PyObject *shards;
     PyObject *dict;
     PyObject *weakreflist;
 } lru_cache_object;
@@ -1274,19 +1285,13 @@ uncached_lru_cache_wrapper(lru_cache_object *self, PyObject *args, PyObject *kwd
     return result;
 }
 
+/* Note:  key is stolen by the functions taking a known hash. */
+
 static PyObject *
-infinite_lru_cache_wrapper(lru_cache_object *self, PyObject *args, PyObject *kwds)
+infinite_lru_cache_call(lru_cache_object *self, PyObject *args, PyObject *kwds,
+                        PyObject *key, Py_hash_t hash)
 {
     PyObject *result;
-    Py_hash_t hash;
-    PyObject *key = lru_cache_make_key(self->kwd_mark, args, kwds, self->typed);
-    if (!key)
-        return NULL;
-    hash = PyObject_Hash(key);
-    if (hash == -1) {
-        Py_DECREF(key);
-        return NULL;
-    }
     int res = _PyDict_GetItemRef_KnownHash((PyDictObject *)self->cache, key, hash, &result);
     if (res > 0) {
         FT_ATOMIC_ADD_SSIZE(self->hits, 1);
@@ -1312,6 +1317,21 @@ infinite_lru_cache_wrapper(lru_cache_object *self, PyObject *args, PyObject *kwd
     return result;
 }
 
+static PyObject *
+infinite_lru_cache_wrapper(lru_cache_object *self, PyObject *args, PyObject *kwds)
+{
+    Py_hash_t hash;
+    PyObject *key = lru_cache_make_key(self->kwd_mark, args, kwds, self->typed);
+    if (!key)
+        return NULL;
+    hash = PyObject_Hash(key);
+    if (hash == -1) {
+        Py_DECREF(key);
+        return NULL;
+    }
+    return infinite_lru_cache_call(self, args, kwds, key, hash);
+}
+
 static void
 lru_cache_extract_link(lru_list_elem *link)
 {
@@ -1322,9 +1342,8 @@ lru_cache_extract_link(lru_list_elem *link)
 }
 
 static void
-lru_cache_append_link(lru_cache_object *self, lru_list_elem *link)
+lru_cache_append_link(lru_list_elem *root, lru_list_elem *link)
 {
-    lru_list_elem *root = &self->root;
     lru_list_elem *last = root->prev;
     last->next = root->prev = link;
     link->prev = last;
@@ -1332,9 +1351,8 @@ lru_cache_append_link(lru_cache_object *self, lru_list_elem *link)
 }
 
 static void
-lru_cache_prepend_link(lru_cache_object *self, lru_list_elem *link)
+lru_cache_prepend_link(lru_list_elem *root, lru_list_elem *link)
 {
-    lru_list_elem *root = &self->root;
     lru_list_elem *first = root->next;
     first->prev = root->next = link;
     link->prev = root;
@@ -1373,34 +1391,24 @@ lru_cache_prepend_link(lru_cache_object *self, lru_list_elem *link)
  */
 
 static int
-bounded_lru_cache_get_lock_held(lru_cache_object *self, PyObject *args, PyObject *kwds,
-                                PyObject **result, PyObject **key, Py_hash_t *hash)
+bounded_lru_cache_get_lock_held(lru_cache_object *self, PyObject *key,
+                                Py_hash_t hash, PyObject **result)
 {
     _Py_CRITICAL_SECTION_ASSERT_OBJECT_LOCKED(self);
     lru_list_elem *link;
 
-    PyObject *key_ = *key = lru_cache_make_key(self->kwd_mark, args, kwds, self->typed);
-    if (!key_)
-        return -1;
-    Py_hash_t hash_ = *hash = PyObject_Hash(key_);
-    if (hash_ == -1) {
-        Py_DECREF(key_);  /* dead reference left in *key, is not used */
-        return -1;
-    }
-    int res = _PyDict_GetItemRef_KnownHash_LockHeld((PyDictObject *)self->cache, key_, hash_,
+    int res = _PyDict_GetItemRef_KnownHash_LockHeld((PyDictObject *)self->cache, key, hash,
                                                     (PyObject **)&link);
     if (res > 0) {
         lru_cache_extract_link(link);
-        lru_cache_append_link(self, link);
+        lru_cache_append_link(&self->root, link);
         *result = link->result;
         FT_ATOMIC_ADD_SSIZE(self->hits, 1);
         Py_INCREF(link->result);
         Py_DECREF(link);
-        Py_DECREF(key_);
         return 1;
     }
     if (res < 0) {
-        Py_DECREF(key_);
         return -1;
     }
     FT_ATOMIC_ADD_SSIZE(self->misses, 1);
@@ -1469,7 +1477,7 @@ bounded_lru_cache_update_lock_held(lru_cache_object *self,
             Py_DECREF(link);
             return NULL;
         }
-        lru_cache_append_link(self, link);
+        lru_cache_append_link(&self->root, link);
         return Py_NewRef(result);
     }
     /* Since the cache is full, we need to evict an old key and add
@@ -1502,7 +1510,7 @@ bounded_lru_cache_update_lock_held(lru_cache_object *self,
            original position as the oldest link.  Then we allow the
            error propagate upward; treating it the same as an error
            arising in the user function. */
-        lru_cache_prepend_link(self, link);
+        lru_cache_prepend_link(&self->root, link);
         Py_DECREF(key);
         Py_DECREF(result);
         return NULL;
@@ -1545,7 +1553,7 @@ bounded_lru_cache_update_lock_held(lru_cache_object *self,
         Py_DECREF(oldresult);
         return NULL;
     }
-    lru_cache_append_link(self, link);
+    lru_cache_append_link(&self->root, link);
     Py_INCREF(result); /* for return */
     Py_DECREF(popresult);
     Py_DECREF(oldkey);
@@ -1554,20 +1562,22 @@ bounded_lru_cache_update_lock_held(lru_cache_object *self,
 }
 
 static PyObject *
-bounded_lru_cache_wrapper(lru_cache_object *self, PyObject *args, PyObject *kwds)
+bounded_lru_cache_call(lru_cache_object *self, PyObject *args, PyObject *kwds,
+                       PyObject *key, Py_hash_t hash)
 {
-    PyObject *key, *result;
-    Py_hash_t hash;
+    PyObject *result;
     int res;
 
     Py_BEGIN_CRITICAL_SECTION(self);
-    res = bounded_lru_cache_get_lock_held(self, args, kwds, &result, &key, &hash);
+    res = bounded_lru_cache_get_lock_held(self, key, hash, &result);
     Py_END_CRITICAL_SECTION();
 
     if (res < 0) {
+        Py_DECREF(key);
         return NULL;
     }
     if (res > 0) {
+        Py_DECREF(key);
         return result;
     }
 
@@ -1584,21 +1594,103 @@ bounded_lru_cache_wrapper(lru_cache_object *self, PyObject *args, PyObject *kwds
     return result;
 }
 
+static PyObject *
+bounded_lru_cache_wrapper(lru_cache_object *self, PyObject *args, PyObject *kwds)
+{
+    Py_hash_t hash;
+    PyObject *key = lru_cache_make_key(self->kwd_mark, args, kwds, self->typed);
+    if (!key)
+        return NULL;
+    hash = PyObject_Hash(key);
+    if (hash == -1) {
+        Py_DECREF(key);
+        return NULL;
+    }
+    return bounded_lru_cache_call(self, args, kwds, key, hash);
+}
+
+/* The dicts of the shards index their keys by the low bits of the hash,
+   so the shard is picked from the high bits of the mixed hash instead.
+   Otherwise, with a power-of-two number of shards, all keys of a shard
+   would start probing at the same slot. */
+static Py_ssize_t
+lru_cache_shard_index(Py_hash_t hash, Py_ssize_t nshards)
+{
+    uint64_t mixed = (uint64_t)(Py_uhash_t)hash * 0x9E3779B97F4A7C15ULL;
+    return (Py_ssize_t)(((mixed >> 32) * (uint64_t)nshards) >> 32);
+}
+
+static PyObject *
+sharded_lru_cache_wrapper(lru_cache_object *self, PyObject *args, PyObject *kwds)
+{
+    Py_hash_t hash;
+    lru_cache_object *shard;
+    PyObject *key = lru_cache_make_key(self->kwd_mark, args, kwds, self->typed);
+    if (!key)
+        return NULL;
+    hash = PyObject_Hash(key);
+    if (hash == -1) {
+        Py_DECREF(key);
+        return NULL;
+    }
+    shard = lru_cache_object_CAST(PyTuple_GET_ITEM(
+        self->shards, lru_cache_shard_index(hash,
+                                            PyTuple_GET_SIZE(self->shards))));
+    if (shard->wrapper == infinite_lru_cache_wrapper) {
+        return infinite_lru_cache_call(shard, args, kwds, key, hash);
+    }
+    return bounded_lru_cache_call(shard, args, kwds, key, hash);
+}
+
+static lru_cache_object *
+lru_cache_alloc(PyTypeObject *type, _functools_state *state,
+                lru_cache_ternaryfunc wrapper, PyObject *func,
+                Py_ssize_t maxsize, int typed, PyObject *cache_info_type)
+{
+    PyObject *cachedict;
+    lru_cache_object *obj;
+
+    if (!(cachedict = PyDict_New()))
+        return NULL;
+
+    obj = (lru_cache_object *)type->tp_alloc(type, 0);
+    if (obj == NULL) {
+        Py_DECREF(cachedict);
+        return NULL;
+    }
+
+    obj->root.prev = &obj->root;
+    obj->root.next = &obj->root;
+    obj->wrapper = wrapper;
+    obj->typed = typed;
+    obj->cache = cachedict;
+    obj->func = Py_NewRef(func);
+    obj->misses = obj->hits = 0;
+    obj->maxsize = maxsize;
+    obj->kwd_mark = Py_NewRef(state->kwd_mark);
+    obj->lru_list_elem_type = (PyTypeObject*)Py_NewRef(state->lru_list_elem_type);
+    obj->cache_info_type = Py_NewRef(cache_info_type);
+    obj->shards = NULL;
+    obj->dict = NULL;
+    obj->weakreflist = NULL;
+    return obj;
+}
+
 static PyObject *
 lru_cache_new(PyTypeObject *type, PyObject *args, PyObject *kw)
 {
-    PyObject *func, *maxsize_O, *cache_info_type, *cachedict;
+    PyObject *func, *maxsize_O, *cache_info_type, *shards;
     int typed;
     lru_cache_object *obj;
-    Py_ssize_t maxsize;
-    PyObject *(*wrapper)(lru_cache_object *, PyObject *, PyObject *);
+    Py_ssize_t maxsize, nshards = 1;
+    lru_cache_ternaryfunc wrapper;
     _functools_state *state;
     static char *keywords[] = {"user_function", "maxsize", "typed",
-                               "cache_info_type", NULL};
+                               "cache_info_type", "shards", NULL};
 
-    if (!PyArg_ParseTupleAndKeywords(args, kw, "OOpO:lru_cache", keywords,
+    if (!PyArg_ParseTupleAndKeywords(args, kw, "OOpO|n:lru_cache", keywords,
                                      &func, &maxsize_O, &typed,
-                                     &cache_info_type)) {
+                                     &cache_info_type, &nshards)) {
         return NULL;
     }
 
@@ -1608,6 +1700,12 @@ lru_cache_new(PyTypeObject *type, PyObject *args, PyObject *kw)
         return NULL;
     }
 
+    if (nshards < 1) {
+        PyErr_SetString(PyExc_ValueError,
+                        "shards must be greater than 0");
+        return NULL;
+    }
+
     state = get_functools_state_by_type(type);
     if (state == NULL) {
         return NULL;
@@ -1634,28 +1732,40 @@ lru_cache_new(PyTypeObject *type, PyObject *args, PyObject *kw)
         return NULL;
     }
 
-    if (!(cachedict = PyDict_New()))
-        return NULL;
+    /* Every shard of a bounded cache holds at least one entry. */
+    if (maxsize >= 0 && nshards > maxsize) {
+        nshards = maxsize;
+    }
+    if (nshards <= 1) {
+        return (PyObject *)lru_cache_alloc(type, state, wrapper, func, maxsize,
+                                           typed, cache_info_type);
+    }
 
-    obj = (lru_cache_object *)type->tp_alloc(type, 0);
+    /* The maxsize is split as evenly as possible between the shards. */
+    shards = PyTuple_New(nshards);
+    if (shards == NULL) {
+        return NULL;
+    }
+    for (Py_ssize_t i = 0; i < nshards; i++) {
+        Py_ssize_t shard_maxsize = maxsize;
+        if (maxsize > 0) {
+            shard_maxsize = maxsize / nshards + (i < maxsize % nshards);
+        }
+        PyObject *shard = (PyObject *)lru_cache_alloc(
+            type, state, wrapper, func, shard_maxsize, typed, cache_info_type);
+        if (shard == NULL) {
+            Py_DECREF(shards);
+            return NULL;
+        }
+        PyTuple_SET_ITEM(shards, i, shard);
+    }
+    obj = lru_cache_alloc(type, state, sharded_lru_cache_wrapper, func,
+                          maxsize, typed, cache_info_type);
     if (obj == NULL) {
-        Py_DECREF(cachedict);
+        Py_DECREF(shards);
         return NULL;
     }
-
-    obj->root.prev = &obj->root;
-    obj->root.next = &obj->root;
-    obj->wrapper = wrapper;
-    obj->typed = typed;
-    obj->cache = cachedict;
-    obj->func = Py_NewRef(func);
-    obj->misses = obj->hits = 0;
-    obj->maxsize = maxsize;
-    obj->kwd_mark = Py_NewRef(state->kwd_mark);
-    obj->lru_list_elem_type = (PyTypeObject*)Py_NewRef(state->lru_list_elem_type);
-    obj->cache_info_type = Py_NewRef(cache_info_type);
-    obj->dict = NULL;
-    obj->weakreflist = NULL;
+    obj->shards = shards;
     return (PyObject *)obj;
 }
 
@@ -1690,6 +1800,7 @@ lru_cache_tp_clear(PyObject *op)
     Py_CLEAR(self->kwd_mark);
     Py_CLEAR(self->lru_list_elem_type);
     Py_CLEAR(self->cache_info_type);
+    Py_CLEAR(self->shards);
     Py_CLEAR(self->dict);
     lru_cache_clear_list(list);
     return 0;
@@ -1739,6 +1850,22 @@ _functools__lru_cache_wrapper_cache_info_impl(PyObject *self)
 /*[clinic end generated code: output=cc796a0b06dbd717 input=00e1acb31aa21ecc]*/
 {
     lru_cache_object *_self = (lru_cache_object *) self;
+    if (_self->shards != NULL) {
+        Py_ssize_t hits = 0, misses = 0, currsize = 0;
+        for (Py_ssize_t i = 0; i < PyTuple_GET_SIZE(_self->shards); i++) {
+            lru_cache_object *shard =
+                lru_cache_object_CAST(PyTuple_GET_ITEM(_self->shards, i));
+            hits += FT_ATOMIC_LOAD_SSIZE_RELAXED(shard->hits);
+            misses += FT_ATOMIC_LOAD_SSIZE_RELAXED(shard->misses);
+            currsize += PyDict_GET_SIZE(shard->cache);
+        }
+        if (_self->maxsize == -1) {
+            return PyObject_CallFunction(_self->cache_info_type, "nnOn",
+                                         hits, misses, Py_None, currsize);
+        }
+        return PyObject_CallFunction(_self->cache_info_type, "nnnn",
+                                     hits, misses, _self->maxsize, currsize);
+    }
     if (_self->maxsize == -1) {
         return PyObject_CallFunction(_self->cache_info_type, "nnOn",
                                      FT_ATOMIC_LOAD_SSIZE_RELAXED(_self->hits),
@@ -1765,6 +1892,17 @@ _functools__lru_cache_wrapper_cache_clear_impl(PyObject *self)
 /*[clinic end generated code: output=58423b35efc3e381 input=dfa33acbecf8b4b2]*/
 {
     lru_cache_object *_self = (lru_cache_object *) self;
+    if (_self->shards != NULL) {
+        for (Py_ssize_t i = 0; i < PyTuple_GET_SIZE(_self->shards); i++) {
+            PyObject *res = _functools__lru_cache_wrapper_cache_clear(
+                PyTuple_GET_ITEM(_self->shards, i), NULL);
+            if (res == NULL) {
+                return NULL;
+            }
+            Py_DECREF(res);
+        }
+        Py_RETURN_NONE;
+    }
     lru_list_elem *list = lru_cache_unlink_list(_self);
     FT_ATOMIC_STORE_SSIZE_RELAXED(_self->hits, 0);
     FT_ATOMIC_STORE_SSIZE_RELAXED(_self->misses, 0);
@@ -1815,6 +1953,7 @@ lru_cache_tp_traverse(PyObject *op, visitproc visit, void *arg)
     Py_VISIT(self->kwd_mark);
     Py_VISIT(self->lru_list_elem_type);
     Py_VISIT(self->cache_info_type);
+    Py_VISIT(self->shards);
     Py_VISIT(self->dict);
     return 0;
 }
@@ -1833,7 +1972,10 @@ typed:    False     cache f(3) and f(3.0) as identical calls\n\
           True      cache f(3) and f(3.0) as distinct calls\n\
 \n\
 cache_info_type:    namedtuple class with the fields:\n\
-                        hits misses currsize maxsize\n"
+                        hits misses currsize maxsize\n\
+\n\
+shards:   n         split the cache between n independently locked\n\
+                    caches, selected by the hash of the arguments\n"
 );
 
 static PyMethodDef lru_cache_methods[] = {
@@ -1845,8 +1987,18 @@ static PyMethodDef lru_cache_methods[] = {
     {NULL}
 };
 
+/* The number of shards actually used, which is at most maxsize. */
+static PyObject *
+lru_cache_get_shards(PyObject *op, void *Py_UNUSED(closure))
+{
+    lru_cache_object *self = lru_cache_object_CAST(op);
+    PyObject *shards = self->shards;
+    return PyLong_FromSsize_t(shards == NULL ? 1 : PyTuple_GET_SIZE(shards));
+}
+
 static PyGetSetDef lru_cache_getsetlist[] = {
     {"__dict__", PyObject_GenericGetDict, PyObject_GenericSetDict},
+    {"_shards", lru_cache_get_shards, NULL},
     {NULL}
 };
 
@@ -1881,81 +2033,944 @@ static PyType_Spec lru_cache_type_spec = {
 };
 
 
-/* module level code ********************************************************/
+/* policy_cache object *******************************************************/
 
-PyDoc_STRVAR(_functools_doc,
-"Tools that operate on functions.");
+/* The C version of _policy_cache_wrapper() in functools.py.  The links of the
+   lru_cache are extended with the weight, the expiration time and the segment
+   of an entry.  Each segment is a circular list of links, least recently used
+   first, like the list of the lru_cache.  All links are also kept in a second
+   list in the order in which they were added, which is the order in which
+   they expire, so that the expired entries can be dropped from its front on
+   every call.
 
-static PyMethodDef _functools_methods[] = {
-    _FUNCTOOLS_REDUCE_METHODDEF
-    _FUNCTOOLS_CMP_TO_KEY_METHODDEF
-    {NULL,              NULL}           /* sentinel */
+   As in the Python version, the timer and the weigher are called outside of
+   the critical section, so that they cannot reenter the cache while its lists
+   are being updated.  The other sources of reentrancy are the same as for the
+   bounded lru_cache (see the general note above) and are dealt with the same
+   way: the links are unlinked before being popped from the cache dict, and
+   the links removed from the cache are chained in a "garbage" list, which is
+   only released once the cache is in a consistent state.
+*/
+
+enum {
+    POLICY_WINDOW,
+    POLICY_PROBATION,
+    POLICY_PROTECTED,
+    POLICY_NSEGMENTS
 };
 
-static int
-_functools_exec(PyObject *module)
+typedef struct policy_list_elem {
+    lru_list_elem link;  /* segment links, hash, key and result */
+    struct policy_list_elem *order_prev, *order_next;  /* borrowed links */
+    Py_ssize_t weight;
+    double expires;
+    int segment;
+} policy_list_elem;
+
+static PyType_Slot policy_list_elem_type_slots[] = {
+    {Py_tp_dealloc, lru_list_elem_dealloc},
+    {0, 0}
+};
+
+static PyType_Spec policy_list_elem_type_spec = {
+    .name = "functools._policy_list_elem",
+    .basicsize = sizeof(policy_list_elem),
+    .flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_DISALLOW_INSTANTIATION |
+             Py_TPFLAGS_IMMUTABLETYPE,
+    .slots = policy_list_elem_type_slots
+};
+
+typedef struct policy_cache_object {
+    PyObject_HEAD
+    PyObject *cache;
+    PyObject *func;
+    PyObject *kwd_mark;
+    PyTypeObject *policy_list_elem_type;
+    PyObject *cache_info_type;
+    PyObject *weigher;  /* NULL if every result weighs 1 */
+    PyObject *timer;    /* NULL for the monotonic clock */
+    int typed;
+    int tinylfu;
+    int has_ttl;
+    double ttl;
+    Py_ssize_t maxsize;  /* -1 for an unbounded cache */
+    Py_ssize_t window_size;
+    Py_ssize_t protected_size;
+    lru_list_elem segments[POLICY_NSEGMENTS];  /* roots of the segments */
+    Py_ssize_t weights[POLICY_NSEGMENTS];
+    policy_list_elem order;  /* root of the list in order of addition */
+    /* count-min sketch of the key frequencies for the tinylfu policy */
+    uint8_t *sketch;
+    Py_ssize_t sketch_mask;
+    Py_ssize_t additions;
+    Py_ssize_t sample_size;
+    Py_ssize_t hits;
+    Py_ssize_t misses;
+    Py_ssize_t evictions;
+    Py_ssize_t expirations;
+    PyObject *dict;
+    PyObject *weakreflist;
+} policy_cache_object;
+
+#define policy_cache_object_CAST(op)    ((policy_cache_object *)(op))
+
+/* The sketch has four rows of counters saturating at 15, which are all
+   halved after a number of increments proportional to its size so that old
+   popularity fades out. */
+static void
+policy_cache_sketch_indexes(policy_cache_object *self, Py_hash_t hash,
+                            Py_ssize_t *indexes)
 {
-    _functools_state *state = get_functools_state(module);
-    state->kwd_mark = _PyObject_CallNoArgs((PyObject *)&PyBaseObject_Type);
-    if (state->kwd_mark == NULL) {
-        return -1;
-    }
+    uint64_t h = (uint64_t)(Py_uhash_t)hash;
+    uint64_t mask = (uint64_t)self->sketch_mask;
+    uint64_t width = mask + 1;
+    indexes[0] = (Py_ssize_t)(h & mask);
+    indexes[1] = (Py_ssize_t)(width + (((h >> 16) ^ (h * 0x9E3779B1)) & mask));
+    indexes[2] = (Py_ssize_t)(2 * width +
+                              (((h >> 32) ^ (h * 0x85EBCA77)) & mask));
+    indexes[3] = (Py_ssize_t)(3 * width +
+                              (((h >> 48) ^ (h * 0xC2B2AE3D)) & mask));
+}
 
-    state->placeholder_type = (PyTypeObject *)PyType_FromModuleAndSpec(module,
-        &placeholder_type_spec, NULL);
-    if (state->placeholder_type == NULL) {
-        return -1;
+static void
+policy_cache_increment(policy_cache_object *self, Py_hash_t hash)
+{
+    Py_ssize_t indexes[4];
+    policy_cache_sketch_indexes(self, hash, indexes);
+    for (int i = 0; i < 4; i++) {
+        if (self->sketch[indexes[i]] < 15) {
+            self->sketch[indexes[i]]++;
+        }
     }
-    if (PyModule_AddType(module, state->placeholder_type) < 0) {
-        return -1;
+    if (++self->additions >= self->sample_size) {
+        for (Py_ssize_t i = 0; i < 4 * (self->sketch_mask + 1); i++) {
+            self->sketch[i] >>= 1;
+        }
+        self->additions /= 2;
     }
+}
 
-    PyObject *placeholder = PyObject_CallNoArgs((PyObject *)state->placeholder_type);
-    if (placeholder == NULL) {
-        return -1;
-    }
-    if (PyModule_AddObjectRef(module, "Placeholder", placeholder) < 0) {
-        Py_DECREF(placeholder);
-        return -1;
+static int
+policy_cache_frequency(policy_cache_object *self, Py_hash_t hash)
+{
+    Py_ssize_t indexes[4];
+    int frequency = 15;
+    policy_cache_sketch_indexes(self, hash, indexes);
+    for (int i = 0; i < 4; i++) {
+        frequency = Py_MIN(frequency, self->sketch[indexes[i]]);
     }
-    Py_DECREF(placeholder);
+    return frequency;
+}
 
-    state->partial_type = (PyTypeObject *)PyType_FromModuleAndSpec(module,
-        &partial_type_spec, NULL);
-    if (state->partial_type == NULL) {
-        return -1;
-    }
-    if (PyModule_AddType(module, state->partial_type) < 0) {
+static void
+policy_cache_link(policy_cache_object *self, policy_list_elem *link,
+                  int segment)
+{
+    link->segment = segment;
+    lru_cache_append_link(&self->segments[segment], &link->link);
+    self->weights[segment] += link->weight;
+}
+
+static void
+policy_cache_unlink(policy_cache_object *self, policy_list_elem *link)
+{
+    lru_cache_extract_link(&link->link);
+    self->weights[link->segment] -= link->weight;
+}
+
+static void
+policy_cache_move(policy_cache_object *self, policy_list_elem *link,
+                  int segment)
+{
+    policy_cache_unlink(self, link);
+    policy_cache_link(self, link, segment);
+}
+
+static void
+policy_cache_order_append(policy_cache_object *self, policy_list_elem *link)
+{
+    policy_list_elem *root = &self->order;
+    policy_list_elem *last = root->order_prev;
+    last->order_next = root->order_prev = link;
+    link->order_prev = last;
+    link->order_next = root;
+}
+
+static void
+policy_cache_order_extract(policy_list_elem *link)
+{
+    link->order_prev->order_next = link->order_next;
+    link->order_next->order_prev = link->order_prev;
+}
+
+/* Remove a link from the cache and chain it to the garbage list, which holds
+   the reference of the lists to the link.  On error, the link is restored
+   as the oldest one. */
+static int
+policy_cache_remove(policy_cache_object *self, policy_list_elem *link,
+                    lru_list_elem **garbage)
+{
+    PyObject *popresult;
+    int res;
+
+    policy_cache_unlink(self, link);
+    policy_cache_order_extract(link);
+    res = _PyDict_Pop_KnownHash((PyDictObject *)self->cache, link->link.key,
+                                link->link.hash, &popresult);
+    if (res < 0) {
+        lru_cache_prepend_link(&self->segments[link->segment], &link->link);
+        self->weights[link->segment] += link->weight;
+        policy_list_elem *root = &self->order;
+        policy_list_elem *first = root->order_next;
+        first->order_prev = root->order_next = link;
+        link->order_prev = root;
+        link->order_next = first;
         return -1;
     }
+    /* If res == 0, the link was already an orphan.  Otherwise the link still
+       has the reference of the lists, so dropping the reference of the cache
+       dict cannot run arbitrary code. */
+    Py_XDECREF(popresult);
+    link->link.next = *garbage;
+    *garbage = &link->link;
+    return 0;
+}
 
-    PyObject *lru_cache_type = PyType_FromModuleAndSpec(module,
-        &lru_cache_type_spec, NULL);
-    if (lru_cache_type == NULL) {
+/* Remove a link to make room, counting it as expired if it is. */
+static int
+policy_cache_discard(policy_cache_object *self, policy_list_elem *link,
+                     double now, lru_list_elem **garbage)
+{
+    int expired = self->has_ttl && link->expires <= now;
+    if (policy_cache_remove(self, link, garbage) < 0) {
         return -1;
     }
-    if (PyModule_AddType(module, (PyTypeObject *)lru_cache_type) < 0) {
-        Py_DECREF(lru_cache_type);
-        return -1;
+    if (expired) {
+        self->expirations++;
     }
-    Py_DECREF(lru_cache_type);
-
-    state->keyobject_type = (PyTypeObject *)PyType_FromModuleAndSpec(module,
-        &keyobject_type_spec, NULL);
-    if (state->keyobject_type == NULL) {
-        return -1;
+    else {
+        self->evictions++;
     }
-    // keyobject_type is used only internally.
-    // So we don't expose it in module namespace.
+    return 0;
+}
 
-    state->lru_list_elem_type = (PyTypeObject *)PyType_FromModuleAndSpec(
-        module, &lru_list_elem_type_spec, NULL);
+static int
+policy_cache_purge(policy_cache_object *self, double now,
+                   lru_list_elem **garbage)
+{
+    policy_list_elem *root = &self->order;
+    while (root->order_next != root && root->order_next->expires <= now) {
+        if (policy_cache_remove(self, root->order_next, garbage) < 0) {
+            return -1;
+        }
+        self->expirations++;
+    }
+    return 0;
+}
+
+/* Move a link leaving the window to the main area if it is more popular than
+   the links which have to be evicted to make room. */
+static int
+policy_cache_admit(policy_cache_object *self, policy_list_elem *candidate,
+                   double now, lru_list_elem **garbage)
+{
+    Py_ssize_t weight = candidate->weight;
+    Py_ssize_t room = self->maxsize - self->window_size -
+                      self->weights[POLICY_PROBATION] -
+                      self->weights[POLICY_PROTECTED];
+    Py_ssize_t nvictims = 0;
+    int max_frequency = -1;
+
+    for (int segment = POLICY_PROBATION; segment <= POLICY_PROTECTED;
+         segment++)
+    {
+        lru_list_elem *root = &self->segments[segment];
+        for (lru_list_elem *victim = root->next;
+             victim != root && room < weight; victim = victim->next)
+        {
+            nvictims++;
+            room += ((policy_list_elem *)victim)->weight;
+            max_frequency = Py_MAX(max_frequency,
+                                   policy_cache_frequency(self, victim->hash));
+        }
+    }
+    if (room < weight ||
+        (nvictims &&
+         policy_cache_frequency(self, candidate->link.hash) <= max_frequency))
+    {
+        return policy_cache_discard(self, candidate, now, garbage);
+    }
+    while (nvictims--) {
+        lru_list_elem *root = &self->segments[POLICY_PROBATION];
+        if (root->next == root) {
+            root = &self->segments[POLICY_PROTECTED];
+        }
+        if (policy_cache_discard(self, (policy_list_elem *)root->next, now,
+                                 garbage) < 0) {
+            return -1;
+        }
+    }
+    policy_cache_move(self, candidate, POLICY_PROBATION);
+    return 0;
+}
+
+static int
+policy_cache_get_lock_held(policy_cache_object *self, PyObject *key,
+                           Py_hash_t hash, double now, PyObject **result)
+{
+    _Py_CRITICAL_SECTION_ASSERT_OBJECT_LOCKED(self);
+    lru_list_elem *garbage = NULL;
+    policy_list_elem *link;
+    int res;
+
+    if (self->tinylfu) {
+        policy_cache_increment(self, hash);
+    }
+    if (self->has_ttl && policy_cache_purge(self, now, &garbage) < 0) {
+        res = -1;
+        goto done;
+    }
+    res = _PyDict_GetItemRef_KnownHash_LockHeld((PyDictObject *)self->cache,
+                                                key, hash, (PyObject **)&link);
+    if (res <= 0) {
+        if (res == 0) {
+            FT_ATOMIC_ADD_SSIZE(self->misses, 1);
+        }
+        goto done;
+    }
+    if (self->has_ttl && link->expires <= now) {
+        /* Only reached if the timer went backwards. */
+        res = policy_cache_remove(self, link, &garbage);
+        Py_DECREF(link);
+        if (res == 0) {
+            self->expirations++;
+            FT_ATOMIC_ADD_SSIZE(self->misses, 1);
+        }
+        goto done;
+    }
+    FT_ATOMIC_ADD_SSIZE(self->hits, 1);
+    if (link->segment == POLICY_PROBATION) {
+        /* Promote to the protected segment, demoting its least recently
+           used links to probation if it gets too large. */
+        lru_list_elem *root = &self->segments[POLICY_PROTECTED];
+        policy_cache_move(self, link, POLICY_PROTECTED);
+        while (self->weights[POLICY_PROTECTED] > self->protected_size &&
+               root->next->next != root)
+        {
+            policy_cache_move(self, (policy_list_elem *)root->next,
+                              POLICY_PROBATION);
+        }
+    }
+    else {
+        lru_cache_extract_link(&link->link);
+        lru_cache_append_link(&self->segments[link->segment], &link->link);
+    }
+    *result = Py_NewRef(link->link.result);
+    Py_DECREF(link);
+done:
+    lru_cache_clear_list(garbage);
+    return res;
+}
+
+/* Note:  key is stolen. */
+static int
+policy_cache_put_lock_held(policy_cache_object *self, PyObject *key,
+                           Py_hash_t hash, PyObject *result,
+                           Py_ssize_t weight, double now)
+{
+    _Py_CRITICAL_SECTION_ASSERT_OBJECT_LOCKED(self);
+    lru_list_elem *garbage = NULL;
+    policy_list_elem *link;
+    int res;
+
+    if (self->has_ttl && policy_cache_purge(self, now, &garbage) < 0) {
+        goto error;
+    }
+    res = _PyDict_GetItemRef_KnownHash_LockHeld((PyDictObject *)self->cache,
+                                                key, hash, (PyObject **)&link);
+    if (res > 0) {
+        /* The key was added during the call of the user function.  Replace
+           its link to restart its time to live. */
+        res = policy_cache_remove(self, link, &garbage);
+        Py_DECREF(link);
+    }
+    if (res < 0) {
+        goto error;
+    }
+    if (self->maxsize >= 0 && weight > self->maxsize) {
+        /* Too large to ever fit in the cache. */
+        self->evictions++;
+        Py_DECREF(key);
+        lru_cache_clear_list(garbage);
+        return 0;
+    }
+
+    link = PyObject_New(policy_list_elem, self->policy_list_elem_type);
+    if (link == NULL) {
+        goto error;
+    }
+    link->link.hash = hash;
+    link->link.key = key;
+    link->link.result = Py_NewRef(result);
+    link->weight = weight;
+    link->expires = self->has_ttl ? now + self->ttl : 0.0;
+    if (_PyDict_SetItem_KnownHash_LockHeld((PyDictObject *)self->cache, key,
+                                           (PyObject *)link, hash) < 0) {
+        Py_DECREF(link);
+        lru_cache_clear_list(garbage);
+        return -1;
+    }
+    policy_cache_link(self, link, POLICY_WINDOW);
+    policy_cache_order_append(self, link);
+
+    lru_list_elem *window = &self->segments[POLICY_WINDOW];
+    if (!self->tinylfu) {
+        if (self->maxsize >= 0) {
+            while (self->weights[POLICY_WINDOW] > self->maxsize) {
+                if (policy_cache_discard(self, (policy_list_elem *)window->next,
+                                         now, &garbage) < 0) {
+                    lru_cache_clear_list(garbage);
+                    return -1;
+                }
+            }
+        }
+    }
+    else {
+        while (self->weights[POLICY_WINDOW] > self->window_size) {
+            if (policy_cache_admit(self, (policy_list_elem *)window->next,
+                                   now, &garbage) < 0) {
+                lru_cache_clear_list(garbage);
+                return -1;
+            }
+        }
+    }
+    lru_cache_clear_list(garbage);
+    return 0;
+
+error:
+    Py_DECREF(key);
+    lru_cache_clear_list(garbage);
+    return -1;
+}
+
+static int
+policy_cache_now(policy_cache_object *self, double *now)
+{
+    if (self->timer == NULL) {
+        PyTime_t t;
+        if (PyTime_Monotonic(&t) < 0) {
+            return -1;
+        }
+        *now = PyTime_AsSecondsDouble(t);
+        return 0;
+    }
+    PyObject *res = _PyObject_CallNoArgs(self->timer);
+    if (res == NULL) {
+        return -1;
+    }
+    *now = PyFloat_AsDouble(res);
+    Py_DECREF(res);
+    if (*now == -1.0 && PyErr_Occurred()) {
+        return -1;
+    }
+    return 0;
+}
+
+static Py_ssize_t
+policy_cache_weigh(policy_cache_object *self, PyObject *result)
+{
+    PyObject *res = PyObject_CallOneArg(self->weigher, result);
+    if (res == NULL) {
+        return -1;
+    }
+    Py_ssize_t weight = PyNumber_AsSsize_t(res, NULL);
+    Py_DECREF(res);
+    if (weight == -1 && PyErr_Occurred()) {
+        return -1;
+    }
+    if (weight < 0) {
+        PyErr_SetString(PyExc_ValueError,
+                        "weigher returned a negative weight");
+        return -1;
+    }
+    return weight;
+}
+
+static PyObject *
+policy_cache_call(PyObject *op, PyObject *args, PyObject *kwds)
+{
+    policy_cache_object *self = policy_cache_object_CAST(op);
+    PyObject *key, *result = NULL;
+    Py_hash_t hash;
+    Py_ssize_t weight = 1;
+    double now = 0.0;
+    int res;
+
+    if (self->maxsize == 0) {
+        FT_ATOMIC_ADD_SSIZE(self->misses, 1);
+        return PyObject_Call(self->func, args, kwds);
+    }
+    key = lru_cache_make_key(self->kwd_mark, args, kwds, self->typed);
+    if (key == NULL) {
+        return NULL;
+    }
+    hash = PyObject_Hash(key);
+    if (hash == -1 || (self->has_ttl && policy_cache_now(self, &now) < 0)) {
+        Py_DECREF(key);
+        return NULL;
+    }
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    res = policy_cache_get_lock_held(self, key, hash, now, &result);
+    Py_END_CRITICAL_SECTION();
+    if (res != 0) {
+        Py_DECREF(key);
+        return res > 0 ? result : NULL;
+    }
+
+    result = PyObject_Call(self->func, args, kwds);
+    if (result == NULL) {
+        Py_DECREF(key);
+        return NULL;
+    }
+    if (self->weigher != NULL) {
+        weight = policy_cache_weigh(self, result);
+    }
+    if (weight < 0 || (self->has_ttl && policy_cache_now(self, &now) < 0)) {
+        Py_DECREF(key);
+        Py_DECREF(result);
+        return NULL;
+    }
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    res = policy_cache_put_lock_held(self, key, hash, result, weight, now);
+    Py_END_CRITICAL_SECTION();
+    if (res < 0) {
+        Py_DECREF(result);
+        return NULL;
+    }
+    return result;
+}
+
+static PyObject *
+policy_cache_new(PyTypeObject *type, PyObject *args, PyObject *kw)
+{
+    PyObject *func, *maxsize_O, *ttl_O, *weigher, *timer, *cache_info_type;
+    const char *policy;
+    int typed;
+    Py_ssize_t maxsize = -1;
+    double ttl = 0.0;
+    policy_cache_object *obj;
+    _functools_state *state;
+    static char *keywords[] = {"user_function", "maxsize", "typed", "ttl",
+                               "weigher", "policy", "timer",
+                               "cache_info_type", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kw,
+                                     "OOpOOsOO:_policy_cache_wrapper",
+                                     keywords, &func, &maxsize_O, &typed,
+                                     &ttl_O, &weigher, &policy, &timer,
+                                     &cache_info_type)) {
+        return NULL;
+    }
+
+    if (!PyCallable_Check(func)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "the first argument must be callable");
+        return NULL;
+    }
+    if (maxsize_O != Py_None) {
+        if (!PyIndex_Check(maxsize_O)) {
+            PyErr_SetString(PyExc_TypeError,
+                            "maxsize should be integer or None");
+            return NULL;
+        }
+        maxsize = PyNumber_AsSsize_t(maxsize_O, PyExc_OverflowError);
+        if (maxsize == -1 && PyErr_Occurred()) {
+            return NULL;
+        }
+        if (maxsize < 0) {
+            maxsize = 0;
+        }
+    }
+    if (ttl_O != Py_None) {
+        ttl = PyFloat_AsDouble(ttl_O);
+        if (ttl == -1.0 && PyErr_Occurred()) {
+            return NULL;
+        }
+        if (!(ttl > 0.0)) {
+            PyErr_SetString(PyExc_ValueError, "ttl must be greater than 0");
+            return NULL;
+        }
+    }
+    if (weigher != Py_None && !PyCallable_Check(weigher)) {
+        PyErr_SetString(PyExc_TypeError, "weigher must be callable");
+        return NULL;
+    }
+    if (timer != Py_None && !PyCallable_Check(timer)) {
+        PyErr_SetString(PyExc_TypeError, "timer must be callable");
+        return NULL;
+    }
+    int tinylfu = strcmp(policy, "tinylfu") == 0;
+    if (!tinylfu && strcmp(policy, "lru") != 0) {
+        PyErr_Format(PyExc_ValueError, "unknown cache policy: '%s'", policy);
+        return NULL;
+    }
+    if (tinylfu && maxsize == -1) {
+        PyErr_SetString(PyExc_ValueError,
+                        "the tinylfu policy requires a maxsize");
+        return NULL;
+    }
+
+    state = get_functools_state_by_type(type);
+    if (state == NULL) {
+        return NULL;
+    }
+    obj = (policy_cache_object *)type->tp_alloc(type, 0);
+    if (obj == NULL) {
+        return NULL;
+    }
+    for (int i = 0; i < POLICY_NSEGMENTS; i++) {
+        obj->segments[i].prev = obj->segments[i].next = &obj->segments[i];
+    }
+    obj->order.order_prev = obj->order.order_next = &obj->order;
+    obj->func = Py_NewRef(func);
+    obj->kwd_mark = Py_NewRef(state->kwd_mark);
+    obj->policy_list_elem_type =
+        (PyTypeObject *)Py_NewRef(state->policy_list_elem_type);
+    obj->cache_info_type = Py_NewRef(cache_info_type);
+    obj->weigher = weigher == Py_None ? NULL : Py_NewRef(weigher);
+    obj->timer = timer == Py_None ? NULL : Py_NewRef(timer);
+    obj->typed = typed;
+    obj->tinylfu = tinylfu;
+    obj->has_ttl = ttl_O != Py_None;
+    obj->ttl = ttl;
+    obj->maxsize = maxsize;
+    if (tinylfu) {
+        Py_ssize_t n = Py_MIN(maxsize, (Py_ssize_t)1 << 20);
+        int bits = 0;
+        while (n >> bits) {
+            bits++;
+        }
+        Py_ssize_t width = (Py_ssize_t)1 << Py_MAX(4, bits);
+        obj->window_size = Py_MAX(maxsize / 100, 1);
+        obj->protected_size = (maxsize - obj->window_size) * 4 / 5;
+        obj->sketch_mask = width - 1;
+        obj->sample_size = 10 * width;
+        obj->sketch = PyMem_Calloc(4 * width, 1);
+        if (obj->sketch == NULL) {
+            Py_DECREF(obj);
+            return PyErr_NoMemory();
+        }
+    }
+    obj->cache = PyDict_New();
+    if (obj->cache == NULL) {
+        Py_DECREF(obj);
+        return NULL;
+    }
+    return (PyObject *)obj;
+}
+
+/* Chain all the links of the cache in a list for lru_cache_clear_list(). */
+static lru_list_elem *
+policy_cache_unlink_lists(policy_cache_object *self)
+{
+    lru_list_elem *list = NULL;
+    for (int i = 0; i < POLICY_NSEGMENTS; i++) {
+        lru_list_elem *root = &self->segments[i];
+        if (root->next != root) {
+            root->prev->next = list;
+            list = root->next;
+            root->next = root->prev = root;
+        }
+        self->weights[i] = 0;
+    }
+    self->order.order_prev = self->order.order_next = &self->order;
+    return list;
+}
+
+static int
+policy_cache_tp_clear(PyObject *op)
+{
+    policy_cache_object *self = policy_cache_object_CAST(op);
+    lru_list_elem *list = policy_cache_unlink_lists(self);
+    Py_CLEAR(self->cache);
+    Py_CLEAR(self->func);
+    Py_CLEAR(self->kwd_mark);
+    Py_CLEAR(self->policy_list_elem_type);
+    Py_CLEAR(self->cache_info_type);
+    Py_CLEAR(self->weigher);
+    Py_CLEAR(self->timer);
+    Py_CLEAR(self->dict);
+    lru_cache_clear_list(list);
+    return 0;
+}
+
+static void
+policy_cache_dealloc(PyObject *op)
+{
+    policy_cache_object *obj = policy_cache_object_CAST(op);
+    PyTypeObject *tp = Py_TYPE(obj);
+    PyObject_GC_UnTrack(obj);
+    FT_CLEAR_WEAKREFS(op, obj->weakreflist);
+
+    (void)policy_cache_tp_clear(op);
+    PyMem_Free(obj->sketch);
+    tp->tp_free(obj);
+    Py_DECREF(tp);
+}
+
+static int
+policy_cache_tp_traverse(PyObject *op, visitproc visit, void *arg)
+{
+    policy_cache_object *self = policy_cache_object_CAST(op);
+    Py_VISIT(Py_TYPE(self));
+    for (int i = 0; i < POLICY_NSEGMENTS; i++) {
+        lru_list_elem *root = &self->segments[i];
+        for (lru_list_elem *link = root->next; link != root;
+             link = link->next)
+        {
+            Py_VISIT(link->key);
+            Py_VISIT(link->result);
+            Py_VISIT(Py_TYPE(link));
+        }
+    }
+    Py_VISIT(self->cache);
+    Py_VISIT(self->func);
+    Py_VISIT(self->kwd_mark);
+    Py_VISIT(self->policy_list_elem_type);
+    Py_VISIT(self->cache_info_type);
+    Py_VISIT(self->weigher);
+    Py_VISIT(self->timer);
+    Py_VISIT(self->dict);
+    return 0;
+}
+
+/*[clinic input]
+@critical_section
+_functools._policy_cache_wrapper.cache_info
+
+Report cache statistics
+[clinic start generated code]*/
+
+static PyObject *
+_functools__policy_cache_wrapper_cache_info_impl(PyObject *self)
+/*[clinic end generated code: output=653db7606fff2b2e input=78cef0a54d7a5adf]*/
+{
+    policy_cache_object *_self = policy_cache_object_CAST(self);
+    PyObject *maxsize;
+    if (_self->maxsize == -1) {
+        maxsize = Py_NewRef(Py_None);
+    }
+    else {
+        maxsize = PyLong_FromSsize_t(_self->maxsize);
+        if (maxsize == NULL) {
+            return NULL;
+        }
+    }
+    Py_ssize_t currsize = 0;
+    for (int i = 0; i < POLICY_NSEGMENTS; i++) {
+        currsize += _self->weights[i];
+    }
+    return PyObject_CallFunction(_self->cache_info_type, "nnNnnn",
+                                 FT_ATOMIC_LOAD_SSIZE_RELAXED(_self->hits),
+                                 FT_ATOMIC_LOAD_SSIZE_RELAXED(_self->misses),
+                                 maxsize, currsize, _self->evictions,
+                                 _self->expirations);
+}
+
+/*[clinic input]
+@critical_section
+_functools._policy_cache_wrapper.cache_clear
+
+Clear the cache and cache statistics
+[clinic start generated code]*/
+
+static PyObject *
+_functools__policy_cache_wrapper_cache_clear_impl(PyObject *self)
+/*[clinic end generated code: output=940b9c32d4e9aadb input=c94855c5e8bdc97a]*/
+{
+    policy_cache_object *_self = policy_cache_object_CAST(self);
+    lru_list_elem *list = policy_cache_unlink_lists(_self);
+    FT_ATOMIC_STORE_SSIZE_RELAXED(_self->hits, 0);
+    FT_ATOMIC_STORE_SSIZE_RELAXED(_self->misses, 0);
+    _self->evictions = _self->expirations = 0;
+    if (_self->sketch != NULL) {
+        memset(_self->sketch, 0, 4 * (_self->sketch_mask + 1));
+        _self->additions = 0;
+    }
+    _PyDict_Clear_LockHeld(_self->cache);
+    lru_cache_clear_list(list);
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(policy_cache_doc,
+"Create a cached callable that wraps another function.\n\
+\n\
+user_function:      the function being cached\n\
+\n\
+maxsize:  0         for no caching\n\
+          None      for unlimited cache size\n\
+          n         for a bounded cache\n\
+\n\
+typed:    False     cache f(3) and f(3.0) as identical calls\n\
+          True      cache f(3) and f(3.0) as distinct calls\n\
+\n\
+ttl:      None      results never expire\n\
+          t         results expire t seconds after being computed\n\
+\n\
+weigher:  None      every result weighs 1\n\
+          f         f(result) is the weight of the result\n\
+\n\
+policy:   'lru'     evict the least recently used results\n\
+          'tinylfu' evict with the W-TinyLFU policy\n\
+\n\
+timer:    None      measure the time with time.monotonic()\n\
+          f         measure the time with f()\n\
+\n\
+cache_info_type:    namedtuple class with the fields:\n\
+                        hits misses maxsize currsize evictions expirations\n"
+);
+
+static PyMethodDef policy_cache_methods[] = {
+    _FUNCTOOLS__POLICY_CACHE_WRAPPER_CACHE_INFO_METHODDEF
+    _FUNCTOOLS__POLICY_CACHE_WRAPPER_CACHE_CLEAR_METHODDEF
+    {"__reduce__", lru_cache_reduce, METH_NOARGS},
+    {"__copy__", lru_cache_copy, METH_VARARGS},
+    {"__deepcopy__", lru_cache_deepcopy, METH_VARARGS},
+    {NULL}
+};
+
+static PyGetSetDef policy_cache_getsetlist[] = {
+    {"__dict__", PyObject_GenericGetDict, PyObject_GenericSetDict},
+    {NULL}
+};
+
+static PyMemberDef policy_cache_memberlist[] = {
+    {"__dictoffset__", Py_T_PYSSIZET,
+     offsetof(policy_cache_object, dict), Py_READONLY},
+    {"__weaklistoffset__", Py_T_PYSSIZET,
+     offsetof(policy_cache_object, weakreflist), Py_READONLY},
+    {NULL}  /* Sentinel */
+};
+
+static PyType_Slot policy_cache_type_slots[] = {
+    {Py_tp_dealloc, policy_cache_dealloc},
+    {Py_tp_call, policy_cache_call},
+    {Py_tp_doc, (void *)policy_cache_doc},
+    {Py_tp_traverse, policy_cache_tp_traverse},
+    {Py_tp_clear, policy_cache_tp_clear},
+    {Py_tp_methods, policy_cache_methods},
+    {Py_tp_members, policy_cache_memberlist},
+    {Py_tp_getset, policy_cache_getsetlist},
+    {Py_tp_descr_get, lru_cache_descr_get},
+    {Py_tp_new, policy_cache_new},
+    {0, 0}
+};
+
+static PyType_Spec policy_cache_type_spec = {
+    .name = "functools._policy_cache_wrapper",
+    .basicsize = sizeof(policy_cache_object),
+    .flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC |
+             Py_TPFLAGS_METHOD_DESCRIPTOR | Py_TPFLAGS_IMMUTABLETYPE,
+    .slots = policy_cache_type_slots
+};
+
+
+/* module level code ********************************************************/
+
+PyDoc_STRVAR(_functools_doc,
+"Tools that operate on functions.");
+
+static PyMethodDef _functools_methods[] = {
+    _FUNCTOOLS_REDUCE_METHODDEF
+    _FUNCTOOLS_CMP_TO_KEY_METHODDEF
+    {NULL,              NULL}           /* sentinel */
+};
+
+static int
+_functools_exec(PyObject *module)
+{
+    _functools_state *state = get_functools_state(module);
+    state->kwd_mark = _PyObject_CallNoArgs((PyObject *)&PyBaseObject_Type);
+    if (state->kwd_mark == NULL) {
+        return -1;
+    }
+
+    state->placeholder_type = (PyTypeObject *)PyType_FromModuleAndSpec(module,
+        &placeholder_type_spec, NULL);
+    if (state->placeholder_type == NULL) {
+        return -1;
+    }
+    if (PyModule_AddType(module, state->placeholder_type) < 0) {
+        return -1;
+    }
+
+    PyObject *placeholder = PyObject_CallNoArgs((PyObject *)state->placeholder_type);
+    if (placeholder == NULL) {
+        return -1;
+    }
+    if (PyModule_AddObjectRef(module, "Placeholder", placeholder) < 0) {
+        Py_DECREF(placeholder);
+        return -1;
+    }
+    Py_DECREF(placeholder);
+
+    state->partial_type = (PyTypeObject *)PyType_FromModuleAndSpec(module,
+        &partial_type_spec, NULL);
+    if (state->partial_type == NULL) {
+        return -1;
+    }
+    if (PyModule_AddType(module, state->partial_type) < 0) {
+        return -1;
+    }
+
+    PyObject *lru_cache_type = PyType_FromModuleAndSpec(module,
+        &lru_cache_type_spec, NULL);
+    if (lru_cache_type == NULL) {
+        return -1;
+    }
+    if (PyModule_AddType(module, (PyTypeObject *)lru_cache_type) < 0) {
+        Py_DECREF(lru_cache_type);
+        return -1;
+    }
+    Py_DECREF(lru_cache_type);
+
+    state->keyobject_type = (PyTypeObject *)PyType_FromModuleAndSpec(module,
+        &keyobject_type_spec, NULL);
+    if (state->keyobject_type == NULL) {
+        return -1;
+    }
+    // keyobject_type is used only internally.
+    // So we don't expose it in module namespace.
+
+    state->lru_list_elem_type = (PyTypeObject *)PyType_FromModuleAndSpec(
+        module, &lru_list_elem_type_spec, NULL);
     if (state->lru_list_elem_type == NULL) {
         return -1;
     }
     // lru_list_elem is used only in _lru_cache_wrapper.
     // So we don't expose it in module namespace.
 
+    PyObject *policy_cache_type = PyType_FromModuleAndSpec(module,
+        &policy_cache_type_spec, NULL);
+    if (policy_cache_type == NULL) {
+        return -1;
+    }
+    if (PyModule_AddType(module, (PyTypeObject *)policy_cache_type) < 0) {
+        Py_DECREF(policy_cache_type);
+        return -1;
+    }
+    Py_DECREF(policy_cache_type);
+
+    state->policy_list_elem_type = (PyTypeObject *)PyType_FromModuleAndSpec(
+        module, &policy_list_elem_type_spec, NULL);
+    if (state->policy_list_elem_type == NULL) {
+        return -1;
+    }
+    // policy_list_elem is used only in _policy_cache_wrapper.
+    // So we don't expose it in module namespace.
+
     return 0;
 }
 
@@ -1969,6 +2984,7 @@ _functools_traverse(PyObject *module, visitproc visit, void *arg)
     Py_VISIT(state->partial_type);
     Py_VISIT(state->keyobject_type);
     Py_VISIT(state->lru_list_elem_type);
+    Py_VISIT(state->policy_list_elem_type);
     return 0;
 }
 
@@ -1982,6 +2998,7 @@ _functools_clear(PyObject *module)
     Py_CLEAR(state->partial_type);
     Py_CLEAR(state->keyobject_type);
     Py_CLEAR(state->lru_list_elem_type);
+    Py_CLEAR(state->policy_list_elem_type);
     return 0;
 }
 
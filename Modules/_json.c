@@ -33,8 +33,18 @@ typedef struct _PyScannerObject {
     PyObject *parse_float;
     PyObject *parse_int;
     PyObject *parse_constant;
+    PyObject *plan;     /* decoding plan of the top-level value, or NULL */
+    PyObject *memo;     /* keys kept between calls, or NULL */
+    Py_ssize_t key_cache_size;
+    char columnar;
 } PyScannerObject;
 
+/* Kinds of the decoding plans compiled by json._schema */
+#define PLAN_LIST 0
+#define PLAN_TUPLE 1
+#define PLAN_DICT 2
+#define PLAN_OBJECT 3
+
 #define PyScannerObject_CAST(op)    ((PyScannerObject *)(op))
 
 static PyMemberDef scanner_members[] = {
@@ -44,6 +54,9 @@ static PyMemberDef scanner_members[] = {
     {"parse_float", _Py_T_OBJECT, offsetof(PyScannerObject, parse_float), Py_READONLY, "parse_float"},
     {"parse_int", _Py_T_OBJECT, offsetof(PyScannerObject, parse_int), Py_READONLY, "parse_int"},
     {"parse_constant", _Py_T_OBJECT, offsetof(PyScannerObject, parse_constant), Py_READONLY, "parse_constant"},
+    {"_type_plan", _Py_T_OBJECT, offsetof(PyScannerObject, plan), Py_READONLY},
+    {"columnar", Py_T_BOOL, offsetof(PyScannerObject, columnar), Py_READONLY, "columnar"},
+    {"key_cache_size", Py_T_PYSSIZET, offsetof(PyScannerObject, key_cache_size), Py_READONLY, "key_cache_size"},
     {NULL}
 };
 
@@ -55,12 +68,25 @@ typedef struct _PyEncoderObject {
     PyObject *indent;
     PyObject *key_separator;
     PyObject *item_separator;
+    PyObject *types;    /* dict mapping record classes to their fields */
     char sort_keys;
     char skipkeys;
     int allow_nan;
     int (*fast_encode)(PyUnicodeWriter *, PyObject *);
+    int (*fast_encode_bytes)(PyBytesWriter *, PyObject *);
 } PyEncoderObject;
 
+/* Output of the encoder: a str built by a PyUnicodeWriter or UTF-8 encoded
+   bytes built by a PyBytesWriter.  If write is not NULL, the output is
+   passed to it in chunks of about JSON_CHUNK_SIZE characters or bytes. */
+typedef struct {
+    PyUnicodeWriter *unicode;
+    PyBytesWriter *bytes;
+    PyObject *write;
+} JSONWriter;
+
+#define JSON_CHUNK_SIZE (64 * 1024)
+
 #define PyEncoderObject_CAST(op)    ((PyEncoderObject *)(op))
 
 static PyMemberDef encoder_members[] = {
@@ -83,7 +109,7 @@ static PyObject *
 py_encode_basestring_ascii(PyObject* Py_UNUSED(self), PyObject *pystr);
 
 static PyObject *
-scan_once_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr);
+scan_once_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr, PyObject *plan);
 static PyObject *
 _build_rval_index_tuple(PyObject *rval, Py_ssize_t idx);
 static PyObject *
@@ -100,11 +126,13 @@ encoder_dealloc(PyObject *self);
 static int
 encoder_clear(PyObject *self);
 static int
-encoder_listencode_list(PyEncoderObject *s, PyUnicodeWriter *writer, PyObject *seq, Py_ssize_t indent_level, PyObject *indent_cache);
+encoder_listencode_list(PyEncoderObject *s, JSONWriter *writer, PyObject *seq, Py_ssize_t indent_level, PyObject *indent_cache);
+static int
+encoder_listencode_obj(PyEncoderObject *s, JSONWriter *writer, PyObject *obj, Py_ssize_t indent_level, PyObject *indent_cache);
 static int
-encoder_listencode_obj(PyEncoderObject *s, PyUnicodeWriter *writer, PyObject *obj, Py_ssize_t indent_level, PyObject *indent_cache);
+encoder_listencode_dict(PyEncoderObject *s, JSONWriter *writer, PyObject *dct, Py_ssize_t indent_level, PyObject *indent_cache);
 static int
-encoder_listencode_dict(PyEncoderObject *s, PyUnicodeWriter *writer, PyObject *dct, Py_ssize_t indent_level, PyObject *indent_cache);
+encoder_listencode_record(PyEncoderObject *s, JSONWriter *writer, PyObject *obj, PyObject *fields, Py_ssize_t indent_level, PyObject *indent_cache);
 static PyObject *
 _encoded_const(PyObject *obj);
 static void
@@ -112,7 +140,7 @@ raise_errmsg(const char *msg, PyObject *s, Py_ssize_t end);
 static int
 _steal_accumulate(PyUnicodeWriter *writer, PyObject *stolen);
 static int
-encoder_write_string(PyEncoderObject *s, PyUnicodeWriter *writer, PyObject *obj);
+encoder_write_string(PyEncoderObject *s, JSONWriter *writer, PyObject *obj);
 static PyObject *
 encoder_encode_float(PyEncoderObject *s, PyObject *obj);
 
@@ -187,20 +215,14 @@ ascii_escape_size(const void *input, int kind, Py_ssize_t input_chars)
     return output_size;
 }
 
-static PyObject *
-ascii_escape_unicode_and_size(const void *input, int kind, Py_ssize_t input_chars, Py_ssize_t output_size)
+static void
+ascii_escape_into(const void *input, int kind, Py_ssize_t input_chars, unsigned char *output)
 {
+    /* Write the quoted ASCII-only escaped string to output.
+    output must have room for ascii_escape_size() bytes */
     Py_ssize_t i;
-    Py_ssize_t chars;
-    PyObject *rval;
-    Py_UCS1 *output;
+    Py_ssize_t chars = 0;
 
-    rval = PyUnicode_New(output_size, 127);
-    if (rval == NULL) {
-        return NULL;
-    }
-    output = PyUnicode_1BYTE_DATA(rval);
-    chars = 0;
     output[chars++] = '"';
     for (i = 0; i < input_chars; i++) {
         Py_UCS4 c = PyUnicode_READ(kind, input, i);
@@ -212,6 +234,18 @@ ascii_escape_unicode_and_size(const void *input, int kind, Py_ssize_t input_char
         }
     }
     output[chars++] = '"';
+}
+
+static PyObject *
+ascii_escape_unicode_and_size(const void *input, int kind, Py_ssize_t input_chars, Py_ssize_t output_size)
+{
+    PyObject *rval;
+
+    rval = PyUnicode_New(output_size, 127);
+    if (rval == NULL) {
+        return NULL;
+    }
+    ascii_escape_into(input, kind, input_chars, PyUnicode_1BYTE_DATA(rval));
 #ifdef Py_DEBUG
     assert(_PyUnicode_CheckConsistency(rval, 1));
 #endif
@@ -269,6 +303,36 @@ write_escaped_ascii(PyUnicodeWriter *writer, PyObject *pystr)
     return _steal_accumulate(writer, rval);
 }
 
+static int
+write_escaped_ascii_bytes(PyBytesWriter *writer, PyObject *pystr)
+{
+    Py_ssize_t input_chars = PyUnicode_GET_LENGTH(pystr);
+    const void *input = PyUnicode_DATA(pystr);
+    int kind = PyUnicode_KIND(pystr);
+
+    Py_ssize_t output_size = ascii_escape_size(input, kind, input_chars);
+    if (output_size < 0) {
+        return -1;
+    }
+
+    Py_ssize_t pos = PyBytesWriter_GetSize(writer);
+    if (PyBytesWriter_Grow(writer, output_size) < 0) {
+        return -1;
+    }
+    unsigned char *output = (unsigned char *)PyBytesWriter_GetData(writer) + pos;
+    if (output_size == input_chars + 2) {
+        /* No need to escape anything */
+        assert(kind == PyUnicode_1BYTE_KIND);
+        output[0] = '"';
+        memcpy(output + 1, input, input_chars);
+        output[output_size - 1] = '"';
+    }
+    else {
+        ascii_escape_into(input, kind, input_chars, output);
+    }
+    return 0;
+}
+
 static Py_ssize_t
 escape_size(const void *input, int kind, Py_ssize_t input_chars)
 {
@@ -410,6 +474,149 @@ write_escaped_unicode(PyUnicodeWriter *writer, PyObject *pystr)
     return _steal_accumulate(writer, rval);
 }
 
+static Py_ssize_t
+utf8_escape_size(PyObject *pystr)
+{
+    /* Compute the size of the UTF-8 encoded JSON representation of pystr */
+    Py_ssize_t input_chars = PyUnicode_GET_LENGTH(pystr);
+    const void *input = PyUnicode_DATA(pystr);
+    int kind = PyUnicode_KIND(pystr);
+    Py_ssize_t i;
+    Py_ssize_t output_size;
+
+    for (i = 0, output_size = 2; i < input_chars; i++) {
+        Py_UCS4 c = PyUnicode_READ(kind, input, i);
+        Py_ssize_t d;
+        switch (c) {
+        case '\\': case '"': case '\b': case '\f':
+        case '\n': case '\r': case '\t':
+            d = 2;
+            break;
+        default:
+            if (c <= 0x1f) {
+                d = 6;
+            }
+            else if (c < 0x80) {
+                d = 1;
+            }
+            else if (c < 0x800) {
+                d = 2;
+            }
+            else if (c < 0x10000) {
+                if (Py_UNICODE_IS_SURROGATE(c)) {
+                    /* Lone surrogates cannot be encoded:
+                       let the codec raise the error */
+                    PyObject *encoded = PyUnicode_AsUTF8String(pystr);
+                    assert(encoded == NULL);
+                    Py_XDECREF(encoded);
+                    return -1;
+                }
+                d = 3;
+            }
+            else {
+                d = 4;
+            }
+        }
+        if (output_size > PY_SSIZE_T_MAX - d) {
+            PyErr_SetString(PyExc_OverflowError, "string is too long to escape");
+            return -1;
+        }
+        output_size += d;
+    }
+
+    return output_size;
+}
+
+static int
+write_escaped_unicode_bytes(PyBytesWriter *writer, PyObject *pystr)
+{
+    Py_ssize_t input_chars = PyUnicode_GET_LENGTH(pystr);
+    const void *input = PyUnicode_DATA(pystr);
+    int kind = PyUnicode_KIND(pystr);
+    Py_ssize_t i;
+    Py_ssize_t chars;
+
+    Py_ssize_t output_size = utf8_escape_size(pystr);
+    if (output_size < 0) {
+        return -1;
+    }
+
+    Py_ssize_t pos = PyBytesWriter_GetSize(writer);
+    if (PyBytesWriter_Grow(writer, output_size) < 0) {
+        return -1;
+    }
+    unsigned char *output = (unsigned char *)PyBytesWriter_GetData(writer) + pos;
+    if (output_size == input_chars + 2) {
+        /* No need to escape or encode anything */
+        assert(PyUnicode_IS_ASCII(pystr));
+        output[0] = '"';
+        memcpy(output + 1, input, input_chars);
+        output[output_size - 1] = '"';
+        return 0;
+    }
+
+    chars = 0;
+    output[chars++] = '"';
+    for (i = 0; i < input_chars; i++) {
+        Py_UCS4 c = PyUnicode_READ(kind, input, i);
+        switch (c) {
+        case '\\': output[chars++] = '\\'; output[chars++] = c; break;
+        case '"':  output[chars++] = '\\'; output[chars++] = c; break;
+        case '\b': output[chars++] = '\\'; output[chars++] = 'b'; break;
+        case '\f': output[chars++] = '\\'; output[chars++] = 'f'; break;
+        case '\n': output[chars++] = '\\'; output[chars++] = 'n'; break;
+        case '\r': output[chars++] = '\\'; output[chars++] = 'r'; break;
+        case '\t': output[chars++] = '\\'; output[chars++] = 't'; break;
+        default:
+            if (c <= 0x1f) {
+                output[chars++] = '\\';
+                output[chars++] = 'u';
+                output[chars++] = '0';
+                output[chars++] = '0';
+                output[chars++] = Py_hexdigits[(c >> 4) & 0xf];
+                output[chars++] = Py_hexdigits[(c     ) & 0xf];
+            }
+            else if (c < 0x80) {
+                output[chars++] = c;
+            }
+            else if (c < 0x800) {
+                output[chars++] = 0xc0 | (c >> 6);
+                output[chars++] = 0x80 | (c & 0x3f);
+            }
+            else if (c < 0x10000) {
+                output[chars++] = 0xe0 | (c >> 12);
+                output[chars++] = 0x80 | ((c >> 6) & 0x3f);
+                output[chars++] = 0x80 | (c & 0x3f);
+            }
+            else {
+                output[chars++] = 0xf0 | (c >> 18);
+                output[chars++] = 0x80 | ((c >> 12) & 0x3f);
+                output[chars++] = 0x80 | ((c >> 6) & 0x3f);
+                output[chars++] = 0x80 | (c & 0x3f);
+            }
+        }
+    }
+    output[chars++] = '"';
+    assert(chars == output_size);
+    return 0;
+}
+
+/* The scanner reads either a str or UTF-8 encoded bytes.  All JSON syntax
+   is ASCII, so bytes are read like a 1-byte kind str and only the contents
+   of JSON strings need to be decoded. */
+static inline const void *
+scanner_data(PyObject *pystr, int *kind, Py_ssize_t *length)
+{
+    if (PyBytes_Check(pystr)) {
+        *kind = PyUnicode_1BYTE_KIND;
+        *length = PyBytes_GET_SIZE(pystr);
+        return PyBytes_AS_STRING(pystr);
+    }
+    *kind = PyUnicode_KIND(pystr);
+    *length = PyUnicode_GET_LENGTH(pystr);
+    return PyUnicode_DATA(pystr);
+}
+
 static void
 raise_errmsg(const char *msg, PyObject *s, Py_ssize_t end)
 {
@@ -421,13 +628,35 @@ raise_errmsg(const char *msg, PyObject *s, Py_ssize_t end)
         return;
     }
 
+    PyObject *doc;
+    if (PyBytes_Check(s)) {
+        /* Report the error for the decoded document.  This raises
+           UnicodeDecodeError if the document is not valid UTF-8. */
+        const char *data = PyBytes_AS_STRING(s);
+        doc = PyUnicode_DecodeUTF8(data, PyBytes_GET_SIZE(s), "surrogatepass");
+        if (doc == NULL) {
+            Py_DECREF(JSONDecodeError);
+            return;
+        }
+        /* Count the characters which start before end */
+        Py_ssize_t pos = 0;
+        for (Py_ssize_t i = 0; i < end; i++) {
+            pos += ((data[i] & 0xc0) != 0x80);
+        }
+        end = pos;
+    }
+    else {
+        doc = Py_NewRef(s);
+    }
+
     PyObject *exc;
-    exc = PyObject_CallFunction(JSONDecodeError, "zOn", msg, s, end);
+    exc = PyObject_CallFunction(JSONDecodeError, "zOn", msg, doc, end);
     if (exc) {
         PyErr_SetObject(JSONDecodeError, exc);
         Py_DECREF(exc);
     }
 
+    Py_DECREF(doc);
     Py_DECREF(JSONDecodeError);
 }
 
@@ -471,7 +700,7 @@ _build_rval_index_tuple(PyObject *rval, Py_ssize_t idx) {
 static PyObject *
 scanstring_unicode(PyObject *pystr, Py_ssize_t end, int strict, Py_ssize_t *next_end_ptr)
 {
-    /* Read the JSON string from PyUnicode pystr.
+    /* Read the JSON string from PyUnicode or UTF-8 encoded PyBytes pystr.
     end is the index of the first character after the quote.
     if strict is zero then literal control characters are allowed
     *next_end_ptr is a return-by-reference index of the character
@@ -487,10 +716,9 @@ scanstring_unicode(PyObject *pystr, Py_ssize_t end, int strict, Py_ssize_t *next
     int kind;
 
     PyUnicodeWriter *writer = NULL;
+    int utf8 = PyBytes_Check(pystr);
 
-    len = PyUnicode_GET_LENGTH(pystr);
-    buf = PyUnicode_DATA(pystr);
-    kind = PyUnicode_KIND(pystr);
+    buf = scanner_data(pystr, &kind, &len);
 
     if (end < 0 || len < end) {
         PyErr_SetString(PyExc_ValueError, "end is out of bounds");
@@ -518,7 +746,14 @@ scanstring_unicode(PyObject *pystr, Py_ssize_t end, int strict, Py_ssize_t *next
         if (c == '"') {
             // Fast path for simple case.
             if (writer == NULL) {
-                PyObject *ret = PyUnicode_Substring(pystr, end, next);
+                PyObject *ret;
+                if (utf8) {
+                    ret = PyUnicode_DecodeUTF8((const char *)buf + end,
+                                               next - end, "surrogatepass");
+                }
+                else {
+                    ret = PyUnicode_Substring(pystr, end, next);
+                }
                 if (ret == NULL) {
                     goto bail;
                 }
@@ -538,7 +773,14 @@ scanstring_unicode(PyObject *pystr, Py_ssize_t end, int strict, Py_ssize_t *next
 
         /* Pick up this chunk if it's not zero length */
         if (next != end) {
-            if (PyUnicodeWriter_WriteSubstring(writer, pystr, end, next) < 0) {
+            if (utf8) {
+                if (PyUnicodeWriter_DecodeUTF8Stateful(
+                        writer, (const char *)buf + end, next - end,
+                        "surrogatepass", NULL) < 0) {
+                    goto bail;
+                }
+            }
+            else if (PyUnicodeWriter_WriteSubstring(writer, pystr, end, next) < 0) {
                 goto bail;
             }
         }
@@ -723,6 +965,8 @@ scanner_traverse(PyObject *op, visitproc visit, void *arg)
     Py_VISIT(self->parse_float);
     Py_VISIT(self->parse_int);
     Py_VISIT(self->parse_constant);
+    Py_VISIT(self->plan);
+    Py_VISIT(self->memo);
     return 0;
 }
 
@@ -735,16 +979,162 @@ scanner_clear(PyObject *op)
     Py_CLEAR(self->parse_float);
     Py_CLEAR(self->parse_int);
     Py_CLEAR(self->parse_constant);
+    Py_CLEAR(self->plan);
+    Py_CLEAR(self->memo);
     return 0;
 }
 
+static int
+plan_kind(PyObject *plan)
+{
+    /* Return the kind of the decoding plan, or -1 with an exception set
+       if it is not a valid plan. */
+    if (PyTuple_Check(plan) && PyTuple_GET_SIZE(plan) >= 2) {
+        int kind = PyLong_AsInt(PyTuple_GET_ITEM(plan, 0));
+        if (kind == -1 && PyErr_Occurred()) {
+            return -1;
+        }
+        if (kind == PLAN_LIST || kind == PLAN_TUPLE || kind == PLAN_DICT) {
+            if (PyTuple_GET_SIZE(plan) == 2) {
+                return kind;
+            }
+            /* (PLAN_TUPLE, item_plans, cls) for a named tuple */
+            if (kind == PLAN_TUPLE && PyTuple_GET_SIZE(plan) == 3 &&
+                PyList_Check(PyTuple_GET_ITEM(plan, 1)) &&
+                PyType_Check(PyTuple_GET_ITEM(plan, 2)))
+            {
+                return kind;
+            }
+        }
+        else if (kind == PLAN_OBJECT && PyTuple_GET_SIZE(plan) == 5) {
+            PyObject *names = PyTuple_GET_ITEM(plan, 3);
+            PyObject *descrs = PyTuple_GET_ITEM(plan, 4);
+            if (PyType_Check(PyTuple_GET_ITEM(plan, 1)) &&
+                PyDict_Check(PyTuple_GET_ITEM(plan, 2)) &&
+                PyTuple_Check(names) &&
+                (descrs == Py_None ||
+                 (PyTuple_Check(descrs) &&
+                  PyTuple_GET_SIZE(descrs) == PyTuple_GET_SIZE(names))))
+            {
+                return kind;
+            }
+        }
+    }
+    PyErr_SetString(PyExc_TypeError, "invalid decoding plan");
+    return -1;
+}
+
+static inline PyObject *
+_sub_plan(PyObject *plan)
+{
+    /* None in a plan means that the value is decoded as usual */
+    return plan == Py_None ? NULL : plan;
+}
+
+static PyObject *
+_build_record(PyObject *plan, PyObject **values)
+{
+    /* Create an instance of the class of the PLAN_OBJECT plan from the
+       values of its fields.  values[i] is NULL for missing fields.
+       The references in values are not stolen, but the array can be
+       reordered. */
+    PyObject *cls = PyTuple_GET_ITEM(plan, 1);
+    PyObject *names = PyTuple_GET_ITEM(plan, 3);
+    PyObject *descrs = PyTuple_GET_ITEM(plan, 4);
+    Py_ssize_t nfields = PyTuple_GET_SIZE(names);
+    Py_ssize_t i, n;
+
+    if (descrs == Py_None) {
+        /* cls(**fields), without creating a dict */
+        for (i = n = 0; i < nfields; i++) {
+            if (values[i] != NULL) {
+                n++;
+            }
+        }
+        if (n == nfields) {
+            return PyObject_Vectorcall(cls, values, 0, names);
+        }
+        PyObject *kwnames = PyTuple_New(n);
+        if (kwnames == NULL) {
+            return NULL;
+        }
+        for (i = n = 0; i < nfields; i++) {
+            if (values[i] != NULL) {
+                PyTuple_SET_ITEM(kwnames, n,
+                                 Py_NewRef(PyTuple_GET_ITEM(names, i)));
+                values[n++] = values[i];
+                if (n <= i) {
+                    values[i] = NULL;
+                }
+            }
+        }
+        PyObject *result = PyObject_Vectorcall(cls, values, 0, kwnames);
+        Py_DECREF(kwnames);
+        return result;
+    }
+
+    /* cls.__new__(cls), then set the fields */
+    PyObject *obj = PyObject_CallMethodOneArg(cls, &_Py_ID(__new__), cls);
+    if (obj == NULL) {
+        return NULL;
+    }
+    for (i = 0; i < nfields; i++) {
+        if (values[i] == NULL) {
+            continue;
+        }
+        PyObject *descr = PyTuple_GET_ITEM(descrs, i);
+        int rv;
+        if (descr != Py_None && Py_TYPE(descr)->tp_descr_set != NULL) {
+            rv = Py_TYPE(descr)->tp_descr_set(descr, obj, values[i]);
+        }
+        else {
+            rv = PyObject_SetAttr(obj, PyTuple_GET_ITEM(names, i), values[i]);
+        }
+        if (rv < 0) {
+            Py_DECREF(obj);
+            return NULL;
+        }
+    }
+    return obj;
+}
+
+static int
+_lookup_field(PyObject *fields, PyObject *key, Py_ssize_t nfields,
+              Py_ssize_t *index, PyObject **plan)
+{
+    /* Find the field key of a PLAN_OBJECT plan.  Set *index to its index,
+       or to -1 if the class has no such field, and *plan to a new
+       reference to its plan, or NULL. */
+    PyObject *field;
+    *index = -1;
+    *plan = NULL;
+    if (PyDict_GetItemRef(fields, key, &field) <= 0) {
+        return PyErr_Occurred() ? -1 : 0;
+    }
+    if (PyTuple_Check(field) && PyTuple_GET_SIZE(field) == 2) {
+        *index = PyLong_AsSsize_t(PyTuple_GET_ITEM(field, 0));
+        if (*index >= 0 && *index < nfields) {
+            *plan = Py_XNewRef(_sub_plan(PyTuple_GET_ITEM(field, 1)));
+            Py_DECREF(field);
+            return 0;
+        }
+    }
+    Py_DECREF(field);
+    if (!PyErr_Occurred()) {
+        PyErr_SetString(PyExc_TypeError, "invalid decoding plan");
+    }
+    return -1;
+}
+
 static PyObject *
-_parse_object_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr)
+_parse_object_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr, PyObject *plan)
 {
     /* Read a JSON object from PyUnicode pystr.
     idx is the index of the first character after the opening curly brace.
     *next_idx_ptr is a return-by-reference index to the first character after
         the closing curly brace.
+    plan is the PLAN_DICT or PLAN_OBJECT decoding plan of the object,
+        or NULL.
 
     Returns a new PyObject (usually a dict, but object_hook can change that)
     */
@@ -754,20 +1144,40 @@ _parse_object_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ss
     PyObject *val = NULL;
     PyObject *rval = NULL;
     PyObject *key = NULL;
-    int has_pairs_hook = (s->object_pairs_hook != Py_None);
+    PyObject *item_plan = NULL;
+    int has_pairs_hook = (plan == NULL && s->object_pairs_hook != Py_None);
+    int plan_kind = -1;
+    PyObject *fields = NULL;
+    PyObject **values = NULL;
+    Py_ssize_t nfields = 0;
     Py_ssize_t next_idx;
     Py_ssize_t comma_idx;
 
-    str = PyUnicode_DATA(pystr);
-    kind = PyUnicode_KIND(pystr);
-    end_idx = PyUnicode_GET_LENGTH(pystr) - 1;
+    str = scanner_data(pystr, &kind, &end_idx);
+    end_idx--;
 
-    if (has_pairs_hook)
-        rval = PyList_New(0);
-    else
-        rval = PyDict_New();
-    if (rval == NULL)
-        return NULL;
+    if (plan != NULL) {
+        /* The plan was checked by scan_once_unicode() */
+        plan_kind = PyLong_AsInt(PyTuple_GET_ITEM(plan, 0));
+    }
+    if (plan_kind == PLAN_OBJECT) {
+        /* The values of the fields, in the order of the plan */
+        fields = PyTuple_GET_ITEM(plan, 2);
+        nfields = PyTuple_GET_SIZE(PyTuple_GET_ITEM(plan, 3));
+        values = PyMem_Calloc(Py_MAX(nfields, 1), sizeof(PyObject *));
+        if (values == NULL) {
+            PyErr_NoMemory();
+            return NULL;
+        }
+    }
+    else {
+        if (has_pairs_hook)
+            rval = PyList_New(0);
+        else
+            rval = PyDict_New();
+        if (rval == NULL)
+            return NULL;
+    }
 
     /* skip whitespace after { */
     while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind,str, idx))) idx++;
@@ -801,11 +1211,32 @@ _parse_object_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ss
             while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind, str, idx))) idx++;
 
             /* read any JSON term */
-            val = scan_once_unicode(s, memo, pystr, idx, &next_idx);
+            Py_ssize_t field_index = -1;
+            if (plan_kind == PLAN_DICT) {
+                item_plan = Py_XNewRef(_sub_plan(PyTuple_GET_ITEM(plan, 1)));
+            }
+            else if (plan_kind == PLAN_OBJECT) {
+                if (_lookup_field(fields, key, nfields,
+                                  &field_index, &item_plan) < 0)
+                    goto bail;
+            }
+            val = scan_once_unicode(s, memo, pystr, idx, &next_idx, item_plan);
+            Py_CLEAR(item_plan);
             if (val == NULL)
                 goto bail;
 
-            if (has_pairs_hook) {
+            if (plan_kind == PLAN_OBJECT) {
+                /* Unknown members are ignored */
+                if (field_index >= 0) {
+                    Py_XSETREF(values[field_index], val);
+                }
+                else {
+                    Py_DECREF(val);
+                }
+                val = NULL;
+                Py_CLEAR(key);
+            }
+            else if (has_pairs_hook) {
                 PyObject *item = PyTuple_Pack(2, key, val);
                 if (item == NULL)
                     goto bail;
@@ -850,6 +1281,15 @@ _parse_object_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ss
 
     *next_idx_ptr = idx + 1;
 
+    if (plan_kind == PLAN_OBJECT) {
+        rval = _build_record(plan, values);
+        for (Py_ssize_t i = 0; i < nfields; i++) {
+            Py_XDECREF(values[i]);
+        }
+        PyMem_Free(values);
+        return rval;
+    }
+
     if (has_pairs_hook) {
         val = PyObject_CallOneArg(s->object_pairs_hook, rval);
         Py_DECREF(rval);
@@ -857,7 +1297,7 @@ _parse_object_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ss
     }
 
     /* if object_hook is not None: rval = object_hook(rval) */
-    if (s->object_hook != Py_None) {
+    if (plan == NULL && s->object_hook != Py_None) {
         val = PyObject_CallOneArg(s->object_hook, rval);
         Py_DECREF(rval);
         return val;
@@ -867,18 +1307,28 @@ _parse_object_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ss
     Py_XDECREF(key);
     Py_XDECREF(val);
     Py_XDECREF(rval);
+    if (values != NULL) {
+        for (Py_ssize_t i = 0; i < nfields; i++) {
+            Py_XDECREF(values[i]);
+        }
+        PyMem_Free(values);
+    }
     return NULL;
 }
 
 static PyObject *
-_parse_array_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr) {
+_parse_array_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr, PyObject *plan) {
     /* Read a JSON array from PyUnicode pystr.
     idx is the index of the first character after the opening brace.
     *next_idx_ptr is a return-by-reference index to the first character after
         the closing brace.
+    plan is the PLAN_LIST or PLAN_TUPLE decoding plan of the array, or NULL.
 
-    Returns a new PyList
+    Returns a new PyList, or a new PyTuple for PLAN_TUPLE, or an instance
+    of the class of the PLAN_TUPLE plan of a named tuple
     */
+    PyObject *item_plan = NULL;
+    PyObject *item_plans = NULL;
     const void *str;
     int kind;
     Py_ssize_t end_idx;
@@ -887,13 +1337,21 @@ _parse_array_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssi
     Py_ssize_t next_idx;
     Py_ssize_t comma_idx;
 
+    if (plan != NULL) {
+        if (PyTuple_GET_SIZE(plan) == 3) {
+            item_plans = PyTuple_GET_ITEM(plan, 1);
+        }
+        else {
+            item_plan = _sub_plan(PyTuple_GET_ITEM(plan, 1));
+        }
+    }
+
     rval = PyList_New(0);
     if (rval == NULL)
         return NULL;
 
-    str = PyUnicode_DATA(pystr);
-    kind = PyUnicode_KIND(pystr);
-    end_idx = PyUnicode_GET_LENGTH(pystr) - 1;
+    str = scanner_data(pystr, &kind, &end_idx);
+    end_idx--;
 
     /* skip whitespace after [ */
     while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind, str, idx))) idx++;
@@ -903,50 +1361,441 @@ _parse_array_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssi
         while (1) {
 
             /* read any JSON term  */
-            val = scan_once_unicode(s, memo, pystr, idx, &next_idx);
+            if (item_plans != NULL) {
+                /* every field of a named tuple has its own plan */
+                Py_ssize_t i = PyList_GET_SIZE(rval);
+                if (i < PyList_GET_SIZE(item_plans)) {
+                    item_plan = PyList_GetItemRef(item_plans, i);
+                    if (item_plan == NULL)
+                        goto bail;
+                    if (item_plan == Py_None)
+                        Py_CLEAR(item_plan);
+                }
+                else {
+                    item_plan = NULL;
+                }
+                val = scan_once_unicode(s, memo, pystr, idx, &next_idx, item_plan);
+                Py_XDECREF(item_plan);
+            }
+            else {
+                val = scan_once_unicode(s, memo, pystr, idx, &next_idx, item_plan);
+            }
+            if (val == NULL)
+                goto bail;
+
+            if (PyList_Append(rval, val) == -1)
+                goto bail;
+
+            Py_CLEAR(val);
+            idx = next_idx;
+
+            /* skip whitespace between term and , */
+            while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind, str, idx))) idx++;
+
+            /* bail if the array is closed or we didn't get the , delimiter */
+            if (idx <= end_idx && PyUnicode_READ(kind, str, idx) == ']')
+                break;
+            if (idx > end_idx || PyUnicode_READ(kind, str, idx) != ',') {
+                raise_errmsg("Expecting ',' delimiter", pystr, idx);
+                goto bail;
+            }
+            comma_idx = idx;
+            idx++;
+
+            /* skip whitespace after , */
+            while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind, str, idx))) idx++;
+
+            if (idx <= end_idx && PyUnicode_READ(kind, str, idx) == ']') {
+                raise_errmsg("Illegal trailing comma before end of array", pystr, comma_idx);
+                goto bail;
+            }
+        }
+    }
+
+    /* verify that idx < end_idx, PyUnicode_READ(kind, str, idx) should be ']' */
+    if (idx > end_idx || PyUnicode_READ(kind, str, idx) != ']') {
+        raise_errmsg("Expecting value", pystr, end_idx);
+        goto bail;
+    }
+    *next_idx_ptr = idx + 1;
+    if (plan != NULL && PyLong_AsInt(PyTuple_GET_ITEM(plan, 0)) == PLAN_TUPLE) {
+        Py_SETREF(rval, PyList_AsTuple(rval));
+        if (rval != NULL && item_plans != NULL) {
+            Py_SETREF(rval, PyObject_Call(PyTuple_GET_ITEM(plan, 2), rval, NULL));
+        }
+    }
+    return rval;
+bail:
+    Py_XDECREF(val);
+    Py_DECREF(rval);
+    return NULL;
+}
+
+/* Keys and values of the members of an object, reused for every item of
+   an array decoded by _parse_columns_unicode() */
+typedef struct {
+    PyObject **keys;
+    PyObject **values;
+    Py_ssize_t size;
+    Py_ssize_t allocated;
+} MembersBuffer;
+
+static void
+members_clear(MembersBuffer *buf)
+{
+    for (Py_ssize_t i = 0; i < buf->size; i++) {
+        Py_DECREF(buf->keys[i]);
+        Py_DECREF(buf->values[i]);
+    }
+    buf->size = 0;
+}
+
+static int
+members_append(MembersBuffer *buf, PyObject *key, PyObject *value)
+{
+    /* Steal references to key and value */
+    if (buf->size == buf->allocated) {
+        Py_ssize_t allocated = buf->allocated ? buf->allocated * 2 : 16;
+        PyObject **keys = PyMem_Resize(buf->keys, PyObject *, allocated);
+        if (keys != NULL) {
+            buf->keys = keys;
+        }
+        PyObject **values = PyMem_Resize(buf->values, PyObject *, allocated);
+        if (values != NULL) {
+            buf->values = values;
+        }
+        if (keys == NULL || values == NULL) {
+            Py_DECREF(key);
+            Py_DECREF(value);
+            PyErr_NoMemory();
+            return -1;
+        }
+        buf->allocated = allocated;
+    }
+    buf->keys[buf->size] = key;
+    buf->values[buf->size] = value;
+    buf->size++;
+    return 0;
+}
+
+static PyObject *
+_make_object(PyScannerObject *s, PyObject **keys, PyObject **values,
+             Py_ssize_t size)
+{
+    /* Create the Python object of a JSON object from its members, as
+       _parse_object_unicode() does */
+    PyObject *rval;
+    if (s->object_pairs_hook != Py_None) {
+        rval = PyList_New(size);
+        if (rval == NULL) {
+            return NULL;
+        }
+        for (Py_ssize_t i = 0; i < size; i++) {
+            PyObject *item = PyTuple_Pack(2, keys[i], values[i]);
+            if (item == NULL) {
+                Py_DECREF(rval);
+                return NULL;
+            }
+            PyList_SET_ITEM(rval, i, item);
+        }
+        Py_SETREF(rval, PyObject_CallOneArg(s->object_pairs_hook, rval));
+        return rval;
+    }
+    rval = PyDict_New();
+    if (rval == NULL) {
+        return NULL;
+    }
+    for (Py_ssize_t i = 0; i < size; i++) {
+        if (PyDict_SetItem(rval, keys[i], values[i]) < 0) {
+            Py_DECREF(rval);
+            return NULL;
+        }
+    }
+    if (s->object_hook != Py_None) {
+        Py_SETREF(rval, PyObject_CallOneArg(s->object_hook, rval));
+    }
+    return rval;
+}
+
+static int
+_parse_members_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr,
+                       Py_ssize_t idx, Py_ssize_t *next_idx_ptr,
+                       MembersBuffer *buf)
+{
+    /* Read the members of a JSON object to buf, like
+       _parse_object_unicode(), but without creating the object.
+       idx is the index of the first character after the opening curly brace.
+    */
+    const void *str;
+    int kind;
+    Py_ssize_t end_idx;
+    Py_ssize_t next_idx;
+    Py_ssize_t comma_idx;
+
+    str = scanner_data(pystr, &kind, &end_idx);
+    end_idx--;
+
+    while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind, str, idx))) idx++;
+
+    if (idx > end_idx || PyUnicode_READ(kind, str, idx) != '}') {
+        while (1) {
+            PyObject *key, *memokey, *val;
+
+            if (idx > end_idx || PyUnicode_READ(kind, str, idx) != '"') {
+                raise_errmsg("Expecting property name enclosed in double quotes", pystr, idx);
+                return -1;
+            }
+            key = scanstring_unicode(pystr, idx + 1, s->strict, &next_idx);
+            if (key == NULL)
+                return -1;
+            if (PyDict_SetDefaultRef(memo, key, key, &memokey) < 0) {
+                Py_DECREF(key);
+                return -1;
+            }
+            Py_SETREF(key, memokey);
+            idx = next_idx;
+
+            while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind, str, idx))) idx++;
+            if (idx > end_idx || PyUnicode_READ(kind, str, idx) != ':') {
+                Py_DECREF(key);
+                raise_errmsg("Expecting ':' delimiter", pystr, idx);
+                return -1;
+            }
+            idx++;
+            while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind, str, idx))) idx++;
+
+            val = scan_once_unicode(s, memo, pystr, idx, &next_idx, NULL);
+            if (val == NULL) {
+                Py_DECREF(key);
+                return -1;
+            }
+            if (members_append(buf, key, val) < 0)
+                return -1;
+            idx = next_idx;
+
+            while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind, str, idx))) idx++;
+
+            if (idx <= end_idx && PyUnicode_READ(kind, str, idx) == '}')
+                break;
+            if (idx > end_idx || PyUnicode_READ(kind, str, idx) != ',') {
+                raise_errmsg("Expecting ',' delimiter", pystr, idx);
+                return -1;
+            }
+            comma_idx = idx;
+            idx++;
+
+            while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind, str, idx))) idx++;
+
+            if (idx <= end_idx && PyUnicode_READ(kind, str, idx) == '}') {
+                raise_errmsg("Illegal trailing comma before end of object", pystr, comma_idx);
+                return -1;
+            }
+        }
+    }
+    *next_idx_ptr = idx + 1;
+    return 0;
+}
+
+static PyObject *
+_rows_from_columns(PyScannerObject *s, PyObject *keys, PyObject *columns,
+                   Py_ssize_t nrows)
+{
+    /* Create the list of the objects of the items decoded to columns */
+    Py_ssize_t ncolumns = PyTuple_GET_SIZE(keys);
+    PyObject **values = PyMem_New(PyObject *, Py_MAX(ncolumns, 1));
+    if (values == NULL) {
+        return PyErr_NoMemory();
+    }
+    PyObject *rows = PyList_New(0);
+    if (rows == NULL) {
+        PyMem_Free(values);
+        return NULL;
+    }
+    for (Py_ssize_t i = 0; i < nrows; i++) {
+        for (Py_ssize_t j = 0; j < ncolumns; j++) {
+            values[j] = PyList_GET_ITEM(PyTuple_GET_ITEM(columns, j), i);
+        }
+        PyObject *row = _make_object(s, &PyTuple_GET_ITEM(keys, 0), values,
+                                     ncolumns);
+        if (row == NULL || PyList_Append(rows, row) < 0) {
+            Py_XDECREF(row);
+            Py_DECREF(rows);
+            PyMem_Free(values);
+            return NULL;
+        }
+        Py_DECREF(row);
+    }
+    PyMem_Free(values);
+    return rows;
+}
+
+static PyObject *
+_parse_columns_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr) {
+    /* Read a JSON array from PyUnicode pystr, like _parse_array_unicode().
+    If its items are objects with the same keys in the same order, return a
+    single object which maps each key to the list of its values, without
+    creating the objects of the items.  Otherwise return a new PyList.
+    */
+    const void *str;
+    int kind;
+    Py_ssize_t end_idx;
+    Py_ssize_t next_idx;
+    Py_ssize_t comma_idx;
+    MembersBuffer buf = {NULL, NULL, 0, 0};
+    PyObject *keys = NULL;      /* tuple of the keys of the first item */
+    PyObject *columns = NULL;   /* tuple of lists */
+    PyObject *rows = NULL;      /* list of items, if not homogeneous */
+    PyObject *val = NULL;
+    PyObject *rval = NULL;
+    Py_ssize_t nrows = 0;
+
+    str = scanner_data(pystr, &kind, &end_idx);
+    end_idx--;
+
+    while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind, str, idx))) idx++;
+
+    if (idx <= end_idx && PyUnicode_READ(kind, str, idx) == ']') {
+        *next_idx_ptr = idx + 1;
+        return PyList_New(0);
+    }
+    while (1) {
+        if (rows == NULL && idx <= end_idx &&
+            PyUnicode_READ(kind, str, idx) == '{')
+        {
+            if (_Py_EnterRecursiveCall(" while decoding a JSON object "
+                                       "from a unicode string"))
+                goto bail;
+            int rv = _parse_members_unicode(s, memo, pystr, idx + 1,
+                                            &next_idx, &buf);
+            _Py_LeaveRecursiveCall();
+            if (rv < 0)
+                goto bail;
+            Py_ssize_t n = buf.size;
+            int match = 0;
+            if (keys == NULL) {
+                if (n > 0) {
+                    keys = PyTuple_New(n);
+                    columns = PyTuple_New(n);
+                    if (keys == NULL || columns == NULL)
+                        goto bail;
+                    for (Py_ssize_t i = 0; i < n; i++) {
+                        PyObject *column = PyList_New(0);
+                        if (column == NULL)
+                            goto bail;
+                        PyTuple_SET_ITEM(columns, i, column);
+                        PyTuple_SET_ITEM(keys, i, Py_NewRef(buf.keys[i]));
+                    }
+                    match = 1;
+                }
+            }
+            else if (n == PyTuple_GET_SIZE(keys)) {
+                match = 1;
+                for (Py_ssize_t i = 0; i < n; i++) {
+                    PyObject *key = PyTuple_GET_ITEM(keys, i);
+                    /* Keys are usually shared by the memo */
+                    if (buf.keys[i] != key && !PyUnicode_Equal(buf.keys[i], key)) {
+                        match = 0;
+                        break;
+                    }
+                }
+            }
+            if (match) {
+                for (Py_ssize_t i = 0; i < n; i++) {
+                    if (PyList_Append(PyTuple_GET_ITEM(columns, i),
+                                      buf.values[i]) < 0)
+                    {
+                        /* Keep the columns of the same length */
+                        for (Py_ssize_t j = 0; j < i; j++) {
+                            PyObject *column = PyTuple_GET_ITEM(columns, j);
+                            if (PyList_SetSlice(column, nrows, PY_SSIZE_T_MAX,
+                                                NULL) < 0)
+                                break;
+                        }
+                        goto bail;
+                    }
+                }
+                nrows++;
+                members_clear(&buf);
+            }
+            else {
+                /* Not homogeneous: create the objects decoded so far */
+                if (keys != NULL) {
+                    rows = _rows_from_columns(s, keys, columns, nrows);
+                }
+                else {
+                    rows = PyList_New(0);
+                }
+                if (rows == NULL)
+                    goto bail;
+                Py_CLEAR(keys);
+                Py_CLEAR(columns);
+                val = _make_object(s, buf.keys, buf.values, buf.size);
+                members_clear(&buf);
+                if (val == NULL || PyList_Append(rows, val) < 0)
+                    goto bail;
+                Py_CLEAR(val);
+            }
+        }
+        else {
+            if (rows == NULL) {
+                if (keys != NULL) {
+                    rows = _rows_from_columns(s, keys, columns, nrows);
+                }
+                else {
+                    rows = PyList_New(0);
+                }
+                if (rows == NULL)
+                    goto bail;
+                Py_CLEAR(keys);
+                Py_CLEAR(columns);
+            }
+            val = scan_once_unicode(s, memo, pystr, idx, &next_idx, NULL);
             if (val == NULL)
                 goto bail;
-
-            if (PyList_Append(rval, val) == -1)
+            if (PyList_Append(rows, val) < 0)
                 goto bail;
-
             Py_CLEAR(val);
-            idx = next_idx;
+        }
+        idx = next_idx;
 
-            /* skip whitespace between term and , */
-            while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind, str, idx))) idx++;
+        while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind, str, idx))) idx++;
 
-            /* bail if the array is closed or we didn't get the , delimiter */
-            if (idx <= end_idx && PyUnicode_READ(kind, str, idx) == ']')
-                break;
-            if (idx > end_idx || PyUnicode_READ(kind, str, idx) != ',') {
-                raise_errmsg("Expecting ',' delimiter", pystr, idx);
-                goto bail;
-            }
-            comma_idx = idx;
-            idx++;
+        if (idx <= end_idx && PyUnicode_READ(kind, str, idx) == ']')
+            break;
+        if (idx > end_idx || PyUnicode_READ(kind, str, idx) != ',') {
+            raise_errmsg("Expecting ',' delimiter", pystr, idx);
+            goto bail;
+        }
+        comma_idx = idx;
+        idx++;
 
-            /* skip whitespace after , */
-            while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind, str, idx))) idx++;
+        while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind, str, idx))) idx++;
 
-            if (idx <= end_idx && PyUnicode_READ(kind, str, idx) == ']') {
-                raise_errmsg("Illegal trailing comma before end of array", pystr, comma_idx);
-                goto bail;
-            }
+        if (idx <= end_idx && PyUnicode_READ(kind, str, idx) == ']') {
+            raise_errmsg("Illegal trailing comma before end of array", pystr, comma_idx);
+            goto bail;
         }
     }
+    *next_idx_ptr = idx + 1;
 
-    /* verify that idx < end_idx, PyUnicode_READ(kind, str, idx) should be ']' */
-    if (idx > end_idx || PyUnicode_READ(kind, str, idx) != ']') {
-        raise_errmsg("Expecting value", pystr, end_idx);
-        goto bail;
+    if (rows != NULL) {
+        rval = rows;
+        rows = NULL;
+    }
+    else {
+        rval = _make_object(s, &PyTuple_GET_ITEM(keys, 0),
+                            &PyTuple_GET_ITEM(columns, 0),
+                            PyTuple_GET_SIZE(keys));
     }
-    *next_idx_ptr = idx + 1;
-    return rval;
 bail:
+    members_clear(&buf);
+    PyMem_Free(buf.keys);
+    PyMem_Free(buf.values);
+    Py_XDECREF(keys);
+    Py_XDECREF(columns);
+    Py_XDECREF(rows);
     Py_XDECREF(val);
-    Py_DECREF(rval);
-    return NULL;
+    return rval;
 }
 
 static PyObject *
@@ -995,9 +1844,8 @@ _match_number_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t start, Py_
     PyObject *numstr = NULL;
     PyObject *custom_func;
 
-    str = PyUnicode_DATA(pystr);
-    kind = PyUnicode_KIND(pystr);
-    end_idx = PyUnicode_GET_LENGTH(pystr) - 1;
+    str = scanner_data(pystr, &kind, &end_idx);
+    end_idx--;
 
     /* read a sign if it's there, make sure it's not the end of the string */
     if (PyUnicode_READ(kind, str, idx) == '-') {
@@ -1090,12 +1938,14 @@ _match_number_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t start, Py_
 }
 
 static PyObject *
-scan_once_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr)
+scan_once_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr, PyObject *plan)
 {
     /* Read one JSON term (of any kind) from PyUnicode pystr.
     idx is the index of the first character of the term
     *next_idx_ptr is a return-by-reference index to the first character after
         the number.
+    plan is the decoding plan of the term, or NULL.  If it is not NULL,
+        the term must be null or the array or object described by the plan.
 
     Returns a new PyObject representation of the term.
     */
@@ -1104,9 +1954,7 @@ scan_once_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_
     int kind;
     Py_ssize_t length;
 
-    str = PyUnicode_DATA(pystr);
-    kind = PyUnicode_KIND(pystr);
-    length = PyUnicode_GET_LENGTH(pystr);
+    str = scanner_data(pystr, &kind, &length);
 
     if (idx < 0) {
         PyErr_SetString(PyExc_ValueError, "idx cannot be negative");
@@ -1117,6 +1965,23 @@ scan_once_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_
         return NULL;
     }
 
+    if (plan != NULL && PyUnicode_READ(kind, str, idx) != 'n') {
+        int expected = plan_kind(plan);
+        if (expected < 0) {
+            return NULL;
+        }
+        if (expected == PLAN_LIST || expected == PLAN_TUPLE) {
+            if (PyUnicode_READ(kind, str, idx) != '[') {
+                raise_errmsg("Expecting array", pystr, idx);
+                return NULL;
+            }
+        }
+        else if (PyUnicode_READ(kind, str, idx) != '{') {
+            raise_errmsg("Expecting object", pystr, idx);
+            return NULL;
+        }
+    }
+
     switch (PyUnicode_READ(kind, str, idx)) {
         case '"':
             /* string */
@@ -1126,7 +1991,7 @@ scan_once_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_
             if (_Py_EnterRecursiveCall(" while decoding a JSON object "
                                        "from a unicode string"))
                 return NULL;
-            res = _parse_object_unicode(s, memo, pystr, idx + 1, next_idx_ptr);
+            res = _parse_object_unicode(s, memo, pystr, idx + 1, next_idx_ptr, plan);
             _Py_LeaveRecursiveCall();
             return res;
         case '[':
@@ -1134,7 +1999,10 @@ scan_once_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_
             if (_Py_EnterRecursiveCall(" while decoding a JSON array "
                                        "from a unicode string"))
                 return NULL;
-            res = _parse_array_unicode(s, memo, pystr, idx + 1, next_idx_ptr);
+            if (s->columnar && plan == NULL)
+                res = _parse_columns_unicode(s, memo, pystr, idx + 1, next_idx_ptr);
+            else
+                res = _parse_array_unicode(s, memo, pystr, idx + 1, next_idx_ptr, plan);
             _Py_LeaveRecursiveCall();
             return res;
         case 'n':
@@ -1201,7 +2069,7 @@ scan_once_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_
 static PyObject *
 scanner_call(PyObject *self, PyObject *args, PyObject *kwds)
 {
-    /* Python callable interface to scan_once_{str,unicode} */
+    /* Python callable interface to scan_once_unicode */
     PyObject *pystr;
     PyObject *rval;
     Py_ssize_t idx;
@@ -1210,19 +2078,29 @@ scanner_call(PyObject *self, PyObject *args, PyObject *kwds)
     if (!PyArg_ParseTupleAndKeywords(args, kwds, "On:scan_once", kwlist, &pystr, &idx))
         return NULL;
 
-    if (!PyUnicode_Check(pystr)) {
+    if (!PyUnicode_Check(pystr) && !PyBytes_Check(pystr)) {
         PyErr_Format(PyExc_TypeError,
-                     "first argument must be a string, not %.80s",
+                     "first argument must be a string or bytes, not %.80s",
                      Py_TYPE(pystr)->tp_name);
         return NULL;
     }
 
-    PyObject *memo = PyDict_New();
-    if (memo == NULL) {
-        return NULL;
+    PyScannerObject *s = PyScannerObject_CAST(self);
+    PyObject *memo;
+    if (s->memo != NULL) {
+        /* Keep the keys between calls */
+        memo = Py_NewRef(s->memo);
+    }
+    else {
+        memo = PyDict_New();
+        if (memo == NULL) {
+            return NULL;
+        }
+    }
+    rval = scan_once_unicode(s, memo, pystr, idx, &next_idx, s->plan);
+    if (s->memo != NULL && PyDict_GET_SIZE(memo) > s->key_cache_size) {
+        PyDict_Clear(memo);
     }
-    rval = scan_once_unicode(PyScannerObject_CAST(self),
-                             memo, pystr, idx, &next_idx);
     Py_DECREF(memo);
     if (rval == NULL)
         return NULL;
@@ -1268,6 +2146,39 @@ scanner_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     s->parse_constant = PyObject_GetAttrString(ctx, "parse_constant");
     if (s->parse_constant == NULL)
         goto bail;
+    if (PyObject_GetOptionalAttrString(ctx, "_type_plan", &s->plan) < 0)
+        goto bail;
+    if (s->plan == Py_None)
+        Py_CLEAR(s->plan);
+
+    PyObject *value;
+    if (PyObject_GetOptionalAttrString(ctx, "columnar", &value) < 0)
+        goto bail;
+    if (value != NULL) {
+        int columnar = PyObject_IsTrue(value);
+        Py_DECREF(value);
+        if (columnar < 0)
+            goto bail;
+        s->columnar = columnar;
+    }
+    if (PyObject_GetOptionalAttrString(ctx, "key_cache_size", &value) < 0)
+        goto bail;
+    if (value != NULL) {
+        s->key_cache_size = PyNumber_AsSsize_t(value, PyExc_OverflowError);
+        Py_DECREF(value);
+        if (s->key_cache_size == -1 && PyErr_Occurred())
+            goto bail;
+    }
+    if (s->key_cache_size > 0) {
+        /* Share the keys with the Python scanner */
+        s->memo = PyObject_GetAttrString(ctx, "memo");
+        if (s->memo == NULL)
+            goto bail;
+        if (!PyDict_Check(s->memo)) {
+            PyErr_SetString(PyExc_TypeError, "memo must be a dict");
+            goto bail;
+        }
+    }
 
     return (PyObject *)s;
 
@@ -1300,17 +2211,18 @@ static PyType_Spec PyScannerType_spec = {
 static PyObject *
 encoder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    static char *kwlist[] = {"markers", "default", "encoder", "indent", "key_separator", "item_separator", "sort_keys", "skipkeys", "allow_nan", NULL};
+    static char *kwlist[] = {"markers", "default", "encoder", "indent", "key_separator", "item_separator", "sort_keys", "skipkeys", "allow_nan", "types", NULL};
 
     PyEncoderObject *s;
     PyObject *markers, *defaultfn, *encoder, *indent, *key_separator;
     PyObject *item_separator;
+    PyObject *types = Py_None;
     int sort_keys, skipkeys, allow_nan;
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwds, "OOOOUUppp:make_encoder", kwlist,
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "OOOOUUppp|O:make_encoder", kwlist,
         &markers, &defaultfn, &encoder, &indent,
         &key_separator, &item_separator,
-        &sort_keys, &skipkeys, &allow_nan))
+        &sort_keys, &skipkeys, &allow_nan, &types))
         return NULL;
 
     if (markers != Py_None && !PyDict_Check(markers)) {
@@ -1319,6 +2231,12 @@ encoder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
                      "not %.200s", Py_TYPE(markers)->tp_name);
         return NULL;
     }
+    if (types != Py_None && !PyDict_Check(types)) {
+        PyErr_Format(PyExc_TypeError,
+                     "make_encoder() argument 10 must be dict or None, "
+                     "not %.200s", Py_TYPE(types)->tp_name);
+        return NULL;
+    }
 
     s = (PyEncoderObject *)type->tp_alloc(type, 0);
     if (s == NULL)
@@ -1330,18 +2248,22 @@ encoder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     s->indent = Py_NewRef(indent);
     s->key_separator = Py_NewRef(key_separator);
     s->item_separator = Py_NewRef(item_separator);
+    s->types = types == Py_None ? NULL : Py_NewRef(types);
     s->sort_keys = sort_keys;
     s->skipkeys = skipkeys;
     s->allow_nan = allow_nan;
     s->fast_encode = NULL;
+    s->fast_encode_bytes = NULL;
 
     if (PyCFunction_Check(s->encoder)) {
         PyCFunction f = PyCFunction_GetFunction(s->encoder);
         if (f == py_encode_basestring_ascii) {
             s->fast_encode = write_escaped_ascii;
+            s->fast_encode_bytes = write_escaped_ascii_bytes;
         }
         else if (f == py_encode_basestring) {
             s->fast_encode = write_escaped_unicode;
+            s->fast_encode_bytes = write_escaped_unicode_bytes;
         }
     }
 
@@ -1349,6 +2271,118 @@ encoder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 }
 
 
+static int
+json_writer_init(JSONWriter *writer, int utf8, PyObject *write)
+{
+    writer->unicode = NULL;
+    writer->bytes = NULL;
+    writer->write = write;
+    if (utf8) {
+        writer->bytes = PyBytesWriter_Create(0);
+        return writer->bytes == NULL ? -1 : 0;
+    }
+    writer->unicode = PyUnicodeWriter_Create(0);
+    return writer->unicode == NULL ? -1 : 0;
+}
+
+static void
+json_writer_discard(JSONWriter *writer)
+{
+    PyUnicodeWriter_Discard(writer->unicode);
+    PyBytesWriter_Discard(writer->bytes);
+}
+
+static PyObject *
+json_writer_finish(JSONWriter *writer)
+{
+    PyObject *result;
+    if (writer->bytes != NULL) {
+        result = PyBytesWriter_Finish(writer->bytes);
+        writer->bytes = NULL;
+    }
+    else {
+        result = PyUnicodeWriter_Finish(writer->unicode);
+        writer->unicode = NULL;
+    }
+    return result;
+}
+
+static int
+json_writer_flush(JSONWriter *writer)
+{
+    /* Pass the output written so far to writer->write */
+    int utf8 = (writer->bytes != NULL);
+    PyObject *chunk = json_writer_finish(writer);
+    if (chunk == NULL) {
+        return -1;
+    }
+    PyObject *res = PyObject_CallOneArg(writer->write, chunk);
+    Py_DECREF(chunk);
+    if (res == NULL) {
+        return -1;
+    }
+    Py_DECREF(res);
+    return json_writer_init(writer, utf8, writer->write);
+}
+
+static inline int
+json_writer_maybe_flush(JSONWriter *writer)
+{
+    if (writer->write == NULL) {
+        return 0;
+    }
+    Py_ssize_t size;
+    if (writer->bytes != NULL) {
+        size = PyBytesWriter_GetSize(writer->bytes);
+    }
+    else {
+        size = ((_PyUnicodeWriter *)writer->unicode)->pos;
+    }
+    return size < JSON_CHUNK_SIZE ? 0 : json_writer_flush(writer);
+}
+
+static inline int
+json_write_char(JSONWriter *writer, char ch)
+{
+    if (writer->bytes != NULL) {
+        return PyBytesWriter_WriteBytes(writer->bytes, &ch, 1);
+    }
+    return PyUnicodeWriter_WriteChar(writer->unicode, ch);
+}
+
+static inline int
+json_write_ascii(JSONWriter *writer, const char *str, Py_ssize_t size)
+{
+    if (writer->bytes != NULL) {
+        return PyBytesWriter_WriteBytes(writer->bytes, str, size);
+    }
+    return PyUnicodeWriter_WriteASCII(writer->unicode, str, size);
+}
+
+static int
+json_write_str(JSONWriter *writer, PyObject *str)
+{
+    if (writer->bytes != NULL) {
+        Py_ssize_t size;
+        const char *data = PyUnicode_AsUTF8AndSize(str, &size);
+        if (data == NULL) {
+            return -1;
+        }
+        return PyBytesWriter_WriteBytes(writer->bytes, data, size);
+    }
+    return PyUnicodeWriter_WriteStr(writer->unicode, str);
+}
+
+static int
+json_write_steal(JSONWriter *writer, PyObject *stolen)
+{
+    /* Append stolen and then decrement its reference count */
+    int rval = json_write_str(writer, stolen);
+    Py_DECREF(stolen);
+    return rval;
+}
+
+
 /* indent_cache is a list that contains intermixed values at even and odd
  * positions:
  *
@@ -1426,29 +2460,36 @@ get_item_separator(PyEncoderObject *s,
 }
 
 static int
-write_newline_indent(PyUnicodeWriter *writer,
+write_newline_indent(JSONWriter *writer,
                      Py_ssize_t indent_level, PyObject *indent_cache)
 {
     PyObject *newline_indent = PyList_GET_ITEM(indent_cache, indent_level * 2);
-    return PyUnicodeWriter_WriteStr(writer, newline_indent);
+    return json_write_str(writer, newline_indent);
 }
 
 
 static PyObject *
 encoder_call(PyObject *op, PyObject *args, PyObject *kwds)
 {
-    /* Python callable interface to encoder_listencode_obj */
-    static char *kwlist[] = {"obj", "_current_indent_level", NULL};
+    /* Python callable interface to encoder_listencode_obj
+
+    Return a 1-tuple containing the str, or the UTF-8 encoded bytes if
+    utf8 is true.  If write is not None, pass the output to it in chunks
+    instead and return None. */
+    static char *kwlist[] = {"obj", "_current_indent_level", "utf8", "write", NULL};
     PyObject *obj;
     Py_ssize_t indent_level;
+    int utf8 = 0;
+    PyObject *write = Py_None;
     PyEncoderObject *self = PyEncoderObject_CAST(op);
+    JSONWriter writer;
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwds, "On:_iterencode", kwlist,
-                                     &obj, &indent_level))
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "On|$pO:_iterencode", kwlist,
+                                     &obj, &indent_level, &utf8, &write))
         return NULL;
 
-    PyUnicodeWriter *writer = PyUnicodeWriter_Create(0);
-    if (writer == NULL) {
+    if (json_writer_init(&writer, utf8, write != Py_None ? write : NULL) < 0) {
+        json_writer_discard(&writer);
         return NULL;
     }
 
@@ -1456,19 +2497,28 @@ encoder_call(PyObject *op, PyObject *args, PyObject *kwds)
     if (self->indent != Py_None) {
         indent_cache = create_indent_cache(self, indent_level);
         if (indent_cache == NULL) {
-            PyUnicodeWriter_Discard(writer);
+            json_writer_discard(&writer);
             return NULL;
         }
     }
     indent_level = 0;
-    if (encoder_listencode_obj(self, writer, obj, indent_level, indent_cache)) {
-        PyUnicodeWriter_Discard(writer);
+    if (encoder_listencode_obj(self, &writer, obj, indent_level, indent_cache)) {
+        json_writer_discard(&writer);
         Py_XDECREF(indent_cache);
         return NULL;
     }
     Py_XDECREF(indent_cache);
 
-    PyObject *str = PyUnicodeWriter_Finish(writer);
+    if (writer.write != NULL) {
+        if (json_writer_flush(&writer) < 0) {
+            json_writer_discard(&writer);
+            return NULL;
+        }
+        json_writer_discard(&writer);
+        Py_RETURN_NONE;
+    }
+
+    PyObject *str = json_writer_finish(&writer);
     if (str == NULL) {
         return NULL;
     }
@@ -1524,13 +2574,63 @@ encoder_encode_float(PyEncoderObject *s, PyObject *obj)
 }
 
 static int
-encoder_write_string(PyEncoderObject *s, PyUnicodeWriter *writer, PyObject *obj)
+encoder_write_float(PyEncoderObject *s, JSONWriter *writer, PyObject *obj)
+{
+    /* Write the JSON representation of a PyFloat */
+    double x = PyFloat_AS_DOUBLE(obj);
+    if (writer->bytes != NULL && isfinite(x)) {
+        /* Same as float.__repr__(), without creating a str */
+        char *buf = PyOS_double_to_string(x, 'r', 0, Py_DTSF_ADD_DOT_0, NULL);
+        if (buf == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        int rval = PyBytesWriter_WriteBytes(writer->bytes, buf, strlen(buf));
+        PyMem_Free(buf);
+        return rval;
+    }
+    PyObject *encoded = encoder_encode_float(s, obj);
+    if (encoded == NULL) {
+        return -1;
+    }
+    return json_write_steal(writer, encoded);
+}
+
+static int
+encoder_write_long(JSONWriter *writer, PyObject *obj)
+{
+    /* Write the JSON representation of an exact PyLong */
+    if (writer->bytes == NULL) {
+        return PyUnicodeWriter_WriteRepr(writer->unicode, obj);
+    }
+    int overflow;
+    long long value = PyLong_AsLongLongAndOverflow(obj, &overflow);
+    if (!overflow) {
+        if (value == -1 && PyErr_Occurred()) {
+            return -1;
+        }
+        char buf[32];
+        int size = PyOS_snprintf(buf, sizeof(buf), "%lld", value);
+        return PyBytesWriter_WriteBytes(writer->bytes, buf, size);
+    }
+    PyObject *encoded = PyLong_Type.tp_repr(obj);
+    if (encoded == NULL) {
+        return -1;
+    }
+    return json_write_steal(writer, encoded);
+}
+
+static int
+encoder_write_string(PyEncoderObject *s, JSONWriter *writer, PyObject *obj)
 {
     /* Return the JSON representation of a string */
     PyObject *encoded;
 
     if (s->fast_encode) {
-        return s->fast_encode(writer, obj);
+        if (writer->bytes != NULL) {
+            return s->fast_encode_bytes(writer->bytes, obj);
+        }
+        return s->fast_encode(writer->unicode, obj);
     }
     encoded = PyObject_CallOneArg(s->encoder, obj);
     if (encoded == NULL) {
@@ -1543,7 +2643,7 @@ encoder_write_string(PyEncoderObject *s, PyUnicodeWriter *writer, PyObject *obj)
         Py_DECREF(encoded);
         return -1;
     }
-    return _steal_accumulate(writer, encoded);
+    return json_write_steal(writer, encoded);
 }
 
 static int
@@ -1556,7 +2656,7 @@ _steal_accumulate(PyUnicodeWriter *writer, PyObject *stolen)
 }
 
 static int
-encoder_listencode_obj(PyEncoderObject *s, PyUnicodeWriter *writer,
+encoder_listencode_obj(PyEncoderObject *s, JSONWriter *writer,
                        PyObject *obj,
                        Py_ssize_t indent_level, PyObject *indent_cache)
 {
@@ -1565,13 +2665,13 @@ encoder_listencode_obj(PyEncoderObject *s, PyUnicodeWriter *writer,
     int rv;
 
     if (obj == Py_None) {
-      return PyUnicodeWriter_WriteASCII(writer, "null", 4);
+      return json_write_ascii(writer, "null", 4);
     }
     else if (obj == Py_True) {
-      return PyUnicodeWriter_WriteASCII(writer, "true", 4);
+      return json_write_ascii(writer, "true", 4);
     }
     else if (obj == Py_False) {
-      return PyUnicodeWriter_WriteASCII(writer, "false", 5);
+      return json_write_ascii(writer, "false", 5);
     }
     else if (PyUnicode_Check(obj)) {
         return encoder_write_string(s, writer, obj);
@@ -1579,18 +2679,15 @@ encoder_listencode_obj(PyEncoderObject *s, PyUnicodeWriter *writer,
     else if (PyLong_Check(obj)) {
         if (PyLong_CheckExact(obj)) {
             // Fast-path for exact integers
-            return PyUnicodeWriter_WriteRepr(writer, obj);
+            return encoder_write_long(writer, obj);
         }
         PyObject *encoded = PyLong_Type.tp_repr(obj);
         if (encoded == NULL)
             return -1;
-        return _steal_accumulate(writer, encoded);
+        return json_write_steal(writer, encoded);
     }
     else if (PyFloat_Check(obj)) {
-        PyObject *encoded = encoder_encode_float(s, obj);
-        if (encoded == NULL)
-            return -1;
-        return _steal_accumulate(writer, encoded);
+        return encoder_write_float(s, writer, obj);
     }
     else if (PyList_Check(obj) || PyTuple_Check(obj)) {
         if (_Py_EnterRecursiveCall(" while encoding a JSON object"))
@@ -1607,6 +2704,23 @@ encoder_listencode_obj(PyEncoderObject *s, PyUnicodeWriter *writer,
         return rv;
     }
     else {
+        if (s->types != NULL) {
+            PyObject *fields;
+            if (PyDict_GetItemRef(s->types, (PyObject *)Py_TYPE(obj),
+                                  &fields) < 0)
+                return -1;
+            if (fields != NULL) {
+                if (_Py_EnterRecursiveCall(" while encoding a JSON object")) {
+                    Py_DECREF(fields);
+                    return -1;
+                }
+                rv = encoder_listencode_record(s, writer, obj, fields,
+                                               indent_level, indent_cache);
+                _Py_LeaveRecursiveCall();
+                Py_DECREF(fields);
+                return rv;
+            }
+        }
         PyObject *ident = NULL;
         if (s->markers != Py_None) {
             int has_key;
@@ -1657,7 +2771,7 @@ encoder_listencode_obj(PyEncoderObject *s, PyUnicodeWriter *writer,
 }
 
 static int
-encoder_encode_key_value(PyEncoderObject *s, PyUnicodeWriter *writer, bool *first,
+encoder_encode_key_value(PyEncoderObject *s, JSONWriter *writer, bool *first,
                          PyObject *dct, PyObject *key, PyObject *value,
                          Py_ssize_t indent_level, PyObject *indent_cache,
                          PyObject *item_separator)
@@ -1703,7 +2817,7 @@ encoder_encode_key_value(PyEncoderObject *s, PyUnicodeWriter *writer, bool *firs
         }
     }
     else {
-        if (PyUnicodeWriter_WriteStr(writer, item_separator) < 0) {
+        if (json_write_str(writer, item_separator) < 0) {
             Py_DECREF(keystr);
             return -1;
         }
@@ -1715,18 +2829,18 @@ encoder_encode_key_value(PyEncoderObject *s, PyUnicodeWriter *writer, bool *firs
     if (rv < 0) {
         return -1;
     }
-    if (PyUnicodeWriter_WriteStr(writer, s->key_separator) < 0) {
+    if (json_write_str(writer, s->key_separator) < 0) {
         return -1;
     }
     if (encoder_listencode_obj(s, writer, value, indent_level, indent_cache) < 0) {
         _PyErr_FormatNote("when serializing %T item %R", dct, key);
         return -1;
     }
-    return 0;
+    return json_writer_maybe_flush(writer);
 }
 
 static inline int
-_encoder_iterate_mapping_lock_held(PyEncoderObject *s, PyUnicodeWriter *writer,
+_encoder_iterate_mapping_lock_held(PyEncoderObject *s, JSONWriter *writer,
                             bool *first, PyObject *dct, PyObject *items,
                             Py_ssize_t indent_level, PyObject *indent_cache,
                             PyObject *separator)
@@ -1766,7 +2880,7 @@ _encoder_iterate_mapping_lock_held(PyEncoderObject *s, PyUnicodeWriter *writer,
 }
 
 static inline int
-_encoder_iterate_dict_lock_held(PyEncoderObject *s, PyUnicodeWriter *writer,
+_encoder_iterate_dict_lock_held(PyEncoderObject *s, JSONWriter *writer,
                          bool *first, PyObject *dct, Py_ssize_t indent_level,
                          PyObject *indent_cache, PyObject *separator)
 {
@@ -1797,7 +2911,7 @@ _encoder_iterate_dict_lock_held(PyEncoderObject *s, PyUnicodeWriter *writer,
 }
 
 static int
-encoder_listencode_dict(PyEncoderObject *s, PyUnicodeWriter *writer,
+encoder_listencode_dict(PyEncoderObject *s, JSONWriter *writer,
                        PyObject *dct,
                        Py_ssize_t indent_level, PyObject *indent_cache)
 {
@@ -1807,7 +2921,7 @@ encoder_listencode_dict(PyEncoderObject *s, PyUnicodeWriter *writer,
 
     if (PyDict_GET_SIZE(dct) == 0) {
         /* Fast path */
-        return PyUnicodeWriter_WriteASCII(writer, "{}", 2);
+        return json_write_ascii(writer, "{}", 2);
     }
 
     if (s->markers != Py_None) {
@@ -1826,7 +2940,7 @@ encoder_listencode_dict(PyEncoderObject *s, PyUnicodeWriter *writer,
         }
     }
 
-    if (PyUnicodeWriter_WriteChar(writer, '{')) {
+    if (json_write_char(writer, '{')) {
         goto bail;
     }
 
@@ -1878,7 +2992,123 @@ encoder_listencode_dict(PyEncoderObject *s, PyUnicodeWriter *writer,
         }
     }
 
-    if (PyUnicodeWriter_WriteChar(writer, '}')) {
+    if (json_write_char(writer, '}')) {
+        goto bail;
+    }
+    return 0;
+
+bail:
+    Py_XDECREF(ident);
+    return -1;
+}
+
+static int
+encoder_listencode_record(PyEncoderObject *s, JSONWriter *writer,
+                          PyObject *obj, PyObject *fields,
+                          Py_ssize_t indent_level, PyObject *indent_cache)
+{
+    /* Encode an instance of a record class to a JSON object.  fields is
+       a tuple of (name, key, descriptor) tuples, where key is the encoded
+       name and descriptor is a member descriptor or None. */
+    PyObject *ident = NULL;
+
+    if (!PyTuple_Check(fields)) {
+        PyErr_SetString(PyExc_TypeError, "invalid encoding plan");
+        return -1;
+    }
+    if (PyTuple_GET_SIZE(fields) == 0) {
+        return json_write_ascii(writer, "{}", 2);
+    }
+
+    if (s->markers != Py_None) {
+        int has_key;
+        ident = PyLong_FromVoidPtr(obj);
+        if (ident == NULL)
+            goto bail;
+        has_key = PyDict_Contains(s->markers, ident);
+        if (has_key) {
+            if (has_key != -1)
+                PyErr_SetString(PyExc_ValueError, "Circular reference detected");
+            goto bail;
+        }
+        if (PyDict_SetItem(s->markers, ident, obj)) {
+            goto bail;
+        }
+    }
+
+    if (json_write_char(writer, '{')) {
+        goto bail;
+    }
+
+    PyObject *separator = s->item_separator; // borrowed reference
+    if (s->indent != Py_None) {
+        indent_level++;
+        separator = get_item_separator(s, indent_level, indent_cache);
+        if (separator == NULL)
+            goto bail;
+        if (write_newline_indent(writer, indent_level, indent_cache) < 0)
+            goto bail;
+    }
+
+    for (Py_ssize_t i = 0; i < PyTuple_GET_SIZE(fields); i++) {
+        PyObject *field = PyTuple_GET_ITEM(fields, i);
+        if (!PyTuple_Check(field) || PyTuple_GET_SIZE(field) != 3 ||
+            !PyUnicode_Check(PyTuple_GET_ITEM(field, 1)))
+        {
+            PyErr_SetString(PyExc_TypeError, "invalid encoding plan");
+            goto bail;
+        }
+        PyObject *name = PyTuple_GET_ITEM(field, 0);
+        PyObject *descr = PyTuple_GET_ITEM(field, 2);
+        PyObject *value;
+
+        if (i && json_write_str(writer, separator) < 0) {
+            goto bail;
+        }
+        if (json_write_str(writer, PyTuple_GET_ITEM(field, 1)) < 0 ||
+            json_write_str(writer, s->key_separator) < 0)
+        {
+            goto bail;
+        }
+        /* Read slots directly, without the attribute lookup */
+        if (descr != Py_None && Py_TYPE(descr)->tp_descr_get != NULL) {
+            value = Py_TYPE(descr)->tp_descr_get(descr, obj,
+                                                 (PyObject *)Py_TYPE(obj));
+        }
+        else {
+            value = PyObject_GetAttr(obj, name);
+        }
+        if (value == NULL) {
+            _PyErr_FormatNote("when serializing %s field %R",
+                              _PyType_Name(Py_TYPE(obj)), name);
+            goto bail;
+        }
+        int rv = encoder_listencode_obj(s, writer, value, indent_level,
+                                        indent_cache);
+        Py_DECREF(value);
+        if (rv < 0) {
+            _PyErr_FormatNote("when serializing %s field %R",
+                              _PyType_Name(Py_TYPE(obj)), name);
+            goto bail;
+        }
+        if (json_writer_maybe_flush(writer) < 0) {
+            goto bail;
+        }
+    }
+
+    if (ident != NULL) {
+        if (PyDict_DelItem(s->markers, ident))
+            goto bail;
+        Py_CLEAR(ident);
+    }
+    if (s->indent != Py_None) {
+        indent_level--;
+        if (write_newline_indent(writer, indent_level, indent_cache) < 0) {
+            goto bail;
+        }
+    }
+
+    if (json_write_char(writer, '}')) {
         goto bail;
     }
     return 0;
@@ -1889,7 +3119,7 @@ encoder_listencode_dict(PyEncoderObject *s, PyUnicodeWriter *writer,
 }
 
 static inline int
-_encoder_iterate_fast_seq_lock_held(PyEncoderObject *s, PyUnicodeWriter *writer,
+_encoder_iterate_fast_seq_lock_held(PyEncoderObject *s, JSONWriter *writer,
     PyObject *seq, PyObject *s_fast,
     Py_ssize_t indent_level, PyObject *indent_cache, PyObject *separator)
 {
@@ -1900,7 +3130,7 @@ _encoder_iterate_fast_seq_lock_held(PyEncoderObject *s, PyUnicodeWriter *writer,
         Py_INCREF(obj);
 #endif
         if (i) {
-            if (PyUnicodeWriter_WriteStr(writer, separator) < 0) {
+            if (json_write_str(writer, separator) < 0) {
 #ifdef Py_GIL_DISABLED
                 Py_DECREF(obj);
 #endif
@@ -1911,6 +3141,12 @@ _encoder_iterate_fast_seq_lock_held(PyEncoderObject *s, PyUnicodeWriter *writer,
             _PyErr_FormatNote("when serializing %T item %zd", seq, i);
 #ifdef Py_GIL_DISABLED
             Py_DECREF(obj);
+#endif
+            return -1;
+        }
+        if (json_writer_maybe_flush(writer) < 0) {
+#ifdef Py_GIL_DISABLED
+            Py_DECREF(obj);
 #endif
             return -1;
         }
@@ -1922,7 +3158,7 @@ _encoder_iterate_fast_seq_lock_held(PyEncoderObject *s, PyUnicodeWriter *writer,
 }
 
 static int
-encoder_listencode_list(PyEncoderObject *s, PyUnicodeWriter *writer,
+encoder_listencode_list(PyEncoderObject *s, JSONWriter *writer,
                         PyObject *seq,
                         Py_ssize_t indent_level, PyObject *indent_cache)
 {
@@ -1934,7 +3170,7 @@ encoder_listencode_list(PyEncoderObject *s, PyUnicodeWriter *writer,
         return -1;
     if (PySequence_Fast_GET_SIZE(s_fast) == 0) {
         Py_DECREF(s_fast);
-        return PyUnicodeWriter_WriteASCII(writer, "[]", 2);
+        return json_write_ascii(writer, "[]", 2);
     }
 
     if (s->markers != Py_None) {
@@ -1953,7 +3189,7 @@ encoder_listencode_list(PyEncoderObject *s, PyUnicodeWriter *writer,
         }
     }
 
-    if (PyUnicodeWriter_WriteChar(writer, '[')) {
+    if (json_write_char(writer, '[')) {
         goto bail;
     }
 
@@ -1988,7 +3224,7 @@ encoder_listencode_list(PyEncoderObject *s, PyUnicodeWriter *writer,
         }
     }
 
-    if (PyUnicodeWriter_WriteChar(writer, ']')) {
+    if (json_write_char(writer, ']')) {
         goto bail;
     }
     Py_DECREF(s_fast);
@@ -2022,6 +3258,7 @@ encoder_traverse(PyObject *op, visitproc visit, void *arg)
     Py_VISIT(self->indent);
     Py_VISIT(self->key_separator);
     Py_VISIT(self->item_separator);
+    Py_VISIT(self->types);
     return 0;
 }
 
@@ -2036,10 +3273,11 @@ encoder_clear(PyObject *op)
     Py_CLEAR(self->indent);
     Py_CLEAR(self->key_separator);
     Py_CLEAR(self->item_separator);
+    Py_CLEAR(self->types);
     return 0;
 }
 
-PyDoc_STRVAR(encoder_doc, "Encoder(markers, default, encoder, indent, key_separator, item_separator, sort_keys, skipkeys, allow_nan)");
+PyDoc_STRVAR(encoder_doc, "Encoder(markers, default, encoder, indent, key_separator, item_separator, sort_keys, skipkeys, allow_nan, types=None)");
 
 static PyType_Slot PyEncoderType_slots[] = {
     {Py_tp_doc, (void *)encoder_doc},
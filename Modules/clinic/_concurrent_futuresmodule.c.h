@@ -0,0 +1,668 @@
+/*[clinic input]
+preserve
+[clinic start generated code]*/
+
+#if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+#  include "pycore_gc.h"          // PyGC_Head
+#  include "pycore_runtime.h"     // _Py_ID()
+#endif
+#include "pycore_modsupport.h"    // _PyArg_NoKeywords()
+
+PyDoc_STRVAR(_concurrent_futures_Future___init____doc__,
+"Future()\n"
+"--\n"
+"\n"
+"Initializes the future. Should not be called by clients.");
+
+static int
+_concurrent_futures_Future___init___impl(FutureObject *self);
+
+static int
+_concurrent_futures_Future___init__(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    int return_value = -1;
+    PyTypeObject *base_tp = get_futures_state_by_type(Py_TYPE(self))->FutureType;
+
+    if ((Py_IS_TYPE(self, base_tp) ||
+         Py_TYPE(self)->tp_new == base_tp->tp_new) &&
+        !_PyArg_NoPositional("Future", args)) {
+        goto exit;
+    }
+    if ((Py_IS_TYPE(self, base_tp) ||
+         Py_TYPE(self)->tp_new == base_tp->tp_new) &&
+        !_PyArg_NoKeywords("Future", kwargs)) {
+        goto exit;
+    }
+    return_value = _concurrent_futures_Future___init___impl((FutureObject *)self);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_concurrent_futures_Future__invoke_callbacks__doc__,
+"_invoke_callbacks($self, /)\n"
+"--\n"
+"\n"
+"Call the done callbacks.");
+
+#define _CONCURRENT_FUTURES_FUTURE__INVOKE_CALLBACKS_METHODDEF    \
+    {"_invoke_callbacks", (PyCFunction)_concurrent_futures_Future__invoke_callbacks, METH_NOARGS, _concurrent_futures_Future__invoke_callbacks__doc__},
+
+static PyObject *
+_concurrent_futures_Future__invoke_callbacks_impl(FutureObject *self);
+
+static PyObject *
+_concurrent_futures_Future__invoke_callbacks(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return _concurrent_futures_Future__invoke_callbacks_impl((FutureObject *)self);
+}
+
+PyDoc_STRVAR(_concurrent_futures_Future_cancel__doc__,
+"cancel($self, /)\n"
+"--\n"
+"\n"
+"Cancel the future if possible.\n"
+"\n"
+"Returns True if the future was cancelled, False otherwise. A future\n"
+"cannot be cancelled if it is running or has already completed.");
+
+#define _CONCURRENT_FUTURES_FUTURE_CANCEL_METHODDEF    \
+    {"cancel", (PyCFunction)_concurrent_futures_Future_cancel, METH_NOARGS, _concurrent_futures_Future_cancel__doc__},
+
+static PyObject *
+_concurrent_futures_Future_cancel_impl(FutureObject *self);
+
+static PyObject *
+_concurrent_futures_Future_cancel(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return _concurrent_futures_Future_cancel_impl((FutureObject *)self);
+}
+
+PyDoc_STRVAR(_concurrent_futures_Future_cancelled__doc__,
+"cancelled($self, /)\n"
+"--\n"
+"\n"
+"Return True if the future was cancelled.");
+
+#define _CONCURRENT_FUTURES_FUTURE_CANCELLED_METHODDEF    \
+    {"cancelled", (PyCFunction)_concurrent_futures_Future_cancelled, METH_NOARGS, _concurrent_futures_Future_cancelled__doc__},
+
+static PyObject *
+_concurrent_futures_Future_cancelled_impl(FutureObject *self);
+
+static PyObject *
+_concurrent_futures_Future_cancelled(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return _concurrent_futures_Future_cancelled_impl((FutureObject *)self);
+}
+
+PyDoc_STRVAR(_concurrent_futures_Future_running__doc__,
+"running($self, /)\n"
+"--\n"
+"\n"
+"Return True if the future is currently executing.");
+
+#define _CONCURRENT_FUTURES_FUTURE_RUNNING_METHODDEF    \
+    {"running", (PyCFunction)_concurrent_futures_Future_running, METH_NOARGS, _concurrent_futures_Future_running__doc__},
+
+static PyObject *
+_concurrent_futures_Future_running_impl(FutureObject *self);
+
+static PyObject *
+_concurrent_futures_Future_running(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return _concurrent_futures_Future_running_impl((FutureObject *)self);
+}
+
+PyDoc_STRVAR(_concurrent_futures_Future_done__doc__,
+"done($self, /)\n"
+"--\n"
+"\n"
+"Return True if the future was cancelled or finished executing.");
+
+#define _CONCURRENT_FUTURES_FUTURE_DONE_METHODDEF    \
+    {"done", (PyCFunction)_concurrent_futures_Future_done, METH_NOARGS, _concurrent_futures_Future_done__doc__},
+
+static PyObject *
+_concurrent_futures_Future_done_impl(FutureObject *self);
+
+static PyObject *
+_concurrent_futures_Future_done(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return _concurrent_futures_Future_done_impl((FutureObject *)self);
+}
+
+PyDoc_STRVAR(_concurrent_futures_Future_add_done_callback__doc__,
+"add_done_callback($self, fn, /)\n"
+"--\n"
+"\n"
+"Attaches a callable that will be called when the future finishes.\n"
+"\n"
+"Args:\n"
+"    fn: A callable that will be called with this future as its only\n"
+"        argument when the future completes or is cancelled. The callable\n"
+"        will always be called by a thread in the same process in which\n"
+"        it was added. If the future has already completed or been\n"
+"        cancelled then the callable will be called immediately. These\n"
+"        callables are called in the order that they were added.");
+
+#define _CONCURRENT_FUTURES_FUTURE_ADD_DONE_CALLBACK_METHODDEF    \
+    {"add_done_callback", (PyCFunction)_concurrent_futures_Future_add_done_callback, METH_O, _concurrent_futures_Future_add_done_callback__doc__},
+
+static PyObject *
+_concurrent_futures_Future_add_done_callback_impl(FutureObject *self,
+                                                  PyObject *fn);
+
+static PyObject *
+_concurrent_futures_Future_add_done_callback(PyObject *self, PyObject *fn)
+{
+    PyObject *return_value = NULL;
+
+    return_value = _concurrent_futures_Future_add_done_callback_impl((FutureObject *)self, fn);
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_concurrent_futures_Future_result__doc__,
+"result($self, /, timeout=None)\n"
+"--\n"
+"\n"
+"Return the result of the call that the future represents.\n"
+"\n"
+"Args:\n"
+"    timeout: The number of seconds to wait for the result if the future\n"
+"        isn\'t done. If None, then there is no limit on the wait time.\n"
+"\n"
+"Returns:\n"
+"    The result of the call that the future represents.\n"
+"\n"
+"Raises:\n"
+"    CancelledError: If the future was cancelled.\n"
+"    TimeoutError: If the future didn\'t finish executing before the given\n"
+"        timeout.\n"
+"    Exception: If the call raised then that exception will be raised.");
+
+#define _CONCURRENT_FUTURES_FUTURE_RESULT_METHODDEF    \
+    {"result", _PyCFunction_CAST(_concurrent_futures_Future_result), METH_FASTCALL|METH_KEYWORDS, _concurrent_futures_Future_result__doc__},
+
+static PyObject *
+_concurrent_futures_Future_result_impl(FutureObject *self, PyObject *timeout);
+
+static PyObject *
+_concurrent_futures_Future_result(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 1
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(timeout), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"timeout", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "result",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 0;
+    PyObject *timeout = Py_None;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 0, /*maxpos*/ 1, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    timeout = args[0];
+skip_optional_pos:
+    return_value = _concurrent_futures_Future_result_impl((FutureObject *)self, timeout);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_concurrent_futures_Future_exception__doc__,
+"exception($self, /, timeout=None)\n"
+"--\n"
+"\n"
+"Return the exception raised by the call that the future represents.\n"
+"\n"
+"Args:\n"
+"    timeout: The number of seconds to wait for the exception if the\n"
+"        future isn\'t done. If None, then there is no limit on the wait\n"
+"        time.\n"
+"\n"
+"Returns:\n"
+"    The exception raised by the call that the future represents or None\n"
+"    if the call completed without raising.\n"
+"\n"
+"Raises:\n"
+"    CancelledError: If the future was cancelled.\n"
+"    TimeoutError: If the future didn\'t finish executing before the given\n"
+"        timeout.");
+
+#define _CONCURRENT_FUTURES_FUTURE_EXCEPTION_METHODDEF    \
+    {"exception", _PyCFunction_CAST(_concurrent_futures_Future_exception), METH_FASTCALL|METH_KEYWORDS, _concurrent_futures_Future_exception__doc__},
+
+static PyObject *
+_concurrent_futures_Future_exception_impl(FutureObject *self,
+                                          PyObject *timeout);
+
+static PyObject *
+_concurrent_futures_Future_exception(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 1
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(timeout), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"timeout", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "exception",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 0;
+    PyObject *timeout = Py_None;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 0, /*maxpos*/ 1, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    timeout = args[0];
+skip_optional_pos:
+    return_value = _concurrent_futures_Future_exception_impl((FutureObject *)self, timeout);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_concurrent_futures_Future_set_running_or_notify_cancel__doc__,
+"set_running_or_notify_cancel($self, /)\n"
+"--\n"
+"\n"
+"Mark the future as running or process any cancel notifications.\n"
+"\n"
+"Should only be used by Executor implementations and unit tests.\n"
+"\n"
+"If the future has been cancelled (cancel() was called and returned\n"
+"True) then any threads waiting on the future completing (though calls\n"
+"to as_completed() or wait()) are notified and False is returned.\n"
+"\n"
+"If the future was not cancelled then it is put in the running state\n"
+"(future calls to running() will return True) and True is returned.\n"
+"\n"
+"This method should be called by Executor implementations before\n"
+"executing the work associated with this future. If this method returns\n"
+"False then the work should not be executed.\n"
+"\n"
+"Returns:\n"
+"    False if the Future was cancelled, True otherwise.\n"
+"\n"
+"Raises:\n"
+"    RuntimeError: if this method was already called or if set_result()\n"
+"        or set_exception() was called.");
+
+#define _CONCURRENT_FUTURES_FUTURE_SET_RUNNING_OR_NOTIFY_CANCEL_METHODDEF    \
+    {"set_running_or_notify_cancel", (PyCFunction)_concurrent_futures_Future_set_running_or_notify_cancel, METH_NOARGS, _concurrent_futures_Future_set_running_or_notify_cancel__doc__},
+
+static PyObject *
+_concurrent_futures_Future_set_running_or_notify_cancel_impl(FutureObject *self);
+
+static PyObject *
+_concurrent_futures_Future_set_running_or_notify_cancel(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return _concurrent_futures_Future_set_running_or_notify_cancel_impl((FutureObject *)self);
+}
+
+PyDoc_STRVAR(_concurrent_futures_Future_set_result__doc__,
+"set_result($self, result, /)\n"
+"--\n"
+"\n"
+"Sets the return value of work associated with the future.\n"
+"\n"
+"Should only be used by Executor implementations and unit tests.");
+
+#define _CONCURRENT_FUTURES_FUTURE_SET_RESULT_METHODDEF    \
+    {"set_result", (PyCFunction)_concurrent_futures_Future_set_result, METH_O, _concurrent_futures_Future_set_result__doc__},
+
+static PyObject *
+_concurrent_futures_Future_set_result_impl(FutureObject *self,
+                                           PyObject *result);
+
+static PyObject *
+_concurrent_futures_Future_set_result(PyObject *self, PyObject *result)
+{
+    PyObject *return_value = NULL;
+
+    return_value = _concurrent_futures_Future_set_result_impl((FutureObject *)self, result);
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_concurrent_futures_Future_set_exception__doc__,
+"set_exception($self, exception, /)\n"
+"--\n"
+"\n"
+"Sets the result of the future as being the given exception.\n"
+"\n"
+"Should only be used by Executor implementations and unit tests.");
+
+#define _CONCURRENT_FUTURES_FUTURE_SET_EXCEPTION_METHODDEF    \
+    {"set_exception", (PyCFunction)_concurrent_futures_Future_set_exception, METH_O, _concurrent_futures_Future_set_exception__doc__},
+
+static PyObject *
+_concurrent_futures_Future_set_exception_impl(FutureObject *self,
+                                              PyObject *exception);
+
+static PyObject *
+_concurrent_futures_Future_set_exception(PyObject *self, PyObject *exception)
+{
+    PyObject *return_value = NULL;
+
+    return_value = _concurrent_futures_Future_set_exception_impl((FutureObject *)self, exception);
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_concurrent_futures_Future__get_snapshot__doc__,
+"_get_snapshot($self, /)\n"
+"--\n"
+"\n"
+"Get a snapshot of the future\'s current state.\n"
+"\n"
+"This method atomically retrieves the state in one lock acquisition,\n"
+"which is significantly faster than multiple method calls.\n"
+"\n"
+"Returns:\n"
+"    Tuple of (done, cancelled, result, exception)\n"
+"    - done: True if the future is done (cancelled or finished)\n"
+"    - cancelled: True if the future was cancelled\n"
+"    - result: The result if available and not cancelled\n"
+"    - exception: The exception if available and not cancelled");
+
+#define _CONCURRENT_FUTURES_FUTURE__GET_SNAPSHOT_METHODDEF    \
+    {"_get_snapshot", (PyCFunction)_concurrent_futures_Future__get_snapshot, METH_NOARGS, _concurrent_futures_Future__get_snapshot__doc__},
+
+static PyObject *
+_concurrent_futures_Future__get_snapshot_impl(FutureObject *self);
+
+static PyObject *
+_concurrent_futures_Future__get_snapshot(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return _concurrent_futures_Future__get_snapshot_impl((FutureObject *)self);
+}
+
+PyDoc_STRVAR(_concurrent_futures__FutureCondition_acquire__doc__,
+"acquire($self, /, blocking=True, timeout=-1)\n"
+"--\n"
+"\n"
+"Acquire the lock of the future.");
+
+#define _CONCURRENT_FUTURES__FUTURECONDITION_ACQUIRE_METHODDEF    \
+    {"acquire", _PyCFunction_CAST(_concurrent_futures__FutureCondition_acquire), METH_FASTCALL|METH_KEYWORDS, _concurrent_futures__FutureCondition_acquire__doc__},
+
+static PyObject *
+_concurrent_futures__FutureCondition_acquire_impl(FutureConditionObject *self,
+                                                  int blocking,
+                                                  PyObject *timeout_obj);
+
+static PyObject *
+_concurrent_futures__FutureCondition_acquire(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 2
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(blocking), &_Py_ID(timeout), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"blocking", "timeout", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "acquire",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[2];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 0;
+    int blocking = 1;
+    PyObject *timeout_obj = NULL;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 0, /*maxpos*/ 2, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    if (args[0]) {
+        blocking = PyObject_IsTrue(args[0]);
+        if (blocking < 0) {
+            goto exit;
+        }
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    timeout_obj = args[1];
+skip_optional_pos:
+    return_value = _concurrent_futures__FutureCondition_acquire_impl((FutureConditionObject *)self, blocking, timeout_obj);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_concurrent_futures__FutureCondition___enter____doc__,
+"__enter__($self, /)\n"
+"--\n"
+"\n"
+"Acquire the lock of the future.");
+
+#define _CONCURRENT_FUTURES__FUTURECONDITION___ENTER___METHODDEF    \
+    {"__enter__", (PyCFunction)_concurrent_futures__FutureCondition___enter__, METH_NOARGS, _concurrent_futures__FutureCondition___enter____doc__},
+
+static PyObject *
+_concurrent_futures__FutureCondition___enter___impl(FutureConditionObject *self);
+
+static PyObject *
+_concurrent_futures__FutureCondition___enter__(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return _concurrent_futures__FutureCondition___enter___impl((FutureConditionObject *)self);
+}
+
+PyDoc_STRVAR(_concurrent_futures__FutureCondition_release__doc__,
+"release($self, /)\n"
+"--\n"
+"\n"
+"Release the lock of the future.");
+
+#define _CONCURRENT_FUTURES__FUTURECONDITION_RELEASE_METHODDEF    \
+    {"release", (PyCFunction)_concurrent_futures__FutureCondition_release, METH_NOARGS, _concurrent_futures__FutureCondition_release__doc__},
+
+static PyObject *
+_concurrent_futures__FutureCondition_release_impl(FutureConditionObject *self);
+
+static PyObject *
+_concurrent_futures__FutureCondition_release(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return _concurrent_futures__FutureCondition_release_impl((FutureConditionObject *)self);
+}
+
+PyDoc_STRVAR(_concurrent_futures__FutureCondition___exit____doc__,
+"__exit__($self, exc_type, exc_value, exc_tb, /)\n"
+"--\n"
+"\n"
+"Release the lock of the future.");
+
+#define _CONCURRENT_FUTURES__FUTURECONDITION___EXIT___METHODDEF    \
+    {"__exit__", _PyCFunction_CAST(_concurrent_futures__FutureCondition___exit__), METH_FASTCALL, _concurrent_futures__FutureCondition___exit____doc__},
+
+static PyObject *
+_concurrent_futures__FutureCondition___exit___impl(FutureConditionObject *self,
+                                                   PyObject *exc_type,
+                                                   PyObject *exc_value,
+                                                   PyObject *exc_tb);
+
+static PyObject *
+_concurrent_futures__FutureCondition___exit__(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *exc_type;
+    PyObject *exc_value;
+    PyObject *exc_tb;
+
+    if (!_PyArg_CheckPositional("__exit__", nargs, 3, 3)) {
+        goto exit;
+    }
+    exc_type = args[0];
+    exc_value = args[1];
+    exc_tb = args[2];
+    return_value = _concurrent_futures__FutureCondition___exit___impl((FutureConditionObject *)self, exc_type, exc_value, exc_tb);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_concurrent_futures__FutureCondition_wait__doc__,
+"wait($self, /, timeout=None)\n"
+"--\n"
+"\n"
+"Wait until notified or until a timeout occurs.\n"
+"\n"
+"The lock of the future must be held.  Return False if the timeout\n"
+"expired, True otherwise.");
+
+#define _CONCURRENT_FUTURES__FUTURECONDITION_WAIT_METHODDEF    \
+    {"wait", _PyCFunction_CAST(_concurrent_futures__FutureCondition_wait), METH_FASTCALL|METH_KEYWORDS, _concurrent_futures__FutureCondition_wait__doc__},
+
+static PyObject *
+_concurrent_futures__FutureCondition_wait_impl(FutureConditionObject *self,
+                                               PyObject *timeout);
+
+static PyObject *
+_concurrent_futures__FutureCondition_wait(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 1
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(timeout), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"timeout", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "wait",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 0;
+    PyObject *timeout = Py_None;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 0, /*maxpos*/ 1, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    timeout = args[0];
+skip_optional_pos:
+    return_value = _concurrent_futures__FutureCondition_wait_impl((FutureConditionObject *)self, timeout);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_concurrent_futures__FutureCondition_notify_all__doc__,
+"notify_all($self, /)\n"
+"--\n"
+"\n"
+"Wake up all threads waiting on the future.\n"
+"\n"
+"The lock of the future must be held.");
+
+#define _CONCURRENT_FUTURES__FUTURECONDITION_NOTIFY_ALL_METHODDEF    \
+    {"notify_all", (PyCFunction)_concurrent_futures__FutureCondition_notify_all, METH_NOARGS, _concurrent_futures__FutureCondition_notify_all__doc__},
+
+static PyObject *
+_concurrent_futures__FutureCondition_notify_all_impl(FutureConditionObject *self);
+
+static PyObject *
+_concurrent_futures__FutureCondition_notify_all(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return _concurrent_futures__FutureCondition_notify_all_impl((FutureConditionObject *)self);
+}
+/*[clinic end generated code: output=6ab66ecbd2f1abdb input=a9049054013a1b77]*/
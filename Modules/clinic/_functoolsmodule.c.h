@@ -192,4 +192,52 @@ _functools__lru_cache_wrapper_cache_clear(PyObject *self, PyObject *Py_UNUSED(ig
 
     return return_value;
 }
-/*[clinic end generated code: output=7f2abc718fcc35d5 input=a9049054013a1b77]*/
+
+PyDoc_STRVAR(_functools__policy_cache_wrapper_cache_info__doc__,
+"cache_info($self, /)\n"
+"--\n"
+"\n"
+"Report cache statistics");
+
+#define _FUNCTOOLS__POLICY_CACHE_WRAPPER_CACHE_INFO_METHODDEF    \
+    {"cache_info", (PyCFunction)_functools__policy_cache_wrapper_cache_info, METH_NOARGS, _functools__policy_cache_wrapper_cache_info__doc__},
+
+static PyObject *
+_functools__policy_cache_wrapper_cache_info_impl(PyObject *self);
+
+static PyObject *
+_functools__policy_cache_wrapper_cache_info(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _functools__policy_cache_wrapper_cache_info_impl(self);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_functools__policy_cache_wrapper_cache_clear__doc__,
+"cache_clear($self, /)\n"
+"--\n"
+"\n"
+"Clear the cache and cache statistics");
+
+#define _FUNCTOOLS__POLICY_CACHE_WRAPPER_CACHE_CLEAR_METHODDEF    \
+    {"cache_clear", (PyCFunction)_functools__policy_cache_wrapper_cache_clear, METH_NOARGS, _functools__policy_cache_wrapper_cache_clear__doc__},
+
+static PyObject *
+_functools__policy_cache_wrapper_cache_clear_impl(PyObject *self);
+
+static PyObject *
+_functools__policy_cache_wrapper_cache_clear(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _functools__policy_cache_wrapper_cache_clear_impl(self);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+/*[clinic end generated code: output=79fe96c9eb308a36 input=a9049054013a1b77]*/
@@ -1118,6 +1118,1033 @@ exit:
 
 #endif /* defined(HAVE_EPOLL) */
 
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring__doc__,
+"io_uring(entries=256)\n"
+"--\n"
+"\n"
+"Returns an io_uring object.\n"
+"\n"
+"  entries\n"
+"    The size of the submission queue.  The kernel rounds it up to\n"
+"    a power of two.");
+
+static PyObject *
+select_io_uring_impl(PyTypeObject *type, int entries);
+
+static PyObject *
+select_io_uring(PyTypeObject *type, PyObject *args, PyObject *kwargs)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 1
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(entries), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"entries", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "io_uring",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    PyObject * const *fastargs;
+    Py_ssize_t nargs = PyTuple_GET_SIZE(args);
+    Py_ssize_t noptargs = nargs + (kwargs ? PyDict_GET_SIZE(kwargs) : 0) - 0;
+    int entries = 256;
+
+    fastargs = _PyArg_UnpackKeywords(_PyTuple_CAST(args)->ob_item, nargs, kwargs, NULL, &_parser,
+            /*minpos*/ 0, /*maxpos*/ 1, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!fastargs) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    entries = PyLong_AsInt(fastargs[0]);
+    if (entries == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional_pos:
+    return_value = select_io_uring_impl(type, entries);
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_close__doc__,
+"close($self, /)\n"
+"--\n"
+"\n"
+"Close the io_uring file descriptor.\n"
+"\n"
+"Requests in flight are cancelled first, and their completion is waited\n"
+"for.  Further operations on the io_uring object will raise an exception.");
+
+#define SELECT_IO_URING_CLOSE_METHODDEF    \
+    {"close", (PyCFunction)select_io_uring_close, METH_NOARGS, select_io_uring_close__doc__},
+
+static PyObject *
+select_io_uring_close_impl(pyIoUring_Object *self);
+
+static PyObject *
+select_io_uring_close(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = select_io_uring_close_impl((pyIoUring_Object *)self);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_fileno__doc__,
+"fileno($self, /)\n"
+"--\n"
+"\n"
+"Return the io_uring file descriptor.");
+
+#define SELECT_IO_URING_FILENO_METHODDEF    \
+    {"fileno", (PyCFunction)select_io_uring_fileno, METH_NOARGS, select_io_uring_fileno__doc__},
+
+static PyObject *
+select_io_uring_fileno_impl(pyIoUring_Object *self);
+
+static PyObject *
+select_io_uring_fileno(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return select_io_uring_fileno_impl((pyIoUring_Object *)self);
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_nop__doc__,
+"nop($self, /, user_data)\n"
+"--\n"
+"\n"
+"Queue a request which does nothing.\n"
+"\n"
+"  user_data\n"
+"    the identifier of the request, reported with its completion");
+
+#define SELECT_IO_URING_NOP_METHODDEF    \
+    {"nop", _PyCFunction_CAST(select_io_uring_nop), METH_FASTCALL|METH_KEYWORDS, select_io_uring_nop__doc__},
+
+static PyObject *
+select_io_uring_nop_impl(pyIoUring_Object *self,
+                         unsigned long long user_data);
+
+static PyObject *
+select_io_uring_nop(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 1
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(user_data), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"user_data", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "nop",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    unsigned long long user_data;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 1, /*maxpos*/ 1, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!_PyLong_UnsignedLongLong_Converter(args[0], &user_data)) {
+        goto exit;
+    }
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = select_io_uring_nop_impl((pyIoUring_Object *)self, user_data);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_read__doc__,
+"read($self, /, user_data, fd, buffer, offset=-1)\n"
+"--\n"
+"\n"
+"Queue a request reading from a file descriptor into a buffer.\n"
+"\n"
+"  user_data\n"
+"    the identifier of the request, reported with its completion\n"
+"  fd\n"
+"    the file descriptor to read from\n"
+"  buffer\n"
+"    a writable bytes-like object to read into\n"
+"  offset\n"
+"    the file offset to read at; -1 means the current file position\n"
+"\n"
+"The result of the request is the number of bytes read.");
+
+#define SELECT_IO_URING_READ_METHODDEF    \
+    {"read", _PyCFunction_CAST(select_io_uring_read), METH_FASTCALL|METH_KEYWORDS, select_io_uring_read__doc__},
+
+static PyObject *
+select_io_uring_read_impl(pyIoUring_Object *self,
+                          unsigned long long user_data, int fd,
+                          PyObject *buffer, long long offset);
+
+static PyObject *
+select_io_uring_read(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 4
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(user_data), &_Py_ID(fd), &_Py_ID(buffer), &_Py_ID(offset), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"user_data", "fd", "buffer", "offset", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "read",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[4];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 3;
+    unsigned long long user_data;
+    int fd;
+    PyObject *buffer;
+    long long offset = -1;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 3, /*maxpos*/ 4, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!_PyLong_UnsignedLongLong_Converter(args[0], &user_data)) {
+        goto exit;
+    }
+    fd = PyObject_AsFileDescriptor(args[1]);
+    if (fd < 0) {
+        goto exit;
+    }
+    buffer = args[2];
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    offset = PyLong_AsLongLong(args[3]);
+    if (offset == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional_pos:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = select_io_uring_read_impl((pyIoUring_Object *)self, user_data, fd, buffer, offset);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_write__doc__,
+"write($self, /, user_data, fd, data, offset=-1)\n"
+"--\n"
+"\n"
+"Queue a request writing data to a file descriptor.\n"
+"\n"
+"  user_data\n"
+"    the identifier of the request, reported with its completion\n"
+"  fd\n"
+"    the file descriptor to write to\n"
+"  data\n"
+"    a bytes-like object to write\n"
+"  offset\n"
+"    the file offset to write at; -1 means the current file position\n"
+"\n"
+"The result of the request is the number of bytes written.");
+
+#define SELECT_IO_URING_WRITE_METHODDEF    \
+    {"write", _PyCFunction_CAST(select_io_uring_write), METH_FASTCALL|METH_KEYWORDS, select_io_uring_write__doc__},
+
+static PyObject *
+select_io_uring_write_impl(pyIoUring_Object *self,
+                           unsigned long long user_data, int fd,
+                           PyObject *data, long long offset);
+
+static PyObject *
+select_io_uring_write(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 4
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(user_data), &_Py_ID(fd), &_Py_ID(data), &_Py_ID(offset), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"user_data", "fd", "data", "offset", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "write",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[4];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 3;
+    unsigned long long user_data;
+    int fd;
+    PyObject *data;
+    long long offset = -1;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 3, /*maxpos*/ 4, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!_PyLong_UnsignedLongLong_Converter(args[0], &user_data)) {
+        goto exit;
+    }
+    fd = PyObject_AsFileDescriptor(args[1]);
+    if (fd < 0) {
+        goto exit;
+    }
+    data = args[2];
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    offset = PyLong_AsLongLong(args[3]);
+    if (offset == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional_pos:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = select_io_uring_write_impl((pyIoUring_Object *)self, user_data, fd, data, offset);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_recv__doc__,
+"recv($self, /, user_data, fd, buffer, flags=0)\n"
+"--\n"
+"\n"
+"Queue a request receiving data from a socket into a buffer.\n"
+"\n"
+"  user_data\n"
+"    the identifier of the request, reported with its completion\n"
+"  fd\n"
+"    the socket to receive from\n"
+"  buffer\n"
+"    a writable bytes-like object to receive into\n"
+"  flags\n"
+"    the flags of recv(2)\n"
+"\n"
+"The result of the request is the number of bytes received.");
+
+#define SELECT_IO_URING_RECV_METHODDEF    \
+    {"recv", _PyCFunction_CAST(select_io_uring_recv), METH_FASTCALL|METH_KEYWORDS, select_io_uring_recv__doc__},
+
+static PyObject *
+select_io_uring_recv_impl(pyIoUring_Object *self,
+                          unsigned long long user_data, int fd,
+                          PyObject *buffer, int flags);
+
+static PyObject *
+select_io_uring_recv(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 4
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(user_data), &_Py_ID(fd), &_Py_ID(buffer), &_Py_ID(flags), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"user_data", "fd", "buffer", "flags", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "recv",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[4];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 3;
+    unsigned long long user_data;
+    int fd;
+    PyObject *buffer;
+    int flags = 0;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 3, /*maxpos*/ 4, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!_PyLong_UnsignedLongLong_Converter(args[0], &user_data)) {
+        goto exit;
+    }
+    fd = PyObject_AsFileDescriptor(args[1]);
+    if (fd < 0) {
+        goto exit;
+    }
+    buffer = args[2];
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    flags = PyLong_AsInt(args[3]);
+    if (flags == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional_pos:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = select_io_uring_recv_impl((pyIoUring_Object *)self, user_data, fd, buffer, flags);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_send__doc__,
+"send($self, /, user_data, fd, data, flags=0)\n"
+"--\n"
+"\n"
+"Queue a request sending data to a socket.\n"
+"\n"
+"  user_data\n"
+"    the identifier of the request, reported with its completion\n"
+"  fd\n"
+"    the socket to send to\n"
+"  data\n"
+"    a bytes-like object to send\n"
+"  flags\n"
+"    the flags of send(2)\n"
+"\n"
+"The result of the request is the number of bytes sent.");
+
+#define SELECT_IO_URING_SEND_METHODDEF    \
+    {"send", _PyCFunction_CAST(select_io_uring_send), METH_FASTCALL|METH_KEYWORDS, select_io_uring_send__doc__},
+
+static PyObject *
+select_io_uring_send_impl(pyIoUring_Object *self,
+                          unsigned long long user_data, int fd,
+                          PyObject *data, int flags);
+
+static PyObject *
+select_io_uring_send(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 4
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(user_data), &_Py_ID(fd), &_Py_ID(data), &_Py_ID(flags), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"user_data", "fd", "data", "flags", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "send",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[4];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 3;
+    unsigned long long user_data;
+    int fd;
+    PyObject *data;
+    int flags = 0;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 3, /*maxpos*/ 4, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!_PyLong_UnsignedLongLong_Converter(args[0], &user_data)) {
+        goto exit;
+    }
+    fd = PyObject_AsFileDescriptor(args[1]);
+    if (fd < 0) {
+        goto exit;
+    }
+    data = args[2];
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    flags = PyLong_AsInt(args[3]);
+    if (flags == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional_pos:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = select_io_uring_send_impl((pyIoUring_Object *)self, user_data, fd, data, flags);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_accept__doc__,
+"accept($self, /, user_data, fd, flags=0)\n"
+"--\n"
+"\n"
+"Queue a request accepting a connection on a socket.\n"
+"\n"
+"  user_data\n"
+"    the identifier of the request, reported with its completion\n"
+"  fd\n"
+"    the listening socket\n"
+"  flags\n"
+"    the flags of accept4(2)\n"
+"\n"
+"The result of the request is the file descriptor of the new connection.");
+
+#define SELECT_IO_URING_ACCEPT_METHODDEF    \
+    {"accept", _PyCFunction_CAST(select_io_uring_accept), METH_FASTCALL|METH_KEYWORDS, select_io_uring_accept__doc__},
+
+static PyObject *
+select_io_uring_accept_impl(pyIoUring_Object *self,
+                            unsigned long long user_data, int fd, int flags);
+
+static PyObject *
+select_io_uring_accept(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 3
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(user_data), &_Py_ID(fd), &_Py_ID(flags), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"user_data", "fd", "flags", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "accept",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[3];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 2;
+    unsigned long long user_data;
+    int fd;
+    int flags = 0;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 2, /*maxpos*/ 3, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!_PyLong_UnsignedLongLong_Converter(args[0], &user_data)) {
+        goto exit;
+    }
+    fd = PyObject_AsFileDescriptor(args[1]);
+    if (fd < 0) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    flags = PyLong_AsInt(args[2]);
+    if (flags == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional_pos:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = select_io_uring_accept_impl((pyIoUring_Object *)self, user_data, fd, flags);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_poll_add__doc__,
+"poll_add($self, /, user_data, fd, eventmask)\n"
+"--\n"
+"\n"
+"Queue a request waiting for events on a file descriptor.\n"
+"\n"
+"  user_data\n"
+"    the identifier of the request, reported with its completion\n"
+"  fd\n"
+"    the file descriptor to poll\n"
+"  eventmask\n"
+"    a bit set composed of the various POLL constants\n"
+"\n"
+"The result of the request is the bit set of events that occurred.");
+
+#define SELECT_IO_URING_POLL_ADD_METHODDEF    \
+    {"poll_add", _PyCFunction_CAST(select_io_uring_poll_add), METH_FASTCALL|METH_KEYWORDS, select_io_uring_poll_add__doc__},
+
+static PyObject *
+select_io_uring_poll_add_impl(pyIoUring_Object *self,
+                              unsigned long long user_data, int fd,
+                              unsigned int eventmask);
+
+static PyObject *
+select_io_uring_poll_add(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 3
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(user_data), &_Py_ID(fd), &_Py_ID(eventmask), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"user_data", "fd", "eventmask", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "poll_add",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[3];
+    unsigned long long user_data;
+    int fd;
+    unsigned int eventmask;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 3, /*maxpos*/ 3, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!_PyLong_UnsignedLongLong_Converter(args[0], &user_data)) {
+        goto exit;
+    }
+    fd = PyObject_AsFileDescriptor(args[1]);
+    if (fd < 0) {
+        goto exit;
+    }
+    {
+        Py_ssize_t _bytes = PyLong_AsNativeBytes(args[2], &eventmask, sizeof(unsigned int),
+                Py_ASNATIVEBYTES_NATIVE_ENDIAN |
+                Py_ASNATIVEBYTES_ALLOW_INDEX |
+                Py_ASNATIVEBYTES_UNSIGNED_BUFFER);
+        if (_bytes < 0) {
+            goto exit;
+        }
+        if ((size_t)_bytes > sizeof(unsigned int)) {
+            if (PyErr_WarnEx(PyExc_DeprecationWarning,
+                "integer value out of range", 1) < 0)
+            {
+                goto exit;
+            }
+        }
+    }
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = select_io_uring_poll_add_impl((pyIoUring_Object *)self, user_data, fd, eventmask);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_cancel__doc__,
+"cancel($self, /, user_data, target)\n"
+"--\n"
+"\n"
+"Queue a request cancelling another request in flight.\n"
+"\n"
+"  user_data\n"
+"    the identifier of the request, reported with its completion\n"
+"  target\n"
+"    the user_data of the request to cancel\n"
+"\n"
+"The result of the request is 0 if the target request was cancelled,\n"
+"or a negative errno value.  A cancelled request completes with\n"
+"-ECANCELED (or -EINTR), unless it already completed.");
+
+#define SELECT_IO_URING_CANCEL_METHODDEF    \
+    {"cancel", _PyCFunction_CAST(select_io_uring_cancel), METH_FASTCALL|METH_KEYWORDS, select_io_uring_cancel__doc__},
+
+static PyObject *
+select_io_uring_cancel_impl(pyIoUring_Object *self,
+                            unsigned long long user_data,
+                            unsigned long long target);
+
+static PyObject *
+select_io_uring_cancel(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 2
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(user_data), &_Py_ID(target), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"user_data", "target", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "cancel",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[2];
+    unsigned long long user_data;
+    unsigned long long target;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 2, /*maxpos*/ 2, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!_PyLong_UnsignedLongLong_Converter(args[0], &user_data)) {
+        goto exit;
+    }
+    if (!_PyLong_UnsignedLongLong_Converter(args[1], &target)) {
+        goto exit;
+    }
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = select_io_uring_cancel_impl((pyIoUring_Object *)self, user_data, target);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_submit__doc__,
+"submit($self, /)\n"
+"--\n"
+"\n"
+"Submit the queued requests to the kernel without waiting.\n"
+"\n"
+"Returns the number of requests submitted.");
+
+#define SELECT_IO_URING_SUBMIT_METHODDEF    \
+    {"submit", (PyCFunction)select_io_uring_submit, METH_NOARGS, select_io_uring_submit__doc__},
+
+static PyObject *
+select_io_uring_submit_impl(pyIoUring_Object *self);
+
+static PyObject *
+select_io_uring_submit(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = select_io_uring_submit_impl((pyIoUring_Object *)self);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_wait__doc__,
+"wait($self, /, timeout=None)\n"
+"--\n"
+"\n"
+"Submit the queued requests and wait for completions.\n"
+"\n"
+"  timeout\n"
+"    the maximum time to wait in seconds (with fractions);\n"
+"    a timeout of None or a negative number makes wait() wait\n"
+"    indefinitely\n"
+"\n"
+"Returns a list of (user_data, result, flags) 3-tuples for the completed\n"
+"requests.  The result is the return value of the equivalent system call,\n"
+"or a negative errno value on failure.  The list is empty if no request\n"
+"completed before the timeout expired.");
+
+#define SELECT_IO_URING_WAIT_METHODDEF    \
+    {"wait", _PyCFunction_CAST(select_io_uring_wait), METH_FASTCALL|METH_KEYWORDS, select_io_uring_wait__doc__},
+
+static PyObject *
+select_io_uring_wait_impl(pyIoUring_Object *self, PyObject *timeout_obj);
+
+static PyObject *
+select_io_uring_wait(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 1
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(timeout), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"timeout", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "wait",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 0;
+    PyObject *timeout_obj = Py_None;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 0, /*maxpos*/ 1, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    timeout_obj = args[0];
+skip_optional_pos:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = select_io_uring_wait_impl((pyIoUring_Object *)self, timeout_obj);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring___enter____doc__,
+"__enter__($self, /)\n"
+"--\n"
+"\n");
+
+#define SELECT_IO_URING___ENTER___METHODDEF    \
+    {"__enter__", (PyCFunction)select_io_uring___enter__, METH_NOARGS, select_io_uring___enter____doc__},
+
+static PyObject *
+select_io_uring___enter___impl(pyIoUring_Object *self);
+
+static PyObject *
+select_io_uring___enter__(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return select_io_uring___enter___impl((pyIoUring_Object *)self);
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring___exit____doc__,
+"__exit__($self, exc_type=None, exc_value=None, exc_tb=None, /)\n"
+"--\n"
+"\n");
+
+#define SELECT_IO_URING___EXIT___METHODDEF    \
+    {"__exit__", _PyCFunction_CAST(select_io_uring___exit__), METH_FASTCALL, select_io_uring___exit____doc__},
+
+static PyObject *
+select_io_uring___exit___impl(pyIoUring_Object *self, PyObject *exc_type,
+                              PyObject *exc_value, PyObject *exc_tb);
+
+static PyObject *
+select_io_uring___exit__(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *exc_type = Py_None;
+    PyObject *exc_value = Py_None;
+    PyObject *exc_tb = Py_None;
+
+    if (!_PyArg_CheckPositional("__exit__", nargs, 0, 3)) {
+        goto exit;
+    }
+    if (nargs < 1) {
+        goto skip_optional;
+    }
+    exc_type = args[0];
+    if (nargs < 2) {
+        goto skip_optional;
+    }
+    exc_value = args[1];
+    if (nargs < 3) {
+        goto skip_optional;
+    }
+    exc_tb = args[2];
+skip_optional:
+    return_value = select_io_uring___exit___impl((pyIoUring_Object *)self, exc_type, exc_value, exc_tb);
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
 #if defined(HAVE_KQUEUE)
 
 PyDoc_STRVAR(select_kqueue__doc__,
@@ -1384,6 +2411,62 @@ exit:
     #define SELECT_EPOLL___EXIT___METHODDEF
 #endif /* !defined(SELECT_EPOLL___EXIT___METHODDEF) */
 
+#ifndef SELECT_IO_URING_CLOSE_METHODDEF
+    #define SELECT_IO_URING_CLOSE_METHODDEF
+#endif /* !defined(SELECT_IO_URING_CLOSE_METHODDEF) */
+
+#ifndef SELECT_IO_URING_FILENO_METHODDEF
+    #define SELECT_IO_URING_FILENO_METHODDEF
+#endif /* !defined(SELECT_IO_URING_FILENO_METHODDEF) */
+
+#ifndef SELECT_IO_URING_NOP_METHODDEF
+    #define SELECT_IO_URING_NOP_METHODDEF
+#endif /* !defined(SELECT_IO_URING_NOP_METHODDEF) */
+
+#ifndef SELECT_IO_URING_READ_METHODDEF
+    #define SELECT_IO_URING_READ_METHODDEF
+#endif /* !defined(SELECT_IO_URING_READ_METHODDEF) */
+
+#ifndef SELECT_IO_URING_WRITE_METHODDEF
+    #define SELECT_IO_URING_WRITE_METHODDEF
+#endif /* !defined(SELECT_IO_URING_WRITE_METHODDEF) */
+
+#ifndef SELECT_IO_URING_RECV_METHODDEF
+    #define SELECT_IO_URING_RECV_METHODDEF
+#endif /* !defined(SELECT_IO_URING_RECV_METHODDEF) */
+
+#ifndef SELECT_IO_URING_SEND_METHODDEF
+    #define SELECT_IO_URING_SEND_METHODDEF
+#endif /* !defined(SELECT_IO_URING_SEND_METHODDEF) */
+
+#ifndef SELECT_IO_URING_ACCEPT_METHODDEF
+    #define SELECT_IO_URING_ACCEPT_METHODDEF
+#endif /* !defined(SELECT_IO_URING_ACCEPT_METHODDEF) */
+
+#ifndef SELECT_IO_URING_POLL_ADD_METHODDEF
+    #define SELECT_IO_URING_POLL_ADD_METHODDEF
+#endif /* !defined(SELECT_IO_URING_POLL_ADD_METHODDEF) */
+
+#ifndef SELECT_IO_URING_CANCEL_METHODDEF
+    #define SELECT_IO_URING_CANCEL_METHODDEF
+#endif /* !defined(SELECT_IO_URING_CANCEL_METHODDEF) */
+
+#ifndef SELECT_IO_URING_SUBMIT_METHODDEF
+    #define SELECT_IO_URING_SUBMIT_METHODDEF
+#endif /* !defined(SELECT_IO_URING_SUBMIT_METHODDEF) */
+
+#ifndef SELECT_IO_URING_WAIT_METHODDEF
+    #define SELECT_IO_URING_WAIT_METHODDEF
+#endif /* !defined(SELECT_IO_URING_WAIT_METHODDEF) */
+
+#ifndef SELECT_IO_URING___ENTER___METHODDEF
+    #define SELECT_IO_URING___ENTER___METHODDEF
+#endif /* !defined(SELECT_IO_URING___ENTER___METHODDEF) */
+
+#ifndef SELECT_IO_URING___EXIT___METHODDEF
+    #define SELECT_IO_URING___EXIT___METHODDEF
+#endif /* !defined(SELECT_IO_URING___EXIT___METHODDEF) */
+
 #ifndef SELECT_KQUEUE_CLOSE_METHODDEF
     #define SELECT_KQUEUE_CLOSE_METHODDEF
 #endif /* !defined(SELECT_KQUEUE_CLOSE_METHODDEF) */
@@ -1399,4 +2482,4 @@ exit:
 #ifndef SELECT_KQUEUE_CONTROL_METHODDEF
     #define SELECT_KQUEUE_CONTROL_METHODDEF
 #endif /* !defined(SELECT_KQUEUE_CONTROL_METHODDEF) */
-/*[clinic end generated code: output=52e3be5cc66cf1b6 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=8b4d34fc3ee63858 input=a9049054013a1b77]*/
@@ -1006,6 +1006,87 @@ exit:
     return return_value;
 }
 
+PyDoc_STRVAR(zlib__ZlibDecompressor__decompress_block__doc__,
+"_decompress_block($self, data, /)\n"
+"--\n"
+"\n"
+"Decompress *data* up to the end of the current deflate block.\n"
+"\n"
+"Return a tuple (output, total_in, data_type): the decompressed data,\n"
+"the number of input bytes consumed since the decompressor was created\n"
+"and the data_type field of the zlib stream.  If bit 7 of data_type is\n"
+"set, decompression stopped at a block boundary and its low 3 bits give\n"
+"the number of unused bits in the last input byte consumed.  Unconsumed\n"
+"input is kept for the next call, as by decompress().");
+
+#define ZLIB__ZLIBDECOMPRESSOR__DECOMPRESS_BLOCK_METHODDEF    \
+    {"_decompress_block", (PyCFunction)zlib__ZlibDecompressor__decompress_block, METH_O, zlib__ZlibDecompressor__decompress_block__doc__},
+
+static PyObject *
+zlib__ZlibDecompressor__decompress_block_impl(ZlibDecompressor *self,
+                                              Py_buffer *data);
+
+static PyObject *
+zlib__ZlibDecompressor__decompress_block(PyObject *self, PyObject *arg)
+{
+    PyObject *return_value = NULL;
+    Py_buffer data = {NULL, NULL};
+
+    if (PyObject_GetBuffer(arg, &data, PyBUF_SIMPLE) != 0) {
+        goto exit;
+    }
+    return_value = zlib__ZlibDecompressor__decompress_block_impl((ZlibDecompressor *)self, &data);
+
+exit:
+    /* Cleanup for data */
+    if (data.obj) {
+       PyBuffer_Release(&data);
+    }
+
+    return return_value;
+}
+
+PyDoc_STRVAR(zlib__ZlibDecompressor__prime__doc__,
+"_prime($self, bits, value, /)\n"
+"--\n"
+"\n"
+"Insert *bits* bits of *value* into the input stream.\n"
+"\n"
+"This must be called before any data is decompressed.  It is used to\n"
+"resume decompression of a raw deflate stream at a position that is not\n"
+"byte aligned.");
+
+#define ZLIB__ZLIBDECOMPRESSOR__PRIME_METHODDEF    \
+    {"_prime", _PyCFunction_CAST(zlib__ZlibDecompressor__prime), METH_FASTCALL, zlib__ZlibDecompressor__prime__doc__},
+
+static PyObject *
+zlib__ZlibDecompressor__prime_impl(ZlibDecompressor *self, int bits,
+                                   int value);
+
+static PyObject *
+zlib__ZlibDecompressor__prime(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    int bits;
+    int value;
+
+    if (!_PyArg_CheckPositional("_prime", nargs, 2, 2)) {
+        goto exit;
+    }
+    bits = PyLong_AsInt(args[0]);
+    if (bits == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+    value = PyLong_AsInt(args[1]);
+    if (value == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+    return_value = zlib__ZlibDecompressor__prime_impl((ZlibDecompressor *)self, bits, value);
+
+exit:
+    return return_value;
+}
+
 PyDoc_STRVAR(zlib__ZlibDecompressor__doc__,
 "_ZlibDecompressor(wbits=MAX_WBITS, zdict=b\'\')\n"
 "--\n"
@@ -1402,4 +1483,4 @@ exit:
 #ifndef ZLIB_DECOMPRESS___DEEPCOPY___METHODDEF
     #define ZLIB_DECOMPRESS___DEEPCOPY___METHODDEF
 #endif /* !defined(ZLIB_DECOMPRESS___DEEPCOPY___METHODDEF) */
-/*[clinic end generated code: output=fa5fc356f3090cce input=a9049054013a1b77]*/
+/*[clinic end generated code: output=8fc8325ba72c4354 input=a9049054013a1b77]*/
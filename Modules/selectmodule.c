@@ -22,6 +22,15 @@
 #  include <unistd.h>             // close()
 #endif
 
+#ifdef HAVE_LINUX_IO_URING_H
+#  include <linux/io_uring.h>
+#  include <sys/mman.h>             // mmap()
+#  include <sys/syscall.h>          // syscall()
+#  if defined(__NR_io_uring_setup) && defined(IORING_ENTER_EXT_ARG)
+#    define HAVE_IO_URING 1
+#  endif
+#endif
+
 #ifdef HAVE_SYS_DEVPOLL_H
 #include <sys/resource.h>
 #include <sys/devpoll.h>
@@ -90,6 +99,7 @@ typedef struct {
     PyTypeObject *poll_Type;
     PyTypeObject *devpoll_Type;
     PyTypeObject *pyEpoll_Type;
+    PyTypeObject *pyIoUring_Type;
 #ifdef HAVE_KQUEUE
     PyTypeObject *kqueue_event_Type;
     PyTypeObject *kqueue_queue_Type;
@@ -115,9 +125,10 @@ module select
 class select.poll "pollObject *" "_selectstate_by_type(type)->poll_Type"
 class select.devpoll "devpollObject *" "_selectstate_by_type(type)->devpoll_Type"
 class select.epoll "pyEpoll_Object *" "_selectstate_by_type(type)->pyEpoll_Type"
+class select.io_uring "pyIoUring_Object *" "_selectstate_by_type(type)->pyIoUring_Type"
 class select.kqueue "kqueue_queue_Object *" "_selectstate_by_type(type)->kqueue_queue_Type"
 [clinic start generated code]*/
-/*[clinic end generated code: output=da39a3ee5e6b4b0d input=8072de35824aa327]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=daa749b086445bd7]*/
 
 /* list of Python objects and their file descriptor */
 typedef struct {
@@ -1772,6 +1783,966 @@ the maximum number of monitored events.");
 
 #endif /* HAVE_EPOLL */
 
+#ifdef HAVE_IO_URING
+/* **************************************************************************
+ *                      io_uring interface for Linux 5.11+
+ */
+
+/* user_data of the requests queued internally; their completions are never
+   reported to the caller. */
+#define IO_URING_INTERNAL UINT64_MAX
+
+typedef struct {
+    PyObject_HEAD
+    int ring_fd;                        /* io_uring file descriptor */
+    void *sq_ptr;                       /* submission queue ring */
+    size_t sq_size;
+    void *cq_ptr;                       /* completion queue ring */
+    size_t cq_size;
+    struct io_uring_sqe *sqes;          /* submission queue entries */
+    size_t sqes_size;
+    unsigned int *sq_head;
+    unsigned int *sq_tail;
+    unsigned int *sq_flags;
+    unsigned int sq_mask;
+    unsigned int sq_entries;
+    unsigned int *cq_head;
+    unsigned int *cq_tail;
+    unsigned int cq_mask;
+    struct io_uring_cqe *cqes;
+    /* Maps the user_data of the requests in flight to the memoryview
+       pinning their buffer, or None. */
+    PyObject *inflight;
+} pyIoUring_Object;
+
+#define pyIoUring_Object_CAST(op) ((pyIoUring_Object *)(op))
+
+static int
+sys_io_uring_setup(unsigned int entries, struct io_uring_params *p)
+{
+    return (int)syscall(__NR_io_uring_setup, entries, p);
+}
+
+static int
+sys_io_uring_enter(int fd, unsigned int to_submit, unsigned int min_complete,
+                   unsigned int flags, void *arg, size_t argsz)
+{
+    return (int)syscall(__NR_io_uring_enter, fd, to_submit, min_complete,
+                        flags, arg, argsz);
+}
+
+static PyObject *
+pyiouring_err_closed(void)
+{
+    PyErr_SetString(PyExc_ValueError,
+                    "I/O operation on closed io_uring object");
+    return NULL;
+}
+
+/* Return the number of queued requests not submitted yet. */
+static unsigned int
+pyiouring_to_submit(pyIoUring_Object *self)
+{
+    return *self->sq_tail - __atomic_load_n(self->sq_head, __ATOMIC_ACQUIRE);
+}
+
+static int
+pyiouring_cq_ready(pyIoUring_Object *self)
+{
+    return __atomic_load_n(self->cq_tail, __ATOMIC_ACQUIRE) != *self->cq_head;
+}
+
+/* Submit the queued requests; wait for a completion if wait is true. */
+static int
+pyiouring_enter(pyIoUring_Object *self, int wait)
+{
+    int ret;
+    unsigned int to_submit = pyiouring_to_submit(self);
+    unsigned int flags = wait ? IORING_ENTER_GETEVENTS : 0;
+
+    Py_BEGIN_ALLOW_THREADS
+    ret = sys_io_uring_enter(self->ring_fd, to_submit, wait ? 1 : 0, flags,
+                             NULL, 0);
+    Py_END_ALLOW_THREADS
+    return ret;
+}
+
+/* Consume the available completions.  Append them as
+   (user_data, result, flags) tuples to list, unless it is NULL. */
+static int
+pyiouring_reap(pyIoUring_Object *self, PyObject *list)
+{
+    unsigned int head = *self->cq_head;
+    unsigned int tail = __atomic_load_n(self->cq_tail, __ATOMIC_ACQUIRE);
+    int status = 0;
+
+    for (; head != tail; head++) {
+        struct io_uring_cqe *cqe = &self->cqes[head & self->cq_mask];
+        unsigned long long user_data = cqe->user_data;
+        PyObject *key, *item;
+
+        if (user_data == IO_URING_INTERNAL) {
+            continue;
+        }
+        key = PyLong_FromUnsignedLongLong(user_data);
+        if (key == NULL) {
+            status = -1;
+            break;
+        }
+        /* Release the buffer of the request once the kernel is done. */
+        if (!(cqe->flags & IORING_CQE_F_MORE)
+            && PyDict_Pop(self->inflight, key, NULL) < 0)
+        {
+            Py_DECREF(key);
+            status = -1;
+            break;
+        }
+        if (list != NULL) {
+            item = Py_BuildValue("NiI", key, cqe->res, cqe->flags);
+            if (item == NULL) {
+                status = -1;
+                head++;
+                break;
+            }
+            if (PyList_Append(list, item) < 0) {
+                Py_DECREF(item);
+                status = -1;
+                head++;
+                break;
+            }
+            Py_DECREF(item);
+        }
+        else {
+            Py_DECREF(key);
+        }
+    }
+    __atomic_store_n(self->cq_head, head, __ATOMIC_RELEASE);
+
+    if (status == 0
+        && __atomic_load_n(self->sq_flags, __ATOMIC_RELAXED) & IORING_SQ_CQ_OVERFLOW)
+    {
+        /* Ask the kernel to flush the completions which did not fit into
+           the completion queue. */
+        int ret;
+        Py_BEGIN_ALLOW_THREADS
+        ret = sys_io_uring_enter(self->ring_fd, 0, 0, IORING_ENTER_GETEVENTS,
+                                 NULL, 0);
+        Py_END_ALLOW_THREADS
+        if (ret >= 0 && pyiouring_cq_ready(self)) {
+            return pyiouring_reap(self, list);
+        }
+    }
+    return status;
+}
+
+/* Return a zeroed submission queue entry, or NULL with an exception set.
+   The entry is queued by pyiouring_push_sqe(). */
+static struct io_uring_sqe *
+pyiouring_get_sqe(pyIoUring_Object *self)
+{
+    struct io_uring_sqe *sqe;
+    unsigned int tail = *self->sq_tail;
+
+    if (pyiouring_to_submit(self) >= self->sq_entries) {
+        /* The submission queue is full: submit the queued requests. */
+        if (pyiouring_enter(self, 0) < 0 && errno != EINTR) {
+            PyErr_SetFromErrno(PyExc_OSError);
+            return NULL;
+        }
+        if (pyiouring_to_submit(self) >= self->sq_entries) {
+            errno = EBUSY;
+            PyErr_SetFromErrno(PyExc_OSError);
+            return NULL;
+        }
+    }
+    sqe = &self->sqes[tail & self->sq_mask];
+    memset(sqe, 0, sizeof(*sqe));
+    return sqe;
+}
+
+static void
+pyiouring_push_sqe(pyIoUring_Object *self)
+{
+    __atomic_store_n(self->sq_tail, *self->sq_tail + 1, __ATOMIC_RELEASE);
+}
+
+/* Prepare a submission queue entry for a request identified by user_data.
+   If buffer is not NULL, it is pinned until the request completes and the
+   address and length of the entry are set to its memory. */
+static struct io_uring_sqe *
+pyiouring_prep(pyIoUring_Object *self, unsigned long long user_data,
+               PyObject *buffer, int writable)
+{
+    struct io_uring_sqe *sqe;
+    PyObject *key, *view = NULL;
+    Py_buffer *view_buffer = NULL;
+    int rc;
+
+    if (self->ring_fd < 0) {
+        pyiouring_err_closed();
+        return NULL;
+    }
+    if (user_data == IO_URING_INTERNAL) {
+        PyErr_SetString(PyExc_ValueError, "user_data is reserved");
+        return NULL;
+    }
+    if (buffer != NULL) {
+        view = PyMemoryView_FromObject(buffer);
+        if (view == NULL) {
+            return NULL;
+        }
+        view_buffer = PyMemoryView_GET_BUFFER(view);
+        if (writable && view_buffer->readonly) {
+            PyErr_Format(PyExc_TypeError,
+                         "buffer must be a read-write bytes-like object, "
+                         "not %T", buffer);
+            Py_DECREF(view);
+            return NULL;
+        }
+        if (!PyBuffer_IsContiguous(view_buffer, 'C')) {
+            PyErr_SetString(PyExc_BufferError, "buffer is not contiguous");
+            Py_DECREF(view);
+            return NULL;
+        }
+    }
+
+    key = PyLong_FromUnsignedLongLong(user_data);
+    if (key == NULL) {
+        Py_XDECREF(view);
+        return NULL;
+    }
+    rc = PyDict_SetDefaultRef(self->inflight, key,
+                              view != NULL ? view : Py_None, NULL);
+    Py_XDECREF(view);
+    if (rc != 0) {
+        if (rc > 0) {
+            PyErr_Format(PyExc_ValueError,
+                         "a request with user_data %llu is in flight",
+                         user_data);
+        }
+        Py_DECREF(key);
+        return NULL;
+    }
+    sqe = pyiouring_get_sqe(self);
+    if (sqe == NULL) {
+        (void)PyDict_DelItem(self->inflight, key);
+        Py_DECREF(key);
+        return NULL;
+    }
+    Py_DECREF(key);
+
+    sqe->user_data = user_data;
+    if (view_buffer != NULL) {
+        sqe->addr = (uint64_t)(uintptr_t)view_buffer->buf;
+        sqe->len = (uint32_t)Py_MIN(view_buffer->len, INT_MAX);
+    }
+    return sqe;
+}
+
+/* Cancel the requests in flight and wait until they complete, so that the
+   kernel no longer accesses the buffers they pinned. */
+static void
+pyiouring_drain(pyIoUring_Object *self)
+{
+    PyObject *exc = PyErr_GetRaisedException();
+
+    while (PyDict_GET_SIZE(self->inflight)) {
+        PyObject *key, *value;
+        Py_ssize_t pos = 0;
+
+        while (PyDict_Next(self->inflight, &pos, &key, &value)) {
+            struct io_uring_sqe *sqe = pyiouring_get_sqe(self);
+            if (sqe == NULL) {
+                goto error;
+            }
+            sqe->opcode = IORING_OP_ASYNC_CANCEL;
+            sqe->fd = -1;
+            sqe->addr = PyLong_AsUnsignedLongLong(key);
+            sqe->user_data = IO_URING_INTERNAL;
+            pyiouring_push_sqe(self);
+        }
+        if (pyiouring_enter(self, 1) < 0 && errno != EINTR) {
+            PyErr_SetFromErrno(PyExc_OSError);
+            goto error;
+        }
+        if (pyiouring_reap(self, NULL) < 0) {
+            goto error;
+        }
+    }
+    PyErr_SetRaisedException(exc);
+    return;
+
+error:
+    /* The buffers may still be in use: never release them. */
+    PyErr_FormatUnraisable("Exception ignored while cancelling "
+                           "the requests of %R", self);
+    self->inflight = PyDict_New();
+    PyErr_SetRaisedException(exc);
+}
+
+static int
+pyiouring_internal_close(pyIoUring_Object *self)
+{
+    int save_errno = 0;
+    if (self->ring_fd >= 0) {
+        int ring_fd;
+        if (self->inflight != NULL) {
+            pyiouring_drain(self);
+        }
+        ring_fd = self->ring_fd;
+        self->ring_fd = -1;
+        if (self->sqes != MAP_FAILED) {
+            munmap(self->sqes, self->sqes_size);
+            self->sqes = MAP_FAILED;
+        }
+        if (self->cq_ptr != MAP_FAILED && self->cq_ptr != self->sq_ptr) {
+            munmap(self->cq_ptr, self->cq_size);
+        }
+        self->cq_ptr = MAP_FAILED;
+        if (self->sq_ptr != MAP_FAILED) {
+            munmap(self->sq_ptr, self->sq_size);
+            self->sq_ptr = MAP_FAILED;
+        }
+        Py_BEGIN_ALLOW_THREADS
+        if (close(ring_fd) < 0)
+            save_errno = errno;
+        Py_END_ALLOW_THREADS
+    }
+    return save_errno;
+}
+
+static PyObject *
+newPyIoUring_Object(PyTypeObject *type, unsigned int entries)
+{
+    pyIoUring_Object *self;
+    struct io_uring_params p;
+    char *sq_ptr, *cq_ptr;
+    unsigned int i;
+
+    assert(type != NULL);
+    allocfunc iouring_alloc = PyType_GetSlot(type, Py_tp_alloc);
+    assert(iouring_alloc != NULL);
+    self = (pyIoUring_Object *) iouring_alloc(type, 0);
+    if (self == NULL)
+        return NULL;
+    self->ring_fd = -1;
+    self->sq_ptr = self->cq_ptr = MAP_FAILED;
+    self->sqes = MAP_FAILED;
+    self->inflight = PyDict_New();
+    if (self->inflight == NULL) {
+        Py_DECREF(self);
+        return NULL;
+    }
+
+    /* The io_uring file descriptor is always created close-on-exec. */
+    memset(&p, 0, sizeof(p));
+    Py_BEGIN_ALLOW_THREADS
+    self->ring_fd = sys_io_uring_setup(entries, &p);
+    Py_END_ALLOW_THREADS
+    if (self->ring_fd < 0) {
+        PyErr_SetFromErrno(PyExc_OSError);
+        Py_DECREF(self);
+        return NULL;
+    }
+    if (!(p.features & IORING_FEAT_EXT_ARG)) {
+        /* Waiting with a timeout requires Linux 5.11. */
+        errno = ENOSYS;
+        PyErr_SetFromErrno(PyExc_OSError);
+        Py_DECREF(self);
+        return NULL;
+    }
+
+    self->sq_size = p.sq_off.array + p.sq_entries * sizeof(unsigned int);
+    self->cq_size = p.cq_off.cqes + p.cq_entries * sizeof(struct io_uring_cqe);
+    if (p.features & IORING_FEAT_SINGLE_MMAP) {
+        self->sq_size = self->cq_size = Py_MAX(self->sq_size, self->cq_size);
+    }
+    self->sq_ptr = mmap(NULL, self->sq_size, PROT_READ | PROT_WRITE,
+                        MAP_SHARED | MAP_POPULATE, self->ring_fd,
+                        IORING_OFF_SQ_RING);
+    if (self->sq_ptr == MAP_FAILED) {
+        goto error;
+    }
+    if (p.features & IORING_FEAT_SINGLE_MMAP) {
+        self->cq_ptr = self->sq_ptr;
+    }
+    else {
+        self->cq_ptr = mmap(NULL, self->cq_size, PROT_READ | PROT_WRITE,
+                            MAP_SHARED | MAP_POPULATE, self->ring_fd,
+                            IORING_OFF_CQ_RING);
+        if (self->cq_ptr == MAP_FAILED) {
+            goto error;
+        }
+    }
+    self->sqes_size = p.sq_entries * sizeof(struct io_uring_sqe);
+    self->sqes = mmap(NULL, self->sqes_size, PROT_READ | PROT_WRITE,
+                      MAP_SHARED | MAP_POPULATE, self->ring_fd,
+                      IORING_OFF_SQES);
+    if (self->sqes == MAP_FAILED) {
+        goto error;
+    }
+
+    sq_ptr = self->sq_ptr;
+    self->sq_head = (unsigned int *)(sq_ptr + p.sq_off.head);
+    self->sq_tail = (unsigned int *)(sq_ptr + p.sq_off.tail);
+    self->sq_flags = (unsigned int *)(sq_ptr + p.sq_off.flags);
+    self->sq_mask = *(unsigned int *)(sq_ptr + p.sq_off.ring_mask);
+    self->sq_entries = *(unsigned int *)(sq_ptr + p.sq_off.ring_entries);
+    /* Submission queue entries are used in order: map each slot of the
+       index array to the entry with the same index once and for all. */
+    for (i = 0; i < self->sq_entries; i++) {
+        ((unsigned int *)(sq_ptr + p.sq_off.array))[i] = i;
+    }
+    cq_ptr = self->cq_ptr;
+    self->cq_head = (unsigned int *)(cq_ptr + p.cq_off.head);
+    self->cq_tail = (unsigned int *)(cq_ptr + p.cq_off.tail);
+    self->cq_mask = *(unsigned int *)(cq_ptr + p.cq_off.ring_mask);
+    self->cqes = (struct io_uring_cqe *)(cq_ptr + p.cq_off.cqes);
+    return (PyObject *)self;
+
+error:
+    PyErr_SetFromErrno(PyExc_OSError);
+    Py_DECREF(self);
+    return NULL;
+}
+
+
+/*[clinic input]
+@classmethod
+select.io_uring.__new__
+
+    entries: int = 256
+      The size of the submission queue.  The kernel rounds it up to
+      a power of two.
+
+Returns an io_uring object.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_impl(PyTypeObject *type, int entries)
+/*[clinic end generated code: output=3e176ae7f5b0bc8b input=bfedcfd9f463ec9a]*/
+{
+    if (entries <= 0) {
+        PyErr_SetString(PyExc_ValueError, "entries must be positive");
+        return NULL;
+    }
+    return newPyIoUring_Object(type, (unsigned int)entries);
+}
+
+
+static void
+pyiouring_dealloc(PyObject *op)
+{
+    pyIoUring_Object *self = pyIoUring_Object_CAST(op);
+    PyTypeObject *type = Py_TYPE(self);
+    (void)pyiouring_internal_close(self);
+    Py_XDECREF(self->inflight);
+    freefunc iouring_free = PyType_GetSlot(type, Py_tp_free);
+    iouring_free(self);
+    Py_DECREF(type);
+}
+
+/*[clinic input]
+@critical_section
+select.io_uring.close
+
+Close the io_uring file descriptor.
+
+Requests in flight are cancelled first, and their completion is waited
+for.  Further operations on the io_uring object will raise an exception.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_close_impl(pyIoUring_Object *self)
+/*[clinic end generated code: output=ab34c3876bdadb71 input=778ad6487deccbca]*/
+{
+    errno = pyiouring_internal_close(self);
+    if (errno) {
+        PyErr_SetFromErrno(PyExc_OSError);
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+
+static PyObject *
+pyiouring_get_closed(PyObject *op, void *Py_UNUSED(closure))
+{
+    pyIoUring_Object *self = pyIoUring_Object_CAST(op);
+    if (self->ring_fd < 0) {
+        Py_RETURN_TRUE;
+    }
+    Py_RETURN_FALSE;
+}
+
+/*[clinic input]
+select.io_uring.fileno
+
+Return the io_uring file descriptor.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_fileno_impl(pyIoUring_Object *self)
+/*[clinic end generated code: output=7915f2f83c9cd9ae input=387b7ad3eb89de90]*/
+{
+    if (self->ring_fd < 0)
+        return pyiouring_err_closed();
+    return PyLong_FromLong(self->ring_fd);
+}
+
+/*[clinic input]
+@critical_section
+select.io_uring.nop
+
+    user_data: unsigned_long_long
+      the identifier of the request, reported with its completion
+
+Queue a request which does nothing.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_nop_impl(pyIoUring_Object *self,
+                         unsigned long long user_data)
+/*[clinic end generated code: output=7f18acd6a0f5c1df input=e38be66e302e7241]*/
+{
+    struct io_uring_sqe *sqe = pyiouring_prep(self, user_data, NULL, 0);
+    if (sqe == NULL)
+        return NULL;
+    sqe->opcode = IORING_OP_NOP;
+    pyiouring_push_sqe(self);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+@critical_section
+select.io_uring.read
+
+    user_data: unsigned_long_long
+      the identifier of the request, reported with its completion
+    fd: fildes
+      the file descriptor to read from
+    buffer: object
+      a writable bytes-like object to read into
+    offset: long_long = -1
+      the file offset to read at; -1 means the current file position
+
+Queue a request reading from a file descriptor into a buffer.
+
+The result of the request is the number of bytes read.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_read_impl(pyIoUring_Object *self,
+                          unsigned long long user_data, int fd,
+                          PyObject *buffer, long long offset)
+/*[clinic end generated code: output=4216c1f31b7b06b6 input=11f453e0b207e09a]*/
+{
+    struct io_uring_sqe *sqe = pyiouring_prep(self, user_data, buffer, 1);
+    if (sqe == NULL)
+        return NULL;
+    sqe->opcode = IORING_OP_READ;
+    sqe->fd = fd;
+    sqe->off = (uint64_t)offset;
+    pyiouring_push_sqe(self);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+@critical_section
+select.io_uring.write
+
+    user_data: unsigned_long_long
+      the identifier of the request, reported with its completion
+    fd: fildes
+      the file descriptor to write to
+    data: object
+      a bytes-like object to write
+    offset: long_long = -1
+      the file offset to write at; -1 means the current file position
+
+Queue a request writing data to a file descriptor.
+
+The result of the request is the number of bytes written.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_write_impl(pyIoUring_Object *self,
+                           unsigned long long user_data, int fd,
+                           PyObject *data, long long offset)
+/*[clinic end generated code: output=52ccc7c4692a97d4 input=3e627b68b4a52152]*/
+{
+    struct io_uring_sqe *sqe = pyiouring_prep(self, user_data, data, 0);
+    if (sqe == NULL)
+        return NULL;
+    sqe->opcode = IORING_OP_WRITE;
+    sqe->fd = fd;
+    sqe->off = (uint64_t)offset;
+    pyiouring_push_sqe(self);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+@critical_section
+select.io_uring.recv
+
+    user_data: unsigned_long_long
+      the identifier of the request, reported with its completion
+    fd: fildes
+      the socket to receive from
+    buffer: object
+      a writable bytes-like object to receive into
+    flags: int = 0
+      the flags of recv(2)
+
+Queue a request receiving data from a socket into a buffer.
+
+The result of the request is the number of bytes received.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_recv_impl(pyIoUring_Object *self,
+                          unsigned long long user_data, int fd,
+                          PyObject *buffer, int flags)
+/*[clinic end generated code: output=7d54e7a6a6418417 input=ef3186e56869af40]*/
+{
+    struct io_uring_sqe *sqe = pyiouring_prep(self, user_data, buffer, 1);
+    if (sqe == NULL)
+        return NULL;
+    sqe->opcode = IORING_OP_RECV;
+    sqe->fd = fd;
+    sqe->msg_flags = (uint32_t)flags;
+    pyiouring_push_sqe(self);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+@critical_section
+select.io_uring.send
+
+    user_data: unsigned_long_long
+      the identifier of the request, reported with its completion
+    fd: fildes
+      the socket to send to
+    data: object
+      a bytes-like object to send
+    flags: int = 0
+      the flags of send(2)
+
+Queue a request sending data to a socket.
+
+The result of the request is the number of bytes sent.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_send_impl(pyIoUring_Object *self,
+                          unsigned long long user_data, int fd,
+                          PyObject *data, int flags)
+/*[clinic end generated code: output=237f2b1fb939fea6 input=1c88ba00ecc22ad1]*/
+{
+    struct io_uring_sqe *sqe = pyiouring_prep(self, user_data, data, 0);
+    if (sqe == NULL)
+        return NULL;
+    sqe->opcode = IORING_OP_SEND;
+    sqe->fd = fd;
+    sqe->msg_flags = (uint32_t)flags;
+    pyiouring_push_sqe(self);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+@critical_section
+select.io_uring.accept
+
+    user_data: unsigned_long_long
+      the identifier of the request, reported with its completion
+    fd: fildes
+      the listening socket
+    flags: int = 0
+      the flags of accept4(2)
+
+Queue a request accepting a connection on a socket.
+
+The result of the request is the file descriptor of the new connection.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_accept_impl(pyIoUring_Object *self,
+                            unsigned long long user_data, int fd, int flags)
+/*[clinic end generated code: output=17972c6d85c8adb9 input=ee8d9bcb8a34ec86]*/
+{
+    struct io_uring_sqe *sqe = pyiouring_prep(self, user_data, NULL, 0);
+    if (sqe == NULL)
+        return NULL;
+    sqe->opcode = IORING_OP_ACCEPT;
+    sqe->fd = fd;
+    sqe->accept_flags = (uint32_t)flags;
+    pyiouring_push_sqe(self);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+@critical_section
+select.io_uring.poll_add
+
+    user_data: unsigned_long_long
+      the identifier of the request, reported with its completion
+    fd: fildes
+      the file descriptor to poll
+    eventmask: unsigned_int(bitwise=True)
+      a bit set composed of the various POLL constants
+
+Queue a request waiting for events on a file descriptor.
+
+The result of the request is the bit set of events that occurred.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_poll_add_impl(pyIoUring_Object *self,
+                              unsigned long long user_data, int fd,
+                              unsigned int eventmask)
+/*[clinic end generated code: output=46ca4aa754146304 input=157851ffc6eb7eff]*/
+{
+    struct io_uring_sqe *sqe = pyiouring_prep(self, user_data, NULL, 0);
+    if (sqe == NULL)
+        return NULL;
+    sqe->opcode = IORING_OP_POLL_ADD;
+    sqe->fd = fd;
+#if PY_BIG_ENDIAN
+    /* The kernel reads the two halves of the event mask swapped. */
+    eventmask = (eventmask << 16) | (eventmask >> 16);
+#endif
+    sqe->poll32_events = eventmask;
+    pyiouring_push_sqe(self);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+@critical_section
+select.io_uring.cancel
+
+    user_data: unsigned_long_long
+      the identifier of the request, reported with its completion
+    target: unsigned_long_long
+      the user_data of the request to cancel
+
+Queue a request cancelling another request in flight.
+
+The result of the request is 0 if the target request was cancelled,
+or a negative errno value.  A cancelled request completes with
+-ECANCELED (or -EINTR), unless it already completed.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_cancel_impl(pyIoUring_Object *self,
+                            unsigned long long user_data,
+                            unsigned long long target)
+/*[clinic end generated code: output=633ed566715b7dac input=9dd9e50aef2ddd7c]*/
+{
+    struct io_uring_sqe *sqe = pyiouring_prep(self, user_data, NULL, 0);
+    if (sqe == NULL)
+        return NULL;
+    sqe->opcode = IORING_OP_ASYNC_CANCEL;
+    sqe->fd = -1;
+    sqe->addr = target;
+    pyiouring_push_sqe(self);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+@critical_section
+select.io_uring.submit
+
+Submit the queued requests to the kernel without waiting.
+
+Returns the number of requests submitted.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_submit_impl(pyIoUring_Object *self)
+/*[clinic end generated code: output=07eb59929b462eb5 input=445ad8b4aae6e741]*/
+{
+    int ret;
+
+    if (self->ring_fd < 0)
+        return pyiouring_err_closed();
+    if (pyiouring_to_submit(self) == 0) {
+        return PyLong_FromLong(0);
+    }
+    do {
+        ret = pyiouring_enter(self, 0);
+        if (ret >= 0 || errno != EINTR) {
+            break;
+        }
+        if (PyErr_CheckSignals())
+            return NULL;
+    } while (1);
+    if (ret < 0) {
+        PyErr_SetFromErrno(PyExc_OSError);
+        return NULL;
+    }
+    return PyLong_FromLong(ret);
+}
+
+/*[clinic input]
+@critical_section
+select.io_uring.wait
+
+    timeout as timeout_obj: object = None
+      the maximum time to wait in seconds (with fractions);
+      a timeout of None or a negative number makes wait() wait
+      indefinitely
+
+Submit the queued requests and wait for completions.
+
+Returns a list of (user_data, result, flags) 3-tuples for the completed
+requests.  The result is the return value of the equivalent system call,
+or a negative errno value on failure.  The list is empty if no request
+completed before the timeout expired.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_wait_impl(pyIoUring_Object *self, PyObject *timeout_obj)
+/*[clinic end generated code: output=6f1bd28cfe8c9979 input=e955422ccebed5fe]*/
+{
+    PyObject *result;
+    PyTime_t timeout = -1, deadline = 0;
+    struct io_uring_getevents_arg arg;
+    struct __kernel_timespec ts;
+
+    if (self->ring_fd < 0)
+        return pyiouring_err_closed();
+
+    if (timeout_obj != Py_None) {
+        if (_PyTime_FromSecondsObject(&timeout, timeout_obj,
+                                      _PyTime_ROUND_TIMEOUT) < 0) {
+            if (PyErr_ExceptionMatches(PyExc_TypeError)) {
+                PyErr_Format(PyExc_TypeError,
+                             "timeout must be a real number or None, not %T",
+                             timeout_obj);
+            }
+            return NULL;
+        }
+        if (timeout > 0) {
+            deadline = _PyDeadline_Init(timeout);
+        }
+    }
+
+    do {
+        unsigned int to_submit = pyiouring_to_submit(self);
+        unsigned int flags = 0;
+        int wait = timeout != 0 && !pyiouring_cq_ready(self);
+        void *argp = NULL;
+        size_t argsz = 0;
+        int ret;
+
+        if (!to_submit && !wait) {
+            break;
+        }
+        if (wait) {
+            flags |= IORING_ENTER_GETEVENTS;
+            if (timeout > 0) {
+                struct timespec tv;
+                _PyTime_AsTimespec_clamp(timeout, &tv);
+                ts.tv_sec = tv.tv_sec;
+                ts.tv_nsec = tv.tv_nsec;
+                memset(&arg, 0, sizeof(arg));
+                arg.ts = (uint64_t)(uintptr_t)&ts;
+                flags |= IORING_ENTER_EXT_ARG;
+                argp = &arg;
+                argsz = sizeof(arg);
+            }
+        }
+
+        Py_BEGIN_ALLOW_THREADS
+        ret = sys_io_uring_enter(self->ring_fd, to_submit, wait ? 1 : 0,
+                                 flags, argp, argsz);
+        Py_END_ALLOW_THREADS
+
+        if (ret >= 0 || errno == ETIME) {
+            break;
+        }
+        if (errno != EINTR) {
+            PyErr_SetFromErrno(PyExc_OSError);
+            return NULL;
+        }
+
+        /* io_uring_enter() was interrupted by a signal */
+        if (PyErr_CheckSignals())
+            return NULL;
+
+        if (timeout > 0) {
+            timeout = _PyDeadline_Get(deadline);
+            if (timeout <= 0) {
+                /* Only collect the completions already available. */
+                timeout = 0;
+            }
+        }
+    } while (1);
+
+    result = PyList_New(0);
+    if (result == NULL) {
+        return NULL;
+    }
+    if (pyiouring_reap(self, result) < 0) {
+        Py_DECREF(result);
+        return NULL;
+    }
+    return result;
+}
+
+
+/*[clinic input]
+select.io_uring.__enter__
+
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring___enter___impl(pyIoUring_Object *self)
+/*[clinic end generated code: output=6453f8b2562a22d4 input=8edfa5fe3684ef9a]*/
+{
+    if (self->ring_fd < 0)
+        return pyiouring_err_closed();
+
+    return Py_NewRef(self);
+}
+
+/*[clinic input]
+select.io_uring.__exit__
+
+    exc_type:  object = None
+    exc_value: object = None
+    exc_tb:    object = None
+    /
+
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring___exit___impl(pyIoUring_Object *self, PyObject *exc_type,
+                              PyObject *exc_value, PyObject *exc_tb)
+/*[clinic end generated code: output=313376fb85210e74 input=1e269333b0d5d167]*/
+{
+    _selectstate *state = _selectstate_by_type(Py_TYPE(self));
+    return PyObject_CallMethodObjArgs((PyObject *)self, state->close, NULL);
+}
+
+static PyGetSetDef pyiouring_getsetlist[] = {
+    {"closed", pyiouring_get_closed, NULL,
+     "True if the io_uring object is closed"},
+    {0},
+};
+
+PyDoc_STRVAR(pyiouring_doc,
+"select.io_uring(entries=256)\n\
+\n\
+Returns an io_uring object\n\
+\n\
+Requests are queued in the submission queue by the methods named after\n\
+the corresponding system calls, and identified by a user_data integer.\n\
+They are submitted to the kernel all at once by submit() or wait(), and\n\
+their results are returned by wait().");
+
+#endif /* HAVE_IO_URING */
+
 #ifdef HAVE_KQUEUE
 /* **************************************************************************
  *                      kqueue interface for BSD
@@ -2574,6 +3545,45 @@ static PyType_Spec pyEpoll_Type_spec = {
 
 #endif /* HAVE_EPOLL */
 
+#ifdef HAVE_IO_URING
+
+static PyMethodDef pyiouring_methods[] = {
+    SELECT_IO_URING_CLOSE_METHODDEF
+    SELECT_IO_URING_FILENO_METHODDEF
+    SELECT_IO_URING_NOP_METHODDEF
+    SELECT_IO_URING_READ_METHODDEF
+    SELECT_IO_URING_WRITE_METHODDEF
+    SELECT_IO_URING_RECV_METHODDEF
+    SELECT_IO_URING_SEND_METHODDEF
+    SELECT_IO_URING_ACCEPT_METHODDEF
+    SELECT_IO_URING_POLL_ADD_METHODDEF
+    SELECT_IO_URING_CANCEL_METHODDEF
+    SELECT_IO_URING_SUBMIT_METHODDEF
+    SELECT_IO_URING_WAIT_METHODDEF
+    SELECT_IO_URING___ENTER___METHODDEF
+    SELECT_IO_URING___EXIT___METHODDEF
+    {NULL,      NULL},
+};
+
+static PyType_Slot pyIoUring_Type_slots[] = {
+    {Py_tp_dealloc, pyiouring_dealloc},
+    {Py_tp_doc, (void*)pyiouring_doc},
+    {Py_tp_getattro, PyObject_GenericGetAttr},
+    {Py_tp_getset, pyiouring_getsetlist},
+    {Py_tp_methods, pyiouring_methods},
+    {Py_tp_new, select_io_uring},
+    {0, 0},
+};
+
+static PyType_Spec pyIoUring_Type_spec = {
+    .name = "select.io_uring",
+    .basicsize = sizeof(pyIoUring_Object),
+    .flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_IMMUTABLETYPE,
+    .slots = pyIoUring_Type_slots
+};
+
+#endif /* HAVE_IO_URING */
+
 #ifdef HAVE_KQUEUE
 
 static PyMethodDef kqueue_queue_methods[] = {
@@ -2634,6 +3644,7 @@ _select_traverse(PyObject *module, visitproc visit, void *arg)
     Py_VISIT(state->poll_Type);
     Py_VISIT(state->devpoll_Type);
     Py_VISIT(state->pyEpoll_Type);
+    Py_VISIT(state->pyIoUring_Type);
 #ifdef HAVE_KQUEUE
     Py_VISIT(state->kqueue_event_Type);
     Py_VISIT(state->kqueue_queue_Type);
@@ -2651,6 +3662,7 @@ _select_clear(PyObject *module)
     Py_CLEAR(state->poll_Type);
     Py_CLEAR(state->devpoll_Type);
     Py_CLEAR(state->pyEpoll_Type);
+    Py_CLEAR(state->pyIoUring_Type);
 #ifdef HAVE_KQUEUE
     Py_CLEAR(state->kqueue_event_Type);
     Py_CLEAR(state->kqueue_queue_Type);
@@ -2797,6 +3809,17 @@ _select_exec(PyObject *m)
 #endif
 #endif /* HAVE_EPOLL */
 
+#ifdef HAVE_IO_URING
+    state->pyIoUring_Type = (PyTypeObject *)PyType_FromModuleAndSpec(
+        m, &pyIoUring_Type_spec, NULL);
+    if (state->pyIoUring_Type == NULL) {
+        return -1;
+    }
+    if (PyModule_AddType(m, state->pyIoUring_Type) < 0) {
+        return -1;
+    }
+#endif /* HAVE_IO_URING */
+
 #undef ADD_INT
 
 #define ADD_INT_CONST(NAME, VAL) \
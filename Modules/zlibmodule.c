@@ -1462,9 +1462,10 @@ arrange_output_buffer_with_maximum(uint32_t *avail_out,
    of sufficiently low size, max_length is allocated immediately. At most
    max_length bytes are returned, so some of the input may not be consumed.
    self->state.next_in and self->avail_in_real are updated to reflect the
-   consumed input. */
+   consumed input.  If flush is Z_BLOCK, decompression also stops at the end
+   of the first deflate block reached. */
 static PyObject*
-decompress_buf(ZlibDecompressor *self, Py_ssize_t max_length)
+decompress_buf(ZlibDecompressor *self, Py_ssize_t max_length, int flush)
 {
     /* data_size is strictly positive, but because we repeatedly have to
        compare against max_length and PyBytes_GET_SIZE we declare it as
@@ -1513,7 +1514,7 @@ decompress_buf(ZlibDecompressor *self, Py_ssize_t max_length)
                 break;
             }
             Py_BEGIN_ALLOW_THREADS
-            err = inflate(&self->zst, Z_SYNC_FLUSH);
+            err = inflate(&self->zst, flush);
             Py_END_ALLOW_THREADS
             switch (err) {
             case Z_OK:  _Py_FALLTHROUGH;
@@ -1529,6 +1530,10 @@ decompress_buf(ZlibDecompressor *self, Py_ssize_t max_length)
                 }
             }
         } while (self->zst.avail_out == 0);
+        if (flush == Z_BLOCK && (self->zst.data_type & 128)) {
+            /* Stopped at the end of a deflate block */
+            break;
+        }
     } while(err != Z_STREAM_END && self->avail_in_real != 0);
 
     if (err == Z_STREAM_END) {
@@ -1563,7 +1568,7 @@ decompress_buf(ZlibDecompressor *self, Py_ssize_t max_length)
 
 static PyObject *
 decompress(ZlibDecompressor *self, uint8_t *data,
-           size_t len, Py_ssize_t max_length)
+           size_t len, Py_ssize_t max_length, int flush)
 {
     bool input_buffer_in_use;
     PyObject *result;
@@ -1613,7 +1618,7 @@ decompress(ZlibDecompressor *self, uint8_t *data,
         input_buffer_in_use = 0;
     }
 
-    result = decompress_buf(self, max_length);
+    result = decompress_buf(self, max_length, flush);
     if(result == NULL) {
         self->zst.next_in = NULL;
         return NULL;
@@ -1710,12 +1715,92 @@ zlib__ZlibDecompressor_decompress_impl(ZlibDecompressor *self,
         PyErr_SetString(PyExc_EOFError, "End of stream already reached");
     }
     else {
-        result = decompress(self, data->buf, data->len, max_length);
+        result = decompress(self, data->buf, data->len, max_length,
+                            Z_SYNC_FLUSH);
     }
     PyMutex_Unlock(&self->mutex);
     return result;
 }
 
+/*[clinic input]
+zlib._ZlibDecompressor._decompress_block
+
+    data: Py_buffer
+    /
+
+Decompress *data* up to the end of the current deflate block.
+
+Return a tuple (output, total_in, data_type): the decompressed data,
+the number of input bytes consumed since the decompressor was created
+and the data_type field of the zlib stream.  If bit 7 of data_type is
+set, decompression stopped at a block boundary and its low 3 bits give
+the number of unused bits in the last input byte consumed.  Unconsumed
+input is kept for the next call, as by decompress().
+[clinic start generated code]*/
+
+static PyObject *
+zlib__ZlibDecompressor__decompress_block_impl(ZlibDecompressor *self,
+                                              Py_buffer *data)
+/*[clinic end generated code: output=0521d9fb119b372b input=b6f801ccf9fd4345]*/
+{
+    PyObject *output, *result = NULL;
+
+    PyMutex_Lock(&self->mutex);
+    if (self->eof) {
+        PyErr_SetString(PyExc_EOFError, "End of stream already reached");
+        PyMutex_Unlock(&self->mutex);
+        return NULL;
+    }
+    output = decompress(self, data->buf, data->len, -1, Z_BLOCK);
+    if (output != NULL) {
+        result = Py_BuildValue("(NKi)", output,
+                               (unsigned long long)self->zst.total_in,
+                               self->zst.data_type);
+    }
+    PyMutex_Unlock(&self->mutex);
+    return result;
+}
+
+/*[clinic input]
+zlib._ZlibDecompressor._prime
+
+    bits: int
+    value: int
+    /
+
+Insert *bits* bits of *value* into the input stream.
+
+This must be called before any data is decompressed.  It is used to
+resume decompression of a raw deflate stream at a position that is not
+byte aligned.
+[clinic start generated code]*/
+
+static PyObject *
+zlib__ZlibDecompressor__prime_impl(ZlibDecompressor *self, int bits,
+                                   int value)
+/*[clinic end generated code: output=a8a324003a7fdd6d input=f0e9e513d41119b4]*/
+{
+    int err;
+    zlibstate *state = PyType_GetModuleState(Py_TYPE(self));
+
+    PyMutex_Lock(&self->mutex);
+    if (!self->is_initialised) {
+        PyMutex_Unlock(&self->mutex);
+        PyErr_SetString(PyExc_ValueError,
+                        "cannot prime an uninitialized decompressor "
+                        "(the end of the stream was reached)");
+        return NULL;
+    }
+    err = inflatePrime(&self->zst, bits, value);
+    if (err != Z_OK) {
+        zlib_error(state, self->zst, err, "while priming decompression");
+        PyMutex_Unlock(&self->mutex);
+        return NULL;
+    }
+    PyMutex_Unlock(&self->mutex);
+    Py_RETURN_NONE;
+}
+
 /*[clinic input]
 @classmethod
 zlib._ZlibDecompressor.__new__
@@ -1806,6 +1891,8 @@ static PyMethodDef Decomp_methods[] =
 
 static PyMethodDef ZlibDecompressor_methods[] = {
     ZLIB__ZLIBDECOMPRESSOR_DECOMPRESS_METHODDEF
+    ZLIB__ZLIBDECOMPRESSOR__DECOMPRESS_BLOCK_METHODDEF
+    ZLIB__ZLIBDECOMPRESSOR__PRIME_METHODDEF
     {NULL}
 };
 
@@ -24,6 +24,7 @@ static const char* _Py_stdlib_module_names[] = {
 "_collections_abc",
 "_colorize",
 "_compat_pickle",
+"_concurrent_futures",
 "_contextvars",
 "_csv",
 "_ctypes",
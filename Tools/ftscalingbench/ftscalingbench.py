@@ -22,12 +22,14 @@
 #
 
 import copy
+import functools
 import math
 import os
 import queue
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from operator import methodcaller
 
@@ -39,6 +41,8 @@
 threads = []
 in_queues = []
 out_queues = []
+# The number of threads running the current benchmark.
+_running_threads = 1
 
 
 def register_benchmark(func):
@@ -222,8 +226,58 @@ def deepcopy():
     for i in range(40 * WORK_SCALE):
         copy.deepcopy(x)
 
+@functools.lru_cache(maxsize=1024)
+def _cached_square(x):
+    return x * x
+
+@register_benchmark
+def lru_cache_hit():
+    # All threads hit the same cache.
+    for _ in range(10 * WORK_SCALE):
+        for i in range(100):
+            _cached_square(i)
+
+@functools.lru_cache(maxsize=1024, shards=64)
+def _sharded_cached_square(x):
+    return x * x
+
+@register_benchmark
+def sharded_lru_cache_hit():
+    for _ in range(10 * WORK_SCALE):
+        for i in range(100):
+            _sharded_cached_square(i)
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+def _get_executor(work_stealing):
+    # All threads submit to the same executor, which has a worker thread
+    # for each thread running the benchmark: one in bench_one_thread() and
+    # len(threads) in bench_parallel().
+    key = (work_stealing, _running_threads)
+    with _executors_lock:
+        if key not in _executors:
+            _executors[key] = ThreadPoolExecutor(
+                _running_threads, work_stealing=work_stealing)
+        return _executors[key]
+
+def _run_executor_tasks(executor):
+    for _ in range(WORK_SCALE):
+        for f in executor.submit_many(abs, range(100)):
+            f.result()
+
+@register_benchmark
+def thread_pool_executor():
+    _run_executor_tasks(_get_executor(work_stealing=False))
+
+@register_benchmark
+def thread_pool_work_stealing():
+    _run_executor_tasks(_get_executor(work_stealing=True))
+
 
 def bench_one_thread(func):
+    global _running_threads
+    _running_threads = 1
     t0 = time.perf_counter_ns()
     func()
     t1 = time.perf_counter_ns()
@@ -231,6 +285,8 @@ def bench_one_thread(func):
 
 
 def bench_parallel(func):
+    global _running_threads
+    _running_threads = len(threads)
     t0 = time.perf_counter_ns()
     for inq in in_queues:
         inq.put(func)
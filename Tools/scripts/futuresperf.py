@@ -0,0 +1,63 @@
+"""
+Measure the overhead of running many tiny tasks in a ThreadPoolExecutor.
+
+Usage: python Tools/scripts/futuresperf.py [-n TASKS] [-w WORKERS]
+
+Every task is a call of a trivial function, so the time is spent in the
+executor and its futures.  The tasks are run with submit() and the pure
+Python Future, with submit() and the C Future of the _concurrent_futures
+module, and with submit_many(), and the wall time and the number of tasks
+per second of each run are reported.
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor, _base
+
+
+def run_submit(executor, n):
+    fs = [executor.submit(abs, i) for i in range(n)]
+    for f in fs:
+        f.result()
+
+
+def run_submit_many(executor, n):
+    for f in executor.submit_many(abs, range(n)):
+        f.result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('-n', '--tasks', type=int, default=1_000_000,
+                        help='number of tasks (default: 1000000)')
+    parser.add_argument('-w', '--workers', type=int, default=4,
+                        help='number of worker threads (default: 4)')
+    args = parser.parse_args()
+
+    cases = [('submit, Python Future', _base._PyFuture, run_submit)]
+    if hasattr(_base, '_CFuture'):
+        cases += [('submit, C Future', _base._CFuture, run_submit),
+                  ('submit_many, C Future', _base._CFuture, run_submit_many)]
+    else:
+        cases += [('submit_many, Python Future', _base._PyFuture,
+                   run_submit_many)]
+
+    print(f'{args.tasks} tasks, {args.workers} workers')
+    default_future = _base.Future
+    try:
+        for label, future_class, run in cases:
+            _base.Future = future_class
+            with ThreadPoolExecutor(args.workers) as executor:
+                # Start the workers.
+                list(executor.map(abs, range(args.workers)))
+                t0 = time.perf_counter()
+                run(executor, args.tasks)
+                elapsed = time.perf_counter() - t0
+            print(f'  {label:28} {elapsed:8.3f} s '
+                  f'{args.tasks / elapsed:12,.0f} tasks/s')
+    finally:
+        _base.Future = default_future
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Measure the throughput of gzip compression versus the number of workers.
+
+Usage: python Tools/scripts/gzipperf.py [-l LEVEL] [-s SIZE_MIB] [FILE]
+
+Compresses FILE (or generated, moderately compressible data) with
+gzip.compress() using 1, 2, 4, ... up to os.process_cpu_count() worker
+threads, and reports the throughput, the speedup over a single worker
+and the compressed size.
+"""
+
+import argparse
+import gzip
+import os
+import random
+import time
+
+
+def generate_data(size):
+    rng = random.Random(0)
+    words = [bytes(rng.choices(b'abcdefghijklmnopqrstuvwxyz', k=n))
+             for n in rng.choices(range(2, 12), k=5000)]
+    chunks = []
+    length = 0
+    while length < size:
+        line = b' '.join(rng.choices(words, k=12)) + b'\n'
+        chunks.append(line)
+        length += len(line)
+    return b''.join(chunks)[:size]
+
+
+def bench(data, level, workers, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        compressed = gzip.compress(data, level, workers=workers)
+        best = min(best, time.perf_counter() - t0)
+    return best, len(compressed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('file', nargs='?',
+                        help='file to compress (default: generated data)')
+    parser.add_argument('-l', '--level', type=int, default=6,
+                        help='compression level (default: 6)')
+    parser.add_argument('-s', '--size', type=int, default=64,
+                        help='size of the generated data in MiB (default: 64)')
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, 'rb') as f:
+            data = f.read()
+    else:
+        data = generate_data(args.size * 1024 * 1024)
+
+    max_workers = os.process_cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= max_workers:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_workers:
+        counts.append(max_workers)
+
+    print(f"{len(data) / 2**20:.1f} MiB, level {args.level}")
+    print(f"{'Workers':>7}  {'MiB/s':>8}  {'Speedup':>7}  {'Ratio':>6}")
+    base = None
+    for workers in counts:
+        elapsed, size = bench(data, args.level, workers)
+        if base is None:
+            base = elapsed
+        print(f"{workers:>7}  {len(data) / 2**20 / elapsed:>8.1f}  "
+              f"{base / elapsed:>7.2f}  {size / len(data):>6.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Compare the speed of logging.JSONFormatter with other logging formatters.
+
+Usage: python Tools/scripts/logformatperf.py [-n RECORDS] [--lazy]
+
+Formats the same log records with logging.Formatter, with a formatter
+which builds a dict and calls json.dumps() for every record, and with
+logging.JSONFormatter, and reports the time per record of each.  With
+--lazy, the records are logging.LazyLogRecord instances.
+"""
+
+import argparse
+import json
+import logging
+import time
+
+
+FIELDS = ('asctime', 'levelname', 'name', 'message')
+
+
+class DumpsFormatter(logging.Formatter):
+    # The usual way to write JSON logs without JSONFormatter.
+    def format(self, record):
+        record.message = record.getMessage()
+        record.asctime = self.formatTime(record, self.datefmt)
+        return json.dumps({name: getattr(record, name) for name in FIELDS})
+
+
+def make_records(n, factory):
+    records = []
+    for i in range(n):
+        record = factory('bench.logger', logging.INFO, __file__, 42,
+                         'request %d took %.3f seconds', (i, i / 7), None,
+                         'make_records')
+        records.append(record)
+    return records
+
+
+def bench(formatter, records, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for record in records:
+            formatter.format(record)
+        best = min(best, time.perf_counter() - t0)
+    return best / len(records)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('-n', '--records', type=int, default=100_000,
+                        help='number of records (default: 100000)')
+    parser.add_argument('--lazy', action='store_true',
+                        help='format logging.LazyLogRecord instances')
+    args = parser.parse_args()
+
+    factory = logging.LazyLogRecord if args.lazy else logging.LogRecord
+    records = make_records(args.records, factory)
+    formatters = [
+        ('Formatter', logging.Formatter(
+            ' '.join('%%(%s)s' % name for name in FIELDS))),
+        ('json.dumps()', DumpsFormatter()),
+        ('JSONFormatter', logging.JSONFormatter(FIELDS)),
+    ]
+    base = None
+    for name, formatter in formatters:
+        elapsed = bench(formatter, records)
+        if base is None:
+            base = elapsed
+        print(f'{name:15} {elapsed * 1e6:8.2f} us/record '
+              f'{base / elapsed:6.2f}x')
+
+
+if __name__ == '__main__':
+    main()
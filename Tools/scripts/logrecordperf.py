@@ -0,0 +1,75 @@
+"""
+Measure the cost of creating and handling log records in a Logger call.
+
+Usage: python Tools/scripts/logrecordperf.py [-n CALLS]
+
+Calls Logger.info() with logging.LogRecord and logging.LazyLogRecord as the
+record factory, with a handler which ignores the records and with a handler
+which formats them, and reports the time per call of each.  The same calls
+without caller information (logging._srcfile set to None) show the cost of
+Logger.findCaller().
+"""
+
+import argparse
+import logging
+import time
+
+
+class DiscardHandler(logging.Handler):
+    def emit(self, record):
+        pass
+
+
+class FormatHandler(logging.Handler):
+    def emit(self, record):
+        self.format(record)
+
+
+def bench(logger, n, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for i in range(n):
+            logger.info('request %d done', i)
+        best = min(best, time.perf_counter() - t0)
+    return best / n
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('-n', '--calls', type=int, default=100_000,
+                        help='number of calls (default: 100000)')
+    args = parser.parse_args()
+
+    logger = logging.getLogger('bench.logger')
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    handlers = [
+        ('discard', DiscardHandler()),
+        ('format', FormatHandler()),
+    ]
+    handlers[1][1].setFormatter(logging.Formatter(
+        '%(asctime)s %(levelname)s %(name)s %(module)s:%(lineno)d '
+        '%(funcName)s %(message)s'))
+    factories = [logging.LogRecord, logging.LazyLogRecord]
+    default_factory = logging.getLogRecordFactory()
+    default_srcfile = logging._srcfile
+    try:
+        for handler_name, handler in handlers:
+            logger.addHandler(handler)
+            for srcfile in (default_srcfile, None):
+                logging._srcfile = srcfile
+                caller = 'caller' if srcfile else 'no caller'
+                for factory in factories:
+                    logging.setLogRecordFactory(factory)
+                    elapsed = bench(logger, args.calls)
+                    label = f'{factory.__name__}, {handler_name}, {caller}'
+                    print(f'{label:38} {elapsed * 1e9:8.0f} ns/call')
+            logger.removeHandler(handler)
+    finally:
+        logging._srcfile = default_srcfile
+        logging.setLogRecordFactory(default_factory)
+
+
+if __name__ == '__main__':
+    main()
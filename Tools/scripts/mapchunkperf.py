@@ -0,0 +1,71 @@
+"""
+Compare the chunking modes of ProcessPoolExecutor.map() on tasks of
+heterogeneous cost.
+
+Usage: python Tools/scripts/mapchunkperf.py [-n TASKS] [-w WORKERS] [--sleep]
+
+Most tasks are cheap, and a few are a hundred times as expensive, with the
+expensive tasks either spread over the input or grouped at its end.  Each
+workload is run with chunksize=1, with a fixed chunksize which gives each
+worker four chunks, and with the adaptive chunksize=None, and the wall time
+of each run is reported.  With --sleep, the tasks sleep instead of using
+the CPU, to show the scheduling on a machine with few CPUs.
+"""
+
+import argparse
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+
+def busy(cost):
+    # Use the CPU for about cost seconds.
+    end = time.perf_counter() + cost
+    while time.perf_counter() < end:
+        pass
+    return cost
+
+
+def workloads(n, unit):
+    rng = random.Random(42)
+    spread = [unit * (100 if rng.random() < 0.01 else 1) for _ in range(n)]
+    tail = sorted(spread)
+    return [('spread', spread), ('slow tail', tail)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('-n', '--tasks', type=int, default=20_000,
+                        help='number of tasks (default: 20000)')
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help='number of worker processes '
+                             '(default: the number of CPUs)')
+    parser.add_argument('--unit', type=float, default=0.0001,
+                        help='cost of a cheap task in seconds '
+                             '(default: 0.0001)')
+    parser.add_argument('--sleep', action='store_true',
+                        help='sleep instead of using the CPU')
+    args = parser.parse_args()
+
+    fn = time.sleep if args.sleep else busy
+    with ProcessPoolExecutor(args.workers) as executor:
+        workers = executor._max_workers
+        fixed = max(1, args.tasks // (4 * workers))
+        # Start the workers.
+        list(executor.map(abs, range(workers)))
+        for name, costs in workloads(args.tasks, args.unit):
+            ideal = sum(costs) / workers
+            print(f'{name}: {len(costs)} tasks, {workers} workers, '
+                  f'ideal {ideal:.3f} s')
+            for label, chunksize in [('chunksize=1', 1),
+                                     (f'chunksize={fixed}', fixed),
+                                     ('chunksize=None', None)]:
+                t0 = time.perf_counter()
+                for _ in executor.map(fn, costs, chunksize=chunksize):
+                    pass
+                elapsed = time.perf_counter() - t0
+                print(f'  {label:16} {elapsed:8.3f} s {ideal / elapsed:6.1%}')
+
+
+if __name__ == '__main__':
+    main()